@@ -5,6 +5,7 @@ import "forge-std/Script.sol";
 import {TreasuryVault} from "../src/vault/TreasuryVault.sol";
 import {TreasuryController} from "../src/controller/TreasuryController.sol";
 import {MockBittensorVotes} from "../src/mocks/MockBittensorVotes.sol";
+import {HotkeyRegistry} from "../src/registry/HotkeyRegistry.sol";
 import {IVotes} from "lib/openzeppelin-contracts/contracts/governance/utils/IVotes.sol";
 
 contract DeployGovernance is Script {
@@ -33,26 +34,34 @@ contract DeployGovernance is Script {
             deployerAddress
         );
 
-        // 3. Governor
+        // 3. Hotkey registry: owned by the vault once permissions are set (step 5), so links
+        //    go through governance proposals (tools/link_hotkeys.py --propose)
+        HotkeyRegistry registry = new HotkeyRegistry(deployerAddress);
+
+        // 4. Governor
         TreasuryController governor = new TreasuryController(
             IVotes(votesAddress),
             vault,
             votesAddress,
-            1
+            1,
+            true, // Mock keeps checkpoints: votes are read at the proposal snapshot
+            registry
         );
 
-        // 4. Permissions
+        // 5. Permissions
         bytes32 PROPOSER_ROLE = vault.PROPOSER_ROLE();
         bytes32 ADMIN_ROLE = vault.DEFAULT_ADMIN_ROLE();
 
         vault.grantRole(PROPOSER_ROLE, address(governor));
         vault.renounceRole(ADMIN_ROLE, deployerAddress);
+        registry.transferOwnership(address(vault));
 
         vm.stopBroadcast();
         console.log("--------------------------------------------------");
         console.log("MockVotes deployed at:", address(mock));
         console.log("Vault deployed at:    ", address(vault));
         console.log("Governor deployed at: ", address(governor));
+        console.log("Registry deployed at: ", address(registry));
         console.log("--------------------------------------------------");
     }
 }
\ No newline at end of file
@@ -7,7 +7,10 @@ import "lib/openzeppelin-contracts/contracts/governance/extensions/GovernorCount
 import "lib/openzeppelin-contracts/contracts/governance/extensions/GovernorVotes.sol";
 import "lib/openzeppelin-contracts/contracts/governance/extensions/GovernorVotesQuorumFraction.sol"; // NOWY IMPORT
 import "lib/openzeppelin-contracts/contracts/governance/extensions/GovernorTimelockControl.sol";
+import "lib/openzeppelin-contracts/contracts/utils/Multicall.sol";
 import "../interfaces/IBittensorVotes.sol";
+import "../interfaces/IBittensorVotesHistory.sol";
+import "../interfaces/IHotkeyRegistry.sol";
 
 contract TreasuryController is
     Governor,
@@ -15,16 +18,24 @@ contract TreasuryController is
     GovernorCountingSimple,
     GovernorVotes,
     GovernorVotesQuorumFraction, // NOWE DZIEDZICZENIE
-    GovernorTimelockControl
+    GovernorTimelockControl,
+    // Batches calls such as castVoteBySig so a relayer can submit many votes in one transaction
+    Multicall
 {
     IBittensorVotes public immutable bittensorVotes;
     uint16 public immutable targetNetuid;
+    /// @notice Whether `bittensorVotes` implements IBittensorVotesHistory (snapshot-consistent votes)
+    bool public immutable historicalVotes;
+    /// @notice Hotkey delegations summed into one vote (address(0): each account votes with its own hotkey only)
+    IHotkeyRegistry public immutable hotkeyRegistry;
 
     constructor(
         IVotes _token,
         TimelockController _timelock,
         address _bittensorVotes,
-        uint16 _netuid
+        uint16 _netuid,
+        bool _historicalVotes,
+        IHotkeyRegistry _hotkeyRegistry
     )
     Governor("BittensorDAO")
     // 0 = Start głosowania od razu (Voting Delay)
@@ -37,15 +48,46 @@ contract TreasuryController is
     {
         bittensorVotes = IBittensorVotes(_bittensorVotes);
         targetNetuid = _netuid;
+        historicalVotes = _historicalVotes;
+        hotkeyRegistry = _hotkeyRegistry;
     }
 
     // Override dla getVotes (logika Bittensor)
+    // The precompile only exposes current power; with a history source, votes are read at the proposal snapshot.
+    // With a registry, the power of every hotkey delegated to the account is summed. The account's own
+    // hotkey counts once: the registry links it to no one but the account itself.
     function _getVotes(
         address account,
         uint256 timepoint,
         bytes memory params
     ) internal view override(Governor, GovernorVotes) returns (uint256) {
-        return bittensorVotes.getVotingPower(targetNetuid, bytes32(uint256(uint160(account))));
+        bytes32 ownHotkey = bytes32(uint256(uint160(account)));
+        if (address(hotkeyRegistry) == address(0)) {
+            return _hotkeyVotes(ownHotkey, timepoint);
+        }
+
+        bytes32[] memory hotkeys;
+        address ownVoter;
+        if (historicalVotes) {
+            hotkeys = hotkeyRegistry.pastHotkeysOf(account, timepoint);
+            ownVoter = hotkeyRegistry.pastVoterOf(ownHotkey, timepoint);
+        } else {
+            hotkeys = hotkeyRegistry.hotkeysOf(account);
+            ownVoter = hotkeyRegistry.voterOf(ownHotkey);
+        }
+
+        uint256 total = ownVoter == address(0) ? _hotkeyVotes(ownHotkey, timepoint) : 0;
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            total += _hotkeyVotes(hotkeys[i], timepoint);
+        }
+        return total;
+    }
+
+    function _hotkeyVotes(bytes32 hotkey, uint256 timepoint) private view returns (uint256) {
+        if (historicalVotes) {
+            return IBittensorVotesHistory(address(bittensorVotes)).getPastVotingPower(targetNetuid, hotkey, timepoint);
+        }
+        return bittensorVotes.getVotingPower(targetNetuid, hotkey);
     }
 
     // --- Boilerplate overrides wymagane przez Solidity ---
@@ -0,0 +1,21 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+/// @notice Snapshot lookups over Bittensor voting power (implemented by the mock; the precompile has no history)
+interface IBittensorVotesHistory {
+    /// @notice Returns voting power of a hotkey on a subnet at the end of a past block
+    /// @param netuid Bittensor subnet network ID
+    /// @param hotkey Hotkey as bytes32 (public key)
+    /// @param timepoint Block number, must be in the past
+    function getPastVotingPower(uint16 netuid, bytes32 hotkey, uint256 timepoint)
+    external
+    view
+    returns (uint256);
+
+    /// @notice Returns the sum of voting power at the end of a past block
+    /// @param timepoint Block number, must be in the past
+    function getPastTotalSupply(uint256 timepoint)
+    external
+    view
+    returns (uint256);
+}
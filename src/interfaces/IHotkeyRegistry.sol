@@ -0,0 +1,21 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+/// @notice Hotkey-to-voter delegation read by TreasuryController to sum many hotkeys into one vote
+interface IHotkeyRegistry {
+    /// @notice Voting address a hotkey is currently delegated to (address(0) if none)
+    /// @param hotkey Hotkey as bytes32 (public key)
+    function voterOf(bytes32 hotkey) external view returns (address);
+
+    /// @notice Voting address a hotkey was delegated to at the end of a past block
+    /// @param hotkey Hotkey as bytes32 (public key)
+    /// @param timepoint Block number, must be in the past
+    function pastVoterOf(bytes32 hotkey, uint256 timepoint) external view returns (address);
+
+    /// @notice Hotkeys currently delegated to a voter
+    function hotkeysOf(address voter) external view returns (bytes32[] memory);
+
+    /// @notice Hotkeys delegated to a voter at the end of a past block
+    /// @param timepoint Block number, must be in the past
+    function pastHotkeysOf(address voter, uint256 timepoint) external view returns (bytes32[] memory);
+}
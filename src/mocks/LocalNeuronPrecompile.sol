@@ -0,0 +1,56 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+/// @dev Address the local precompile sends burned funds to, so burns stay visible as a balance.
+address constant BURN_SINK = 0x000000000000000000000000000000000000dEaD;
+
+/// @title LocalNeuronPrecompile
+/// @notice Stand-in for the neuron registration precompile (0x804) in forge tests and on a local anvil node.
+/// @dev Its runtime code is placed at NEURON_PRECOMPILE with `vm.etch`/`anvil_setCode`, so the constructor
+///      never runs there and every setting lives in storage written through the setters.
+///      Like a payable precompile, it takes the burn out of msg.value: the burn goes to BURN_SINK and the
+///      rest goes back to the caller, so TreasuryVault's balance check sees exactly the burn.
+contract LocalNeuronPrecompile {
+    /// @notice Burn of the next registration per subnet, in wei. Zero means the subnet doesn't exist.
+    mapping(uint16 => uint256) public burn;
+    /// @notice Burn growth per registration in basis points, like subtensor's burn adjustment.
+    mapping(uint16 => uint256) public burnIncreaseBps;
+    mapping(uint16 => mapping(bytes32 => bool)) public registered;
+    mapping(uint16 => uint256) public registrations;
+
+    event Burned(uint16 indexed netuid, bytes32 hotkey, address indexed payer, uint256 amount);
+
+    error UnknownSubnet(uint16 netuid);
+    error AlreadyRegistered(uint16 netuid, bytes32 hotkey);
+    error InsufficientValue(uint256 value, uint256 burn);
+    error TransferFailed(address to, uint256 amount);
+
+    function setBurn(uint16 netuid, uint256 amount) external {
+        burn[netuid] = amount;
+    }
+
+    function setBurnIncreaseBps(uint16 netuid, uint256 bps) external {
+        burnIncreaseBps[netuid] = bps;
+    }
+
+    function burnedRegister(uint16 netuid, bytes32 hotkey) external payable {
+        uint256 amount = burn[netuid];
+        if (amount == 0) revert UnknownSubnet(netuid);
+        if (registered[netuid][hotkey]) revert AlreadyRegistered(netuid, hotkey);
+        if (msg.value < amount) revert InsufficientValue(msg.value, amount);
+
+        registered[netuid][hotkey] = true;
+        registrations[netuid] += 1;
+        burn[netuid] = amount + (amount * burnIncreaseBps[netuid]) / 10_000;
+
+        _send(BURN_SINK, amount);
+        _send(msg.sender, msg.value - amount);
+        emit Burned(netuid, hotkey, msg.sender, amount);
+    }
+
+    function _send(address to, uint256 amount) private {
+        if (amount == 0) return;
+        (bool success, ) = payable(to).call{ value: amount }("");
+        if (!success) revert TransferFailed(to, amount);
+    }
+}
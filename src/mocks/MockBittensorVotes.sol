@@ -1,25 +1,81 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.24;
 
+import "lib/openzeppelin-contracts/contracts/utils/math/SafeCast.sol";
+import "lib/openzeppelin-contracts/contracts/utils/structs/Checkpoints.sol";
 import "../interfaces/IBittensorVotes.sol";
+import "../interfaces/IBittensorVotesHistory.sol";
 
 /// @title MockBittensorVotes
 /// @notice Mock contract to simulate EMA stake voting power
-contract MockBittensorVotes is IBittensorVotes {
+/// @dev Every update is checkpointed per block, so past lookups are a binary search
+///      (O(log n) in the number of checkpoints) like OpenZeppelin's Votes.
+contract MockBittensorVotes is IBittensorVotes, IBittensorVotesHistory {
+    using Checkpoints for Checkpoints.Trace208;
+
+    /// @notice Fixed-point denominator of the EMA alpha (alpha = 1e18 means power follows stake)
+    uint256 public constant EMA_ALPHA_SCALE = 1e18;
+
     mapping(bytes32 => uint256) public votingPower;
     mapping(uint16 => bool) public trackingEnabled;
+    mapping(uint16 => uint64) public emaAlpha;
+    mapping(uint16 => uint64) public disableAtBlock;
 
-    // --- FIX: TO JEST TA KLUCZOWA ZMIANA ---
-    // Governor potrzebuje tej funkcji do obliczenia Quorum (4%).
-    // Zwracamy 100,000 TAO. Ty masz 10,000 głosów (10%), więc > 4% i propozycja przejdzie.
-    function getPastTotalSupply(uint256 /* timepoint */) external pure returns (uint256) {
-        return 100_000 * 1e9; // 100,000 TAO (w jednostkach RAO)
-    }
-    // ----------------------------------------
+    mapping(bytes32 => Checkpoints.Trace208) private _votingPowerCheckpoints;
+    Checkpoints.Trace208 private _totalSupplyCheckpoints;
+
+    /// @notice Lookup for a block that is not finalized yet
+    error FutureLookup(uint256 timepoint, uint48 clock);
+    /// @notice EMA alpha above EMA_ALPHA_SCALE
+    error InvalidEmaAlpha(uint64 alpha);
+    /// @notice EMA update after the subnet's disable block
+    error TrackingDisabled(uint16 netuid, uint64 disableAtBlock);
+    error LengthMismatch();
 
     function setVotingPower(uint16 netuid, bytes32 hotkey, uint256 amount) external {
+        _setVotingPower(netuid, hotkey, amount);
+    }
+
+    function setVotingPowerEmaAlpha(uint16 netuid, uint64 alpha) external {
+        if (alpha > EMA_ALPHA_SCALE) {
+            revert InvalidEmaAlpha(alpha);
+        }
+        emaAlpha[netuid] = alpha;
+    }
+
+    function setVotingPowerDisableAtBlock(uint16 netuid, uint64 blockNumber) external {
+        disableAtBlock[netuid] = blockNumber;
+    }
+
+    /// @notice Applies one EMA step: power = (alpha * stake + (1 - alpha) * power) / EMA_ALPHA_SCALE
+    /// @dev Stands in for the runtime's per-epoch update; one call is one step for every hotkey given.
+    function updateVotingPowerEma(uint16 netuid, bytes32[] calldata hotkeys, uint256[] calldata stakes) external {
+        if (hotkeys.length != stakes.length) {
+            revert LengthMismatch();
+        }
+        uint64 disableAt = disableAtBlock[netuid];
+        if (disableAt != 0 && block.number >= disableAt) {
+            revert TrackingDisabled(netuid, disableAt);
+        }
+
+        uint256 alpha = emaAlpha[netuid];
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            uint256 power =
+                (alpha * stakes[i] + (EMA_ALPHA_SCALE - alpha) * votingPower[hotkeys[i]]) / EMA_ALPHA_SCALE;
+            _setVotingPower(netuid, hotkeys[i], power);
+        }
+    }
+
+    function _setVotingPower(uint16 netuid, bytes32 hotkey, uint256 amount) private {
+        uint256 previous = votingPower[hotkey];
         votingPower[hotkey] = amount;
         trackingEnabled[netuid] = true;
+
+        uint48 currentBlock = SafeCast.toUint48(block.number);
+        _votingPowerCheckpoints[hotkey].push(currentBlock, SafeCast.toUint208(amount));
+        _totalSupplyCheckpoints.push(
+            currentBlock, SafeCast.toUint208(_totalSupplyCheckpoints.latest() - previous + amount)
+        );
     }
 
     function getVotingPower(uint16 /* netuid */, bytes32 hotkey)
@@ -31,6 +87,37 @@ contract MockBittensorVotes is IBittensorVotes {
         return votingPower[hotkey];
     }
 
+    function getPastVotingPower(uint16 /* netuid */, bytes32 hotkey, uint256 timepoint)
+    external
+    view
+    override
+    returns (uint256)
+    {
+        return _votingPowerCheckpoints[hotkey].upperLookupRecent(_validateTimepoint(timepoint));
+    }
+
+    /// @notice Sum of all voting power at a past block (used by the Governor for the 4% quorum)
+    /// @dev Earlier versions returned a fixed 100,000 TAO, i.e. a 4,000 TAO quorum whatever power was
+    ///      assigned. The quorum now follows the assigned power: 4% of the sum at the proposal snapshot.
+    function getPastTotalSupply(uint256 timepoint)
+    external
+    view
+    override
+    returns (uint256)
+    {
+        return _totalSupplyCheckpoints.upperLookupRecent(_validateTimepoint(timepoint));
+    }
+
+    /// @notice Sum of all current voting power
+    function getTotalSupply() external view returns (uint256) {
+        return _totalSupplyCheckpoints.latest();
+    }
+
+    /// @notice Number of voting power checkpoints recorded for a hotkey
+    function numCheckpoints(bytes32 hotkey) external view returns (uint256) {
+        return _votingPowerCheckpoints[hotkey].length();
+    }
+
     function isVotingPowerTrackingEnabled(uint16 netuid)
     external
     view
@@ -40,21 +127,29 @@ contract MockBittensorVotes is IBittensorVotes {
         return trackingEnabled[netuid];
     }
 
-    function getVotingPowerDisableAtBlock(uint16 /* netuid */)
+    function getVotingPowerDisableAtBlock(uint16 netuid)
     external
-    pure
+    view
     override
     returns (uint64)
     {
-        return 0;
+        return disableAtBlock[netuid];
     }
 
-    function getVotingPowerEmaAlpha(uint16 /* netuid */)
+    function getVotingPowerEmaAlpha(uint16 netuid)
     external
-    pure
+    view
     override
     returns (uint64)
     {
-        return 0;
+        return emaAlpha[netuid];
+    }
+
+    function _validateTimepoint(uint256 timepoint) private view returns (uint48) {
+        uint48 currentBlock = SafeCast.toUint48(block.number);
+        if (timepoint >= currentBlock) {
+            revert FutureLookup(timepoint, currentBlock);
+        }
+        return SafeCast.toUint48(timepoint);
     }
-}
\ No newline at end of file
+}
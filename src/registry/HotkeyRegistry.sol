@@ -0,0 +1,198 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "lib/openzeppelin-contracts/contracts/access/Ownable.sol";
+import "lib/openzeppelin-contracts/contracts/utils/math/SafeCast.sol";
+import "lib/openzeppelin-contracts/contracts/utils/structs/Checkpoints.sol";
+import "../interfaces/IHotkeyRegistry.sol";
+
+/// @title HotkeyRegistry
+/// @notice Delegates Bittensor hotkeys (bytes32 public keys, e.g. decoded SS58 validator hotkeys) to EVM
+///         voting addresses, so an operator with many hotkeys votes once with their summed power.
+/// @dev Hotkey ownership can't be proven from the EVM, so links are written by the owner (the timelock,
+///      script/Deploy.s.sol hands ownership to the vault), and only to voters that accept links with
+///      setAcceptsLinks. A voter can drop hotkeys delegated to it with release. The hotkey of an EVM
+///      account (bytes32(uint160(account))) is never linked to anyone but that account.
+///      Nothing here proves a hotkey agreed to its link: governance vouches for every link (README.md,
+///      "Hotkey delegation").
+///      Each hotkey's voter is checkpointed per block like MockBittensorVotes, so a hotkey moved to
+///      another voter during a vote still counts once at the proposal snapshot.
+///      A voter's hotkey list keeps hotkeys that left it (past lookups need them) until they have been
+///      gone for SNAPSHOT_RETENTION_BLOCKS, after which link reuses their slots. The list is capped at
+///      MAX_HOTKEYS_PER_VOTER, which bounds the gas of summing a vote.
+contract HotkeyRegistry is IHotkeyRegistry, Ownable {
+    using Checkpoints for Checkpoints.Trace160;
+
+    /// @notice Most hotkeys in a voter's list, linked or left within SNAPSHOT_RETENTION_BLOCKS
+    uint256 public constant MAX_HOTKEYS_PER_VOTER = 64;
+    /// @notice Blocks a hotkey that left a voter stays in its list (~1 day of 12s blocks)
+    /// @dev Must cover the governor's votingDelay + votingPeriod (0 + 10 blocks in TreasuryController):
+    ///      past lookups older than this may miss hotkeys whose slots were reused.
+    uint256 public constant SNAPSHOT_RETENTION_BLOCKS = 7200;
+
+    mapping(bytes32 => Checkpoints.Trace160) private _voterCheckpoints;
+    mapping(address => bytes32[]) private _hotkeys;
+    /// @dev Index in _hotkeys[voter] plus one, zero when not listed
+    mapping(address => mapping(bytes32 => uint256)) private _positions;
+
+    /// @notice Whether the owner may link hotkeys to a voter
+    mapping(address => bool) public acceptsLinks;
+
+    /// @notice Emitted when a hotkey is delegated to `voter` (address(0) when unlinked)
+    event HotkeyLinked(bytes32 indexed hotkey, address indexed previousVoter, address indexed voter);
+    event LinksAccepted(address indexed voter, bool accepted);
+
+    /// @notice Lookup for a block that is not finalized yet
+    error FutureLookup(uint256 timepoint, uint48 clock);
+    /// @notice Linking would take a voter past MAX_HOTKEYS_PER_VOTER
+    error TooManyHotkeys(address voter, uint256 limit);
+    /// @notice The voter hasn't called setAcceptsLinks(true)
+    error LinksNotAccepted(address voter);
+    /// @notice The hotkey is an EVM account's own and can only count for that account
+    error AccountHotkey(bytes32 hotkey, address account);
+    /// @notice release of a hotkey that isn't delegated to the caller
+    error NotLinked(bytes32 hotkey, address voter);
+    error InvalidVoter();
+
+    constructor(address initialOwner) Ownable(initialOwner) {}
+
+    /// @notice Lets the owner link hotkeys to the caller (or stops it; existing links stay)
+    function setAcceptsLinks(bool accepted) external {
+        acceptsLinks[msg.sender] = accepted;
+        emit LinksAccepted(msg.sender, accepted);
+    }
+
+    /// @notice Delegates `hotkeys` to `voter`, moving any that were delegated elsewhere
+    function link(address voter, bytes32[] calldata hotkeys) external onlyOwner {
+        if (voter == address(0)) {
+            revert InvalidVoter();
+        }
+        if (!acceptsLinks[voter]) {
+            revert LinksNotAccepted(voter);
+        }
+        bytes32[] storage listed = _hotkeys[voter];
+        bool compacted;
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            bytes32 hotkey = hotkeys[i];
+            // Left padded 20 bytes: the hotkey of an EVM account
+            if (uint256(hotkey) >> 160 == 0 && address(uint160(uint256(hotkey))) != voter) {
+                revert AccountHotkey(hotkey, address(uint160(uint256(hotkey))));
+            }
+            if (_positions[voter][hotkey] == 0) {
+                if (listed.length == MAX_HOTKEYS_PER_VOTER && !compacted) {
+                    _compact(voter);
+                    compacted = true;
+                }
+                if (listed.length == MAX_HOTKEYS_PER_VOTER) {
+                    revert TooManyHotkeys(voter, MAX_HOTKEYS_PER_VOTER);
+                }
+                listed.push(hotkey);
+                _positions[voter][hotkey] = listed.length;
+            }
+            _setVoter(hotkey, voter);
+        }
+    }
+
+    /// @notice Removes the delegation of `hotkeys`; they stay in their voter's list for past lookups
+    function unlink(bytes32[] calldata hotkeys) external onlyOwner {
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            _setVoter(hotkeys[i], address(0));
+        }
+    }
+
+    /// @notice Removes the delegation of `hotkeys` that are delegated to the caller
+    function release(bytes32[] calldata hotkeys) external {
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            if (address(_voterCheckpoints[hotkeys[i]].latest()) != msg.sender) {
+                revert NotLinked(hotkeys[i], msg.sender);
+            }
+            _setVoter(hotkeys[i], address(0));
+        }
+    }
+
+    function voterOf(bytes32 hotkey) external view override returns (address) {
+        return address(_voterCheckpoints[hotkey].latest());
+    }
+
+    function pastVoterOf(bytes32 hotkey, uint256 timepoint) external view override returns (address) {
+        return address(_voterCheckpoints[hotkey].upperLookupRecent(_validateTimepoint(timepoint)));
+    }
+
+    function hotkeysOf(address voter) external view override returns (bytes32[] memory hotkeys) {
+        bytes32[] storage listed = _hotkeys[voter];
+        hotkeys = new bytes32[](listed.length);
+        uint256 count;
+        for (uint256 i = 0; i < listed.length; i++) {
+            if (address(_voterCheckpoints[listed[i]].latest()) == voter) {
+                hotkeys[count++] = listed[i];
+            }
+        }
+        assembly ("memory-safe") {
+            mstore(hotkeys, count)
+        }
+    }
+
+    /// @dev Exact for the last SNAPSHOT_RETENTION_BLOCKS blocks, which covers every open proposal
+    function pastHotkeysOf(address voter, uint256 timepoint)
+    external
+    view
+    override
+    returns (bytes32[] memory hotkeys)
+    {
+        uint96 key = _validateTimepoint(timepoint);
+        bytes32[] storage listed = _hotkeys[voter];
+        hotkeys = new bytes32[](listed.length);
+        uint256 count;
+        for (uint256 i = 0; i < listed.length; i++) {
+            if (address(_voterCheckpoints[listed[i]].upperLookupRecent(key)) == voter) {
+                hotkeys[count++] = listed[i];
+            }
+        }
+        assembly ("memory-safe") {
+            mstore(hotkeys, count)
+        }
+    }
+
+    /// @notice Number of slots used in a voter's list (counts towards MAX_HOTKEYS_PER_VOTER)
+    /// @dev Includes hotkeys that left the voter less than SNAPSHOT_RETENTION_BLOCKS ago, and older
+    ///      ones until a link needs their slot
+    function linkedCount(address voter) external view returns (uint256) {
+        return _hotkeys[voter].length;
+    }
+
+    /// @dev Drops hotkeys that left `voter` at least SNAPSHOT_RETENTION_BLOCKS ago from its list
+    function _compact(address voter) private {
+        bytes32[] storage listed = _hotkeys[voter];
+        uint256 i = 0;
+        while (i < listed.length) {
+            bytes32 hotkey = listed[i];
+            (, uint96 since, uint160 current) = _voterCheckpoints[hotkey].latestCheckpoint();
+            if (address(current) == voter || since + SNAPSHOT_RETENTION_BLOCKS > block.number) {
+                i++;
+                continue;
+            }
+            bytes32 last = listed[listed.length - 1];
+            listed[i] = last;
+            _positions[voter][last] = i + 1;
+            listed.pop();
+            delete _positions[voter][hotkey];
+        }
+    }
+
+    function _setVoter(bytes32 hotkey, address voter) private {
+        address previous = address(_voterCheckpoints[hotkey].latest());
+        if (previous == voter) {
+            return;
+        }
+        _voterCheckpoints[hotkey].push(SafeCast.toUint96(block.number), uint160(voter));
+        emit HotkeyLinked(hotkey, previous, voter);
+    }
+
+    function _validateTimepoint(uint256 timepoint) private view returns (uint96) {
+        uint48 currentBlock = SafeCast.toUint48(block.number);
+        if (timepoint >= currentBlock) {
+            revert FutureLookup(timepoint, currentBlock);
+        }
+        return SafeCast.toUint96(timepoint);
+    }
+}
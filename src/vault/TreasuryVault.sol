@@ -23,8 +23,43 @@ contract TreasuryVault is TimelockController {
         address indexed caller
     );
 
+    /// @notice Recurring payout approved once by governance and claimed per period
+    /// @dev Packed into two slots; a claim only rewrites the second one.
+    struct PayoutStream {
+        address recipient;
+        uint64 start;
+        uint32 period;
+        uint128 amountPerPeriod;
+        uint32 periods;
+        uint32 claimed;
+    }
+
+    /// @notice Id of the next stream created by createStream
+    uint256 public nextStreamId;
+    mapping(uint256 => PayoutStream) public streams;
+
+    /// @notice Emitted when governance creates a payout stream
+    event StreamCreated(
+        uint256 indexed streamId,
+        address indexed recipient,
+        uint256 amountPerPeriod,
+        uint64 start,
+        uint32 period,
+        uint32 periods
+    );
+
+    /// @notice Emitted for every claim, covering all periods due at that time
+    event StreamClaimed(uint256 indexed streamId, address indexed recipient, uint32 periods, uint256 amount);
+
+    /// @notice Emitted when governance stops a stream; periods vested before it stay claimable
+    event StreamCancelled(uint256 indexed streamId, uint32 periods);
+
     error RefundError();
     error NeuronRegistrationFailed();
+    error InvalidStream();
+    error UnknownStream(uint256 streamId);
+    error NothingToClaim(uint256 streamId);
+    error StreamPaymentFailed(uint256 streamId);
 
     /// @notice Internal function to handle safe refunds to the user.
     /// @param recipient The address to receive the refund.
@@ -39,6 +74,8 @@ contract TreasuryVault is TimelockController {
     }
 
     /// @notice Registers a neuron using burned TAO.
+    /// @dev msg.value is forwarded to the payable precompile, which takes the burn and returns the rest;
+    ///      the vault's balance drop is the burn and the remainder is refunded to the caller.
     /// @param netuid Network UID.
     /// @param hotkey Hotkey to register.
     function registerNeuron(
@@ -53,7 +90,7 @@ contract TreasuryVault is TimelockController {
 
         uint256 balanceBefore = address(this).balance;
 
-        (bool success, ) = NEURON_PRECOMPILE.call{value: 0, gas: gasleft()}(
+        (bool success, ) = NEURON_PRECOMPILE.call{value: msg.value, gas: gasleft()}(
             data
         );
 
@@ -72,4 +109,95 @@ contract TreasuryVault is TimelockController {
         emit NeuronRegistration(netuid, hotkey, msg.sender);
         return true;
     }
+
+    /// @notice Creates a payout stream. Only callable by the vault itself, i.e. through an executed proposal.
+    /// @param recipient Receiver of every period's payout.
+    /// @param amountPerPeriod Amount in wei vested per period.
+    /// @param start Timestamp at which the first period starts.
+    /// @param period Period length in seconds.
+    /// @param periods Number of periods.
+    function createStream(
+        address recipient,
+        uint128 amountPerPeriod,
+        uint64 start,
+        uint32 period,
+        uint32 periods
+    ) external returns (uint256 streamId) {
+        if (msg.sender != address(this)) {
+            revert TimelockUnauthorizedCaller(msg.sender);
+        }
+        if (recipient == address(0) || amountPerPeriod == 0 || period == 0 || periods == 0) {
+            revert InvalidStream();
+        }
+
+        streamId = nextStreamId++;
+        streams[streamId] = PayoutStream({
+            recipient: recipient,
+            start: start,
+            period: period,
+            amountPerPeriod: amountPerPeriod,
+            periods: periods,
+            claimed: 0
+        });
+        emit StreamCreated(streamId, recipient, amountPerPeriod, start, period, periods);
+    }
+
+    /// @notice Stops a stream. Only callable by the vault itself, i.e. through an executed proposal.
+    /// @dev Periods that already vested remain claimable.
+    function cancelStream(uint256 streamId) external {
+        if (msg.sender != address(this)) {
+            revert TimelockUnauthorizedCaller(msg.sender);
+        }
+        PayoutStream storage stream = streams[streamId];
+        if (stream.recipient == address(0)) {
+            revert UnknownStream(streamId);
+        }
+
+        uint32 vested = _vestedPeriods(stream);
+        stream.periods = vested;
+        emit StreamCancelled(streamId, vested);
+    }
+
+    /// @notice Amount currently claimable from a stream and the number of periods it covers.
+    function claimable(uint256 streamId) external view returns (uint256 amount, uint32 periods) {
+        PayoutStream storage stream = streams[streamId];
+        if (stream.recipient == address(0)) {
+            revert UnknownStream(streamId);
+        }
+        periods = _vestedPeriods(stream) - stream.claimed;
+        amount = uint256(periods) * stream.amountPerPeriod;
+    }
+
+    /// @notice Pays every vested, unclaimed period of a stream to its recipient. Callable by anyone.
+    /// @dev O(1) regardless of how many periods are due.
+    function claim(uint256 streamId) external returns (uint256 amount) {
+        PayoutStream storage stream = streams[streamId];
+        address recipient = stream.recipient;
+        if (recipient == address(0)) {
+            revert UnknownStream(streamId);
+        }
+
+        uint32 vested = _vestedPeriods(stream);
+        uint32 due = vested - stream.claimed;
+        if (due == 0) {
+            revert NothingToClaim(streamId);
+        }
+
+        stream.claimed = vested;
+        amount = uint256(due) * stream.amountPerPeriod;
+
+        (bool success, ) = payable(recipient).call{value: amount}("");
+        if (!success) {
+            revert StreamPaymentFailed(streamId);
+        }
+        emit StreamClaimed(streamId, recipient, due, amount);
+    }
+
+    function _vestedPeriods(PayoutStream storage stream) private view returns (uint32) {
+        if (block.timestamp < stream.start) {
+            return 0;
+        }
+        uint256 elapsed = (block.timestamp - stream.start) / stream.period;
+        return elapsed < stream.periods ? uint32(elapsed) : stream.periods;
+    }
 }
@@ -0,0 +1,365 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "lib/openzeppelin-contracts/contracts/governance/utils/IVotes.sol";
+import "src/controller/TreasuryController.sol";
+import "src/mocks/LocalNeuronPrecompile.sol";
+import "src/mocks/MockBittensorVotes.sol";
+import "src/registry/HotkeyRegistry.sol";
+import "src/vault/TreasuryVault.sol";
+
+/// @title GovernanceGasBenchmark
+/// @notice Gas of the governance lifecycle as load grows: targets per proposal, voters per
+///         proposal (direct and signature votes, individually or batched through multicall), hotkeys
+///         delegated to one voter and concurrent proposals, plus TreasuryVault.registerNeuron and payout streams.
+/// @dev Numbers are recorded as named gas snapshots (snapshots/<group>.json).
+///      Run with the `bench` profile so every call is metered as its own transaction
+///      (cold storage access), e.g. `FOUNDRY_PROFILE=bench forge snapshot --match-path "test/benchmark/*"`.
+contract GovernanceGasBenchmark is Test {
+    uint16 constant NETUID = 1;
+    uint256 constant MIN_DELAY = 30;
+    uint256 constant PAYOUT = 1e18;
+    uint256 constant WHALE_POWER = 10_000e9;
+
+    MockBittensorVotes votes;
+    TreasuryVault vault;
+    TreasuryController governor;
+
+    address proposer = makeAddr("proposer");
+
+    function setUp() public {
+        votes = new MockBittensorVotes();
+
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        vault = new TreasuryVault(MIN_DELAY, proposers, executors, address(this));
+
+        governor = new TreasuryController(
+            IVotes(address(votes)), vault, address(votes), NETUID, true, IHotkeyRegistry(address(0))
+        );
+        vault.grantRole(vault.PROPOSER_ROLE(), address(governor));
+        vault.renounceRole(vault.DEFAULT_ADMIN_ROLE(), address(this));
+
+        _setPower(proposer, WHALE_POWER);
+        vm.deal(address(vault), 1_000_000e18);
+        // Votes are read at past blocks, so power must be set before the proposal block
+        vm.roll(vm.getBlockNumber() + 1);
+    }
+
+    receive() external payable {}
+
+    // --- Targets per proposal ---
+
+    function testGasLifecycleTargets1() public {
+        _benchmarkLifecycle(1);
+    }
+
+    function testGasLifecycleTargets10() public {
+        _benchmarkLifecycle(10);
+    }
+
+    function testGasLifecycleTargets50() public {
+        _benchmarkLifecycle(50);
+    }
+
+    function testGasLifecycleTargets200() public {
+        _benchmarkLifecycle(200);
+    }
+
+    // --- Voters per proposal ---
+
+    function testGasCastVoteVoters1() public {
+        _benchmarkVoters(1);
+    }
+
+    function testGasCastVoteVoters10() public {
+        _benchmarkVoters(10);
+    }
+
+    function testGasCastVoteVoters100() public {
+        _benchmarkVoters(100);
+    }
+
+    // --- Signed votes: one transaction per vote vs one multicall ---
+
+    function testGasCastVoteBySigIndividual10() public {
+        _benchmarkVotesBySig(10, false);
+    }
+
+    function testGasCastVoteBySigMulticall10() public {
+        _benchmarkVotesBySig(10, true);
+    }
+
+    function testGasCastVoteBySigIndividual100() public {
+        _benchmarkVotesBySig(100, false);
+    }
+
+    function testGasCastVoteBySigMulticall100() public {
+        _benchmarkVotesBySig(100, true);
+    }
+
+    // --- Hotkeys delegated to one voter (HotkeyRegistry) ---
+
+    function testGasCastVoteDelegatedHotkeys1() public {
+        _benchmarkDelegatedHotkeys(1);
+    }
+
+    function testGasCastVoteDelegatedHotkeys10() public {
+        _benchmarkDelegatedHotkeys(10);
+    }
+
+    function testGasCastVoteDelegatedHotkeys64() public {
+        _benchmarkDelegatedHotkeys(64);
+    }
+
+    // --- Concurrent proposals ---
+
+    function testGasConcurrentProposals1() public {
+        _benchmarkConcurrent(1);
+    }
+
+    function testGasConcurrentProposals10() public {
+        _benchmarkConcurrent(10);
+    }
+
+    function testGasConcurrentProposals50() public {
+        _benchmarkConcurrent(50);
+    }
+
+    // --- Neuron registration ---
+
+    function testGasRegisterNeuron() public {
+        LocalNeuronPrecompile precompile = _etchPrecompile(1e18);
+
+        // Exact payment: no refund
+        vault.registerNeuron{ value: 1e18 }(NETUID, bytes32(uint256(1)));
+        vm.snapshotGasLastCall("registerNeuron", "exact_value");
+
+        // Overpayment: burn plus refund to the caller
+        vault.registerNeuron{ value: 3e18 }(NETUID, bytes32(uint256(2)));
+        vm.snapshotGasLastCall("registerNeuron", "with_refund");
+
+        assertTrue(precompile.registered(NETUID, bytes32(uint256(2))));
+    }
+
+    // --- Payout streams ---
+
+    function testGasStreamClaim() public {
+        address recipient = makeAddr("grantee");
+        uint32 month = 30 days;
+
+        // One governance cycle creates the stream
+        address[] memory targets = new address[](1);
+        uint256[] memory values = new uint256[](1);
+        bytes[] memory calldatas = new bytes[](1);
+        targets[0] = address(vault);
+        calldatas[0] = abi.encodeCall(
+            TreasuryVault.createStream, (recipient, uint128(PAYOUT), uint64(vm.getBlockTimestamp()), month, 120)
+        );
+        string memory description = "Monthly grant stream";
+        bytes32 descriptionHash = keccak256(bytes(description));
+
+        vm.prank(proposer);
+        uint256 proposalId = governor.propose(targets, values, calldatas, description);
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(proposer);
+        governor.castVote(proposalId, 1);
+        vm.roll(governor.proposalDeadline(proposalId) + 1);
+        governor.queue(targets, values, calldatas, descriptionHash);
+        vm.warp(vm.getBlockTimestamp() + MIN_DELAY + 1);
+        governor.execute(targets, values, calldatas, descriptionHash);
+        vm.snapshotGasLastCall("stream", "execute_createStream");
+
+        // Claim cost must not depend on how many periods are due
+        vm.warp(vm.getBlockTimestamp() + month);
+        vault.claim(0);
+        vm.snapshotGasLastCall("stream", "claim_1_period");
+
+        vm.warp(vm.getBlockTimestamp() + 100 * uint256(month));
+        vault.claim(0);
+        vm.snapshotGasLastCall("stream", "claim_100_periods");
+
+        assertEq(recipient.balance, 101 * PAYOUT);
+    }
+
+    // --- Helpers ---
+
+    function _benchmarkLifecycle(uint256 targetCount) internal {
+        string memory group = string.concat("lifecycle_targets_", vm.toString(targetCount));
+        (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) = _payouts(targetCount);
+        string memory description = string.concat("Payout batch of ", vm.toString(targetCount));
+
+        vm.prank(proposer);
+        uint256 proposalId = governor.propose(targets, values, calldatas, description);
+        vm.snapshotGasLastCall(group, "propose");
+
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(proposer);
+        governor.castVote(proposalId, 1);
+        vm.snapshotGasLastCall(group, "castVote");
+
+        vm.roll(governor.proposalDeadline(proposalId) + 1);
+        bytes32 descriptionHash = keccak256(bytes(description));
+        governor.queue(targets, values, calldatas, descriptionHash);
+        vm.snapshotGasLastCall(group, "queue");
+
+        vm.warp(vm.getBlockTimestamp() + MIN_DELAY + 1);
+        governor.execute(targets, values, calldatas, descriptionHash);
+        vm.snapshotGasLastCall(group, "execute");
+
+        assertEq(targets[targetCount - 1].balance, PAYOUT);
+    }
+
+    function _benchmarkVoters(uint256 voterCount) internal {
+        string memory group = string.concat("castVote_voters_", vm.toString(voterCount));
+        for (uint256 i = 0; i < voterCount; i++) {
+            _setPower(address(uint160(0x10000 + i)), 100e9);
+        }
+        vm.roll(vm.getBlockNumber() + 1);
+        uint256 proposalId = _propose("Voters benchmark");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        uint256 total;
+        for (uint256 i = 0; i < voterCount; i++) {
+            address voter = address(uint160(0x10000 + i));
+            vm.prank(voter);
+            governor.castVote(proposalId, uint8(i % 3));
+            total += vm.lastCallGas().gasTotalUsed;
+        }
+        vm.snapshotGasLastCall(group, "last_vote");
+        vm.snapshotValue(group, "avg_vote", total / voterCount);
+        vm.snapshotValue(group, "total", total);
+    }
+
+    function _benchmarkVotesBySig(uint256 voterCount, bool batched) internal {
+        string memory group = string.concat(
+            batched ? "castVoteBySig_multicall_" : "castVoteBySig_individual_", vm.toString(voterCount)
+        );
+        for (uint256 i = 0; i < voterCount; i++) {
+            _setPower(vm.addr(0xB0000 + i), 100e9);
+        }
+        vm.roll(vm.getBlockNumber() + 1);
+        uint256 proposalId = _propose("Signed votes benchmark");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        address[] memory voters = new address[](voterCount);
+        bytes[] memory signatures = new bytes[](voterCount);
+        bytes[] memory calls = new bytes[](voterCount);
+        for (uint256 i = 0; i < voterCount; i++) {
+            voters[i] = vm.addr(0xB0000 + i);
+            signatures[i] = _signBallot(0xB0000 + i, proposalId, uint8(i % 3));
+            calls[i] = abi.encodeCall(governor.castVoteBySig, (proposalId, uint8(i % 3), voters[i], signatures[i]));
+        }
+
+        uint256 total;
+        if (batched) {
+            governor.multicall(calls);
+            total = vm.lastCallGas().gasTotalUsed;
+        } else {
+            for (uint256 i = 0; i < voterCount; i++) {
+                governor.castVoteBySig(proposalId, uint8(i % 3), voters[i], signatures[i]);
+                total += vm.lastCallGas().gasTotalUsed;
+            }
+        }
+        vm.snapshotValue(group, "per_vote", total / voterCount);
+        vm.snapshotValue(group, "total", total);
+        assertTrue(governor.hasVoted(proposalId, voters[voterCount - 1]));
+    }
+
+    /// @dev One vote summing `hotkeyCount` delegated hotkeys, on a governor wired to a registry
+    function _benchmarkDelegatedHotkeys(uint256 hotkeyCount) internal {
+        string memory group = string.concat("castVote_delegated_hotkeys_", vm.toString(hotkeyCount));
+        HotkeyRegistry registry = new HotkeyRegistry(address(this));
+        TreasuryController delegating = new TreasuryController(
+            IVotes(address(votes)), vault, address(votes), NETUID, true, registry
+        );
+        address operator = makeAddr("operator");
+        vm.prank(operator);
+        registry.setAcceptsLinks(true);
+        bytes32[] memory hotkeys = new bytes32[](hotkeyCount);
+        for (uint256 i = 0; i < hotkeyCount; i++) {
+            hotkeys[i] = keccak256(abi.encode("hotkey", i));
+            votes.setVotingPower(NETUID, hotkeys[i], 100e9);
+        }
+        registry.link(operator, hotkeys);
+        vm.snapshotGasLastCall(group, "link");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) = _payouts(1);
+        vm.prank(proposer);
+        uint256 proposalId = delegating.propose(targets, values, calldatas, "Delegated hotkeys benchmark");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        vm.prank(operator);
+        delegating.castVote(proposalId, 1);
+        vm.snapshotGasLastCall(group, "castVote");
+
+        (, uint256 forVotes, ) = delegating.proposalVotes(proposalId);
+        assertEq(forVotes, hotkeyCount * 100e9);
+    }
+
+    function _benchmarkConcurrent(uint256 openProposals) internal {
+        string memory group = string.concat("concurrent_proposals_", vm.toString(openProposals));
+        for (uint256 i = 1; i < openProposals; i++) {
+            _propose(string.concat("Open proposal ", vm.toString(i)));
+        }
+
+        uint256 proposalId = _propose("Measured proposal");
+        vm.snapshotGasLastCall(group, "propose");
+
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(proposer);
+        governor.castVote(proposalId, 1);
+        vm.snapshotGasLastCall(group, "castVote");
+    }
+
+    function _propose(string memory description) internal returns (uint256) {
+        (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) = _payouts(1);
+        vm.prank(proposer);
+        return governor.propose(targets, values, calldatas, description);
+    }
+
+    function _payouts(uint256 count)
+        internal
+        pure
+        returns (address[] memory targets, uint256[] memory values, bytes[] memory calldatas)
+    {
+        targets = new address[](count);
+        values = new uint256[](count);
+        calldatas = new bytes[](count);
+        for (uint256 i = 0; i < count; i++) {
+            targets[i] = address(uint160(0xA0000 + i));
+            values[i] = PAYOUT;
+        }
+    }
+
+    function _signBallot(uint256 privateKey, uint256 proposalId, uint8 support) internal view returns (bytes memory) {
+        address voter = vm.addr(privateKey);
+        bytes32 structHash =
+            keccak256(abi.encode(governor.BALLOT_TYPEHASH(), proposalId, support, voter, governor.nonces(voter)));
+        bytes32 domainSeparator = keccak256(
+            abi.encode(
+                keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"),
+                keccak256(bytes(governor.name())),
+                keccak256(bytes(governor.version())),
+                block.chainid,
+                address(governor)
+            )
+        );
+        (uint8 v, bytes32 r, bytes32 s) =
+            vm.sign(privateKey, keccak256(abi.encodePacked("\x19\x01", domainSeparator, structHash)));
+        return abi.encodePacked(r, s, v);
+    }
+
+    function _etchPrecompile(uint256 burn) internal returns (LocalNeuronPrecompile precompile) {
+        vm.etch(NEURON_PRECOMPILE, address(new LocalNeuronPrecompile()).code);
+        precompile = LocalNeuronPrecompile(NEURON_PRECOMPILE);
+        precompile.setBurn(NETUID, burn);
+    }
+
+    function _setPower(address account, uint256 amount) internal {
+        votes.setVotingPower(NETUID, bytes32(uint256(uint160(account))), amount);
+    }
+}
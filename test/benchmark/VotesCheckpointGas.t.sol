@@ -0,0 +1,96 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "lib/openzeppelin-contracts/contracts/governance/utils/IVotes.sol";
+import "src/controller/TreasuryController.sol";
+import "src/mocks/MockBittensorVotes.sol";
+import "src/vault/TreasuryVault.sol";
+
+/// @title VotesCheckpointGasBenchmark
+/// @notice Cost of snapshot lookups in MockBittensorVotes as checkpoint history grows.
+/// @dev Lookups are binary searches, so gas should grow with log2(history), not history.
+contract VotesCheckpointGasBenchmark is Test {
+    uint16 constant NETUID = 1;
+
+    MockBittensorVotes votes;
+    TreasuryController governor;
+
+    address voter = makeAddr("voter");
+    bytes32 hotkey;
+
+    function setUp() public {
+        votes = new MockBittensorVotes();
+
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        TreasuryVault vault = new TreasuryVault(30, proposers, executors, address(this));
+
+        governor = new TreasuryController(
+            IVotes(address(votes)), vault, address(votes), NETUID, true, IHotkeyRegistry(address(0))
+        );
+        vault.grantRole(vault.PROPOSER_ROLE(), address(governor));
+
+        hotkey = bytes32(uint256(uint160(voter)));
+    }
+
+    function testGasLookupHistory1() public {
+        _benchmarkLookups(1);
+    }
+
+    function testGasLookupHistory10() public {
+        _benchmarkLookups(10);
+    }
+
+    function testGasLookupHistory100() public {
+        _benchmarkLookups(100);
+    }
+
+    function testGasLookupHistory1000() public {
+        _benchmarkLookups(1000);
+    }
+
+    function testGasLookupHistory5000() public {
+        _benchmarkLookups(5000);
+    }
+
+    function _benchmarkLookups(uint256 historyLength) internal {
+        string memory group = string.concat("checkpoints_", vm.toString(historyLength));
+        uint256 firstBlock = vm.getBlockNumber();
+
+        for (uint256 i = 0; i < historyLength; i++) {
+            votes.setVotingPower(NETUID, hotkey, 10_000e9 + i);
+            vm.roll(vm.getBlockNumber() + 1);
+        }
+        vm.snapshotGasLastCall(group, "setVotingPower");
+
+        votes.getPastVotingPower(NETUID, hotkey, firstBlock);
+        vm.snapshotGasLastCall(group, "getPastVotingPower_oldest");
+
+        votes.getPastVotingPower(NETUID, hotkey, firstBlock + historyLength / 2);
+        vm.snapshotGasLastCall(group, "getPastVotingPower_middle");
+
+        votes.getPastVotingPower(NETUID, hotkey, vm.getBlockNumber() - 1);
+        vm.snapshotGasLastCall(group, "getPastVotingPower_latest");
+
+        votes.getPastTotalSupply(firstBlock + historyLength / 2);
+        vm.snapshotGasLastCall(group, "getPastTotalSupply_middle");
+
+        // End to end: castVote reads the voter's power at the proposal snapshot
+        address[] memory targets = new address[](1);
+        uint256[] memory values = new uint256[](1);
+        bytes[] memory calldatas = new bytes[](1);
+        targets[0] = address(0xBEEF);
+
+        vm.prank(voter);
+        uint256 proposalId = governor.propose(targets, values, calldatas, "Checkpoint benchmark");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        vm.prank(voter);
+        governor.castVote(proposalId, 1);
+        vm.snapshotGasLastCall(group, "castVote");
+
+        assertEq(votes.numCheckpoints(hotkey), historyLength);
+    }
+}
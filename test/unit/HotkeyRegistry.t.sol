@@ -0,0 +1,170 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "src/registry/HotkeyRegistry.sol";
+
+contract HotkeyRegistryTest is Test {
+    HotkeyRegistry registry;
+
+    address operator = makeAddr("operator");
+    address other = makeAddr("other");
+
+    function setUp() public {
+        registry = new HotkeyRegistry(address(this));
+        vm.prank(operator);
+        registry.setAcceptsLinks(true);
+        vm.prank(other);
+        registry.setAcceptsLinks(true);
+        vm.roll(10);
+    }
+
+    function testLinkDelegatesHotkeys() public {
+        bytes32[] memory hotkeys = _hotkeys(3);
+        registry.link(operator, hotkeys);
+
+        assertEq(registry.voterOf(hotkeys[0]), operator);
+        assertEq(registry.hotkeysOf(operator).length, 3);
+        assertEq(registry.hotkeysOf(other).length, 0);
+    }
+
+    function testRelinkMovesHotkeyAndKeepsHistory() public {
+        bytes32[] memory hotkeys = _hotkeys(2);
+        registry.link(operator, hotkeys);
+        vm.roll(11);
+
+        bytes32[] memory moved = new bytes32[](1);
+        moved[0] = hotkeys[1];
+        registry.link(other, moved);
+        vm.roll(12);
+
+        assertEq(registry.hotkeysOf(operator).length, 1);
+        assertEq(registry.hotkeysOf(other)[0], hotkeys[1]);
+        assertEq(registry.pastVoterOf(hotkeys[1], 10), operator);
+        assertEq(registry.pastVoterOf(hotkeys[1], 11), other);
+        assertEq(registry.pastHotkeysOf(operator, 10).length, 2);
+        assertEq(registry.pastHotkeysOf(operator, 11).length, 1);
+        assertEq(registry.pastHotkeysOf(other, 10).length, 0);
+    }
+
+    function testUnlinkClearsVoterButNotPastLookups() public {
+        bytes32[] memory hotkeys = _hotkeys(2);
+        registry.link(operator, hotkeys);
+        vm.roll(11);
+        registry.unlink(hotkeys);
+        vm.roll(12);
+
+        assertEq(registry.voterOf(hotkeys[0]), address(0));
+        assertEq(registry.hotkeysOf(operator).length, 0);
+        assertEq(registry.pastHotkeysOf(operator, 10).length, 2);
+        assertEq(registry.linkedCount(operator), 2);
+    }
+
+    function testRelinkingSameHotkeyDoesNotGrowList() public {
+        bytes32[] memory hotkeys = _hotkeys(2);
+        registry.link(operator, hotkeys);
+        registry.unlink(hotkeys);
+        registry.link(operator, hotkeys);
+
+        assertEq(registry.linkedCount(operator), 2);
+        assertEq(registry.hotkeysOf(operator).length, 2);
+    }
+
+    function testLinkIsCappedPerVoter() public {
+        uint256 limit = registry.MAX_HOTKEYS_PER_VOTER();
+        registry.link(operator, _hotkeys(limit));
+
+        bytes32[] memory extra = new bytes32[](1);
+        extra[0] = keccak256("extra");
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.TooManyHotkeys.selector, operator, limit));
+        registry.link(operator, extra);
+    }
+
+    function testUnlinkedSlotsAreReusedAfterRetention() public {
+        uint256 limit = registry.MAX_HOTKEYS_PER_VOTER();
+        bytes32[] memory hotkeys = _hotkeys(limit);
+        registry.link(operator, hotkeys);
+        vm.roll(11);
+        bytes32[] memory dropped = new bytes32[](2);
+        dropped[0] = hotkeys[0];
+        dropped[1] = hotkeys[5];
+        registry.unlink(dropped);
+
+        bytes32[] memory extra = new bytes32[](2);
+        extra[0] = keccak256("extra0");
+        extra[1] = keccak256("extra1");
+        // Still needed by snapshots within the retention window
+        vm.roll(11 + registry.SNAPSHOT_RETENTION_BLOCKS() - 1);
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.TooManyHotkeys.selector, operator, limit));
+        registry.link(operator, extra);
+
+        vm.roll(11 + registry.SNAPSHOT_RETENTION_BLOCKS());
+        registry.link(operator, extra);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        assertEq(registry.linkedCount(operator), limit);
+        assertEq(registry.hotkeysOf(operator).length, limit);
+        assertEq(registry.pastHotkeysOf(operator, vm.getBlockNumber() - 1).length, limit);
+        assertEq(registry.voterOf(hotkeys[0]), address(0));
+        assertEq(registry.voterOf(extra[1]), operator);
+    }
+
+    function testLinkRequiresVoterConsent() public {
+        address stranger = makeAddr("stranger");
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.LinksNotAccepted.selector, stranger));
+        registry.link(stranger, _hotkeys(1));
+
+        vm.prank(stranger);
+        registry.setAcceptsLinks(true);
+        registry.link(stranger, _hotkeys(1));
+        assertEq(registry.hotkeysOf(stranger).length, 1);
+    }
+
+    function testAccountHotkeyLinksOnlyToItsAccount() public {
+        bytes32[] memory hotkeys = new bytes32[](1);
+        hotkeys[0] = bytes32(uint256(uint160(other)));
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.AccountHotkey.selector, hotkeys[0], other));
+        registry.link(operator, hotkeys);
+
+        registry.link(other, hotkeys);
+        assertEq(registry.voterOf(hotkeys[0]), other);
+    }
+
+    function testVoterReleasesItsHotkeys() public {
+        bytes32[] memory hotkeys = _hotkeys(2);
+        registry.link(operator, hotkeys);
+
+        vm.prank(other);
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.NotLinked.selector, hotkeys[0], other));
+        registry.release(hotkeys);
+
+        vm.prank(operator);
+        registry.release(hotkeys);
+        assertEq(registry.voterOf(hotkeys[0]), address(0));
+        assertEq(registry.hotkeysOf(operator).length, 0);
+    }
+
+    function testOnlyOwnerLinks() public {
+        bytes32[] memory hotkeys = _hotkeys(1);
+        vm.prank(operator);
+        vm.expectRevert(abi.encodeWithSelector(Ownable.OwnableUnauthorizedAccount.selector, operator));
+        registry.link(operator, hotkeys);
+    }
+
+    function testLinkToZeroAddressReverts() public {
+        vm.expectRevert(HotkeyRegistry.InvalidVoter.selector);
+        registry.link(address(0), _hotkeys(1));
+    }
+
+    function testPastLookupRejectsCurrentBlock() public {
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.FutureLookup.selector, 10, 10));
+        registry.pastHotkeysOf(operator, 10);
+    }
+
+    function _hotkeys(uint256 count) internal pure returns (bytes32[] memory hotkeys) {
+        hotkeys = new bytes32[](count);
+        for (uint256 i = 0; i < count; i++) {
+            hotkeys[i] = keccak256(abi.encode(i));
+        }
+    }
+}
@@ -0,0 +1,78 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "src/mocks/LocalNeuronPrecompile.sol";
+import "src/vault/TreasuryVault.sol";
+
+contract LocalNeuronPrecompileTest is Test {
+    uint16 constant NETUID = 1;
+
+    TreasuryVault vault;
+    LocalNeuronPrecompile precompile;
+    address caller = makeAddr("caller");
+
+    function setUp() public {
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        vault = new TreasuryVault(30, proposers, executors, address(this));
+
+        // Same as anvil_setCode: runtime code only, settings written afterwards
+        vm.etch(NEURON_PRECOMPILE, address(new LocalNeuronPrecompile()).code);
+        precompile = LocalNeuronPrecompile(NEURON_PRECOMPILE);
+        precompile.setBurn(NETUID, 1e18);
+        vm.deal(caller, 10e18);
+    }
+
+    function testRegisterRecordsBurnAndRaisesNext() public {
+        precompile.setBurnIncreaseBps(NETUID, 500);
+
+        vm.expectEmit(true, true, false, true, NEURON_PRECOMPILE);
+        emit LocalNeuronPrecompile.Burned(NETUID, bytes32(uint256(1)), address(vault), 1e18);
+        vm.prank(caller);
+        vault.registerNeuron{ value: 2e18 }(NETUID, bytes32(uint256(1)));
+
+        assertTrue(precompile.registered(NETUID, bytes32(uint256(1))));
+        assertEq(precompile.registrations(NETUID), 1);
+        assertEq(precompile.burn(NETUID), 1.05e18);
+        // The precompile keeps the burn out of the forwarded value, so only the excess is refunded
+        assertEq(caller.balance, 9e18);
+        assertEq(address(vault).balance, 0);
+        assertEq(BURN_SINK.balance, 1e18);
+    }
+
+    function testRejectsDuplicateAndUnknownSubnet() public {
+        vm.startPrank(caller);
+        vault.registerNeuron{ value: 1e18 }(NETUID, bytes32(uint256(1)));
+
+        vm.expectRevert(TreasuryVault.NeuronRegistrationFailed.selector);
+        vault.registerNeuron{ value: 1e18 }(NETUID, bytes32(uint256(1)));
+
+        vm.expectRevert(TreasuryVault.NeuronRegistrationFailed.selector);
+        vault.registerNeuron{ value: 1e18 }(7, bytes32(uint256(2)));
+        vm.stopPrank();
+    }
+
+    function testRequiresBurnAsValue() public {
+        vm.expectRevert(abi.encodeWithSelector(LocalNeuronPrecompile.InsufficientValue.selector, 0.5e18, 1e18));
+        vm.prank(caller);
+        precompile.burnedRegister{ value: 0.5e18 }(NETUID, bytes32(uint256(1)));
+
+        // Through the vault an underpayment fails the registration instead of spending treasury funds
+        vm.deal(address(vault), 5e18);
+        vm.expectRevert(TreasuryVault.NeuronRegistrationFailed.selector);
+        vm.prank(caller);
+        vault.registerNeuron{ value: 0.5e18 }(NETUID, bytes32(uint256(1)));
+        assertEq(address(vault).balance, 5e18);
+    }
+
+    function testDirectCallRefundsExcess() public {
+        vm.prank(caller);
+        precompile.burnedRegister{ value: 3e18 }(NETUID, bytes32(uint256(1)));
+
+        assertEq(caller.balance, 9e18);
+        assertEq(BURN_SINK.balance, 1e18);
+        assertEq(NEURON_PRECOMPILE.balance, 0);
+    }
+}
@@ -46,4 +46,97 @@ contract MockBittensorVotesV2Test is Test {
         assertEq(votes.getVotingPowerDisableAtBlock(subnet1), 0);
         assertEq(votes.getVotingPowerEmaAlpha(subnet1), 0);
     }
+
+    function testPastVotingPowerFollowsCheckpoints() public {
+        vm.roll(10);
+        votes.setVotingPower(subnet1, hotkey1, 100);
+        vm.roll(20);
+        votes.setVotingPower(subnet1, hotkey1, 300);
+        vm.roll(30);
+
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 9), 0);
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 10), 100);
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 19), 100);
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 20), 300);
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 29), 300);
+        assertEq(votes.numCheckpoints(hotkey1), 2);
+    }
+
+    function testSameBlockUpdatesShareOneCheckpoint() public {
+        vm.roll(5);
+        votes.setVotingPower(subnet1, hotkey1, 100);
+        votes.setVotingPower(subnet1, hotkey1, 150);
+        vm.roll(6);
+
+        assertEq(votes.getPastVotingPower(subnet1, hotkey1, 5), 150);
+        assertEq(votes.numCheckpoints(hotkey1), 1);
+    }
+
+    function testPastTotalSupplyTracksSumOfPower() public {
+        vm.roll(10);
+        votes.setVotingPower(subnet1, hotkey1, 100);
+        votes.setVotingPower(subnet1, hotkey2, 50);
+        vm.roll(20);
+        votes.setVotingPower(subnet1, hotkey1, 20);
+        vm.roll(21);
+
+        assertEq(votes.getPastTotalSupply(9), 0);
+        assertEq(votes.getPastTotalSupply(10), 150);
+        assertEq(votes.getPastTotalSupply(20), 70);
+        assertEq(votes.getTotalSupply(), 70);
+    }
+
+    function testFutureLookupReverts() public {
+        vm.roll(10);
+        vm.expectRevert(abi.encodeWithSelector(MockBittensorVotes.FutureLookup.selector, 10, uint48(10)));
+        votes.getPastVotingPower(subnet1, hotkey1, 10);
+
+        vm.expectRevert(abi.encodeWithSelector(MockBittensorVotes.FutureLookup.selector, 11, uint48(10)));
+        votes.getPastTotalSupply(11);
+    }
+
+    function testEmaUpdateMovesPowerTowardsStake() public {
+        votes.setVotingPowerEmaAlpha(subnet1, 0.25e18);
+        assertEq(votes.getVotingPowerEmaAlpha(subnet1), 0.25e18);
+
+        bytes32[] memory hotkeys = new bytes32[](2);
+        uint256[] memory stakes = new uint256[](2);
+        hotkeys[0] = hotkey1;
+        hotkeys[1] = hotkey2;
+        stakes[0] = 1000;
+        stakes[1] = 0;
+        votes.setVotingPower(subnet1, hotkey2, 400);
+
+        votes.updateVotingPowerEma(subnet1, hotkeys, stakes);
+        assertEq(votes.getVotingPower(subnet1, hotkey1), 250);
+        assertEq(votes.getVotingPower(subnet1, hotkey2), 300);
+
+        votes.updateVotingPowerEma(subnet1, hotkeys, stakes);
+        // 0.25 * 1000 + 0.75 * 250 = 437.5, floored
+        assertEq(votes.getVotingPower(subnet1, hotkey1), 437);
+        assertEq(votes.getVotingPower(subnet1, hotkey2), 225);
+        assertEq(votes.getTotalSupply(), 662);
+    }
+
+    function testEmaAlphaAboveScaleReverts() public {
+        vm.expectRevert(abi.encodeWithSelector(MockBittensorVotes.InvalidEmaAlpha.selector, uint64(1e18 + 1)));
+        votes.setVotingPowerEmaAlpha(subnet1, 1e18 + 1);
+    }
+
+    function testEmaUpdateRevertsAfterDisableBlock() public {
+        votes.setVotingPowerDisableAtBlock(subnet1, 50);
+        assertEq(votes.getVotingPowerDisableAtBlock(subnet1), 50);
+
+        bytes32[] memory hotkeys = new bytes32[](1);
+        uint256[] memory stakes = new uint256[](1);
+        hotkeys[0] = hotkey1;
+        stakes[0] = 1000;
+
+        vm.roll(49);
+        votes.updateVotingPowerEma(subnet1, hotkeys, stakes);
+
+        vm.roll(50);
+        vm.expectRevert(abi.encodeWithSelector(MockBittensorVotes.TrackingDisabled.selector, subnet1, uint64(50)));
+        votes.updateVotingPowerEma(subnet1, hotkeys, stakes);
+    }
 }
@@ -0,0 +1,210 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "lib/openzeppelin-contracts/contracts/governance/utils/IVotes.sol";
+import "src/controller/TreasuryController.sol";
+import "src/mocks/MockBittensorVotes.sol";
+import "src/registry/HotkeyRegistry.sol";
+import "src/vault/TreasuryVault.sol";
+
+contract TreasuryControllerTest is Test {
+    uint16 constant NETUID = 1;
+
+    MockBittensorVotes votes;
+    TreasuryVault vault;
+
+    address proposer = makeAddr("proposer");
+    address voter = makeAddr("voter");
+
+    function setUp() public {
+        votes = new MockBittensorVotes();
+
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        vault = new TreasuryVault(30, proposers, executors, address(this));
+
+        _setPower(proposer, 10_000e9);
+        _setPower(voter, 1_000e9);
+        vm.roll(vm.getBlockNumber() + 1);
+    }
+
+    function testVotesAreReadAtProposalSnapshot() public {
+        TreasuryController governor = _deployGovernor(true);
+        uint256 proposalId = _propose(governor);
+
+        // Power gained after the snapshot block must not count
+        vm.roll(vm.getBlockNumber() + 1);
+        _setPower(voter, 50_000e9);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        vm.prank(voter);
+        governor.castVote(proposalId, 1);
+
+        (, uint256 forVotes, ) = governor.proposalVotes(proposalId);
+        assertEq(forVotes, 1_000e9);
+    }
+
+    function testQuorumUsesTotalSupplyAtSnapshot() public {
+        TreasuryController governor = _deployGovernor(true);
+        uint256 proposalId = _propose(governor);
+        uint256 snapshot = governor.proposalSnapshot(proposalId);
+
+        vm.roll(vm.getBlockNumber() + 1);
+        _setPower(voter, 50_000e9);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        assertEq(governor.quorum(snapshot), (11_000e9 * 4) / 100);
+    }
+
+    function testProposeUsesPowerBeforeCurrentBlock() public {
+        TreasuryController governor = _deployGovernor(true);
+        address newcomer = makeAddr("newcomer");
+        _setPower(newcomer, 10_000e9);
+
+        (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) = _payout();
+        vm.prank(newcomer);
+        vm.expectRevert();
+        governor.propose(targets, values, calldatas, "Too early");
+
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(newcomer);
+        governor.propose(targets, values, calldatas, "After one block");
+    }
+
+    function testWithoutHistoryVotesUseCurrentPower() public {
+        TreasuryController governor = _deployGovernor(false);
+        uint256 proposalId = _propose(governor);
+
+        vm.roll(vm.getBlockNumber() + 1);
+        _setPower(voter, 50_000e9);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        vm.prank(voter);
+        governor.castVote(proposalId, 1);
+
+        (, uint256 forVotes, ) = governor.proposalVotes(proposalId);
+        assertEq(forVotes, 50_000e9);
+    }
+
+    function testDelegatedHotkeysAreSummedIntoOneVote() public {
+        HotkeyRegistry registry = _deployRegistry();
+        TreasuryController governor = _deployGovernor(true, registry);
+        bytes32[] memory hotkeys = _hotkeys(30, 0xA000);
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            votes.setVotingPower(NETUID, hotkeys[i], 100e9);
+        }
+        registry.link(voter, hotkeys);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        uint256 proposalId = _propose(governor);
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(voter);
+        governor.castVote(proposalId, 1);
+
+        // 30 delegated hotkeys plus the voter's own, undelegated hotkey
+        (, uint256 forVotes, ) = governor.proposalVotes(proposalId);
+        assertEq(forVotes, 30 * 100e9 + 1_000e9);
+    }
+
+    function testOwnHotkeyCannotBeDelegatedAway() public {
+        HotkeyRegistry registry = _deployRegistry();
+        TreasuryController governor = _deployGovernor(true, registry);
+        address operator = _acceptingVoter(registry, "operator");
+        bytes32[] memory hotkeys = new bytes32[](1);
+        hotkeys[0] = bytes32(uint256(uint160(voter)));
+        vm.expectRevert(abi.encodeWithSelector(HotkeyRegistry.AccountHotkey.selector, hotkeys[0], voter));
+        registry.link(operator, hotkeys);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        assertEq(governor.getVotes(voter, vm.getBlockNumber() - 1), 1_000e9);
+        assertEq(governor.getVotes(operator, vm.getBlockNumber() - 1), 0);
+    }
+
+    function testRelinkDuringVoteDoesNotDoubleCount() public {
+        HotkeyRegistry registry = _deployRegistry();
+        TreasuryController governor = _deployGovernor(true, registry);
+        address operator = _acceptingVoter(registry, "operator");
+        bytes32[] memory hotkeys = _hotkeys(3, 0xB000);
+        for (uint256 i = 0; i < hotkeys.length; i++) {
+            votes.setVotingPower(NETUID, hotkeys[i], 500e9);
+        }
+        registry.link(voter, hotkeys);
+        vm.roll(vm.getBlockNumber() + 1);
+
+        uint256 proposalId = _propose(governor);
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(voter);
+        governor.castVote(proposalId, 1);
+
+        // Moved after the snapshot: the new voter gets nothing for this proposal
+        registry.link(operator, hotkeys);
+        vm.roll(vm.getBlockNumber() + 1);
+        vm.prank(operator);
+        governor.castVote(proposalId, 0);
+
+        (uint256 againstVotes, uint256 forVotes, ) = governor.proposalVotes(proposalId);
+        assertEq(forVotes, 3 * 500e9 + 1_000e9);
+        assertEq(againstVotes, 0);
+    }
+
+    function testWithoutHistoryDelegationsUseCurrentLinks() public {
+        HotkeyRegistry registry = _deployRegistry();
+        TreasuryController governor = _deployGovernor(false, registry);
+        bytes32[] memory hotkeys = _hotkeys(2, 0xC000);
+        votes.setVotingPower(NETUID, hotkeys[0], 200e9);
+        votes.setVotingPower(NETUID, hotkeys[1], 300e9);
+        registry.link(voter, hotkeys);
+
+        assertEq(governor.getVotes(voter, vm.getBlockNumber() - 1), 1_500e9);
+        registry.unlink(hotkeys);
+        assertEq(governor.getVotes(voter, vm.getBlockNumber() - 1), 1_000e9);
+    }
+
+    function _deployGovernor(bool historical) internal returns (TreasuryController) {
+        return _deployGovernor(historical, IHotkeyRegistry(address(0)));
+    }
+
+    function _deployGovernor(bool historical, IHotkeyRegistry registry) internal returns (TreasuryController) {
+        return new TreasuryController(IVotes(address(votes)), vault, address(votes), NETUID, historical, registry);
+    }
+
+    /// @dev Registry owned by the test, with `voter` accepting links
+    function _deployRegistry() internal returns (HotkeyRegistry registry) {
+        registry = new HotkeyRegistry(address(this));
+        vm.prank(voter);
+        registry.setAcceptsLinks(true);
+    }
+
+    function _acceptingVoter(HotkeyRegistry registry, string memory name) internal returns (address account) {
+        account = makeAddr(name);
+        vm.prank(account);
+        registry.setAcceptsLinks(true);
+    }
+
+    function _hotkeys(uint256 count, uint256 seed) internal pure returns (bytes32[] memory hotkeys) {
+        hotkeys = new bytes32[](count);
+        for (uint256 i = 0; i < count; i++) {
+            hotkeys[i] = keccak256(abi.encode(seed, i));
+        }
+    }
+
+    function _propose(TreasuryController governor) internal returns (uint256) {
+        (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) = _payout();
+        vm.prank(proposer);
+        return governor.propose(targets, values, calldatas, "Grant");
+    }
+
+    function _payout() internal pure returns (address[] memory targets, uint256[] memory values, bytes[] memory calldatas) {
+        targets = new address[](1);
+        values = new uint256[](1);
+        calldatas = new bytes[](1);
+        targets[0] = address(0xBEEF);
+        values[0] = 1e18;
+    }
+
+    function _setPower(address account, uint256 amount) internal {
+        votes.setVotingPower(NETUID, bytes32(uint256(uint160(account))), amount);
+    }
+}
@@ -0,0 +1,147 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "lib/openzeppelin-contracts/contracts/governance/TimelockController.sol";
+import "src/vault/TreasuryVault.sol";
+
+contract RejectingRecipient {
+    receive() external payable {
+        revert();
+    }
+}
+
+contract TreasuryVaultStreamsTest is Test {
+    uint32 constant MONTH = 30 days;
+    uint128 constant GRANT = 5e18;
+
+    TreasuryVault vault;
+    address recipient = makeAddr("recipient");
+
+    function setUp() public {
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        vault = new TreasuryVault(30, proposers, executors, address(this));
+        vm.deal(address(vault), 1_000e18);
+    }
+
+    function testCreateStreamOnlyByVault() public {
+        vm.expectRevert(abi.encodeWithSelector(TimelockController.TimelockUnauthorizedCaller.selector, address(this)));
+        vault.createStream(recipient, GRANT, uint64(vm.getBlockTimestamp()), MONTH, 12);
+    }
+
+    function testCreateStreamRejectsInvalidParameters() public {
+        vm.startPrank(address(vault));
+        vm.expectRevert(TreasuryVault.InvalidStream.selector);
+        vault.createStream(address(0), GRANT, uint64(vm.getBlockTimestamp()), MONTH, 12);
+        vm.expectRevert(TreasuryVault.InvalidStream.selector);
+        vault.createStream(recipient, 0, uint64(vm.getBlockTimestamp()), MONTH, 12);
+        vm.expectRevert(TreasuryVault.InvalidStream.selector);
+        vault.createStream(recipient, GRANT, uint64(vm.getBlockTimestamp()), 0, 12);
+        vm.expectRevert(TreasuryVault.InvalidStream.selector);
+        vault.createStream(recipient, GRANT, uint64(vm.getBlockTimestamp()), MONTH, 0);
+        vm.stopPrank();
+    }
+
+    function testClaimPaysVestedPeriods() public {
+        uint256 streamId = _createStream(12);
+
+        vm.expectRevert(abi.encodeWithSelector(TreasuryVault.NothingToClaim.selector, streamId));
+        vault.claim(streamId);
+
+        vm.warp(vm.getBlockTimestamp() + 3 * MONTH + 1);
+        (uint256 amount, uint32 periods) = vault.claimable(streamId);
+        assertEq(periods, 3);
+        assertEq(amount, 3 * uint256(GRANT));
+
+        // Anyone can trigger the claim; funds always go to the recipient
+        vm.prank(makeAddr("keeper"));
+        vault.claim(streamId);
+        assertEq(recipient.balance, 3 * uint256(GRANT));
+
+        vm.warp(vm.getBlockTimestamp() + MONTH);
+        vault.claim(streamId);
+        assertEq(recipient.balance, 4 * uint256(GRANT));
+    }
+
+    function testClaimStopsAtLastPeriod() public {
+        uint256 streamId = _createStream(3);
+
+        vm.warp(vm.getBlockTimestamp() + 10 * MONTH);
+        vault.claim(streamId);
+        assertEq(recipient.balance, 3 * uint256(GRANT));
+
+        vm.expectRevert(abi.encodeWithSelector(TreasuryVault.NothingToClaim.selector, streamId));
+        vault.claim(streamId);
+    }
+
+    function testStreamStartingInTheFuture() public {
+        vm.prank(address(vault));
+        uint256 streamId = vault.createStream(recipient, GRANT, uint64(vm.getBlockTimestamp() + 7 days), MONTH, 2);
+
+        vm.warp(vm.getBlockTimestamp() + 7 days + MONTH - 1);
+        (, uint32 periods) = vault.claimable(streamId);
+        assertEq(periods, 0);
+
+        vm.warp(vm.getBlockTimestamp() + 1);
+        (, periods) = vault.claimable(streamId);
+        assertEq(periods, 1);
+    }
+
+    function testCancelKeepsVestedPeriodsClaimable() public {
+        uint256 streamId = _createStream(12);
+        vm.warp(vm.getBlockTimestamp() + 2 * MONTH);
+
+        vm.expectRevert(abi.encodeWithSelector(TimelockController.TimelockUnauthorizedCaller.selector, address(this)));
+        vault.cancelStream(streamId);
+
+        vm.prank(address(vault));
+        vault.cancelStream(streamId);
+
+        vm.warp(vm.getBlockTimestamp() + 6 * MONTH);
+        vault.claim(streamId);
+        assertEq(recipient.balance, 2 * uint256(GRANT));
+    }
+
+    function testUnknownStreamReverts() public {
+        vm.expectRevert(abi.encodeWithSelector(TreasuryVault.UnknownStream.selector, 7));
+        vault.claim(7);
+        vm.expectRevert(abi.encodeWithSelector(TreasuryVault.UnknownStream.selector, 7));
+        vault.claimable(7);
+    }
+
+    function testFailedPaymentDoesNotConsumePeriods() public {
+        address rejecting = address(new RejectingRecipient());
+        vm.prank(address(vault));
+        uint256 streamId = vault.createStream(rejecting, GRANT, uint64(vm.getBlockTimestamp()), MONTH, 12);
+        vm.warp(vm.getBlockTimestamp() + MONTH);
+
+        vm.expectRevert(abi.encodeWithSelector(TreasuryVault.StreamPaymentFailed.selector, streamId));
+        vault.claim(streamId);
+
+        (, uint32 periods) = vault.claimable(streamId);
+        assertEq(periods, 1);
+    }
+
+    function testFuzzClaimedNeverExceedsTotal(uint32 periods, uint64 elapsed) public {
+        periods = uint32(bound(periods, 1, 100));
+        elapsed = uint64(bound(elapsed, 0, uint64(MONTH) * 200));
+        uint256 streamId = _createStream(periods);
+
+        vm.warp(vm.getBlockTimestamp() + elapsed / 2);
+        (uint256 first, ) = vault.claimable(streamId);
+        if (first > 0) vault.claim(streamId);
+        vm.warp(vm.getBlockTimestamp() + elapsed - elapsed / 2);
+        (uint256 second, ) = vault.claimable(streamId);
+        if (second > 0) vault.claim(streamId);
+
+        assertLe(recipient.balance, uint256(periods) * GRANT);
+        assertEq(recipient.balance, first + second);
+    }
+
+    function _createStream(uint32 periods) internal returns (uint256) {
+        vm.prank(address(vault));
+        return vault.createStream(recipient, GRANT, uint64(vm.getBlockTimestamp()), MONTH, periods);
+    }
+}
@@ -0,0 +1,155 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import "forge-std/Test.sol";
+import "lib/openzeppelin-contracts/contracts/governance/utils/IVotes.sol";
+import "src/controller/TreasuryController.sol";
+import "src/mocks/MockBittensorVotes.sol";
+import "src/vault/TreasuryVault.sol";
+
+contract TreasuryControllerVoteBySigTest is Test {
+    uint16 constant NETUID = 1;
+    uint256 constant VOTER_POWER = 1_000e9;
+
+    MockBittensorVotes votes;
+    TreasuryVault vault;
+    TreasuryController governor;
+
+    address proposer = makeAddr("proposer");
+    address relayer = makeAddr("relayer");
+    uint256[] voterKeys;
+
+    function setUp() public {
+        votes = new MockBittensorVotes();
+
+        address[] memory proposers = new address[](0);
+        address[] memory executors = new address[](1);
+        executors[0] = address(0);
+        vault = new TreasuryVault(30, proposers, executors, address(this));
+        governor = new TreasuryController(
+            IVotes(address(votes)), vault, address(votes), NETUID, true, IHotkeyRegistry(address(0))
+        );
+
+        _setPower(proposer, 10_000e9);
+        for (uint256 i = 0; i < 3; i++) {
+            voterKeys.push(0xA11CE + i);
+            _setPower(vm.addr(voterKeys[i]), VOTER_POWER);
+        }
+        vm.roll(vm.getBlockNumber() + 1);
+    }
+
+    function testMulticallCastsSignedVotes() public {
+        uint256 proposalId = _propose("Grant");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        bytes[] memory calls = new bytes[](3);
+        for (uint256 i = 0; i < 3; i++) {
+            calls[i] = _castVoteBySig(voterKeys[i], proposalId, i == 2 ? 0 : 1, 0);
+        }
+
+        // The relayer pays for the transaction; votes count for the signers
+        vm.prank(relayer);
+        governor.multicall(calls);
+
+        (uint256 against, uint256 forVotes, ) = governor.proposalVotes(proposalId);
+        assertEq(forVotes, 2 * VOTER_POWER);
+        assertEq(against, VOTER_POWER);
+        assertFalse(governor.hasVoted(proposalId, relayer));
+        for (uint256 i = 0; i < 3; i++) {
+            address voter = vm.addr(voterKeys[i]);
+            assertTrue(governor.hasVoted(proposalId, voter));
+            assertEq(governor.nonces(voter), 1);
+        }
+    }
+
+    function testInvalidSignatureRevertsBatch() public {
+        uint256 proposalId = _propose("Grant");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        address voter = vm.addr(voterKeys[1]);
+        bytes[] memory calls = new bytes[](2);
+        calls[0] = _castVoteBySig(voterKeys[0], proposalId, 1, 0);
+        // Signed by the wrong key
+        calls[1] = abi.encodeCall(
+            governor.castVoteBySig, (proposalId, 1, voter, _signBallot(voterKeys[2], voter, proposalId, 1, 0))
+        );
+
+        vm.expectRevert(abi.encodeWithSelector(IGovernor.GovernorInvalidSignature.selector, voter));
+        governor.multicall(calls);
+        assertFalse(governor.hasVoted(proposalId, vm.addr(voterKeys[0])));
+    }
+
+    function testSignatureCannotBeReplayed() public {
+        uint256 proposalId = _propose("Grant");
+        uint256 otherProposalId = _propose("Other grant");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        address voter = vm.addr(voterKeys[0]);
+        bytes memory signature = _signBallot(voterKeys[0], voter, proposalId, 1, 0);
+        governor.castVoteBySig(proposalId, 1, voter, signature);
+
+        // The nonce is spent, so the same ballot is no longer valid anywhere
+        vm.expectRevert(abi.encodeWithSelector(IGovernor.GovernorInvalidSignature.selector, voter));
+        governor.castVoteBySig(otherProposalId, 1, voter, signature);
+    }
+
+    function testBatchAppliesConsecutiveNoncesInOrder() public {
+        uint256 first = _propose("Grant");
+        uint256 second = _propose("Other grant");
+        vm.roll(vm.getBlockNumber() + 1);
+
+        bytes[] memory calls = new bytes[](2);
+        calls[0] = _castVoteBySig(voterKeys[0], first, 1, 0);
+        calls[1] = _castVoteBySig(voterKeys[0], second, 0, 1);
+        governor.multicall(calls);
+
+        address voter = vm.addr(voterKeys[0]);
+        assertTrue(governor.hasVoted(first, voter));
+        assertTrue(governor.hasVoted(second, voter));
+        assertEq(governor.nonces(voter), 2);
+    }
+
+    function _castVoteBySig(uint256 privateKey, uint256 proposalId, uint8 support, uint256 nonce)
+        internal
+        view
+        returns (bytes memory)
+    {
+        address voter = vm.addr(privateKey);
+        bytes memory signature = _signBallot(privateKey, voter, proposalId, support, nonce);
+        return abi.encodeCall(governor.castVoteBySig, (proposalId, support, voter, signature));
+    }
+
+    function _signBallot(uint256 privateKey, address voter, uint256 proposalId, uint8 support, uint256 nonce)
+        internal
+        view
+        returns (bytes memory)
+    {
+        bytes32 structHash = keccak256(abi.encode(governor.BALLOT_TYPEHASH(), proposalId, support, voter, nonce));
+        bytes32 domainSeparator = keccak256(
+            abi.encode(
+                keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"),
+                keccak256(bytes(governor.name())),
+                keccak256(bytes(governor.version())),
+                block.chainid,
+                address(governor)
+            )
+        );
+        (uint8 v, bytes32 r, bytes32 s) =
+            vm.sign(privateKey, keccak256(abi.encodePacked("\x19\x01", domainSeparator, structHash)));
+        return abi.encodePacked(r, s, v);
+    }
+
+    function _propose(string memory description) internal returns (uint256) {
+        address[] memory targets = new address[](1);
+        uint256[] memory values = new uint256[](1);
+        bytes[] memory calldatas = new bytes[](1);
+        targets[0] = address(0xBEEF);
+        values[0] = 1e18;
+        vm.prank(proposer);
+        return governor.propose(targets, values, calldatas, description);
+    }
+
+    function _setPower(address account, uint256 amount) internal {
+        votes.setVotingPower(NETUID, bytes32(uint256(uint160(account))), amount);
+    }
+}
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The tools import their helpers as `utils.x`, so tests do the same
+tools_dir = Path(__file__).resolve().parent.parent / "tools"
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
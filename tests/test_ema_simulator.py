@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from utils.ema_simulator import ALPHA_SCALE, NEVER, alpha_from_raw, first_crossing, simulate, stake_grid
+
+
+def reference_ema(stake, alpha, initial, step_rows):
+    """One step at a time, the way the contract applies them."""
+    power = np.empty_like(stake)
+    current = np.array(initial, dtype=np.float64)
+    for row in range(len(stake)):
+        if row in step_rows:
+            current = alpha * stake[row] + (1 - alpha) * current
+        power[row] = current
+    return power
+
+
+def test_alpha_from_raw():
+    assert alpha_from_raw(ALPHA_SCALE // 4) == 0.25
+
+
+def test_stake_grid_forward_fills_and_keeps_the_last_event_of_a_block():
+    grid = stake_grid(
+        blocks=[9, 10, 12, 12, 13, 20],
+        columns=[1, 0, 0, 0, 1, 0],
+        stakes=[7, 1, 2, 3, 4, 99],
+        start_block=10, n_blocks=5, n_hotkeys=2, initial=[5, 6],
+    )
+    assert grid.tolist() == [
+        [1, 7],  # block 9 carries into row 0, block 10 overrides the initial stake
+        [1, 7],
+        [3, 7],  # two events in block 12: the later one wins
+        [3, 4],
+        [3, 4],  # block 20 is past the grid
+    ]
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 128])
+def test_simulate_matches_a_step_by_step_ema(chunk):
+    rng = np.random.default_rng(7)
+    stake = rng.integers(0, 10**12, size=(50, 4)).astype(np.float64)
+    initial = [10**11, 0, 5, 10**12]
+    power = simulate(stake, 0.1, initial_power=initial, interval=3, chunk=chunk)
+    expected = reference_ema(stake, 0.1, initial, set(range(0, 50, 3)))
+    np.testing.assert_allclose(power, expected, rtol=1e-9)
+
+
+def test_simulate_freezes_power_from_the_disable_row():
+    stake = np.full((10, 1), 100.0)
+    power = simulate(stake, 0.5, disable_row=3)
+    assert power[:, 0].tolist() == [50, 75, 87.5] + [87.5] * 7
+
+
+def test_first_crossing():
+    power = np.array([[0, 5], [10, 5], [20, 5]])
+    assert first_crossing(power, threshold=10).tolist() == [1, NEVER]
@@ -0,0 +1,146 @@
+import pytest
+from eth_account import Account
+from web3 import Web3
+
+from utils.inclusion import InclusionError, InclusionTracker, TransactionStuck
+
+RECIPIENT = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+GWEI = 10**9
+
+
+class FakeEth:
+    """
+    The w3.eth reads the tracker makes. Sent transactions go to `pool`;
+    `mine(tx_hash)` includes one, and `reject` holds error messages for the
+    next broadcasts.
+    """
+
+    def __init__(self):
+        self.block_number = 100
+        self.mined_nonce = 0
+        self.pool = []
+        self.receipts = {}
+        self.reject = []
+
+    def send_raw_transaction(self, raw):
+        if self.reject:
+            raise ValueError(self.reject.pop(0))
+        tx_hash = Web3.keccak(raw)
+        self.pool.append(tx_hash)
+        return tx_hash
+
+    def mine(self, tx_hash):
+        self.block_number += 1
+        self.mined_nonce += 1
+        self.receipts[bytes(tx_hash)] = {"transactionHash": tx_hash, "blockNumber": self.block_number, "status": 1}
+
+    def get_transaction_count(self, address, block):
+        return self.mined_nonce
+
+    def get_transaction_receipt(self, tx_hash):
+        if bytes(tx_hash) not in self.receipts:
+            raise ValueError("not found")
+        return self.receipts[bytes(tx_hash)]
+
+
+class FakeWeb3:
+    # No batch_requests: batch_read reads one call at a time
+    def __init__(self):
+        self.eth = FakeEth()
+
+    from_wei = staticmethod(Web3.from_wei)
+
+
+@pytest.fixture
+def w3():
+    return FakeWeb3()
+
+
+@pytest.fixture
+def account():
+    return Account.from_key(b"\x01" * 32)
+
+
+def transaction(nonce=0, gas_price=10 * GWEI):
+    return {"to": RECIPIENT, "value": 1, "gas": 21_000, "gasPrice": gas_price, "nonce": nonce, "chainId": 31337}
+
+
+def tracker_for(w3, account, **kwargs):
+    return InclusionTracker(w3, account, stuck_after=0, poll_interval=0, **kwargs)
+
+
+def test_wait_returns_the_receipt_of_a_mined_transaction(w3, account):
+    tracker = tracker_for(w3, account)
+    pending = tracker.send(transaction())
+    w3.eth.mine(pending.tx_hash)
+    assert tracker.wait([pending]) == [pending.receipt]
+    assert pending.attempts == 1 and pending.blocks_to_inclusion == 1
+
+
+def test_a_stuck_transaction_is_rebroadcast_at_a_higher_fee(w3, account):
+    tracker = tracker_for(w3, account, bump_percent=12.5)
+    pending = tracker.send(transaction())
+    assert tracker._bump(pending)
+    assert pending.attempts == 2
+    assert pending.fee == int(10 * GWEI * 1.125)
+    # Whichever version is mined ends the wait
+    w3.eth.mine(pending.hashes[0])
+    tracker.wait([pending])
+    assert pending.tx_hash == pending.hashes[0]
+
+
+def test_bumping_stops_at_the_fee_cap(w3, account):
+    tracker = tracker_for(w3, account, bump_percent=50, max_fee=12 * GWEI)
+    pending = tracker.send(transaction())
+    assert tracker._bump(pending) and pending.fee == 12 * GWEI
+    assert not tracker._bump(pending)
+    assert pending.attempts == 2
+
+
+def test_an_underpriced_rejection_ends_the_bumps(w3, account):
+    tracker = tracker_for(w3, account)
+    pending = tracker.send(transaction())
+    w3.eth.reject.append("replacement transaction underpriced")
+    assert not tracker._bump(pending)
+    assert pending.bump_rejected and pending.fee == 10 * GWEI
+    # No further broadcast is attempted
+    sent = len(w3.eth.pool)
+    assert not tracker._bump(pending)
+    assert len(w3.eth.pool) == sent and pending.attempts == 1
+
+
+def test_wait_gives_up_on_an_underpriced_transaction_at_the_timeout(w3, account):
+    tracker = tracker_for(w3, account, timeout=0)
+    pending = tracker.send(transaction())
+    w3.eth.reject.append("transaction underpriced")
+    with pytest.raises(TransactionStuck) as stuck:
+        tracker.wait([pending])
+    assert stuck.value.pending == [pending]
+    assert pending.bump_rejected
+
+
+def test_an_already_known_bump_is_tracked(w3, account):
+    tracker = tracker_for(w3, account)
+    pending = tracker.send(transaction())
+    w3.eth.reject.append("already known")
+    assert tracker._bump(pending)
+    assert pending.attempts == 2 and pending.fee > 10 * GWEI
+    w3.eth.mine(pending.hashes[1])
+    tracker.wait([pending])
+    assert pending.tx_hash == pending.hashes[1]
+
+
+def test_a_nonce_used_by_another_transaction_is_an_error(w3, account):
+    tracker = tracker_for(w3, account)
+    pending = tracker.send(transaction())
+    w3.eth.mine(b"\xff" * 32)
+    with pytest.raises(InclusionError, match="nonce 0 was used"):
+        tracker.wait([pending])
+
+
+def test_other_rebroadcast_errors_are_raised(w3, account):
+    tracker = tracker_for(w3, account)
+    pending = tracker.send(transaction())
+    w3.eth.reject.append("insufficient funds for gas * price + value")
+    with pytest.raises(ValueError, match="insufficient funds"):
+        tracker._bump(pending)
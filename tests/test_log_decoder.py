@@ -0,0 +1,106 @@
+import pytest
+from eth_abi import encode as abi_encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from utils.log_decoder import KNOWN_EVENTS, LogDecoder, event_abi_from_signature
+
+GOVERNOR = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+VOTER = Web3.to_checksum_address(f"0x{0xABC:040x}")
+TARGET = Web3.to_checksum_address(f"0x{0xBEEF:040x}")
+
+
+@pytest.fixture(scope="module")
+def decoder():
+    # Built from the signatures so the tests don't depend on forge artifacts
+    return LogDecoder([[event_abi_from_signature(signature) for signature in KNOWN_EVENTS]])
+
+
+def word(value):
+    return abi_encode(["uint256"], [value])
+
+
+def address_topic(address):
+    return abi_encode(["address"], [address])
+
+
+def make_log(topics, data, index=0):
+    return {
+        "address": GOVERNOR,
+        "topics": [HexBytes(topic) for topic in topics],
+        "data": HexBytes(data),
+        "blockNumber": 100,
+        "transactionHash": HexBytes(index.to_bytes(32, "big")),
+        "logIndex": index,
+    }
+
+
+def test_event_abi_from_signature():
+    abi = event_abi_from_signature("CallSalt(bytes32 indexed id,bytes32 salt)")
+    assert abi == {
+        "type": "event",
+        "name": "CallSalt",
+        "inputs": [
+            {"type": "bytes32", "indexed": True, "name": "id"},
+            {"type": "bytes32", "indexed": False, "name": "salt"},
+        ],
+        "anonymous": False,
+    }
+    assert event_abi_from_signature("EIP712DomainChanged()")["inputs"] == []
+
+
+def test_topics_are_the_canonical_signature_hashes(decoder):
+    assert decoder.topic("ProposalQueued") == Web3.keccak(text="ProposalQueued(uint256,uint256)")
+    assert decoder.topic("VoteCast") == Web3.keccak(text="VoteCast(address,uint256,uint8,uint256,string)")
+    uint_alias = LogDecoder([[event_abi_from_signature("Paid(uint amount)")]])
+    assert uint_alias.topic("Paid") == Web3.keccak(text="Paid(uint256)")
+    with pytest.raises(KeyError, match="Missing"):
+        decoder.topic("Missing")
+
+
+def test_static_events_are_decoded_word_by_word(decoder):
+    log = make_log([decoder.topic("StreamClaimed"), word(7), address_topic(VOTER)], abi_encode(["uint32", "uint256"], [3, 10**18]), 5)
+    [event] = decoder.decode_logs([log]).events
+    assert event["event"] == "StreamClaimed"
+    assert event["args"] == {"streamId": 7, "recipient": VOTER, "periods": 3, "amount": 10**18}
+    assert list(event["args"]) == ["streamId", "recipient", "periods", "amount"]
+    assert (event["address"], event["blockNumber"], event["logIndex"]) == (GOVERNOR, 100, 5)
+
+
+def test_dynamic_events_go_through_eth_abi(decoder):
+    data = abi_encode(
+        ["uint256", "address", "address[]", "uint256[]", "string[]", "bytes[]", "uint256", "uint256", "string"],
+        [1, VOTER.lower(), [TARGET.lower()], [10**18], [""], [b"\x01"], 100, 110, "Payout #1"],
+    )
+    [event] = decoder.decode_logs([make_log([decoder.topic("ProposalCreated")], data)]).events
+    args = event["args"]
+    assert args["proposer"] == VOTER and args["targets"] == (TARGET,)
+    assert args["calldatas"] == (b"\x01",) and args["description"] == "Payout #1"
+    assert (args["voteStart"], args["voteEnd"]) == (100, 110)
+
+
+def test_signed_bool_and_fixed_bytes_words():
+    decoder = LogDecoder([[event_abi_from_signature("Mixed(int256 delta,bool flag,bytes4 tag)")]])
+    data = abi_encode(["int256", "bool", "bytes4"], [-5, True, b"\xde\xad\xbe\xef"])
+    [event] = decoder.decode_logs([make_log([decoder.topic("Mixed")], data)]).events
+    assert event["args"] == {"delta": -5, "flag": True, "tag": b"\xde\xad\xbe\xef"}
+
+
+def test_unknown_and_malformed_logs_are_reported_separately(decoder):
+    good = make_log([decoder.topic("ProposalExecuted")], word(1), 0)
+    foreign = make_log([Web3.keccak(text="Transfer(address,address,uint256)")], word(1), 1)
+    anonymous = make_log([], b"", 2)
+    short_data = make_log([decoder.topic("ProposalExecuted")], word(1)[:31], 3)
+    missing_topic = make_log([decoder.topic("VoteCast")], abi_encode(["uint256", "uint8", "uint256", "string"], [1, 1, 1, ""]), 4)
+    result = decoder.decode_logs([good, foreign, anonymous, short_data, missing_topic])
+    assert [event["logIndex"] for event in result.events] == [0]
+    assert result.by_name("ProposalExecuted") == result.events
+    assert result.unknown == [foreign, anonymous]
+    assert [log["logIndex"] for log, _ in result.errors] == [3, 4]
+    assert "expected 32 data bytes" in str(result.errors[0][1])
+    assert "expected 2 topics" in str(result.errors[1][1])
+
+
+def test_from_artifacts_falls_back_to_the_known_events(tmp_path):
+    decoder = LogDecoder.from_artifacts([tmp_path / "missing.json"])
+    assert len(decoder.index) == len(KNOWN_EVENTS)
@@ -0,0 +1,89 @@
+import pytest
+from eth_abi import encode as abi_encode
+from web3 import Web3
+
+from utils.proposal_encoder import (
+    EXECUTE_SELECTOR,
+    PROPOSE_SELECTOR,
+    QUEUE_SELECTOR,
+    description_hash,
+    encode_proposal,
+    encode_propose,
+    hash_proposal,
+    normalize_actions,
+    timelock_operation_id,
+)
+
+GOVERNOR = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+TARGETS = [
+    "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+    "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512",
+    "0x" + "ab" * 20,
+]
+VALUES = [0, 10**18, 2**256 - 1]
+# Empty, a bare selector, and lengths off the 32-byte boundary
+CALLDATAS = [b"", b"\xa9\x05\x9c\xbb", bytes(range(70))]
+DESCRIPTION = "Payout batch #1: 3 recipients ünïcode"
+ACTION_TYPES = ["address[]", "uint256[]", "bytes[]"]
+
+
+def reference_args(last_type, last_value):
+    targets = [Web3.to_checksum_address(target) for target in TARGETS]
+    return abi_encode(ACTION_TYPES + [last_type], [targets, VALUES, CALLDATAS, last_value])
+
+
+def test_hash_proposal_matches_eth_abi():
+    desc_hash = description_hash(DESCRIPTION)
+    assert desc_hash == Web3.keccak(text=DESCRIPTION)
+    expected = int.from_bytes(Web3.keccak(reference_args("bytes32", desc_hash)), "big")
+    assert hash_proposal(TARGETS, VALUES, CALLDATAS, desc_hash) == expected
+
+
+def test_encode_proposal_calldata_matches_eth_abi():
+    encoded = encode_proposal(TARGETS, VALUES, CALLDATAS, DESCRIPTION)
+    desc_hash = description_hash(DESCRIPTION)
+    assert encoded["description_hash"] == "0x" + desc_hash.hex()
+    assert encoded["proposal_id"] == str(hash_proposal(TARGETS, VALUES, CALLDATAS, desc_hash))
+    assert encoded["propose"] == "0x" + (PROPOSE_SELECTOR + reference_args("string", DESCRIPTION)).hex()
+    assert encoded["queue"] == "0x" + (QUEUE_SELECTOR + reference_args("bytes32", desc_hash)).hex()
+    assert encoded["execute"] == "0x" + (EXECUTE_SELECTOR + reference_args("bytes32", desc_hash)).hex()
+    assert "timelock_operation_id" not in encoded
+    assert encode_propose(TARGETS, VALUES, CALLDATAS, DESCRIPTION).hex() == encoded["propose"][2:]
+
+
+def test_encode_proposal_ids_only():
+    encoded = encode_proposal(TARGETS, VALUES, CALLDATAS, DESCRIPTION, governor=GOVERNOR, ids_only=True)
+    assert set(encoded) == {"proposal_id", "description_hash"}
+
+
+def test_timelock_operation_id_matches_hash_operation_batch():
+    desc_hash = description_hash(DESCRIPTION)
+    salt = bytes(a ^ b for a, b in zip(bytes.fromhex(GOVERNOR[2:]) + b"\x00" * 12, desc_hash))
+    targets = [Web3.to_checksum_address(target) for target in TARGETS]
+    expected = Web3.keccak(abi_encode(
+        ACTION_TYPES + ["bytes32", "bytes32"], [targets, VALUES, CALLDATAS, b"\x00" * 32, salt],
+    ))
+    assert timelock_operation_id(GOVERNOR, TARGETS, VALUES, CALLDATAS, desc_hash) == expected
+    encoded = encode_proposal(TARGETS, VALUES, CALLDATAS, DESCRIPTION, governor=GOVERNOR)
+    assert encoded["timelock_operation_id"] == "0x" + expected.hex()
+
+
+def test_normalize_actions_accepts_hex_strings():
+    targets, values, calldatas = normalize_actions([TARGETS[0][2:]], ["5"], ["0xdeadbeef"])
+    assert targets == [bytes.fromhex(TARGETS[0][2:])]
+    assert values == [5]
+    assert calldatas == [b"\xde\xad\xbe\xef"]
+
+
+@pytest.mark.parametrize("targets, values, calldatas, message", [
+    ([TARGETS[0]], [0, 1], [b""], "invalid proposal length"),
+    ([], [], [], "empty proposal"),
+    ([TARGETS[0]], [-1], [b""], "uint256"),
+    ([TARGETS[0]], [2**256], [b""], "uint256"),
+    (["0x1234"], [0], [b""], "invalid target address"),
+    (["0xzz"], [0], [b""], "invalid target address"),
+    ([TARGETS[0]], [0], ["0xzz"], "calldatas"),
+])
+def test_normalize_actions_rejects_what_propose_would(targets, values, calldatas, message):
+    with pytest.raises(ValueError, match=message):
+        normalize_actions(targets, values, calldatas)
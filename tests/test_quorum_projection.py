@@ -0,0 +1,72 @@
+import numpy as np
+
+from utils.quorum_projection import (
+    NOT_VOTED,
+    SUPPORT_ABSTAIN,
+    SUPPORT_AGAINST,
+    SUPPORT_FOR,
+    UNREACHABLE,
+    build_support_matrix,
+    min_voter_set,
+    project,
+)
+
+VOTERS = ["a", "b", "c", "d"]
+POWER = [40, 30, 20, 10]
+
+
+def test_build_support_matrix_ignores_unknown_voters_and_proposals():
+    support = build_support_matrix(["p1", "p2"], VOTERS, [
+        ("p1", "a", SUPPORT_FOR),
+        ("p2", "c", SUPPORT_ABSTAIN),
+        ("p2", "x", SUPPORT_FOR),
+        ("p3", "a", SUPPORT_AGAINST),
+    ])
+    assert support.tolist() == [
+        [SUPPORT_FOR, NOT_VOTED, NOT_VOTED, NOT_VOTED],
+        [NOT_VOTED, NOT_VOTED, SUPPORT_ABSTAIN, NOT_VOTED],
+    ]
+
+
+def test_project_tallies_and_applies_the_quorum_per_proposal():
+    support = build_support_matrix(["p1", "p2"], VOTERS, [
+        ("p1", "b", SUPPORT_FOR), ("p1", "d", SUPPORT_AGAINST),
+        ("p2", "b", SUPPORT_FOR), ("p2", "d", SUPPORT_AGAINST),
+    ])
+    result = project(POWER, support, [30, 31])
+    assert result["for"].tolist() == [30, 30]
+    assert result["against"].tolist() == [10, 10]
+    assert result["quorum"].tolist() == [30, 31]
+    assert result["quorum_gap"].tolist() == [0, 1]
+    assert result["succeeded"].tolist() == [True, False]
+    assert result["remaining_power"].tolist() == [60, 60]
+
+
+def test_project_counts_the_fewest_largest_voters_to_pass_and_block():
+    support = build_support_matrix(["p1"], VOTERS, [("p1", "d", SUPPORT_AGAINST)])
+    result = project(POWER, support, 50)
+    # For must reach 50 (quorum) and beat 10: a (40) + b (30)
+    assert result["pass_power"].tolist() == [50]
+    assert result["votes_to_pass"].tolist() == [2]
+    assert min_voter_set(result, 0, "pass").tolist() == [0, 1]
+    # Against with B while the other 90 - B go For: For <= Against needs B >= 40
+    assert result["block_power"].tolist() == [40]
+    assert result["votes_to_block"].tolist() == [1]
+    assert min_voter_set(result, 0, "block").tolist() == [0]
+
+
+def test_project_reports_unreachable_outcomes():
+    support = build_support_matrix(["p1"], VOTERS, [("p1", "a", SUPPORT_AGAINST), ("p1", "b", SUPPORT_AGAINST)])
+    result = project(POWER, support, 10)
+    # 30 For at most against 70 Against
+    assert result["votes_to_pass"].tolist() == [UNREACHABLE]
+    assert result["votes_to_block"].tolist() == [0]
+    assert min_voter_set(result, 0, "pass").tolist() == []
+
+
+def test_project_takes_per_proposal_power():
+    power = np.array([[40, 30, 20, 10], [0, 0, 0, 100]])
+    support = np.full((2, 4), SUPPORT_FOR, dtype=np.int8)
+    result = project(power, support, 0)
+    assert result["for"].tolist() == [100, 100]
+    assert result["succeeded"].tolist() == [True, True]
@@ -0,0 +1,40 @@
+from decimal import InvalidOperation
+
+import pytest
+
+from utils.burn_monitor import WEI_PER_RAO
+from utils.fake_substrate import FakeSubstrate
+from utils.reads import ACCOUNT_STORAGE, read_account_balances, tao_to_rao
+
+COLDKEY = "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"
+MIRROR = "5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty"
+
+
+def test_read_account_balances_reads_free_balances_in_wei():
+    substrate = FakeSubstrate(storage={
+        (*ACCOUNT_STORAGE, COLDKEY): {"nonce": 3, "data": {"free": 1_500_000_000, "reserved": 7}},
+        (*ACCOUNT_STORAGE, MIRROR): {"nonce": 0, "data": {"free": 1, "reserved": 0}},
+    })
+    balances = read_account_balances(substrate, [MIRROR, COLDKEY], block_hash=substrate.get_chain_head())
+    assert balances == [WEI_PER_RAO, 1_500_000_000 * WEI_PER_RAO]
+
+
+def test_read_account_balances_treats_missing_accounts_as_empty():
+    substrate = FakeSubstrate(storage={(*ACCOUNT_STORAGE, COLDKEY): {"data": {"free": 5}}})
+    assert read_account_balances(substrate, [MIRROR, COLDKEY]) == [0, 5 * WEI_PER_RAO]
+
+
+@pytest.mark.parametrize("value, rao", [
+    ("8.2", 8_200_000_000),
+    (8.2, 8_200_000_000),
+    ("0.000000001", 1),
+    ("123456789.123456789", 123_456_789_123_456_789),
+    ("1e-10", 0),
+])
+def test_tao_to_rao_is_exact(value, rao):
+    assert tao_to_rao(value) == rao
+
+
+def test_tao_to_rao_rejects_text_that_is_not_a_number():
+    with pytest.raises(InvalidOperation):
+        tao_to_rao("1,5")
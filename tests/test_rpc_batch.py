@@ -0,0 +1,109 @@
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from utils.rpc_batch import CountingHTTPProvider, batch_read
+
+ADDRESSES = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 4)]
+
+
+class FakeNode:
+    """
+    Minimal JSON-RPC node: eth_chainId, eth_getBalance (the address as wei)
+    and an eth_estimateGas that always reverts. With `reject_batches`, batch
+    arrays get a single error object back, like nodes without batch support.
+    `answered` counts the calls answered per method.
+    """
+
+    def __init__(self, reject_batches=False):
+        self.reject_batches = reject_batches
+        self.answered = Counter()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def answer(self, request):
+        self.answered[request["method"]] += 1
+        response = {"jsonrpc": "2.0", "id": request["id"]}
+        if request["method"] == "eth_chainId":
+            response["result"] = "0x7a69"
+        elif request["method"] == "eth_getBalance":
+            response["result"] = hex(int(request["params"][0], 16))
+        else:
+            response["error"] = {"code": 3, "message": "execution reverted"}
+        return response
+
+    def _handler(self):
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if not isinstance(request, list):
+                    response = node.answer(request)
+                elif node.reject_batches:
+                    response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}}
+                else:
+                    response = [node.answer(item) for item in request]
+                data = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture(params=[False, True], ids=["batching", "no-batching"])
+def node(request):
+    with FakeNode(reject_batches=request.param) as node:
+        yield node
+
+
+def reads(w3, failing=False):
+    calls = [lambda: w3.eth.chain_id]
+    calls += [lambda address=address: w3.eth.get_balance(address) for address in ADDRESSES]
+    if failing:
+        calls.insert(2, lambda: w3.eth.estimate_gas({"from": ADDRESSES[0], "to": ADDRESSES[1]}))
+    return calls
+
+
+def test_batch_read_returns_formatted_results_in_order(node):
+    provider = CountingHTTPProvider(node.url)
+    w3 = Web3(provider)
+    assert batch_read(w3, reads(w3)) == [31337, 1, 2, 3]
+    # One array, plus one request per call when the node rejects it
+    assert provider.http_requests == (5 if node.reject_batches else 1)
+
+
+def test_batch_read_keeps_a_failing_call_in_its_slot(node):
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    results = batch_read(w3, reads(w3, failing=True), return_exceptions=True)
+    assert results[:2] + results[3:] == [31337, 1, 2, 3]
+    assert isinstance(results[2], ContractLogicError)
+    # The other results come from the same array, nothing is re-sent
+    assert node.answered["eth_getBalance"] == len(ADDRESSES)
+    assert node.answered["eth_estimateGas"] == 1
+
+
+def test_batch_read_raises_a_failing_call_by_default(node):
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    with pytest.raises(ContractLogicError, match="execution reverted"):
+        batch_read(w3, reads(w3, failing=True))
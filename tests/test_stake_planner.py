@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+from web3 import Web3
+
+from utils.address_converter import ss58_to_bytes
+from utils.stake_planner import (
+    CALL_OVERHEAD_GAS,
+    GAS_ESTIMATE_MARGIN,
+    PLANNED_SIGNATURES,
+    build_calls,
+    estimate_call_gas,
+    missing_functions,
+    pack_proposals,
+    parse_subnet_stakes,
+    plan_rebalance,
+)
+
+TREASURY = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+VAULT = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+ALICE = "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"
+HOTKEYS = [bytes([i]) * 32 for i in range(1, 6)]
+
+
+def test_parse_subnet_stakes_sums_exact_rao_per_subnet():
+    data = {"stake_info": {ALICE: [
+        {"netuid": 1, "stake_value": 8.2},
+        {"netuid": 1, "stake_value": "0.000000001"},
+        {"netuid": 2, "stake_value": 0},
+        {"netuid": 9, "stake_value": 5},
+    ]}}
+    assert parse_subnet_stakes(data, [1, 2]) == {1: {ss58_to_bytes(ALICE): 8_200_000_001}, 2: {}}
+
+
+def test_plan_rebalance_unstakes_from_the_largest_positions_first():
+    stakes = {1: {HOTKEYS[0]: 100, HOTKEYS[1]: 300, HOTKEYS[2]: 200}}
+    unstakes, additions = plan_rebalance(stakes, {1: 150})
+    assert unstakes == {1: [(HOTKEYS[1], 300), (HOTKEYS[2], 150)]}
+    assert additions == []
+
+
+def test_plan_rebalance_adds_to_the_stake_hotkey_or_the_largest_position():
+    stakes = {1: {HOTKEYS[0]: 100, HOTKEYS[1]: 300}, 2: {HOTKEYS[0]: 10}}
+    unstakes, additions = plan_rebalance(stakes, {1: 500, 2: 40}, stake_hotkeys={2: HOTKEYS[4]})
+    assert unstakes == {}
+    assert additions == [(1, HOTKEYS[1], 100), (2, HOTKEYS[4], 30)]
+
+
+def test_plan_rebalance_leaves_subnets_within_tolerance_alone():
+    assert plan_rebalance({1: {HOTKEYS[0]: 100}}, {1: 95}, tolerance=5) == ({}, [])
+
+
+def test_plan_rebalance_needs_a_hotkey_to_stake_on():
+    with pytest.raises(ValueError, match="netuid 3 has no stake"):
+        plan_rebalance({3: {}}, {3: 1})
+
+
+def test_build_calls_chunks_unstakes_and_costs_them_heuristically():
+    unstakes = {1: [(hotkey, 10) for hotkey in HOTKEYS]}
+    calls = build_calls(TREASURY, unstakes, [(2, HOTKEYS[0], 7)], max_hotkeys_per_call=2, gas_per_hotkey=1_000)
+    assert [(call["kind"], len(call["hotkeys"]), call["amount_rao"]) for call in calls] == [
+        ("unstakeAndBurn", 2, 20), ("unstakeAndBurn", 2, 20), ("unstakeAndBurn", 1, 10), ("stake", 1, 7),
+    ]
+    assert [call["gas"] for call in calls] == [CALL_OVERHEAD_GAS + 2_000] * 2 + [CALL_OVERHEAD_GAS + 1_000] * 2
+    assert {call["gas_source"] for call in calls} == {"heuristic"}
+    assert calls[-1]["calldata"][:10] == "0x" + Web3.keccak(text=PLANNED_SIGNATURES["stake"])[:4].hex()
+
+
+def test_estimate_call_gas_uses_the_executor_and_keeps_the_heuristic_on_failure():
+    calls = build_calls(TREASURY, {1: [(HOTKEYS[0], 10)]}, [(2, HOTKEYS[1], 7)])
+    senders = []
+
+    def estimate_gas(tx):
+        senders.append(tx["from"])
+        if tx["data"] == calls[1]["calldata"]:
+            raise ValueError("execution reverted")
+        return 50_000
+
+    # Without batch_requests, batch_read falls back to one call at a time
+    w3 = SimpleNamespace(eth=SimpleNamespace(estimate_gas=estimate_gas))
+    failed = estimate_call_gas(w3, calls, VAULT.lower())
+    assert senders == [VAULT, VAULT]
+    assert calls[0]["gas"] == int(50_000 * GAS_ESTIMATE_MARGIN) and calls[0]["gas_source"] == "estimate"
+    assert failed == [(calls[1], failed[0][1])] and calls[1]["gas_source"] == "heuristic"
+
+
+def test_pack_proposals_splits_by_gas_and_numbers_the_descriptions():
+    calls = build_calls(TREASURY, {1: [(hotkey, 1) for hotkey in HOTKEYS]}, [], max_hotkeys_per_call=1)
+    for call, gas in zip(calls, [400, 300, 300, 500, 100]):
+        call["gas"], call["gas_source"] = gas, "estimate"
+    calls[4]["gas_source"] = "heuristic"
+    proposals = pack_proposals(calls, "Rebalance", max_proposal_gas=1_000)
+    assert [len(p["calldatas"]) for p in proposals] == [3, 2]
+    assert [p["estimated_gas"] for p in proposals] == [1_000, 600]
+    assert [p["description"] for p in proposals] == ["Rebalance (1/2)", "Rebalance (2/2)"]
+    assert [p["heuristic_gas"] for p in proposals] == [False, True]
+
+
+def test_pack_proposals_keeps_one_description_and_rejects_oversized_calls():
+    calls = build_calls(TREASURY, {}, [(1, HOTKEYS[0], 1)])
+    assert pack_proposals(calls, "Rebalance")[0]["description"] == "Rebalance"
+    with pytest.raises(ValueError, match="over the 1 per proposal"):
+        pack_proposals(calls, "Rebalance", max_proposal_gas=1)
+
+
+def test_missing_functions_checks_the_abi_and_the_code():
+    calls = build_calls(TREASURY, {1: [(HOTKEYS[0], 1)]}, [(1, HOTKEYS[0], 1)])
+    stake_selector = Web3.keccak(text=PLANNED_SIGNATURES["stake"])[:4]
+    code = b"\x60\x80" + bytes([0x63]) + stake_selector + b"\x14"
+    assert missing_functions(calls, code=code) == [PLANNED_SIGNATURES["unstakeAndBurn"]]
+    abi = [{"type": "function", "name": "stake", "inputs": [{"type": "bytes32"}, {"type": "uint256"}, {"type": "uint256"}]}]
+    assert missing_functions(calls, abi=abi) == [PLANNED_SIGNATURES["unstakeAndBurn"]]
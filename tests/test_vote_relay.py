@@ -0,0 +1,99 @@
+import pytest
+from eth_account import Account
+
+from utils.vote_relay import GovernorDomain, bisect_ballots, order_ballots, parse_ballot, sign_ballot, verify_ballot
+
+GOVERNOR = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+
+
+@pytest.fixture
+def domain():
+    return GovernorDomain(GOVERNOR, 31337)
+
+
+@pytest.fixture
+def voters():
+    return [Account.from_key(bytes([i + 1]) * 32) for i in range(3)]
+
+
+def test_verify_ballot_accepts_the_voters_signature(domain, voters):
+    ballot = parse_ballot(sign_ballot(voters[0], domain, 7, 1, 0))
+    verify_ballot(domain, ballot)
+
+
+def test_verify_ballot_rejects_another_signer(domain, voters):
+    ballot = parse_ballot(sign_ballot(voters[0], domain, 7, 1, 0))
+    ballot["voter"] = voters[1].address
+    with pytest.raises(ValueError, match="signature is from"):
+        verify_ballot(domain, ballot)
+
+
+@pytest.mark.parametrize("signature", ["0x" + "00" * 65, "0x" + "ff" * 64 + "1b"])
+def test_verify_ballot_turns_unrecoverable_signatures_into_value_error(domain, voters, signature):
+    ballot = parse_ballot(sign_ballot(voters[0], domain, 7, 1, 0))
+    ballot["signature"] = signature
+    with pytest.raises(ValueError, match="unrecoverable signature"):
+        verify_ballot(domain, ballot)
+
+
+def _ballot(voter, nonce, proposal_id=7):
+    return {"proposalId": proposal_id, "support": 1, "voter": voter, "nonce": nonce, "signature": "0x"}
+
+
+def test_order_ballots_interleaves_voters_by_nonce_position():
+    ballots = [_ballot("A", 6, 8), _ballot("A", 5, 7), _ballot("B", 0, 7)]
+    ready, skipped = order_ballots(ballots, {"A": 5, "B": 0}, voted=set(), active={7, 8})
+
+    assert [(b["voter"], b["nonce"]) for b in ready] == [("A", 5), ("B", 0), ("A", 6)]
+    assert skipped == []
+
+
+def test_order_ballots_skips_what_cast_vote_by_sig_rejects():
+    ballots = [
+        _ballot("A", 0, 9),      # inactive proposal
+        _ballot("B", 0),         # already voted
+        _ballot("C", 0),
+        _ballot("C", 1),         # duplicate of C on proposal 7
+        _ballot("D", 2),         # nonce gap
+        _ballot("E", 0),         # nonce used
+    ]
+    ready, skipped = order_ballots(
+        ballots, {"A": 0, "B": 0, "C": 0, "D": 0, "E": 1}, voted={(7, "B")}, active={7},
+    )
+
+    assert [b["voter"] for b in ready] == ["C"]
+    assert [reason for _, reason in skipped] == [
+        "proposal is not active",
+        "already voted",
+        "duplicate ballot",
+        "nonce gap: expected 0, got 2",
+        "nonce 0 already used",
+    ]
+
+
+def test_bisect_ballots_isolates_the_reverting_ballot_and_its_voters_later_ones():
+    ballots = [_ballot(voter, nonce, proposal) for proposal, (voter, nonce) in enumerate(
+        [("A", 0), ("B", 0), ("C", 0), ("B", 1), ("D", 0)]
+    )]
+    simulations = []
+
+    def simulate(batch):
+        simulations.append(len(batch))
+        if any(b["voter"] == "B" and b["nonce"] == 0 for b in batch):
+            raise ValueError("InvalidSignature")
+
+    kept, dropped = bisect_ballots(ballots, simulate)
+
+    assert [(b["voter"], b["nonce"]) for b in kept] == [("A", 0), ("C", 0), ("D", 0)]
+    assert [(b["voter"], b["nonce"], reason) for b, reason in dropped] == [
+        ("B", 0, "reverts: InvalidSignature"),
+        ("B", 1, "earlier ballot of this voter was dropped"),
+    ]
+    # Every simulation re-runs the ballots already kept
+    assert simulations[0] == len(ballots)
+
+
+def test_bisect_ballots_keeps_everything_when_the_batch_passes():
+    ballots = [_ballot("A", 0), _ballot("B", 0)]
+    kept, dropped = bisect_ballots(ballots, lambda batch: None)
+    assert kept == ballots and dropped == []
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+CLI to build and serve pre-seeded anvil environments.
+
+`build` deploys the governance contracts with script/Deploy.s.sol on a
+throwaway anvil, sets voting power, funds the vault, and dumps the chain
+(anvil_dumpState) with the contract addresses and seeded accounts to a JSON
+fixture. `serve` starts a fresh anvil, loads a fixture into it
+(anvil_loadState) and keeps it running, so tools can be pointed at a ready
+environment without redeploying:
+
+  python tools/anvil_fixture.py build --power 0xf39F...=10000 --power 0x7099...=2500 --vault-funding 500
+  python tools/anvil_fixture.py serve --port 8545
+
+The default fixture is out/fixtures/governance.json with power on anvil's
+first five dev accounts. `serve` rebuilds it first when the contract
+sources changed since it was built. Python tests can use
+utils.anvil_fixture.FixtureNode directly. Requires Foundry (forge, anvil).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.anvil_fixture import (
+    DEFAULT_FIXTURE_PATH,
+    DEFAULT_VAULT_FUNDING_TAO,
+    FixtureNode,
+    build_fixture,
+    ensure_fixture,
+    load_fixture,
+    save_fixture,
+    source_hash,
+)
+from utils.reads import RAO_PER_TAO
+
+
+def parse_power(values):
+    power = {}
+    for value in values:
+        address, _, tao = value.partition("=")
+        try:
+            power[address] = float(tao)
+        except ValueError:
+            raise ValueError(f"expected ADDRESS=TAO, got '{value}'")
+    return power
+
+
+def print_fixture(fixture):
+    print("-" * 40)
+    print(f"Block:   {fixture['block']}")
+    for name, address in fixture["addresses"].items():
+        print(f"{name.capitalize() + ':':<9}{address}")
+    print(f"Vault:   {fixture['vault_balance'] / 10**18:g} TAO")
+    print("-" * 40)
+    for account in fixture["accounts"]:
+        print(f"{account['address']}  {account['voting_power'] / RAO_PER_TAO:>12,.2f} TAO")
+    print("-" * 40)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Anvil State Fixtures")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Deploy, seed and dump a fixture")
+    build_parser.add_argument("--out", type=Path, default=DEFAULT_FIXTURE_PATH)
+    build_parser.add_argument("--power", action="append", default=[],
+                              help="ADDRESS=TAO voting power (repeatable, default: anvil dev accounts)")
+    build_parser.add_argument("--vault-funding", type=float, default=DEFAULT_VAULT_FUNDING_TAO, help="TAO")
+    build_parser.add_argument("--netuid", type=int, default=1)
+
+    serve_parser = subparsers.add_parser("serve", help="Run anvil restored from a fixture")
+    serve_parser.add_argument("fixture", type=Path, nargs="?", default=DEFAULT_FIXTURE_PATH)
+    serve_parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            voting_power = parse_power(args.power) or None
+        except ValueError as e:
+            sys.exit(f"Argument Error: {e}")
+        start = time.perf_counter()
+        try:
+            fixture = build_fixture(voting_power, args.vault_funding, args.netuid)
+            save_fixture(fixture, args.out)
+        except Exception as e:
+            sys.exit(f"Fixture Error: {e}")
+        print(f"Built {args.out} in {time.perf_counter() - start:.1f}s")
+        print_fixture(fixture)
+        return
+
+    try:
+        if args.fixture == DEFAULT_FIXTURE_PATH:
+            fixture, built = ensure_fixture(args.fixture)
+            if built:
+                print(f"Built {args.fixture}")
+        else:
+            fixture = load_fixture(args.fixture)
+            if fixture["source_hash"] != source_hash():
+                print("WARNING: contract sources changed since this fixture was built", file=sys.stderr)
+    except Exception as e:
+        sys.exit(f"Fixture Error: {e}")
+
+    start = time.perf_counter()
+    try:
+        node = FixtureNode(fixture, port=args.port).start()
+    except Exception as e:
+        sys.exit(f"Startup Error: {e}")
+    print(f"Restored in {time.perf_counter() - start:.2f}s at {node.rpc_url}")
+    print_fixture(fixture)
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("Stopping.")
+    finally:
+        node.stop()
+
+if __name__ == "__main__":
+    main()
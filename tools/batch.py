@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+CLI that runs many tool operations in one process.
+
+Reads newline-delimited JSON commands from stdin and writes one JSON result
+line per command to stdout, in input order, as soon as each one finishes.
+The RPC connection, chain id, loaded contracts, signer and nonce are set up
+once and reused, so shell pipelines can drive thousands of operations
+without paying interpreter startup and artifact parsing for each one.
+
+Command lines are objects with an "op" and its parameters; an optional "id"
+is echoed back:
+
+  {"id": 1, "op": "proposal-state", "contract": "0x...", "proposal_id": "123"}
+  {"op": "voting-power", "contract": "0x...", "hotkey": "0x...", "netuid": 1, "timepoint": 100}
+  {"op": "balance", "address": "0x..."}            (or "addresses": [...])
+  {"op": "vote", "contract": "0x...", "proposal_id": "123", "support": 1, "reason": "..."}
+  {"op": "set-voting-power", "contract": "0x...", "hotkey": "0x...", "netuid": 1, "amount_tao": 10}
+
+Reads accept "block" (defaults to latest). "contract" can be omitted when
+--governor/--votes is given. Results look like {"id": 1, "ok": true,
+"result": {...}} or {"id": 1, "ok": false, "error": "..."}; large integers
+are strings. Writes are signed with --private-key, PRIVATE_KEY or the
+signing agent, using locally tracked nonces, and wait for their receipt
+unless --no-wait is given; a write stuck in the mempool is re-sent with a
+higher fee (see utils/inclusion.py).
+
+Example:
+  jq -c '{op: "balance", address: .}' addresses.json | python tools/batch.py --rpc-url $RPC
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider
+from utils.inclusion import add_inclusion_args, tracker_from_args
+from utils.reads import ContractCache, hotkey_to_bytes32, read_balances, read_proposal_state, read_voting_power, tao_to_rao
+from utils.rpc_batch import batch_read, fetch_tx_params
+from utils.signing_agent import get_signer
+
+
+class Sender:
+    """
+    Signs and sends writes from one account with locally assigned nonces.
+    The pending nonce and chain id are fetched with the first write; after a
+    failed broadcast the nonce is fetched again.
+    """
+
+    def __init__(self, w3, account, tracker, gas_price=None, wait=True):
+        self.w3 = w3
+        self.account = account
+        self.tracker = tracker
+        self.gas_price = gas_price
+        self.wait = wait
+        self.nonce = None
+        self.chain_id = None
+
+    def send(self, fn):
+        address = self.account.address
+        if self.nonce is None:
+            gas_estimate, node_gas_price, self.nonce, self.chain_id = fetch_tx_params(self.w3, fn, address)
+        else:
+            gas_estimate, node_gas_price = batch_read(self.w3, [
+                lambda: fn.estimate_gas({"from": address}),
+                lambda: self.w3.eth.gas_price,
+            ], return_exceptions=True)
+
+        # A failed estimate means the call would revert; report it instead of sending
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
+        gas_price = self.gas_price
+        if gas_price is None:
+            if isinstance(node_gas_price, Exception):
+                raise node_gas_price
+            gas_price = node_gas_price
+
+        tx = fn.build_transaction({
+            "from": address,
+            "nonce": self.nonce,
+            "gas": int(gas_estimate * 1.2),
+            "gasPrice": gas_price,
+            "chainId": self.chain_id,
+            "value": 0,
+        })
+        try:
+            pending = self.tracker.send(tx)
+        except Exception:
+            self.nonce = None
+            raise
+        self.nonce += 1
+        if not self.wait:
+            return {"tx_hash": "0x" + bytes(pending.tx_hash).hex(), "nonce": pending.nonce}
+
+        receipt = self.tracker.wait([pending])[0]
+        return {
+            "tx_hash": "0x" + bytes(pending.tx_hash).hex(),
+            "nonce": pending.nonce,
+            "status": receipt["status"],
+            "block": receipt["blockNumber"],
+            "gas_used": receipt["gasUsed"],
+            "broadcasts": pending.attempts,
+            "inclusion_seconds": round(pending.latency, 3),
+        }
+
+
+class BatchSession:
+    def __init__(self, w3, args):
+        self.w3 = w3
+        self.args = args
+        self.contracts = ContractCache(w3)
+        self.sender = None
+
+    def contract(self, kind, params):
+        address = params.get("contract") or getattr(self.args, kind)
+        if not address:
+            raise ValueError(f"missing 'contract' (or pass --{kind})")
+        return self.contracts.get(kind, address)
+
+    def get_sender(self):
+        if self.sender is None:
+            account = get_signer(self.args.private_key)
+            if account is None:
+                raise ValueError("no signer: set PRIVATE_KEY, pass --private-key or start tools/signing_agent.py")
+            gas_price = self.w3.to_wei(self.args.force_gas_price_gwei, "gwei") if self.args.force_gas_price_gwei else None
+            tracker = tracker_from_args(self.w3, account, self.args)
+            self.sender = Sender(self.w3, account, tracker, gas_price, wait=not self.args.no_wait)
+        return self.sender
+
+    def proposal_state(self, params):
+        governor = self.contract("governor", params)
+        return read_proposal_state(self.w3, governor, int(params["proposal_id"]), params.get("block", "latest"))
+
+    def voting_power(self, params):
+        votes = self.contract("votes", params)
+        timepoint = params.get("timepoint")
+        return read_voting_power(
+            votes, int(params.get("netuid", 1)), params["hotkey"],
+            int(timepoint) if timepoint is not None else None, params.get("block", "latest"),
+        )
+
+    def balance(self, params):
+        if "addresses" in params:
+            return read_balances(self.w3, params["addresses"], params.get("block", "latest"))
+        return read_balances(self.w3, [params["address"]], params.get("block", "latest"))[0]
+
+    def vote(self, params):
+        governor = self.contract("governor", params)
+        proposal_id, support = int(params["proposal_id"]), int(params["support"])
+        if params.get("reason"):
+            fn = governor.functions.castVoteWithReason(proposal_id, support, params["reason"])
+        else:
+            fn = governor.functions.castVote(proposal_id, support)
+        return self.get_sender().send(fn)
+
+    def set_voting_power(self, params):
+        votes = self.contract("votes", params)
+        amount = tao_to_rao(params["amount_tao"])
+        fn = votes.functions.setVotingPower(int(params.get("netuid", 1)), hotkey_to_bytes32(params["hotkey"]), amount)
+        return self.get_sender().send(fn)
+
+    OPS = {
+        "proposal-state": proposal_state,
+        "voting-power": voting_power,
+        "balance": balance,
+        "vote": vote,
+        "set-voting-power": set_voting_power,
+    }
+
+    def run(self, line):
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            return {"id": None, "ok": False, "error": f"invalid command: {e}"}
+
+        handler = self.OPS.get(command.get("op"))
+        if handler is None:
+            return {"id": command.get("id"), "ok": False, "error": f"unknown op '{command.get('op')}'"}
+        try:
+            return {"id": command.get("id"), "ok": True, "result": handler(self, command)}
+        except KeyError as e:
+            return {"id": command.get("id"), "ok": False, "error": f"missing parameter {e}"}
+        except Exception as e:
+            return {"id": command.get("id"), "ok": False, "error": str(e)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run NDJSON commands from stdin over one connection")
+    parser.add_argument("--rpc-url", required=True)
+    parser.add_argument("--governor", help="Default TreasuryController address")
+    parser.add_argument("--votes", help="Default MockBittensorVotes address")
+    parser.add_argument("--private-key", default=None)
+    parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(parser)
+    parser.add_argument("--no-wait", action="store_true", help="Return writes once broadcast, without the receipt")
+    args = parser.parse_args()
+
+    try:
+        w3 = get_web3_provider(args.rpc_url)
+    except Exception as e:
+        sys.exit(f"RPC Connection Error: {e}")
+
+    session = BatchSession(w3, args)
+    processed = failed = 0
+    start = time.perf_counter()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        result = session.run(line)
+        processed += 1
+        failed += not result["ok"]
+        print(json.dumps(result), flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Processed {processed} commands ({failed} failed) in {elapsed:.2f}s "
+        f"with {w3.provider.http_requests} HTTP requests",
+        file=sys.stderr,
+    )
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
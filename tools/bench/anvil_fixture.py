@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: seeded environment from scratch vs restored from a fixture.
+
+Builds the default fixture once the way every local run used to start
+(fresh anvil, script/Deploy.s.sol, voting power, vault funding), then times
+starting --iterations fresh anvils from it with anvil_loadState, and
+resetting one node with evm_revert. Every restored chain is checked
+against the fixture (contract code, voting power at the fixture's block,
+vault balance) so only working environments are timed. Requires Foundry.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from utils.anvil_fixture import FixtureNode, build_fixture
+from utils.contract_loader import load_contract
+from utils.reads import ARTIFACTS
+from utils.rpc_batch import batch_read
+
+
+def check_environment(node):
+    """True when the node holds the fixture's contracts, voting power and vault balance."""
+    fixture, w3 = node.fixture, node.w3
+    votes = load_contract(w3, node.addresses["votes"], ARTIFACTS["votes"])
+    block = fixture["block"]
+    accounts = fixture["accounts"]
+    code, balance, *powers = batch_read(w3, [
+        lambda: w3.eth.get_code(node.addresses["governor"]),
+        lambda: w3.eth.get_balance(node.addresses["vault"]),
+        # Power was set before the fixture's last block, so it is readable there
+        *[
+            votes.functions.getPastVotingPower(
+                fixture["netuid"], bytes.fromhex(account["address"][2:].rjust(64, "0")), block - 1
+            )
+            for account in accounts
+        ],
+    ])
+    return (
+        len(code) > 0
+        and balance == fixture["vault_balance"]
+        and powers == [account["voting_power"] for account in accounts]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark anvil fixture restore against a fresh deployment")
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        fixture = build_fixture()
+    except Exception as e:
+        sys.exit(f"Fixture Error: {e}")
+    build_seconds = time.perf_counter() - start
+
+    restore_timings, ok = [], True
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        with FixtureNode(fixture) as node:
+            restore_timings.append(time.perf_counter() - start)
+            ok &= check_environment(node)
+
+    reset_timings = []
+    with FixtureNode(fixture) as node:
+        for _ in range(args.iterations):
+            # Dirty the chain the way a test would, then reset
+            node.w3.provider.make_request("anvil_mine", ["0x5"])
+            start = time.perf_counter()
+            node.reset()
+            reset_timings.append(time.perf_counter() - start)
+            ok &= node.w3.eth.block_number == fixture["block"] and check_environment(node)
+
+    print("-" * 52)
+    print(f"ANVIL FIXTURE BENCHMARK ({args.iterations} iterations, {len(fixture['state']) // 2 // 1024} KiB state)")
+    print("-" * 52)
+    print(f"Deploy + seed (build):     {build_seconds * 1000:>10.0f} ms")
+    print(f"Fresh anvil + loadState:   {statistics.median(restore_timings) * 1000:>10.0f} ms (median)")
+    print(f"evm_revert reset:          {statistics.median(reset_timings) * 1000:>10.1f} ms (median)")
+    print(f"Speedup (fresh restore):   {build_seconds / statistics.median(restore_timings):>10.1f}x")
+    print(f"Environment:               {'identical' if ok else 'MISMATCH'}")
+    print("-" * 52)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
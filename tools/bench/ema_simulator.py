@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Validates the NumPy EMA simulator against MockBittensorVotes on anvil, then
+times it at subnet scale.
+
+Starts anvil, deploys the contracts with script/Deploy.s.sol, sets an EMA
+alpha and drives random stake series through updateVotingPowerEma (with
+random gaps of empty blocks between steps). Every hotkey's power is then read
+back with getPastVotingPower at every block and compared with the simulation.
+The contract floors each step, so the chain may sit up to one rao per applied
+step below the simulated value; anything outside that band is a mismatch.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from web3 import Web3
+
+from utils.anvil import ANVIL_ADDRESS, AnvilNode, deploy_governance
+from utils.contract_loader import load_contract
+from utils.ema_simulator import ALPHA_SCALE, first_crossing, simulate, stake_grid
+from utils.rpc_batch import batch_read
+
+RAO_PER_TAO = 1_000_000_000
+
+
+def drive_chain(w3, votes, netuid, hotkeys, steps, raw_alpha, rng, max_gap):
+    """Sends one EMA step per iteration; returns (events, step_blocks)."""
+    votes.functions.setVotingPowerEmaAlpha(netuid, raw_alpha).transact({"from": ANVIL_ADDRESS})
+
+    stake = rng.integers(0, 20_000 * RAO_PER_TAO, len(hotkeys))
+    events, step_blocks = [], []
+    for _ in range(steps):
+        # Move roughly a third of the hotkeys each step
+        changed = rng.random(len(hotkeys)) < 0.33
+        stake = np.where(changed, rng.integers(0, 20_000 * RAO_PER_TAO, len(hotkeys)), stake)
+
+        tx_hash = votes.functions.updateVotingPowerEma(
+            netuid, [bytes.fromhex(h[2:].zfill(64)) for h in hotkeys], [int(s) for s in stake]
+        ).transact({"from": ANVIL_ADDRESS, "gas": 30_000_000})
+        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        if receipt["status"] != 1:
+            raise RuntimeError(f"updateVotingPowerEma reverted in block {receipt['blockNumber']}")
+
+        block = receipt["blockNumber"]
+        step_blocks.append(block)
+        events.extend((block, j, int(s)) for j, s in enumerate(stake))
+
+        gap = int(rng.integers(0, max_gap + 1))
+        if gap:
+            w3.provider.make_request("anvil_mine", [hex(gap)])
+    return events, step_blocks
+
+
+def read_history(w3, votes, netuid, hotkeys, first_block, last_block, batch_size=200):
+    """(blocks, hotkeys) matrix of getPastVotingPower, batched."""
+    calls = [
+        votes.functions.getPastVotingPower(netuid, bytes.fromhex(h[2:].zfill(64)), block)
+        for block in range(first_block, last_block + 1)
+        for h in hotkeys
+    ]
+    values = []
+    for start in range(0, len(calls), batch_size):
+        values.extend(batch_read(w3, calls[start:start + batch_size]))
+    return np.array(values, dtype=np.float64).reshape(-1, len(hotkeys))
+
+
+def validate(args, rng):
+    with AnvilNode() as node:
+        print(f"anvil on {node.rpc_url}, deploying contracts...")
+        contracts = deploy_governance(node.rpc_url)
+        w3 = Web3(Web3.HTTPProvider(node.rpc_url))
+        artifact_path = tools_dir.parent / "out" / "MockBittensorVotes.sol" / "MockBittensorVotes.json"
+        votes = load_contract(w3, contracts["votes"], artifact_path)
+
+        hotkeys = [f"0x{0xE3A000 + i:040x}" for i in range(args.hotkeys)]
+        raw_alpha = int(args.alpha * ALPHA_SCALE)
+        events, step_blocks = drive_chain(w3, votes, args.netuid, hotkeys, args.steps, raw_alpha, rng, args.max_gap)
+
+        # getPastVotingPower needs a finalized block
+        w3.provider.make_request("anvil_mine", ["0x1"])
+        first_block, last_block = step_blocks[0], w3.eth.block_number - 1
+        chain = read_history(w3, votes, args.netuid, hotkeys, first_block, last_block)
+
+    n_blocks = last_block - first_block + 1
+    blocks, columns, stakes = zip(*events)
+    stake = stake_grid(blocks, columns, stakes, first_block, n_blocks, len(hotkeys))
+    step_rows = np.array(step_blocks) - first_block
+    simulated = simulate(stake, args.alpha, step_rows=step_rows)
+
+    applied = np.searchsorted(step_rows, np.arange(n_blocks), side="right")[:, None]
+    diff = simulated - chain
+    ok = bool(np.all((diff > -1e-6 * np.maximum(chain, 1)) & (diff <= applied + 1e-9 * chain + 1)))
+
+    print("-" * 40)
+    print("VALIDATION AGAINST MockBittensorVotes")
+    print(f"Hotkeys x Blocks: {len(hotkeys)} x {n_blocks} ({len(step_blocks)} EMA steps)")
+    print(f"Alpha:            {args.alpha} (raw {raw_alpha})")
+    print(f"Max |sim-chain|:  {np.max(np.abs(diff)):.3f} rao")
+    print(f"Result:           {'MATCH' if ok else 'MISMATCH'}")
+    return ok
+
+
+def benchmark(args, rng):
+    stake = rng.uniform(0, 20_000 * RAO_PER_TAO, (args.bench_blocks, args.bench_hotkeys))
+    timings = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        power = simulate(stake, args.alpha, interval=args.interval)
+        first_crossing(power)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print("-" * 40)
+    print("SUBNET-SCALE SIMULATION")
+    print(f"Hotkeys x Blocks: {args.bench_hotkeys} x {args.bench_blocks} (interval {args.interval})")
+    print(f"p50:              {np.percentile(timings, 50):.2f} ms")
+    print(f"max:              {max(timings):.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and benchmark the EMA voting power simulator")
+    parser.add_argument("--hotkeys", type=int, default=8, help="Hotkeys driven on anvil")
+    parser.add_argument("--steps", type=int, default=40, help="EMA steps driven on anvil")
+    parser.add_argument("--max-gap", type=int, default=3, help="Max empty blocks between steps")
+    parser.add_argument("--alpha", type=float, default=0.1)
+    parser.add_argument("--netuid", type=int, default=1)
+    parser.add_argument("--bench-hotkeys", type=int, default=256)
+    parser.add_argument("--bench-blocks", type=int, default=7200)
+    parser.add_argument("--interval", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--skip-chain", action="store_true", help="Only run the timing benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    ok = True
+    if not args.skip_chain:
+        try:
+            ok = validate(args, rng)
+        except Exception as e:
+            sys.exit(f"Validation Error: {e}")
+    benchmark(args, rng)
+    print("-" * 40)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
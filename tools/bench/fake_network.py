@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Runs a tool against the fake substrate RPC of tools/local_subtensor.py.
+
+The tools only talk to real networks. This bench helper replaces their
+substrate reads with a FakeSubstrateClient and then runs the tool's main()
+with the remaining arguments:
+
+  python tools/bench/fake_network.py http://127.0.0.1:PORT register_neuron.py 0xVault --netuid 1 --hotkey 0x...
+
+Covered: the burn cost of register_neuron.py, the substrate of
+schedule_registrations.py (unless --fake-burn is given) and the stake reads
+of utils.staking_manager and utils.stake_planner (link_hotkeys.py --coldkey,
+plan_stakes.py).
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+import utils.stake_planner as stake_planner
+import utils.staking_manager as staking_manager
+from utils.burn_monitor import BURN_STORAGE
+from utils.fake_substrate import FakeSubstrateClient
+
+
+def install(substrate_url):
+    """
+    Points the stake reads at the fake substrate and returns the hooks for a
+    tool module, by the name of the function each one replaces.
+    """
+    client = FakeSubstrateClient(substrate_url)
+
+    def fetch_stake_info(coldkey_ss58, network="test"):
+        return client.stake_list(coldkey_ss58)
+
+    def fetch_burn_cost_rao(network, netuid):
+        value = client.query(*BURN_STORAGE, [netuid])
+        if value is None:
+            raise RuntimeError(f"Could not find Burn cost for NetUID {netuid} in storage")
+        return int(value.value), None
+
+    staking_manager.fetch_stake_info = fetch_stake_info
+    stake_planner.fetch_stake_info = fetch_stake_info
+    return {"fetch_burn_cost_rao": fetch_burn_cost_rao, "client": client}
+
+
+def run_tool(substrate_url, script, args):
+    hooks = install(substrate_url)
+    tool = importlib.import_module(Path(script).stem)
+    if hasattr(tool, "fetch_burn_cost_rao"):
+        tool.fetch_burn_cost_rao = hooks["fetch_burn_cost_rao"]
+    if hasattr(tool, "connect_substrate"):
+        connect_substrate = tool.connect_substrate
+        tool.connect_substrate = lambda parsed: (
+            connect_substrate(parsed) if parsed.fake_burn else (hooks["client"], None)
+        )
+    sys.argv = [str(tools_dir / script), *args]
+    tool.main()
+
+
+def main():
+    if len(sys.argv) < 3:
+        sys.exit("usage: fake_network.py SUBSTRATE_URL TOOL.py [ARGS...]")
+    run_tool(sys.argv[1], sys.argv[2], sys.argv[3:])
+
+
+if __name__ == "__main__":
+    main()
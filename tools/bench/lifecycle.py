@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+End-to-end latency benchmark of the tools/ operator flow against a local anvil.
+
+Starts the offline local subtensor (anvil with the contracts deployed by
+script/Deploy.s.sol, LocalNeuronPrecompile at 0x804 and a fake substrate RPC
+serving the burn) and runs the full lifecycle (set voting power, propose,
+vote, queue, execute, register) N times, each step as its own tools/*.py
+process exactly as an operator would. All tool traffic goes through a
+counting JSON-RPC proxy so every step reports wall time and RPC usage; the
+summary gives p50/p95.
+
+Chain housekeeping between steps (mining blocks, advancing time, funding the
+vault, syncing burns) is done directly by the harness and is not part of the
+measurements. The register step reads the burn from the fake substrate through
+tools/bench/fake_network.py.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from web3 import Web3
+
+from utils.anvil import ANVIL_ADDRESS, ANVIL_PRIVATE_KEY
+from utils.local_subtensor import LocalSubtensor
+
+VOTING_PERIOD_BLOCKS = 10
+VAULT_MIN_DELAY_SECONDS = 30
+PAYOUT_TAO = "0.1"
+PROPOSAL_ID_PATTERN = re.compile(r"Proposal ID:\s*(\d+)")
+
+
+class CountingProxy:
+    """Local HTTP proxy in front of the node that counts requests and JSON-RPC calls."""
+
+    def __init__(self, upstream_url: str):
+        self.upstream_url = upstream_url
+        self.lock = threading.Lock()
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                try:
+                    payload = json.loads(body)
+                    calls = len(payload) if isinstance(payload, list) else 1
+                except ValueError:
+                    calls = 1
+                with proxy.lock:
+                    proxy.http_requests += 1
+                    proxy.rpc_calls += calls
+
+                request = urllib.request.Request(
+                    proxy.upstream_url, data=body, headers={"Content-Type": "application/json"}
+                )
+                with urllib.request.urlopen(request) as response:
+                    data = response.read()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def counters(self):
+        with self.lock:
+            return self.http_requests, self.rpc_calls
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StepRecorder:
+    def __init__(self, proxy: CountingProxy):
+        self.proxy = proxy
+        self.samples = {}
+
+    def run(self, step: str, script: str, *args, stdin: str = None) -> str:
+        """Runs tools/<script> with args, records its metrics and returns stdout."""
+        cmd = [sys.executable, str(tools_dir / script), *args]
+        http_before, rpc_before = self.proxy.counters()
+        start = time.perf_counter()
+        result = subprocess.run(cmd, capture_output=True, text=True, input=stdin, check=False)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        http_after, rpc_after = self.proxy.counters()
+
+        if result.returncode != 0 or "FAILED" in result.stdout:
+            raise RuntimeError(f"{step} failed ({script}):\n{result.stdout}\n{result.stderr}")
+
+        self.samples.setdefault(step, []).append(
+            (elapsed_ms, http_after - http_before, rpc_after - rpc_before)
+        )
+        return result.stdout
+
+    def report(self, total_seconds: float, iterations: int):
+        print("-" * 80)
+        print(f"TOOLS LIFECYCLE BENCHMARK ({iterations} iterations, {total_seconds:.2f}s total)")
+        print("-" * 80)
+        print(f"{'Step':<18} {'n':>4} {'p50 ms':>10} {'p95 ms':>10} {'mean ms':>10} {'HTTP':>8} {'RPC':>8}")
+        for step, samples in self.samples.items():
+            data = np.array(samples, dtype=float)
+            wall = data[:, 0]
+            print(
+                f"{step:<18} {len(samples):>4} "
+                f"{np.percentile(wall, 50):>10.1f} {np.percentile(wall, 95):>10.1f} {wall.mean():>10.1f} "
+                f"{data[:, 1].mean():>8.1f} {data[:, 2].mean():>8.1f}"
+            )
+        print("-" * 80)
+
+    def to_json(self, total_seconds: float, iterations: int) -> dict:
+        steps = {}
+        for step, samples in self.samples.items():
+            data = np.array(samples, dtype=float)
+            steps[step] = {
+                "n": len(samples),
+                "p50_ms": float(np.percentile(data[:, 0], 50)),
+                "p95_ms": float(np.percentile(data[:, 0], 95)),
+                "mean_ms": float(data[:, 0].mean()),
+                "http_requests": float(data[:, 1].mean()),
+                "rpc_calls": float(data[:, 2].mean()),
+            }
+        return {"iterations": iterations, "total_seconds": total_seconds, "steps": steps}
+
+
+def mine(w3, blocks: int = 1, seconds: int = 0):
+    if seconds:
+        w3.provider.make_request("evm_increaseTime", [seconds])
+    w3.provider.make_request("anvil_mine", [hex(blocks)])
+
+
+def run_iteration(recorder, local, w3, contracts, rpc_url, iteration, register_args):
+    common = ["--rpc-url", rpc_url, "--private-key", ANVIL_PRIVATE_KEY]
+    recipient = Web3.to_checksum_address(f"0x{0xBE000 + iteration:040x}")
+    description = f"Benchmark payout #{iteration} ({time.time_ns()})"
+    payload = ["--recipient", recipient, "--description", description]
+
+    recorder.run(
+        "set_voting_power", "set_voting_power.py", contracts["votes"],
+        "--hotkey", ANVIL_ADDRESS, "--amount", "10000", *common,
+    )
+
+    stdout = recorder.run("propose", "propose_transfer.py", contracts["governor"], *payload, "--amount", PAYOUT_TAO, *common)
+    match = PROPOSAL_ID_PATTERN.search(stdout)
+    if not match:
+        raise RuntimeError(f"propose_transfer.py did not report a proposal id:\n{stdout}")
+    proposal_id = match.group(1)
+
+    mine(w3)
+    recorder.run("vote", "vote.py", contracts["governor"], "--proposal-id", proposal_id, "--support", "1", *common)
+    recorder.run(
+        "proposal_state", "get_proposal_state.py", contracts["governor"],
+        "--proposal-id", proposal_id, "--rpc-url", rpc_url,
+    )
+
+    mine(w3, VOTING_PERIOD_BLOCKS + 1)
+    recorder.run("queue", "queue_proposal.py", contracts["governor"], *payload, "--amount", PAYOUT_TAO, *common)
+
+    mine(w3, 1, VAULT_MIN_DELAY_SECONDS + 1)
+    recorder.run("execute", "execute.py", contracts["governor"], *payload, "--amount-eth", PAYOUT_TAO, *common)
+
+    if register_args is not None:
+        hotkey = f"0x{iteration + 1:064x}"
+        recorder.run(
+            "register", "bench/fake_network.py", local.substrate_url, "register_neuron.py", contracts["vault"],
+            "--hotkey", hotkey, *register_args, *common,
+            stdin="y\n",
+        )
+        local.sync()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tools/ lifecycle against anvil")
+    parser.add_argument("--iterations", "-n", type=int, default=5)
+    parser.add_argument("--vault-funding", type=float, default=100.0, help="TAO sent to the vault before the runs")
+    parser.add_argument("--burn", type=float, default=1.0, help="Registration burn of --netuid (TAO)")
+    parser.add_argument("--skip-register", action="store_true", help="Leave out the register step")
+    parser.add_argument("--netuid", type=int, default=1)
+    parser.add_argument("--json-out", type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    with LocalSubtensor(burns={args.netuid: Web3.to_wei(args.burn, "ether")}) as local, \
+            CountingProxy(local.rpc_url) as proxy:
+        w3 = local.w3
+        contracts = local.addresses
+        print(f"Deployed to {local.rpc_url} (fake substrate at {local.substrate_url}):")
+        for name, address in contracts.items():
+            print(f"  > {name:<9} {address}")
+
+        register_args = None
+        if not args.skip_register:
+            register_args = ["--netuid", str(args.netuid)]
+
+        w3.eth.send_transaction({
+            "from": ANVIL_ADDRESS,
+            "to": contracts["vault"],
+            "value": w3.to_wei(args.vault_funding, "ether"),
+        })
+
+        recorder = StepRecorder(proxy)
+        start = time.perf_counter()
+        for iteration in range(args.iterations):
+            run_iteration(recorder, local, w3, contracts, proxy.url, iteration, register_args)
+            print(f"Iteration {iteration + 1}/{args.iterations} done")
+        total_seconds = time.perf_counter() - start
+
+    recorder.report(total_seconds, args.iterations)
+    if args.json_out:
+        args.json_out.write_text(json.dumps(recorder.to_json(total_seconds, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
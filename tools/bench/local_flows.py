@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: registration and staking flows against the offline local subtensor.
+
+Starts utils.local_subtensor.LocalSubtensor (anvil, deployed contracts,
+LocalNeuronPrecompile at 0x804 and a fake substrate RPC), then measures:
+
+  registration  --registrations registerNeuron calls through TreasuryVault,
+                driven by RegistrationScheduler with burn cost read from the
+                fake substrate; burns are collected between polls and the
+                caller's balance is checked against them
+  staking       reading --hotkeys stakes from the fake substrate with
+                staking_manager and pushing them into MockBittensorVotes
+                with set_voting_power's bulk path
+
+No network access is needed; requires anvil and `forge build`.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from eth_account import Account
+from web3 import Web3
+
+from schedule_registrations import make_submitter
+from set_voting_power import set_bulk
+from utils.address_converter import h160_to_ss58
+from utils.anvil import ANVIL_ADDRESS, ANVIL_PRIVATE_KEY
+from utils.burn_monitor import BurnMonitor, RegistrationScheduler
+from utils.contract_loader import load_contract
+from utils.fake_substrate import FakeSubstrateClient
+from utils.local_subtensor import LocalSubtensor
+from utils.reads import RAO_PER_TAO, tao_to_rao
+from utils.staking_manager import fetch_validator_stakes
+OUT_DIR = tools_dir.parent / "out"
+
+
+def bench_registration(local, w3, netuids, count):
+    vault = load_contract(w3, local.addresses["vault"], OUT_DIR / "TreasuryVault.sol" / "TreasuryVault.json")
+    account = Account.from_key(ANVIL_PRIVATE_KEY)
+    monitor = BurnMonitor(FakeSubstrateClient(local.substrate_url), netuids)
+    scheduler = RegistrationScheduler(monitor, make_submitter(w3, vault, account, slippage=5.0), max_attempts=1)
+    for i in range(count):
+        # The ceiling never binds: this measures throughput, not waiting for cheap burns
+        scheduler.add(netuids[i % len(netuids)], os.urandom(32), 10**6 * RAO_PER_TAO)
+
+    balance_before = w3.eth.get_balance(ANVIL_ADDRESS)
+    burns_before = len(local.burn_log.burns)
+
+    def on_poll(scheduler, sent):
+        local.sync()
+
+    start = time.perf_counter()
+    polls = scheduler.run(interval=0, on_poll=on_poll)
+    elapsed = time.perf_counter() - start
+    local.sync()
+
+    burned = sum(amount for _, amount in local.burn_log.burns[burns_before:])
+    receipts = [w3.eth.get_transaction_receipt(tx_hash) for _, _, tx_hash in scheduler.submitted]
+    gas_fees = sum(receipt["gasUsed"] * receipt["effectiveGasPrice"] for receipt in receipts)
+    balance_after = w3.eth.get_balance(ANVIL_ADDRESS)
+    return {
+        "registered": len(scheduler.submitted),
+        "failed": len(scheduler.failed),
+        "polls": polls,
+        "seconds": elapsed,
+        "per_second": len(scheduler.submitted) / elapsed,
+        "avg_gas": sum(receipt["gasUsed"] for receipt in receipts) // max(len(receipts), 1),
+        "burned_tao": burned / 10**18,
+        "balance_ok": balance_before - balance_after == burned + gas_fees,
+        "failures": [str(request.last_error) for request in scheduler.failed][:3],
+    }
+
+
+def bench_staking(local, w3, coldkey, netuid):
+    start = time.perf_counter()
+    hotkeys, amounts_tao = fetch_validator_stakes(
+        coldkey, netuid, stake_list=FakeSubstrateClient(local.substrate_url).stake_list
+    )
+    fetched = time.perf_counter()
+
+    votes = load_contract(w3, local.addresses["votes"], OUT_DIR / "MockBittensorVotes.sol" / "MockBittensorVotes.json")
+    entries = [(hotkey, tao_to_rao(amount)) for hotkey, amount in zip(hotkeys, amounts_tao)]
+    set_bulk(w3, votes, Account.from_key(ANVIL_PRIVATE_KEY), netuid, entries, w3.eth.gas_price, workers=None, batch_size=100)
+    done = time.perf_counter()
+
+    sample = entries[len(entries) // 2]
+    stored = votes.functions.getVotingPower(netuid, sample[0]).call()
+    return {
+        "hotkeys": len(entries),
+        "fetch_seconds": fetched - start,
+        "push_seconds": done - fetched,
+        "per_second": len(entries) / (done - start),
+        "power_ok": stored == sample[1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark registration and staking flows offline")
+    parser.add_argument("--subnets", type=int, default=4)
+    parser.add_argument("--registrations", type=int, default=200)
+    parser.add_argument("--burn-tao", type=float, default=1.0)
+    parser.add_argument("--burn-increase-bps", type=int, default=100)
+    parser.add_argument("--hotkeys", type=int, default=1000)
+    args = parser.parse_args()
+
+    netuids = list(range(1, args.subnets + 1))
+    coldkey = h160_to_ss58(ANVIL_ADDRESS)
+    stakes = [
+        (coldkey, h160_to_ss58("0x" + os.urandom(20).hex()), netuids[0], (i + 1) * RAO_PER_TAO)
+        for i in range(args.hotkeys)
+    ]
+    burns = {netuid: tao_to_rao(args.burn_tao) * 10**9 for netuid in netuids}
+
+    try:
+        local = LocalSubtensor(burns, stakes, args.burn_increase_bps).start()
+    except Exception as e:
+        sys.exit(f"Startup Error: {e}")
+
+    try:
+        w3 = Web3(Web3.HTTPProvider(local.rpc_url))
+        registration = bench_registration(local, w3, netuids, args.registrations)
+        staking = bench_staking(local, w3, coldkey, netuids[0])
+    finally:
+        local.stop()
+
+    print("-" * 52)
+    print(f"REGISTRATION ({args.registrations} over {args.subnets} subnets, +{args.burn_increase_bps} bps/registration)")
+    print("-" * 52)
+    print(f"Registered:     {registration['registered']} ({registration['failed']} failed, {registration['polls']} polls)")
+    print(f"Time:           {registration['seconds']:.2f}s ({registration['per_second']:.1f}/s)")
+    print(f"Avg gas:        {registration['avg_gas']}")
+    print(f"Burned:         {registration['burned_tao']:.4f} TAO")
+    print(f"Balance check:  {'ok' if registration['balance_ok'] else 'MISMATCH'}")
+    for failure in registration["failures"]:
+        print(f"  {failure}")
+    print("-" * 52)
+    print(f"STAKING ({args.hotkeys} hotkeys on NetUID {netuids[0]})")
+    print("-" * 52)
+    print(f"Fetch stakes:   {staking['fetch_seconds']:.3f}s")
+    print(f"Push power:     {staking['push_seconds']:.2f}s")
+    print(f"Throughput:     {staking['per_second']:.1f} hotkeys/s")
+    print(f"Power check:    {'ok' if staking['power_ok'] else 'MISMATCH'}")
+    print("-" * 52)
+
+
+if __name__ == "__main__":
+    main()
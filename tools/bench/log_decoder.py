@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: topic-indexed LogDecoder vs web3's per-event process_receipt.
+
+Builds a synthetic receipt with a realistic mix of TreasuryController and
+TreasuryVault events (votes, proposals, timelock calls, registrations),
+decodes it both ways and reports logs per second. Decoded arguments are
+compared so the speedup is only reported for identical output. Runs
+offline; no node is needed.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from eth_abi import encode as abi_encode
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.logs import DISCARD
+
+from utils.log_decoder import KNOWN_EVENTS, LogDecoder, event_abi_from_signature
+
+GOVERNOR = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+VAULT = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+
+
+def word(value):
+    return HexBytes(abi_encode(["uint256"], [value]))
+
+
+def address_topic(address):
+    return HexBytes(abi_encode(["address"], [address]))
+
+
+def make_log(address, topics, data, index):
+    return AttributeDict({
+        "address": address,
+        "topics": [HexBytes(topic) for topic in topics],
+        "data": HexBytes(data),
+        "blockNumber": 100 + index // 50,
+        "blockHash": HexBytes(b"\x01" * 32),
+        "transactionHash": HexBytes(index.to_bytes(32, "big")),
+        "transactionIndex": 0,
+        "logIndex": index,
+        "removed": False,
+    })
+
+
+def make_receipt(decoder, count):
+    voter = Web3.to_checksum_address(f"0x{0xABC:040x}")
+    target = Web3.to_checksum_address(f"0x{0xBEEF:040x}")
+    makers = [
+        lambda i: (GOVERNOR, [decoder.topic("VoteCast"), address_topic(voter)],
+                   abi_encode(["uint256", "uint8", "uint256", "string"], [i, i % 3, 10**12 + i, ""])),
+        lambda i: (GOVERNOR, [decoder.topic("VoteCast"), address_topic(voter)],
+                   abi_encode(["uint256", "uint8", "uint256", "string"], [i, 1, 5 * 10**11, "for the grant"])),
+        lambda i: (GOVERNOR, [decoder.topic("ProposalCreated")],
+                   abi_encode(
+                       ["uint256", "address", "address[]", "uint256[]", "string[]", "bytes[]", "uint256", "uint256", "string"],
+                       [i, voter, [target], [10**18], [""], [b""], 100 + i, 110 + i, f"Payout #{i}"],
+                   )),
+        lambda i: (GOVERNOR, [decoder.topic("ProposalQueued")], abi_encode(["uint256", "uint256"], [i, 1_700_000_000 + i])),
+        lambda i: (VAULT, [decoder.topic("CallScheduled"), word(i), word(0)],
+                   abi_encode(["address", "uint256", "bytes", "bytes32", "uint256"], [target, 10**18, b"", b"\x00" * 32, 30])),
+        lambda i: (VAULT, [decoder.topic("CallExecuted"), word(i), word(0)],
+                   abi_encode(["address", "uint256", "bytes"], [target, 10**18, b""])),
+        lambda i: (VAULT, [decoder.topic("NeuronRegistration"), word(1), address_topic(voter)],
+                   abi_encode(["bytes32"], [i.to_bytes(32, "big")])),
+        lambda i: (GOVERNOR, [decoder.topic("ProposalExecuted")], abi_encode(["uint256"], [i])),
+    ]
+    logs = [make_log(*makers[i % len(makers)](i), i) for i in range(count)]
+    return AttributeDict({"logs": logs})
+
+
+def decode_with_process_receipt(contracts, receipt):
+    decoded = []
+    for contract in contracts:
+        for event in contract.events:
+            decoded.extend(event().process_receipt(receipt, errors=DISCARD))
+    return decoded
+
+
+def normalize(args):
+    return {key: (list(value) if isinstance(value, (list, tuple)) else value) for key, value in dict(args).items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark log decoding")
+    parser.add_argument("--logs", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    decoder = LogDecoder.from_artifacts()
+    index_ms = (time.perf_counter() - start) * 1000
+
+    receipt = make_receipt(decoder, args.logs)
+
+    # The contracts a caller would otherwise hold, one ABI per emitting contract
+    abi = [event_abi_from_signature(signature) for signature in KNOWN_EVENTS]
+    w3 = Web3()
+    contracts = [w3.eth.contract(address=GOVERNOR, abi=abi[:12]), w3.eth.contract(address=VAULT, abi=abi[12:])]
+
+    def best_of(fn):
+        timings = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start)
+        return result, min(timings)
+
+    web3_events, web3_seconds = best_of(lambda: decode_with_process_receipt(contracts, receipt))
+    ours, ours_seconds = best_of(lambda: decoder.decode_logs(receipt["logs"]))
+
+    web3_by_index = {event["logIndex"]: normalize(event["args"]) for event in web3_events}
+    mismatches = sum(
+        1 for event in ours.events if web3_by_index.get(event["logIndex"]) != normalize(event["args"])
+    )
+    same = len(web3_by_index) == len(ours.events) and mismatches == 0 and not ours.errors
+
+    print("-" * 52)
+    print(f"LOG DECODING BENCHMARK ({args.logs} logs, {len(decoder.index)} indexed events)")
+    print("-" * 52)
+    print(f"Index build:              {index_ms:.2f} ms (once per process)")
+    print(f"process_receipt per event: {args.logs / web3_seconds:>10.0f} logs/s")
+    print(f"LogDecoder.decode_logs:    {args.logs / ours_seconds:>10.0f} logs/s")
+    print(f"Speedup:                   {web3_seconds / ours_seconds:>10.1f}x")
+    print(f"Output:                    {'identical' if same else f'DIFFERS ({mismatches} mismatches)'}")
+    print("-" * 52)
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: local proposal encoder vs web3 contract objects and eth_abi.
+
+Encodes synthetic payout proposals (one to --actions transfers or calls
+each) the way the tools did before, with `contract.encode_abi` for the
+propose/queue/execute calldata and `eth_abi.encode` plus keccak for
+hashProposal, and with utils.proposal_encoder. Outputs are compared so the
+speedup is only reported for identical results. Runs offline.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from eth_abi import encode as abi_encode
+from web3 import Web3
+
+from utils.proposal_encoder import encode_proposal, timelock_operation_id
+
+GOVERNOR = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+PROPOSAL_TYPES = ["address[]", "uint256[]", "bytes[]", "bytes32"]
+
+
+def governor_abi():
+    def function(name, last_type):
+        inputs = [
+            {"name": "targets", "type": "address[]"},
+            {"name": "values", "type": "uint256[]"},
+            {"name": "calldatas", "type": "bytes[]"},
+            {"name": "description" if last_type == "string" else "descriptionHash", "type": last_type},
+        ]
+        return {"type": "function", "name": name, "inputs": inputs, "outputs": [], "stateMutability": "nonpayable"}
+
+    return [function("propose", "string"), function("queue", "bytes32"), function("execute", "bytes32")]
+
+
+def make_proposals(count, max_actions, seed):
+    rng = random.Random(seed)
+    proposals = []
+    for i in range(count):
+        actions = rng.randint(1, max_actions)
+        targets = [Web3.to_checksum_address("0x" + os.urandom(20).hex()) for _ in range(actions)]
+        values = [rng.randint(0, 10**21) for _ in range(actions)]
+        calldatas = [os.urandom(rng.choice([0, 4, 36, 68, 100])) for _ in range(actions)]
+        proposals.append((targets, values, calldatas, f"Payout batch #{i}: {actions} recipients"))
+    return proposals
+
+
+def encode_with_web3(governor, proposals):
+    results = []
+    for targets, values, calldatas, description in proposals:
+        description_hash = Web3.keccak(text=description)
+        proposal_id = int.from_bytes(Web3.keccak(abi_encode(PROPOSAL_TYPES, [targets, values, calldatas, description_hash])), "big")
+        results.append({
+            "proposal_id": str(proposal_id),
+            "description_hash": description_hash.to_0x_hex(),
+            "propose": governor.encode_abi("propose", [targets, values, calldatas, description]),
+            "queue": governor.encode_abi("queue", [targets, values, calldatas, description_hash]),
+            "execute": governor.encode_abi("execute", [targets, values, calldatas, description_hash]),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline proposal encoding")
+    parser.add_argument("--proposals", type=int, default=2000)
+    parser.add_argument("--actions", type=int, default=5, help="Maximum actions per proposal")
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    proposals = make_proposals(args.proposals, args.actions, seed=1)
+    governor = Web3().eth.contract(address=GOVERNOR, abi=governor_abi())
+
+    def best_of(fn):
+        timings = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start)
+        return result, min(timings)
+
+    web3_results, web3_seconds = best_of(lambda: encode_with_web3(governor, proposals))
+    ours, ours_seconds = best_of(lambda: [encode_proposal(*proposal) for proposal in proposals])
+    ids, ids_seconds = best_of(lambda: [encode_proposal(*proposal, ids_only=True) for proposal in proposals])
+
+    mismatches = sum(1 for theirs, mine in zip(web3_results, ours) if theirs != mine)
+    # The timelock operation id against TimelockController.hashOperationBatch's encoding
+    targets, values, calldatas, description = proposals[0]
+    description_hash = Web3.keccak(text=description)
+    salt = bytes(a ^ b for a, b in zip(bytes.fromhex(GOVERNOR[2:]) + b"\x00" * 12, description_hash))
+    expected_operation = Web3.keccak(abi_encode(
+        ["address[]", "uint256[]", "bytes[]", "bytes32", "bytes32"], [targets, values, calldatas, b"\x00" * 32, salt]
+    ))
+    operation_ok = timelock_operation_id(GOVERNOR, targets, values, calldatas, description_hash) == expected_operation
+    same = mismatches == 0 and operation_ok and [r["proposal_id"] for r in ids] == [r["proposal_id"] for r in ours]
+
+    print("-" * 52)
+    print(f"PROPOSAL ENCODING BENCHMARK ({args.proposals} proposals, 1-{args.actions} actions)")
+    print("-" * 52)
+    print(f"web3 encode_abi + eth_abi: {args.proposals / web3_seconds:>10.0f} proposals/s")
+    print(f"encode_proposal:           {args.proposals / ours_seconds:>10.0f} proposals/s")
+    print(f"encode_proposal ids only:  {args.proposals / ids_seconds:>10.0f} proposals/s")
+    print(f"Speedup:                   {web3_seconds / ours_seconds:>10.1f}x")
+    print(f"Output:                    {'identical' if same else f'DIFFERS ({mismatches} mismatches)'}")
+    print("-" * 52)
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
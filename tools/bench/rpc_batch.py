@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential JSON-RPC reads vs batched reads vs coalesced reads.
+
+Intended to run against a local anvil (`anvil` then pass --rpc-url
+http://127.0.0.1:8545). Reports HTTP round trips and wall time per scenario.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from web3 import Web3
+
+from utils.rpc_batch import CoalescingHTTPProvider, CountingHTTPProvider, batch_read
+
+
+def preflight_calls(w3, sender, recipient):
+    """The reads every write tool performs before signing."""
+    return [
+        lambda: w3.eth.estimate_gas({"from": sender, "to": recipient, "value": 1}),
+        lambda: w3.eth.gas_price,
+        lambda: w3.eth.get_transaction_count(sender, "pending"),
+        lambda: w3.eth.chain_id,
+    ]
+
+
+def balance_calls(w3, addresses):
+    return [lambda address=address: w3.eth.get_balance(address) for address in addresses]
+
+
+def run(label, provider, fn, iterations):
+    provider.reset_counters()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    http_per_iter = provider.http_requests / iterations
+    rpc_per_iter = provider.rpc_calls / iterations
+    print(
+        f"{label:<34} {http_per_iter:>8.1f} {rpc_per_iter:>8.1f} "
+        f"{statistics.median(timings):>10.2f} {max(timings):>10.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON-RPC batching")
+    parser.add_argument("--rpc-url", default="http://127.0.0.1:8545")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--addresses", type=int, default=10, help="Balances per fan-out iteration")
+    args = parser.parse_args()
+
+    provider = CountingHTTPProvider(args.rpc_url)
+    w3 = Web3(provider)
+    if not w3.is_connected():
+        sys.exit(f"RPC Connection Error: cannot reach {args.rpc_url}")
+
+    accounts = w3.eth.accounts
+    if len(accounts) < 2:
+        sys.exit("Node exposes no unlocked accounts (run against anvil)")
+    addresses = [accounts[i % len(accounts)] for i in range(args.addresses)]
+
+    coalescing = CoalescingHTTPProvider(args.rpc_url, window=0.002)
+    w3_coalescing = Web3(coalescing)
+    pool = ThreadPoolExecutor(max_workers=args.addresses)
+
+    print("-" * 74)
+    print(f"JSON-RPC BATCH BENCHMARK ({args.iterations} iterations, {args.rpc_url})")
+    print("-" * 74)
+    print(f"{'Scenario':<34} {'HTTP/it':>8} {'RPC/it':>8} {'p50 ms':>10} {'max ms':>10}")
+
+    calls = preflight_calls(w3, accounts[0], accounts[1])
+    run("write preflight, sequential", provider, lambda: [call() for call in calls], args.iterations)
+    run("write preflight, batch", provider, lambda: batch_read(w3, calls), args.iterations)
+
+    calls = balance_calls(w3, addresses)
+    run(f"{args.addresses} balances, sequential", provider, lambda: [call() for call in calls], args.iterations)
+    run(f"{args.addresses} balances, batch", provider, lambda: batch_read(w3, calls), args.iterations)
+
+    coalesced_calls = balance_calls(w3_coalescing, addresses)
+    run(
+        f"{args.addresses} balances, threads+coalescing",
+        coalescing,
+        lambda: list(pool.map(lambda call: call(), coalesced_calls)),
+        args.iterations,
+    )
+    print("-" * 74)
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: transaction signing throughput against worker process count.
+
+Signs the same batch of setVotingPower-shaped legacy transactions with 1, 2,
+4, ... worker processes (up to --max-workers) and reports transactions per
+second. Runs offline: no node is needed, only the signing key.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+tools_dir = Path(__file__).resolve().parent.parent
+if str(tools_dir) not in sys.path:
+    sys.path.append(str(tools_dir))
+
+from eth_account import Account
+from web3 import Web3
+
+from utils.anvil import ANVIL_PRIVATE_KEY
+from utils.signing_pool import SigningPool
+
+# setVotingPower(uint16,bytes32,uint256)
+SET_VOTING_POWER_SELECTOR = Web3.keccak(text="setVotingPower(uint16,bytes32,uint256)")[:4]
+
+
+def make_transactions(count, chain_id=31337):
+    txs = []
+    for i in range(count):
+        data = (
+            SET_VOTING_POWER_SELECTOR
+            + (1).to_bytes(32, "big")
+            + (0xE3A000 + i).to_bytes(32, "big")
+            + (10_000 * 10**9).to_bytes(32, "big")
+        )
+        txs.append({
+            "to": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+            "nonce": i,
+            "gas": 120_000,
+            "gasPrice": 10**9,
+            "chainId": chain_id,
+            "value": 0,
+            "data": "0x" + data.hex(),
+        })
+    return txs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark process-pool transaction signing")
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=32)
+    args = parser.parse_args()
+
+    txs = make_transactions(args.transactions)
+    reference = [bytes(Account.sign_transaction(tx, ANVIL_PRIVATE_KEY).hash) for tx in txs[:50]]
+
+    worker_counts = []
+    workers = 1
+    while workers <= args.max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print("-" * 52)
+    print(f"SIGNING BENCHMARK ({args.transactions} txs, {os.cpu_count()} CPUs)")
+    print("-" * 52)
+    print(f"{'Workers':>8} {'Seconds':>10} {'tx/s':>10} {'Speedup':>10} {'Order':>8}")
+
+    baseline = None
+    for workers in worker_counts:
+        with SigningPool(ANVIL_PRIVATE_KEY, workers=workers, chunk_size=args.chunk_size) as pool:
+            # Warm up the worker processes outside the measurement
+            list(pool.sign(txs[:workers]))
+            start = time.perf_counter()
+            signed = list(pool.sign(txs))
+            elapsed = time.perf_counter() - start
+
+        in_order = [tx_hash for tx_hash, _ in signed[:len(reference)]] == reference
+        rate = len(signed) / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8} {elapsed:>10.2f} {rate:>10.1f} {rate / baseline:>9.2f}x {'ok' if in_order else 'BROKEN':>8}")
+    print("-" * 52)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+CLI to compute proposal IDs and governor calldata offline.
+
+Gives the hashProposal-compatible proposal ID, the descriptionHash and the
+ABI-encoded propose/queue/execute calldata for a proposal without a node,
+so IDs are known before `propose` is sent. Transfers use the same
+arguments as propose_transfer.py/queue_proposal.py/execute.py:
+
+  python tools/encode_proposal.py --recipient 0x... --amount 1.5 --description "Payout #1"
+  python tools/encode_proposal.py --target 0x... --value 0 --calldata 0x... --description "..."
+
+With --batch, newline-delimited JSON proposals are read from stdin and one
+JSON line is written per proposal; each line is either
+{"recipient", "amount", "description"} (amount in TAO) or
+{"targets", "values", "calldatas", "description"}. A proposal whose ID was
+already seen is marked with "duplicate_of" (the earlier input line), which
+is how Governor.propose would reject it. --ids-only skips the calldata.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from web3 import Web3
+
+from utils.proposal_encoder import encode_proposal
+
+
+def proposal_actions(item):
+    """Returns (targets, values, calldatas, description) of a batch line or CLI arguments."""
+    if item.get("recipient") is not None:
+        return [item["recipient"]], [Web3.to_wei(float(item["amount"]), 'ether')], [b""], item["description"]
+    return item["targets"], item["values"], item["calldatas"], item["description"]
+
+
+def run_batch(lines, governor, ids_only):
+    seen = {}
+    processed = duplicates = failed = 0
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        processed += 1
+        try:
+            result = encode_proposal(*proposal_actions(json.loads(line)), governor=governor, ids_only=ids_only)
+        except (KeyError, TypeError, ValueError) as e:
+            failed += 1
+            error = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+            print(json.dumps({"line": line_no, "error": error}), flush=True)
+            continue
+
+        result = {"line": line_no, **result}
+        if result["proposal_id"] in seen:
+            duplicates += 1
+            result["duplicate_of"] = seen[result["proposal_id"]]
+        else:
+            seen[result["proposal_id"]] = line_no
+        print(json.dumps(result))
+    return processed, duplicates, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode Proposal Offline")
+    parser.add_argument("--recipient", help="Transfer recipient (with --amount)")
+    parser.add_argument("--amount", type=float, help="Transfer amount (TAO)")
+    parser.add_argument("--target", action="append", default=[], help="Call target (repeatable)")
+    parser.add_argument("--value", action="append", default=[], type=int, help="Call value in wei (repeatable)")
+    parser.add_argument("--calldata", action="append", default=[], help="Call data as hex (repeatable)")
+    parser.add_argument("--description")
+    parser.add_argument("--governor", help="TreasuryController address, adds the timelock operation id")
+    parser.add_argument("--batch", action="store_true", help="Read NDJSON proposals from stdin")
+    parser.add_argument("--ids-only", action="store_true", help="With --batch, output only IDs and description hashes")
+    args = parser.parse_args()
+
+    if args.batch:
+        start = time.perf_counter()
+        processed, duplicates, failed = run_batch(sys.stdin, args.governor, args.ids_only)
+        elapsed = time.perf_counter() - start
+        print(
+            f"Encoded {processed - failed} proposals ({duplicates} duplicates, {failed} invalid) in {elapsed:.2f}s"
+            + (f" ({processed / elapsed:.0f}/s)" if elapsed > 0 else ""),
+            file=sys.stderr,
+        )
+        if failed:
+            sys.exit(1)
+        return
+
+    if args.description is None:
+        parser.error("--description is required")
+    if args.recipient:
+        if args.amount is None:
+            parser.error("--recipient requires --amount")
+        item = {"recipient": args.recipient, "amount": args.amount, "description": args.description}
+    else:
+        item = {"targets": args.target, "values": args.value, "calldatas": args.calldata, "description": args.description}
+
+    try:
+        encoded = encode_proposal(*proposal_actions(item), governor=args.governor)
+    except ValueError as e:
+        sys.exit(f"Proposal Error: {e}")
+
+    print("-" * 40)
+    print("PROPOSAL ENCODING")
+    print("-" * 40)
+    print(f"Proposal ID:      {encoded['proposal_id']}")
+    print(f"Description hash: {encoded['description_hash']}")
+    if "timelock_operation_id" in encoded:
+        print(f"Timelock op id:   {encoded['timelock_operation_id']}")
+    print("-" * 40)
+    for name in ("propose", "queue", "execute"):
+        print(f"{name}: {encoded[name]}")
+    print("-" * 40)
+
+if __name__ == "__main__":
+    main()
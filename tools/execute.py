@@ -5,7 +5,6 @@ Requires exact same parameters as Propose.
 """
 
 import argparse
-import os
 import sys
 from pathlib import Path
 from web3 import Web3
@@ -15,6 +14,10 @@ if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
 from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, add_inclusion_args, tracker_from_args
+from utils.proposal_encoder import hash_proposal
+from utils.rpc_batch import fetch_tx_params
+from utils.signing_agent import AgentError, get_signer
 
 def main():
     parser = argparse.ArgumentParser(description="Execute Proposal")
@@ -27,11 +30,16 @@ def main():
     parser.add_argument("--rpc-url", required=True)
     parser.add_argument("--private-key", default=None)
     parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(parser)
     args = parser.parse_args()
 
-    private_key = args.private_key or os.getenv("PRIVATE_KEY")
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None:
+        raise SystemExit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
     w3 = get_web3_provider(args.rpc_url)
-    account = w3.eth.account.from_key(private_key)
 
     artifact_path = current_dir.parent / "out" / "TreasuryController.sol" / "TreasuryController.json"
     governor = load_contract(w3, args.contract, artifact_path)
@@ -41,33 +49,45 @@ def main():
     values = [w3.to_wei(args.amount_eth, 'ether')]
     calldatas = [b""]
     description_hash = Web3.keccak(text=args.description)
+    print(f"Proposal ID: {hash_proposal(targets, values, calldatas, description_hash)}")
 
     print(f"--- EXECUTING PROPOSAL ---")
 
     fn = governor.functions.execute(targets, values, calldatas, description_hash)
 
+    gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(w3, fn, account.address)
     try:
-        gas_limit = int(fn.estimate_gas({"from": account.address}) * 1.2)
-        gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei') if args.force_gas_price_gwei else w3.eth.gas_price
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
+        gas_limit = int(gas_estimate * 1.2)
+        if args.force_gas_price_gwei:
+            gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
+        elif isinstance(node_gas_price, Exception):
+            raise node_gas_price
+        else:
+            gas_price = node_gas_price
     except Exception as e:
         print(f"Gas Estimate failed ({e}), using safe fallback")
         gas_limit = 2_000_000 # High limit for execution
         gas_price = w3.to_wei(100, 'gwei')
 
-    nonce = w3.eth.get_transaction_count(account.address, "pending")
     tx = fn.build_transaction({
         "from": account.address,
         "nonce": nonce,
         "gas": gas_limit,
         "gasPrice": gas_price,
-        "chainId": w3.eth.chain_id,
+        "chainId": chain_id,
         "value": 0,
     })
 
-    signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-    print(f"Sent tx: {tx_hash.hex()}")
-    w3.eth.wait_for_transaction_receipt(tx_hash)
+    tracker = tracker_from_args(w3, account, args, log=print)
+    pending = tracker.send(tx)
+    print(f"Sent tx: {pending.tx_hash.hex()}")
+    try:
+        tracker.wait([pending])
+    except InclusionError as e:
+        sys.exit(f"Inclusion Error: {e}")
+    print(f"Included after {pending.latency:.1f}s ({pending.blocks_to_inclusion} blocks, {pending.attempts} broadcasts)")
     print("Proposal EXECUTED! Money should be moved.")
 
 if __name__ == "__main__":
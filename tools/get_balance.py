@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 """
 CLI to check native balance (TAO) of any address.
+
+Accepts several addresses at once (and/or a --file with one address per line)
+and reads all balances at a single block so the results are consistent with
+each other. H160 addresses are read in JSON-RPC batches. SS58 addresses
+(coldkeys) are read from the substrate System.Account storage of --network in
+one multi-key query; bittensor is only imported when one is given. An SS58
+address that is the mirror of a listed H160 is merged into that H160. Balances under --min-tao (or a per-address
+threshold from the file) are flagged and make the process exit with code 3
+(argparse already uses 2 for usage errors).
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -11,42 +21,190 @@ current_dir = Path(__file__).resolve().parent
 if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
+from utils.address_converter import h160_to_ss58, ss58_to_bytes
 from utils.contract_loader import get_web3_provider
+from utils.reads import read_account_balances
+from utils.rpc_batch import batch_read
+
+# 2 is argparse's usage-error status
+EXIT_ALERT = 3
+
+
+def read_address_file(path: Path):
+    """
+    Parses `address[,label[,min_tao]]` lines. Blank lines and lines starting
+    with '#' are ignored.
+    """
+    entries = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part.strip() for part in line.split(",")]
+        try:
+            min_tao = float(parts[2]) if len(parts) > 2 and parts[2] else None
+        except ValueError:
+            raise ValueError(f"{path}:{line_no}: invalid threshold '{parts[2]}'")
+        entries.append({
+            "address": parts[0],
+            "label": parts[1] if len(parts) > 1 else "",
+            "min_tao": min_tao,
+        })
+    return entries
+
+
+def resolve_addresses(w3, entries):
+    """
+    Normalizes H160 addresses to checksum form, checks SS58 addresses and
+    merges entries that name the same account (an H160 and its SS58 mirror
+    included): the first non-empty label is kept and the highest threshold
+    wins. Entries are keyed by SS58; "h160" is None for accounts only known
+    by SS58, whose balance has to come from the substrate.
+    """
+    unique = {}
+    for entry in entries:
+        if w3.is_address(entry["address"]):
+            h160 = w3.to_checksum_address(entry["address"])
+            ss58 = h160_to_ss58(h160)
+        else:
+            try:
+                ss58_to_bytes(entry["address"])
+            except (ValueError, IndexError):
+                raise ValueError(f"'{entry['address']}' is neither an H160 nor an SS58 address")
+            h160, ss58 = None, entry["address"]
+        merged = unique.setdefault(ss58, {**entry, "address": h160 or ss58, "h160": h160, "ss58": ss58})
+        if h160 and not merged["h160"]:
+            # The SS58 mirror was listed first: read it over the EVM RPC like the H160
+            merged.update(address=h160, h160=h160)
+        if not merged["label"]:
+            merged["label"] = entry["label"]
+        if entry["min_tao"] is not None and (merged["min_tao"] is None or entry["min_tao"] > merged["min_tao"]):
+            merged["min_tao"] = entry["min_tao"]
+    return list(unique.values())
+
+
+def fetch_balances(w3, addresses, block_number, batch_size):
+    """Reads all balances at `block_number` in JSON-RPC batches. Returns wei amounts."""
+    balances = []
+    for start in range(0, len(addresses), batch_size):
+        chunk = addresses[start:start + batch_size]
+        balances.extend(batch_read(w3, [
+            lambda address=address: w3.eth.get_balance(address, block_identifier=block_number)
+            for address in chunk
+        ]))
+    return balances
+
+
+def fetch_substrate_balances(network, ss58_addresses, block_number):
+    """Reads SS58 balances at `block_number` from the substrate of `network`. Returns wei amounts."""
+    import bittensor as bt
+
+    subtensor = bt.subtensor(network=network)
+    try:
+        block_hash = subtensor.substrate.get_block_hash(block_number)
+        return read_account_balances(subtensor.substrate, ss58_addresses, block_hash=block_hash)
+    finally:
+        subtensor.substrate.close()
+
+
+def fetch_all_balances(w3, entries, block_number, args):
+    """Balances of resolved entries in their order: H160s over the RPC, the rest from the substrate."""
+    evm = [entry["h160"] for entry in entries if entry["h160"]]
+    substrate = [entry["ss58"] for entry in entries if not entry["h160"]]
+    balances = dict(zip(evm, fetch_balances(w3, evm, block_number, args.batch_size)))
+    if substrate:
+        balances.update(zip(substrate, fetch_substrate_balances(args.network, substrate, block_number)))
+    return [balances[entry["h160"] or entry["ss58"]] for entry in entries]
+
+
+def print_single(target_address, balance_wei, balance_tao):
+    print("-" * 40)
+    print("BALANCE CHECK")
+    print("-" * 40)
+    print(f"Target:  {target_address}")
+    print("-" * 40)
+    print(f"TAO:     {balance_tao}")
+    print(f"Wei/Rao: {balance_wei}")
+    print("-" * 40)
+
+
+def print_table(results, block_number):
+    print("-" * 100)
+    print(f"BALANCE SCAN @ Block {block_number}")
+    print("-" * 100)
+    print(f"{'Address':<48}  {'Label':<16}  {'TAO':>22}  {'Min':>10}  Status")
+    for row in results:
+        min_tao = "" if row["min_tao"] is None else f"{row['min_tao']:g}"
+        status = "ALERT" if row["alert"] else "ok"
+        print(f"{row['address']:<48}  {row['label'][:16]:<16}  {row['tao']:>22}  {min_tao:>10}  {status}")
+    print("-" * 100)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Get Account Balance")
-    parser.add_argument("address", help="Address to check (Wallet or Contract)")
+    parser.add_argument("address", nargs="*", help="H160 or SS58 address(es) to check (Wallet, Contract or coldkey)")
+    parser.add_argument("--file", type=Path, help="File with address[,label[,min_tao]] lines")
+    parser.add_argument("--min-tao", type=float, help="Alert when a balance is below this (TAO)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    parser.add_argument("--batch-size", type=int, default=100, help="Balances per JSON-RPC batch")
+    parser.add_argument("--network", default="test", help="Bittensor network for SS58 addresses")
     parser.add_argument("--rpc-url", required=True)
     args = parser.parse_args()
 
+    entries = [{"address": address, "label": "", "min_tao": None} for address in args.address]
+    if args.file:
+        try:
+            entries.extend(read_address_file(args.file))
+        except (OSError, ValueError) as e:
+            sys.exit(f"Address File Error: {e}")
+    if not entries:
+        parser.error("pass at least one address or --file")
+
     # 1. Connect
     try:
         w3 = get_web3_provider(args.rpc_url)
     except Exception as e:
         sys.exit(f"RPC Connection Error: {e}")
 
-    # 2. Resolve Address
-    if not w3.is_address(args.address):
-        sys.exit("Invalid address format")
-
-    target_address = w3.to_checksum_address(args.address)
+    # 2. Resolve Addresses
+    try:
+        entries = resolve_addresses(w3, entries)
+    except ValueError as e:
+        sys.exit(f"Invalid address format: {e}")
 
-    # 3. Get Balance
+    # 3. Get Balances (all at the same block)
     try:
-        # Returns balance in Wei (10^18)
-        balance_wei = w3.eth.get_balance(target_address)
-        balance_tao = w3.from_wei(balance_wei, 'ether')
+        block_number = w3.eth.block_number
+        balances_wei = fetch_all_balances(w3, entries, block_number, args)
     except Exception as e:
         sys.exit(f"Error fetching balance: {e}")
 
-    print("-" * 40)
-    print(f"BALANCE CHECK")
-    print("-" * 40)
-    print(f"Target:  {target_address}")
-    print("-" * 40)
-    print(f"TAO:     {balance_tao}")
-    print(f"Wei/Rao: {balance_wei}")
-    print("-" * 40)
+    single = len(entries) == 1 and not args.file and not args.json and args.min_tao is None
+    if single:
+        print_single(entries[0]["address"], balances_wei[0], w3.from_wei(balances_wei[0], 'ether'))
+        return
+
+    results = []
+    for entry, balance_wei in zip(entries, balances_wei):
+        min_tao = entry["min_tao"] if entry["min_tao"] is not None else args.min_tao
+        min_wei = w3.to_wei(min_tao, 'ether') if min_tao is not None else None
+        results.append({
+            "address": entry["address"],
+            "ss58": entry["ss58"],
+            "label": entry["label"],
+            "wei": balance_wei,
+            "tao": str(w3.from_wei(balance_wei, 'ether')),
+            "min_tao": min_tao,
+            "alert": min_wei is not None and balance_wei < min_wei,
+        })
+
+    if args.json:
+        print(json.dumps({"block": block_number, "balances": results}, indent=2))
+    else:
+        print_table(results, block_number)
+
+    if any(row["alert"] for row in results):
+        sys.exit(EXIT_ALERT)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
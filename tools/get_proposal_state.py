@@ -12,18 +12,9 @@ if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
 from utils.contract_loader import get_web3_provider, load_contract
+from utils.reads import STATES
+from utils.rpc_batch import batch_read
 
-# OpenZeppelin ProposalState Enum
-STATES = [
-    "Pending",   # 0
-    "Active",    # 1
-    "Canceled",  # 2
-    "Defeated",  # 3
-    "Succeeded", # 4
-    "Queued",    # 5
-    "Expired",   # 6
-    "Executed"   # 7
-]
 
 def main():
     parser = argparse.ArgumentParser(description="Get Proposal State")
@@ -49,20 +40,28 @@ def main():
     print(f"QUERY PROPOSAL: {args.proposal_id}")
     print("-" * 40)
 
-    # 3. Get State
-    try:
-        state_enum = contract.functions.state(args.proposal_id).call()
+    # 3. Fetch all reads in one JSON-RPC batch
+    state_enum, snapshot, deadline, current_block, votes = batch_read(w3, [
+        contract.functions.state(args.proposal_id),
+        contract.functions.proposalSnapshot(args.proposal_id),
+        contract.functions.proposalDeadline(args.proposal_id),
+        lambda: w3.eth.block_number,
+        # proposalVotes(uint256) returns (against, for, abstain)
+        contract.functions.proposalVotes(args.proposal_id),
+    ], return_exceptions=True)
+
+    # 4. Get State
+    if isinstance(state_enum, Exception):
+        print(f"State:      Error ({state_enum})")
+    else:
         state_str = STATES[state_enum] if 0 <= state_enum < len(STATES) else "Unknown"
         print(f"State:      {state_str} ({state_enum})")
-    except Exception as e:
-        print(f"State:      Error ({e})")
-
-    # 4. Get Deadlines (Snapshot & Deadline)
-    try:
-        snapshot = contract.functions.proposalSnapshot(args.proposal_id).call()
-        deadline = contract.functions.proposalDeadline(args.proposal_id).call()
-        current_block = w3.eth.block_number
 
+    # 5. Get Deadlines (Snapshot & Deadline)
+    details_error = next((r for r in (snapshot, deadline, current_block) if isinstance(r, Exception)), None)
+    if details_error is not None:
+        print(f"Details:    Error fetching details ({details_error})")
+    else:
         print(f"Snapshot:   Block {snapshot}")
         print(f"Deadline:   Block {deadline}")
         print(f"Current:    Block {current_block}")
@@ -72,24 +71,16 @@ def main():
         else:
             print(f"Status:     Voting Ended")
 
-    except Exception as e:
-        print(f"Details:    Error fetching details ({e})")
-
-    # 5. Get Votes (For/Against/Abstain)
-    try:
-        # proposalVotes(uint256) returns (against, for, abstain)
-        votes = contract.functions.proposalVotes(args.proposal_id).call()
-
+    # 6. Get Votes (For/Against/Abstain)
+    # Not all governors implement proposalVotes directly depending on extensions,
+    # but ours (GovernorCountingSimple) does.
+    if not isinstance(votes, Exception):
         # Helper to format wei to human readable
         # Assuming token is 9 decimals (Mock) or 18. Just showing raw for safety.
         print("-" * 40)
         print(f"Against:    {votes[0]}")
         print(f"For:        {votes[1]}")
         print(f"Abstain:    {votes[2]}")
-    except Exception:
-        # Not all governors implement proposalVotes directly depending on extensions,
-        # but ours (GovernorCountingSimple) does.
-        pass
 
     print("-" * 40)
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+CLI to list TreasuryVault payout streams and what each can claim right now.
+
+Reads every stream (or only the given ids / --recipient) with
+`streams(id)` and `claimable(id)` in JSON-RPC batches at the latest block.
+Claiming is permissionless: anyone may call `claim(id)` and the funds go to
+the stream's recipient.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.rpc_batch import batch_read
+
+
+def fetch_streams(w3, vault, stream_ids, batch_size):
+    """Returns one dict per stream id, read in batches of `batch_size` ids."""
+    rows = []
+    for start in range(0, len(stream_ids), batch_size):
+        chunk = stream_ids[start:start + batch_size]
+        calls = []
+        for stream_id in chunk:
+            calls.append(vault.functions.streams(stream_id))
+            calls.append(vault.functions.claimable(stream_id))
+        results = batch_read(w3, calls)
+        for i, stream_id in enumerate(chunk):
+            recipient, stream_start, period, amount_per_period, periods, claimed = results[2 * i]
+            claimable_wei, claimable_periods = results[2 * i + 1]
+            rows.append({
+                "id": stream_id,
+                "recipient": recipient,
+                "start": stream_start,
+                "period": period,
+                "amount_per_period_wei": amount_per_period,
+                "periods": periods,
+                "claimed": claimed,
+                "claimable_periods": claimable_periods,
+                "claimable_wei": claimable_wei,
+                "remaining_wei": (periods - claimed) * amount_per_period,
+            })
+    return rows
+
+
+def format_time(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+def print_table(w3, rows, block_number):
+    print("-" * 110)
+    print(f"PAYOUT STREAMS @ Block {block_number}")
+    print("-" * 110)
+    print(f"{'ID':>4}  {'Recipient':<42}  {'Per Period (TAO)':>18}  {'Every':>8}  {'Start (UTC)':<16}  {'Paid':>9}  {'Claimable (TAO)':>16}")
+    for row in rows:
+        every = f"{row['period'] / 86400:g}d"
+        paid = f"{row['claimed']}/{row['periods']}"
+        print(
+            f"{row['id']:>4}  {row['recipient']:<42}  {w3.from_wei(row['amount_per_period_wei'], 'ether'):>18}  "
+            f"{every:>8}  {format_time(row['start']):<16}  {paid:>9}  {w3.from_wei(row['claimable_wei'], 'ether'):>16}"
+        )
+    print("-" * 110)
+    total = sum(row["claimable_wei"] for row in rows)
+    remaining = sum(row["remaining_wei"] for row in rows)
+    print(f"Claimable now:   {w3.from_wei(total, 'ether')} TAO")
+    print(f"Still committed: {w3.from_wei(remaining, 'ether')} TAO")
+    print("-" * 110)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List Payout Streams")
+    parser.add_argument("contract", help="TreasuryVault address")
+    parser.add_argument("stream_id", nargs="*", type=int, help="Stream id(s); all streams if omitted")
+    parser.add_argument("--recipient", help="Only streams paying this address")
+    parser.add_argument("--claimable", action="store_true", help="Only streams with something to claim")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    parser.add_argument("--batch-size", type=int, default=50, help="Streams per JSON-RPC batch")
+    parser.add_argument("--rpc-url", required=True)
+    args = parser.parse_args()
+
+    # 1. Connect
+    try:
+        w3 = get_web3_provider(args.rpc_url)
+        artifact_path = current_dir.parent / "out" / "TreasuryVault.sol" / "TreasuryVault.json"
+        vault = load_contract(w3, args.contract, artifact_path)
+    except Exception as e:
+        sys.exit(f"RPC Connection Error: {e}")
+
+    # 2. Read Streams
+    try:
+        block_number, next_stream_id = batch_read(w3, [
+            lambda: w3.eth.block_number,
+            vault.functions.nextStreamId(),
+        ])
+        stream_ids = args.stream_id or list(range(next_stream_id))
+        unknown = [stream_id for stream_id in stream_ids if stream_id >= next_stream_id]
+        if unknown:
+            sys.exit(f"Error: unknown stream id(s) {unknown} (vault has {next_stream_id})")
+        rows = fetch_streams(w3, vault, stream_ids, args.batch_size)
+    except Exception as e:
+        sys.exit(f"Error fetching streams: {e}")
+
+    if args.recipient:
+        recipient = w3.to_checksum_address(args.recipient)
+        rows = [row for row in rows if row["recipient"] == recipient]
+    if args.claimable:
+        rows = [row for row in rows if row["claimable_wei"] > 0]
+
+    if args.json:
+        print(json.dumps({"block": block_number, "streams": rows}, indent=2))
+    else:
+        print_table(w3, rows, block_number)
+
+
+if __name__ == "__main__":
+    main()
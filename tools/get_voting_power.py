@@ -18,6 +18,7 @@ def main():
     parser.add_argument("contract", help="MockBittensorVotes contract address")
     parser.add_argument("--hotkey", required=True, help="Address/Hotkey (0x...)")
     parser.add_argument("--netuid", default=1, type=int)
+    parser.add_argument("--block", type=int, help="Read checkpointed power at a past block")
     parser.add_argument("--rpc-url", required=True)
     args = parser.parse_args()
 
@@ -47,7 +48,14 @@ def main():
 
     # 4. Call (No Gas)
     # function getVotingPower(uint16 netuid, bytes32 key) external view returns (uint256)
-    power_raw = contract.functions.getVotingPower(args.netuid, hotkey_bytes32).call()
+    # function getPastVotingPower(uint16 netuid, bytes32 key, uint256 timepoint) external view returns (uint256)
+    try:
+        if args.block is not None:
+            power_raw = contract.functions.getPastVotingPower(args.netuid, hotkey_bytes32, args.block).call()
+        else:
+            power_raw = contract.functions.getVotingPower(args.netuid, hotkey_bytes32).call()
+    except Exception as e:
+        sys.exit(f"Call Error: {e}")
 
     # 9 decimals logic (RAO -> TAO for display)
     power_tao = power_raw / 1_000_000_000
@@ -58,6 +66,8 @@ def main():
     print(f"Contract: {args.contract}")
     print(f"NetUID:   {args.netuid}")
     print(f"Hotkey:   {args.hotkey}")
+    if args.block is not None:
+        print(f"Block:    {args.block}")
     print("-" * 40)
     print(f"Power (Raw): {power_raw}")
     print(f"Power (TAO): {power_tao}")
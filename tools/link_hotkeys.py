@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+CLI for calling: HotkeyRegistry.link(address voter, bytes32[] hotkeys)
+
+Delegates validator hotkeys to one EVM voting address, so TreasuryController
+sums their voting power into a single vote. Hotkeys come from a coldkey's
+stake (utils.staking_manager.fetch_validator_stakes, SS58 hotkeys decoded
+with address_converter.ss58_to_bytes) or from --hotkey (SS58 or 0x hex):
+
+  python tools/link_hotkeys.py 0xRegistry --accept --rpc-url $RPC
+  python tools/link_hotkeys.py 0xRegistry --coldkey 5F... --netuid 1 --propose --rpc-url $RPC
+  python tools/link_hotkeys.py 0xRegistry --hotkey 5G... --hotkey 0x... --voter 0x... --rpc-url $RPC
+
+The registry only links hotkeys to voters that accepted links: --accept sends
+setAcceptsLinks(true) from the signer. script/Deploy.s.sol hands the registry
+to TreasuryVault, so links go through governance: --propose writes one NDJSON
+proposal ({"targets", "values", "calldatas", "description"}) that
+encode_proposal.py --batch accepts. When the signer owns the registry the
+calls are sent directly.
+
+The registry can't verify that a hotkey agreed to be linked: whoever reviews
+a link proposal vouches for it (see "Hotkey delegation" in README.md).
+
+Current delegations are read in one JSON-RPC batch and hotkeys already linked
+to the voter are skipped. The rest is split in --chunk-size hotkeys per call
+and sent with locally assigned nonces. With --unlink, the delegations of the
+given hotkeys are removed instead; a voter that doesn't own the registry
+releases hotkeys delegated to itself.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from web3 import Web3
+
+from utils.address_converter import ss58_to_bytes
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, add_inclusion_args, tracker_from_args
+from utils.reads import hotkey_to_bytes32, tao_to_rao
+from utils.rpc_batch import batch_read, fetch_tx_params
+from utils.signing_agent import AgentError, get_signer
+from utils.staking_manager import fetch_validator_stakes
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def parse_hotkey(value):
+    """A hotkey as bytes32: 0x hex (EVM addresses are left padded) or an SS58 address."""
+    if value.startswith("0x"):
+        return hotkey_to_bytes32(value)
+    return ss58_to_bytes(value)
+
+
+def collect_hotkeys(args):
+    hotkeys = [parse_hotkey(value) for value in args.hotkey]
+    if args.coldkey:
+        staked, amounts_tao = fetch_validator_stakes(args.coldkey, args.netuid, network=args.network)
+        min_rao = tao_to_rao(args.min_stake)
+        kept = [hotkey for hotkey, tao in zip(staked, amounts_tao) if tao_to_rao(tao) >= min_rao]
+        print(f"Staked hotkeys on netuid {args.netuid}: {len(staked)} ({len(staked) - len(kept)} under --min-stake)")
+        hotkeys.extend(kept)
+    # Keep the first occurrence of each hotkey
+    return list(dict.fromkeys(hotkeys))
+
+
+def account_hotkey_owner(hotkey):
+    """The EVM account a left padded 20 byte hotkey belongs to, None for other hotkeys."""
+    if int.from_bytes(hotkey, "big") >> 160:
+        return None
+    return Web3.to_checksum_address(hotkey[12:])
+
+
+def pending_changes(w3, registry, voter, hotkeys, unlink, batch_size):
+    """
+    Hotkeys whose delegation differs from the target, with current voters read in batches.
+
+    Returns (changes, moved, current) where current maps each changed hotkey
+    to its voter now.
+    """
+    target = ZERO_ADDRESS if unlink else voter
+    current = []
+    for start in range(0, len(hotkeys), batch_size):
+        current.extend(batch_read(w3, [
+            registry.functions.voterOf(hotkey) for hotkey in hotkeys[start:start + batch_size]
+        ]))
+    moved = sum(1 for owner in current if owner not in (ZERO_ADDRESS, target))
+    changed = {hotkey: owner for hotkey, owner in zip(hotkeys, current) if owner != target}
+    return list(changed), moved, changed
+
+
+def send_calls(w3, account, args, fns, labels):
+    """Sends one transaction per call with consecutive nonces; exits unless all succeed."""
+    # Parameters of the first transaction in one batch; the others reuse them with the next nonces
+    gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(w3, fns[0], account.address)
+    if isinstance(gas_estimate, Exception):
+        sys.exit(f"Gas Estimation Error: {gas_estimate}")
+    if args.force_gas_price_gwei:
+        gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
+    elif isinstance(node_gas_price, Exception):
+        sys.exit(f"Gas Price Error: {node_gas_price}")
+    else:
+        gas_price = node_gas_price
+    estimates = [gas_estimate]
+    try:
+        for start in range(1, len(fns), args.batch_size):
+            estimates.extend(batch_read(w3, [
+                lambda fn=fn: fn.estimate_gas({"from": account.address}) for fn in fns[start:start + args.batch_size]
+            ]))
+    except Exception as e:
+        sys.exit(f"Gas Estimation Error: {e}")
+
+    tracker = tracker_from_args(w3, account, args, log=print)
+    pending = []
+    try:
+        for i, (fn, estimate) in enumerate(zip(fns, estimates)):
+            tx = fn.build_transaction({
+                "from": account.address,
+                "nonce": nonce + i,
+                "gas": int(estimate * 1.2),
+                "gasPrice": gas_price,
+                "chainId": chain_id,
+                "value": 0,
+            })
+            pending.append(tracker.send(tx))
+            print(f"Sent {labels[i]} (Nonce: {nonce + i}): {pending[-1].tx_hash.hex()}")
+        print("Waiting for receipts...")
+        receipts = tracker.wait(pending)
+    except InclusionError as e:
+        sys.exit(f"Inclusion Error: {e}")
+    except Exception as e:
+        sys.exit(f"Transaction Error: {e}")
+
+    failed = [p.tx_hash.hex() for p, receipt in zip(pending, receipts) if receipt["status"] != 1]
+    if failed:
+        print(f"FAILED: {len(failed)} of {len(pending)}")
+        for tx_hash in failed:
+            print(f"  {tx_hash}")
+        sys.exit(1)
+    return receipts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delegate Hotkeys to a Voting Address")
+    parser.add_argument("contract", help="HotkeyRegistry contract address")
+    parser.add_argument("--voter", help="Voting address (default: the signer)")
+    parser.add_argument("--hotkey", action="append", default=[], help="Hotkey as SS58 or 0x hex (repeatable)")
+    parser.add_argument("--coldkey", help="Link every hotkey this coldkey stakes on --netuid")
+    parser.add_argument("--netuid", default=1, type=int)
+    parser.add_argument("--network", default="test", help="btcli network")
+    parser.add_argument("--min-stake", type=float, default=0.0, help="Skip --coldkey hotkeys under this stake (TAO)")
+    parser.add_argument("--unlink", action="store_true", help="Remove the delegation of the given hotkeys")
+    parser.add_argument("--accept", action="store_true", help="Accept links to the signer and exit")
+    parser.add_argument("--propose", action="store_true",
+                        help="Write a governance proposal (NDJSON) instead of sending")
+    parser.add_argument("--description", default="Link hotkeys", help="With --propose, proposal description")
+    parser.add_argument("--chunk-size", type=int, default=32, help="Hotkeys per transaction")
+    parser.add_argument("--batch-size", type=int, default=100, help="JSON-RPC calls per batch")
+    parser.add_argument("--dry-run", action="store_true", help="Show the changes without sending")
+    parser.add_argument("--rpc-url", required=True)
+    parser.add_argument("--private-key", default=None)
+    parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(parser)
+    args = parser.parse_args()
+    if not args.hotkey and not args.coldkey and not args.accept:
+        parser.error("pass --hotkey and/or --coldkey")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None and not ((args.dry_run or args.propose) and args.voter):
+        raise SystemExit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
+
+    try:
+        w3 = get_web3_provider(args.rpc_url)
+    except Exception as e:
+        print(f"CRITICAL ERROR connecting to Web3: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    artifact_path = current_dir.parent / "out" / "HotkeyRegistry.sol" / "HotkeyRegistry.json"
+    if args.accept:
+        try:
+            registry = load_contract(w3, args.contract, artifact_path)
+        except Exception as e:
+            sys.exit(f"Registry Error: {e}")
+        if not args.dry_run:
+            send_calls(w3, account, args, [registry.functions.setAcceptsLinks(True)], ["setAcceptsLinks(true)"])
+            print(f"SUCCESS! {account.address} accepts hotkey links")
+        return
+
+    try:
+        hotkeys = collect_hotkeys(args)
+        voter = Web3.to_checksum_address(args.voter or account.address)
+    except (RuntimeError, ValueError) as e:
+        sys.exit(f"Hotkey Error: {e}")
+    if not hotkeys:
+        sys.exit("Error: no hotkeys to link")
+    if not args.unlink:
+        foreign = [hotkey for hotkey in hotkeys if account_hotkey_owner(hotkey) not in (None, voter)]
+        if foreign:
+            sys.exit(f"Hotkey Error: 0x{foreign[0].hex()} is the hotkey of {account_hotkey_owner(foreign[0])} "
+                     f"and can only be linked to that account")
+
+    try:
+        registry = load_contract(w3, args.contract, artifact_path)
+        changes, moved, current = pending_changes(w3, registry, voter, hotkeys, args.unlink, args.batch_size)
+        owner, accepts, linked, limit = batch_read(w3, [
+            registry.functions.owner(),
+            registry.functions.acceptsLinks(voter),
+            registry.functions.linkedCount(voter),
+            registry.functions.MAX_HOTKEYS_PER_VOTER(),
+        ])
+    except Exception as e:
+        sys.exit(f"Registry Error: {e}")
+
+    # With --propose stdout carries the proposal only
+    out = sys.stderr if args.propose else sys.stdout
+    print("-" * 40, file=out)
+    print("HOTKEY DELEGATION", file=out)
+    print("-" * 40, file=out)
+    print(f"Registry owner:   {owner}", file=out)
+    print(f"Voter:            {voter} ({'accepts' if accepts else 'does not accept'} links)", file=out)
+    print(f"Hotkeys given:    {len(hotkeys)}", file=out)
+    print(f"Already in place: {len(hotkeys) - len(changes)}", file=out)
+    label = "To unlink:" if args.unlink else "To link:"
+    print(f"{label:<18}{len(changes)}" + (f" ({moved} from other voters)" if moved and not args.unlink else ""),
+          file=out)
+    print(f"Voter's list:     {linked} of {limit} slots used", file=out)
+    print("-" * 40, file=out)
+    if not args.unlink and linked + len(changes) > limit:
+        # Hotkeys still in the list don't take a new slot, and the registry frees the slots of
+        # hotkeys unlinked more than SNAPSHOT_RETENTION_BLOCKS ago
+        print(f"WARNING: up to {linked + len(changes)} hotkeys for {limit} slots, "
+              "link may revert with TooManyHotkeys", file=sys.stderr)
+    if not args.unlink and not accepts:
+        message = f"{voter} doesn't accept links yet, the voter runs: link_hotkeys.py {args.contract} --accept"
+        if not args.propose:
+            sys.exit(f"Voter Error: {message}")
+        print(f"WARNING: {message} (before the proposal executes)", file=sys.stderr)
+    if not changes or args.dry_run:
+        return
+
+    chunks = [changes[start:start + args.chunk_size] for start in range(0, len(changes), args.chunk_size)]
+    releasing = False
+    if not args.propose and account.address != owner:
+        if not args.unlink:
+            sys.exit(f"Owner Error: the registry is owned by {owner}, link through governance with --propose")
+        # A voter drops its own delegations without the owner
+        foreign = [hotkey for hotkey in changes if current[hotkey] != account.address]
+        if foreign:
+            sys.exit(f"Owner Error: the registry is owned by {owner} and 0x{foreign[0].hex()} is delegated to "
+                     f"{current[foreign[0]]}, unlink through governance with --propose")
+        releasing = True
+    if releasing:
+        fns = [registry.functions.release(chunk) for chunk in chunks]
+    elif args.unlink:
+        fns = [registry.functions.unlink(chunk) for chunk in chunks]
+    else:
+        fns = [registry.functions.link(voter, chunk) for chunk in chunks]
+
+    if args.propose:
+        # Executed by the vault (the registry's owner) through the timelock, one action per chunk
+        print(json.dumps({
+            "targets": [registry.address] * len(fns),
+            "values": [0] * len(fns),
+            "calldatas": [fn._encode_transaction_data() for fn in fns],
+            "description": args.description,
+        }))
+        print(f"Proposal with {len(fns)} actions for {len(changes)} hotkeys written to stdout", file=sys.stderr)
+        return
+
+    receipts = send_calls(w3, account, args, fns, [f"{len(chunk)} hotkeys" for chunk in chunks])
+    gas_used = sum(receipt["gasUsed"] for receipt in receipts)
+    print(f"SUCCESS! {len(changes)} hotkeys in {len(receipts)} transactions, gas used: {gas_used}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+CLI to run an offline stand-in for a subtensor node with the EVM.
+
+Starts anvil, deploys the governance contracts with script/Deploy.s.sol,
+places LocalNeuronPrecompile at the neuron precompile address (0x804) and
+serves a fake substrate RPC with Burn and stake storage. Burns taken by
+the precompile are reported and mirrored into the fake substrate every
+--interval seconds until interrupted.
+
+The tools themselves only talk to real networks. Point one at the fake
+substrate through tools/bench/fake_network.py, which injects it:
+
+  python tools/bench/fake_network.py http://127.0.0.1:PORT register_neuron.py 0xVault --netuid 1 ...
+
+Requires `forge build` and anvil; no network access is needed.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.anvil import ANVIL_ADDRESS, ANVIL_PRIVATE_KEY
+from utils.burn_monitor import WEI_PER_RAO
+from utils.local_subtensor import NEURON_PRECOMPILE, LocalSubtensor
+from utils.reads import tao_to_rao
+
+
+def parse_burns(values):
+    burns = {}
+    for value in values:
+        netuid, _, tao = value.partition("=")
+        try:
+            burns[int(netuid)] = tao_to_rao(tao) * WEI_PER_RAO
+        except (ArithmeticError, ValueError):
+            raise ValueError(f"expected NETUID=TAO, got '{value}'")
+    return burns
+
+
+def read_stakes(path: Path):
+    """Parses `coldkey_ss58,hotkey_ss58,netuid,stake_tao` lines. Blank lines and lines starting with '#' are ignored."""
+    stakes = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part.strip() for part in line.split(",")]
+        try:
+            stakes.append((parts[0], parts[1], int(parts[2]), tao_to_rao(parts[3])))
+        except (IndexError, ArithmeticError, ValueError):
+            raise ValueError(f"{path}:{line_no}: expected coldkey,hotkey,netuid,stake_tao")
+    return stakes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Subtensor Stand-in")
+    parser.add_argument("--burn", action="append", default=[], help="NETUID=TAO registration burn (repeatable, default 1=1)")
+    parser.add_argument("--burn-increase-bps", type=int, default=0, help="Burn growth per registration")
+    parser.add_argument("--stakes", type=Path, help="File with coldkey,hotkey,netuid,stake_tao lines")
+    parser.add_argument("--port", type=int, help="anvil port")
+    parser.add_argument("--substrate-port", type=int, default=0, help="Fake substrate RPC port")
+    parser.add_argument("--no-deploy", action="store_true", help="Skip deploying the governance contracts")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between burn syncs")
+    args = parser.parse_args()
+
+    try:
+        burns = parse_burns(args.burn or ["1=1"])
+        stakes = read_stakes(args.stakes) if args.stakes else []
+    except (OSError, ValueError) as e:
+        sys.exit(f"Input Error: {e}")
+
+    local = LocalSubtensor(
+        burns, stakes, args.burn_increase_bps,
+        deploy=not args.no_deploy, port=args.port, substrate_port=args.substrate_port,
+    )
+    try:
+        local.start()
+    except Exception as e:
+        sys.exit(f"Startup Error: {e}")
+
+    print("-" * 40)
+    print("LOCAL SUBTENSOR")
+    print("-" * 40)
+    print(f"EVM RPC:       {local.rpc_url}")
+    print(f"Substrate RPC: {local.substrate_url}")
+    print(f"Precompile:    {NEURON_PRECOMPILE}")
+    for name, address in local.addresses.items():
+        print(f"{name.capitalize() + ':':<15}{address}")
+    print(f"Account:       {ANVIL_ADDRESS}")
+    print(f"Private key:   {ANVIL_PRIVATE_KEY}")
+    for netuid, burn_wei in sorted(burns.items()):
+        print(f"NetUID {netuid:<7} burn {burn_wei / 10**18} TAO")
+    print(f"Stakes:        {len(stakes)}")
+    print("-" * 40)
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            for account, amount in local.sync():
+                print(f"Burned {amount / 10**18} TAO for {account}")
+    except KeyboardInterrupt:
+        print("Stopping.")
+    finally:
+        local.stop()
+
+
+if __name__ == "__main__":
+    main()
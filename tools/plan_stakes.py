@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+CLI to plan a treasury stake rebalance across subnets in one pass.
+
+Fetches the treasury coldkey's stake on every --target subnet (one btcli
+call per coldkey, all coldkeys concurrently), converts it to exact rao and
+plans the moves to each subnet's target total:
+
+  unstakeAndBurn(bytes32[] hotkeys, uint256 netuid, uint256[] amounts)
+      for subnets over target, largest positions first, at most
+      --max-hotkeys-per-call hotkeys per call
+  stake(bytes32 hotkey, uint256 netuid, uint256 amount)
+      for subnets under target, on --stake-hotkey or the largest position
+
+Calls are packed into proposals of at most --max-proposal-gas gas and
+written as NDJSON lines ({"targets", "values", "calldatas", "description",
+...}) that encode_proposal.py --batch accepts, or encoded directly with
+--encode:
+
+  python tools/plan_stakes.py 0xTreasury --rpc-url $RPC --executor 0xVault --target 1=1000 --target 3=250.5 --target 8=0 --encode > plan.ndjson
+
+With --rpc-url and --executor (the timelock that executes proposals,
+TreasuryVault), each call's gas is estimated with eth_estimateGas against the
+target. Otherwise, and for calls whose estimate fails, a heuristic is used
+(30000 + --gas-per-hotkey per hotkey, not measured); the summary says which.
+
+The calls are those of FALLBACK_ABI (utils/contract_loader.py): they are meant
+for a staking adapter that holds the treasury's stake and lets the timelock
+call unstakeAndBurn/stake. No contract in src/ implements them yet
+(TreasuryVault and TreasuryController don't). Before anything is written, the
+target is checked with --abi (its Forge artifact or ABI JSON) and/or
+--rpc-url (its deployed code must dispatch each selector); a missing
+function is an error, since the proposal would revert on execute.
+
+The coldkey defaults to the one derived from the treasury address. The
+summary goes to stderr.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from web3 import Web3
+
+from utils.address_converter import h160_to_ss58, ss58_to_bytes
+from utils.contract_loader import get_web3_provider
+from utils.proposal_encoder import encode_proposal
+from utils.reads import RAO_PER_TAO, hotkey_to_bytes32, tao_to_rao
+from utils.stake_planner import (
+    CALL_OVERHEAD_GAS,
+    DEFAULT_GAS_PER_HOTKEY,
+    DEFAULT_MAX_HOTKEYS_PER_CALL,
+    DEFAULT_MAX_PROPOSAL_GAS,
+    GAS_ESTIMATE_MARGIN,
+    build_calls,
+    estimate_call_gas,
+    fetch_subnet_stakes,
+    missing_functions,
+    pack_proposals,
+    plan_rebalance,
+)
+
+
+def parse_pairs(values, convert, what):
+    """NETUID=VALUE arguments as {netuid: convert(VALUE)}."""
+    pairs = {}
+    for value in values:
+        netuid, _, rest = value.partition("=")
+        try:
+            pairs[int(netuid)] = convert(rest)
+        except (ArithmeticError, ValueError):
+            raise ValueError(f"expected NETUID={what}, got '{value}'")
+    return pairs
+
+
+def parse_hotkey(value):
+    return hotkey_to_bytes32(value) if value.startswith("0x") else ss58_to_bytes(value)
+
+
+def format_tao(rao):
+    return f"{rao / RAO_PER_TAO:,.9f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan Stake Rebalance Across Subnets")
+    parser.add_argument("treasury", help="Staking adapter that holds the stake and implements unstakeAndBurn/stake")
+    parser.add_argument("--abi", type=Path, help="Treasury's Forge artifact or ABI JSON, checked for the planned calls")
+    parser.add_argument("--rpc-url", help="Check the treasury's deployed code for the planned calls")
+    parser.add_argument("--executor", help="With --rpc-url, timelock (TreasuryVault) to estimate each call's gas from")
+    parser.add_argument("--target", action="append", required=True, help="NETUID=TAO target total stake (repeatable)")
+    parser.add_argument("--coldkey", action="append", default=[], help="Coldkey SS58 (repeatable, default: treasury's)")
+    parser.add_argument("--stake-hotkey", action="append", default=[],
+                        help="NETUID=HOTKEY (SS58 or 0x) that receives added stake (default: largest position)")
+    parser.add_argument("--network", default="test", help="btcli network")
+    parser.add_argument("--tolerance", default="0", help="Leave subnets within this many TAO of target alone")
+    parser.add_argument("--max-hotkeys-per-call", type=int, default=DEFAULT_MAX_HOTKEYS_PER_CALL)
+    parser.add_argument("--gas-per-hotkey", type=int, default=DEFAULT_GAS_PER_HOTKEY,
+                        help="Heuristic gas per hotkey staked or unstaked, for calls that aren't estimated")
+    parser.add_argument("--max-proposal-gas", type=int, default=DEFAULT_MAX_PROPOSAL_GAS)
+    parser.add_argument("--description", default="Stake rebalance")
+    parser.add_argument("--encode", action="store_true", help="Add proposal ids and propose/queue/execute calldata")
+    parser.add_argument("--governor", help="With --encode, TreasuryController address for the timelock operation id")
+    args = parser.parse_args()
+    if args.max_hotkeys_per_call < 1:
+        parser.error("--max-hotkeys-per-call must be positive")
+    if args.abi is None and args.rpc_url is None:
+        parser.error("pass --abi and/or --rpc-url to check the treasury implements the planned calls")
+    if args.executor and args.rpc_url is None:
+        parser.error("--executor requires --rpc-url")
+
+    try:
+        # Targets are parsed from the argument text, so they are exact in rao
+        targets = parse_pairs(args.target, tao_to_rao, "TAO")
+        stake_hotkeys = parse_pairs(args.stake_hotkey, parse_hotkey, "HOTKEY")
+        tolerance = tao_to_rao(args.tolerance)
+        coldkeys = args.coldkey or [h160_to_ss58(args.treasury)]
+    except (ArithmeticError, ValueError) as e:
+        sys.exit(f"Argument Error: {e}")
+    if any(target < 0 for target in targets.values()):
+        sys.exit("Argument Error: targets must not be negative")
+
+    print(f"Fetching stake of {len(coldkeys)} coldkey(s) on {len(targets)} subnets...", file=sys.stderr)
+    try:
+        stakes = fetch_subnet_stakes(coldkeys, targets, network=args.network)
+    except (RuntimeError, ValueError) as e:
+        sys.exit(f"Stake Fetch Error: {e}")
+
+    try:
+        unstakes, additions = plan_rebalance(stakes, targets, stake_hotkeys, tolerance)
+        calls = build_calls(args.treasury, unstakes, additions, args.max_hotkeys_per_call, args.gas_per_hotkey)
+    except ValueError as e:
+        sys.exit(f"Plan Error: {e}")
+
+    try:
+        abi = code = w3 = None
+        if args.abi is not None:
+            data = json.loads(args.abi.read_text())
+            abi = data["abi"] if isinstance(data, dict) else data
+        if args.rpc_url is not None:
+            w3 = get_web3_provider(args.rpc_url)
+            code = w3.eth.get_code(Web3.to_checksum_address(args.treasury))
+            if len(code) == 0:
+                sys.exit(f"Target Error: no contract at {args.treasury}")
+        missing = missing_functions(calls, abi=abi, code=code)
+    except (OSError, ValueError, KeyError, ConnectionError) as e:
+        sys.exit(f"Target Error: {e}")
+    if missing:
+        sys.exit(f"Target Error: {args.treasury} does not implement {', '.join(missing)}, "
+                 "so the proposals would revert on execute")
+
+    if args.executor:
+        try:
+            failed = estimate_call_gas(w3, calls, args.executor)
+        except (ValueError, ConnectionError) as e:
+            sys.exit(f"Gas Estimate Error: {e}")
+        for call, error in failed:
+            print(f"Warning: could not estimate a {call['kind']} call on netuid {call['netuid']} ({error}), "
+                  "using the heuristic", file=sys.stderr)
+
+    try:
+        proposals = pack_proposals(calls, args.description, args.max_proposal_gas)
+    except ValueError as e:
+        sys.exit(f"Plan Error: {e}")
+
+    for proposal in proposals:
+        if args.encode:
+            proposal.update(encode_proposal(
+                proposal["targets"], proposal["values"], proposal["calldatas"], proposal["description"],
+                governor=args.governor,
+            ))
+        print(json.dumps(proposal))
+
+    removed = {netuid: sum(amount for _, amount in removals) for netuid, removals in unstakes.items()}
+    added = {netuid: amount for netuid, _, amount in additions}
+    out = sys.stderr
+    print("-" * 72, file=out)
+    print(f"{'NetUID':>6} {'Hotkeys':>8} {'Current TAO':>20} {'Target TAO':>20} {'Change':>12}", file=out)
+    print("-" * 72, file=out)
+    for netuid, target in sorted(targets.items()):
+        current = sum(stakes[netuid].values())
+        if netuid in removed:
+            change = f"-{len(unstakes[netuid])} hk"
+        elif netuid in added:
+            change = "+stake"
+        else:
+            change = "-"
+        print(f"{netuid:>6} {len(stakes[netuid]):>8} {format_tao(current):>20} {format_tao(target):>20} {change:>12}",
+              file=out)
+    print("-" * 72, file=out)
+    print(f"Unstake and burn: {format_tao(sum(removed.values()))} TAO "
+          f"({sum(1 for call in calls if call['kind'] == 'unstakeAndBurn')} calls)", file=out)
+    print(f"Stake:            {format_tao(sum(added.values()))} TAO ({len(additions)} calls)", file=out)
+    print(f"Proposals:        {len(proposals)} "
+          f"(max ~{max((p['estimated_gas'] for p in proposals), default=0)} gas each)", file=out)
+    heuristic = sum(1 for call in calls if call["gas_source"] == "heuristic")
+    if heuristic:
+        reason = "estimates failed" if args.executor else "pass --rpc-url and --executor to estimate"
+        print(f"Gas:              heuristic for {heuristic}/{len(calls)} calls "
+              f"({CALL_OVERHEAD_GAS} + {args.gas_per_hotkey}/hotkey, not measured; {reason})", file=out)
+    else:
+        print(f"Gas:              eth_estimateGas from the executor, +{GAS_ESTIMATE_MARGIN - 1:.0%}", file=out)
+    print("-" * 72, file=out)
+
+if __name__ == "__main__":
+    main()
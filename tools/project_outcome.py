@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+CLI to project proposal outcomes against the TreasuryController quorum rules.
+
+`fetch` takes one snapshot from the chain (voting power of every known voter,
+VoteCast logs and the governor's quorum at each proposal snapshot) into a
+local .npz. Proposals whose snapshot block is not in the past yet (Pending)
+are skipped: their votes and quorum can't be read until it is.
+`project` answers offline from that file: current tally, quorum gap and the
+minimum set of remaining voters needed to pass or to block each proposal.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.log_decoder import default_decoder
+from utils.quorum_projection import UNREACHABLE, build_support_matrix, min_voter_set, project
+from utils.rpc_batch import batch_read
+
+RAO_PER_TAO = 1_000_000_000
+
+
+def read_hotkeys(path: Path):
+    lines = [line.strip() for line in path.read_text().splitlines()]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def fetch_snapshot(w3, governor, proposal_ids, voters, from_block, batch_size=100):
+    """
+    Collects everything `project` needs in as few round trips as possible.
+    Returns (snapshot, skipped), skipped being the ids of proposals whose
+    snapshot block is not in the past yet.
+    """
+    historical, head = batch_read(w3, [
+        governor.functions.historicalVotes(),
+        lambda: w3.eth.block_number,
+    ])
+
+    decoder = default_decoder()
+    logs = w3.eth.get_logs({
+        "address": governor.address,
+        "fromBlock": from_block,
+        "toBlock": "latest",
+        "topics": [[decoder.topic("VoteCast"), decoder.topic("VoteCastWithParams")]],
+    })
+    decoded = decoder.decode_logs(logs)
+    if decoded.errors:
+        log, error = decoded.errors[0]
+        raise ValueError(f"{len(decoded.errors)} undecodable vote logs, first in block {log['blockNumber']}: {error}")
+    cast = []
+    for event in decoded.events:
+        proposal_id = str(event["args"]["proposalId"])
+        if proposal_ids and proposal_id not in proposal_ids:
+            continue
+        cast.append((proposal_id, event["args"]["voter"], event["args"]["support"], event["args"]["weight"]))
+
+    if not proposal_ids:
+        proposal_ids = sorted({entry[0] for entry in cast})
+    voters = list(dict.fromkeys([w3.to_checksum_address(v) for v in voters] + [entry[1] for entry in cast]))
+
+    snapshots = batch_read(w3, [governor.functions.proposalSnapshot(int(pid)) for pid in proposal_ids])
+    # Past lookups revert (FutureLookup) until the snapshot block is over
+    skipped = [pid for pid, block in zip(proposal_ids, snapshots) if block >= head]
+    kept = [(pid, block) for pid, block in zip(proposal_ids, snapshots) if block < head]
+    proposal_ids, snapshots = [pid for pid, _ in kept], [block for _, block in kept]
+    cast = [entry for entry in cast if entry[0] not in skipped]
+    quorum = batch_read(w3, [governor.functions.quorum(block) for block in snapshots])
+
+    # The governor's own getVotes, so power follows TreasuryController._getVotes (including hotkeys
+    # delegated in its HotkeyRegistry). With historical votes, each proposal counts power at its own
+    # snapshot block; without, the timepoint is ignored and current power counts.
+    if historical:
+        calls = [governor.functions.getVotes(voter, block) for block in snapshots for voter in voters]
+    else:
+        calls = [governor.functions.getVotes(voter, head) for voter in voters]
+    power = []
+    for start in range(0, len(calls), batch_size):
+        power.extend(batch_read(w3, calls[start:start + batch_size]))
+
+    power_matrix = np.array(power, dtype=np.int64).reshape(-1, len(voters))
+    if not historical:
+        power_matrix = np.tile(power_matrix, (len(proposal_ids), 1))
+    support = build_support_matrix(proposal_ids, voters, [(p, v, s) for p, v, s, _ in cast])
+    # Counted weight is authoritative for voters who already voted
+    rows = {pid: i for i, pid in enumerate(proposal_ids)}
+    cols = {voter: j for j, voter in enumerate(voters)}
+    for proposal_id, voter, _, weight in cast:
+        power_matrix[rows[proposal_id], cols[voter]] = weight
+
+    return {
+        "proposal_ids": np.array(proposal_ids),
+        "voters": np.array(voters),
+        "power": power_matrix,
+        "support": support,
+        "quorum": np.array(quorum, dtype=np.int64),
+        "block": np.array(head),
+    }, skipped
+
+
+def format_count(count):
+    return "n/a" if count == UNREACHABLE else str(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project Proposal Outcomes")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="Snapshot voting data from the chain")
+    fetch_parser.add_argument("contract", help="Governor contract address")
+    fetch_parser.add_argument("--hotkeys", type=Path, required=True, help="File with one voter address per line")
+    fetch_parser.add_argument("--proposal-id", action="append", default=[], help="Repeatable; default: all voted")
+    fetch_parser.add_argument("--from-block", type=int, default=0, help="First block to scan for VoteCast")
+    fetch_parser.add_argument("--out", type=Path, default=Path("votes_snapshot.npz"))
+    fetch_parser.add_argument("--rpc-url", required=True)
+
+    project_parser = subparsers.add_parser("project", help="Project outcomes offline")
+    project_parser.add_argument("--snapshot", type=Path, default=Path("votes_snapshot.npz"))
+    project_parser.add_argument("--show-voters", type=int, default=0, help="List up to N voters of each minimum set")
+    project_parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "fetch":
+        try:
+            w3 = get_web3_provider(args.rpc_url)
+        except Exception as e:
+            sys.exit(f"RPC Connection Error: {e}")
+        try:
+            artifact_path = current_dir.parent / "out" / "TreasuryController.sol" / "TreasuryController.json"
+            governor = load_contract(w3, args.contract, artifact_path)
+        except Exception as e:
+            sys.exit(f"Contract Load Error: {e}")
+        try:
+            snapshot, skipped = fetch_snapshot(w3, governor, args.proposal_id, read_hotkeys(args.hotkeys), args.from_block)
+        except Exception as e:
+            sys.exit(f"Snapshot Error: {e}")
+        for proposal_id in skipped:
+            print(f"Skipped proposal {proposal_id}: its snapshot block is not in the past yet")
+        np.savez_compressed(args.out, **snapshot)
+        print(f"Saved {len(snapshot['proposal_ids'])} proposals x {len(snapshot['voters'])} voters to {args.out}")
+        return
+
+    try:
+        with np.load(args.snapshot, allow_pickle=False) as data:
+            snapshot = {name: data[name] for name in data.files}
+    except OSError as e:
+        sys.exit(f"Snapshot Load Error: {e}")
+    if "quorum" not in snapshot:
+        sys.exit(f"Snapshot Load Error: {args.snapshot} has no quorum (written by an older fetch), fetch it again")
+
+    start = time.perf_counter()
+    result = project(snapshot["power"], snapshot["support"], snapshot["quorum"])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    voters = snapshot["voters"]
+    rows = []
+    for i, proposal_id in enumerate(snapshot["proposal_ids"]):
+        row = {
+            "proposal_id": str(proposal_id),
+            **{key: int(result[key][i]) for key in (
+                "against", "for", "abstain", "quorum", "quorum_gap", "remaining_power",
+                "pass_power", "block_power", "votes_to_pass", "votes_to_block",
+            )},
+            "succeeded": bool(result["succeeded"][i]),
+        }
+        if args.show_voters:
+            row["pass_set"] = [str(v) for v in voters[min_voter_set(result, i, "pass")][:args.show_voters]]
+            row["block_set"] = [str(v) for v in voters[min_voter_set(result, i, "block")][:args.show_voters]]
+        rows.append(row)
+
+    if args.json:
+        print(json.dumps({"block": int(snapshot["block"]), "elapsed_ms": elapsed_ms, "proposals": rows}, indent=2))
+        return
+
+    print("-" * 40)
+    print(f"OUTCOME PROJECTION @ Block {int(snapshot['block'])}")
+    print(f"{len(rows)} proposals x {len(voters)} voters in {elapsed_ms:.2f} ms")
+    for row in rows:
+        print("-" * 40)
+        print(f"Proposal:   {row['proposal_id']}")
+        print(f"For:        {row['for'] / RAO_PER_TAO}")
+        print(f"Against:    {row['against'] / RAO_PER_TAO}")
+        print(f"Abstain:    {row['abstain'] / RAO_PER_TAO}")
+        print(f"Quorum:     {row['quorum'] / RAO_PER_TAO} (gap {row['quorum_gap'] / RAO_PER_TAO})")
+        print(f"Outcome:    {'Succeeding' if row['succeeded'] else 'Failing'} if voting ended now")
+        print(f"To pass:    {format_count(row['votes_to_pass'])} voters ({row['pass_power'] / RAO_PER_TAO} TAO For)")
+        print(f"To block:   {format_count(row['votes_to_block'])} voters ({row['block_power'] / RAO_PER_TAO} TAO Against)")
+        for key, label in (("pass_set", "Pass set"), ("block_set", "Block set")):
+            if row.get(key):
+                print(f"{label + ':':<11} {', '.join(row[key])}")
+    print("-" * 40)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ CLI for calling: queue(address[] targets, uint256[] values, bytes[] calldatas, b
 """
 
 import argparse
-import os
 import sys
 from pathlib import Path
 from web3 import Web3
@@ -14,6 +13,10 @@ if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
 from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, add_inclusion_args, tracker_from_args
+from utils.proposal_encoder import hash_proposal
+from utils.rpc_batch import fetch_tx_params
+from utils.signing_agent import AgentError, get_signer
 
 def main():
     parser = argparse.ArgumentParser(description="Queue Proposal")
@@ -24,15 +27,18 @@ def main():
     parser.add_argument("--rpc-url", required=True)
     parser.add_argument("--private-key", default=None)
     parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(parser)
     args = parser.parse_args()
 
-    private_key = args.private_key or os.getenv("PRIVATE_KEY")
-    if not private_key:
-        raise SystemExit("Error: Set PRIVATE_KEY env var or pass --private-key")
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None:
+        raise SystemExit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
 
     try:
         w3 = get_web3_provider(args.rpc_url)
-        account = w3.eth.account.from_key(private_key)
         print(f"--- WALLET INFO ---")
         print(f"Address: {account.address}")
     except Exception as e:
@@ -44,6 +50,7 @@ def main():
     values = [w3.to_wei(args.amount, 'ether')]
     calldatas = [b""]
     description_hash = Web3.keccak(text=args.description)
+    print(f"Proposal ID: {hash_proposal(targets, values, calldatas, description_hash)}")
 
     try:
         artifact_path = current_dir.parent / "out" / "TreasuryController.sol" / "TreasuryController.json"
@@ -55,16 +62,21 @@ def main():
     fn = contract.functions.queue(targets, values, calldatas, description_hash)
 
     print("--- GAS & COST CALCULATION ---")
+    # Estimate, gas price, nonce and chain id travel in one JSON-RPC batch
+    gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(w3, fn, account.address)
     try:
-        gas_estimate = fn.estimate_gas({"from": account.address})
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
         gas_limit = int(gas_estimate * 1.2)
         print(f"Gas Limit (Estimated): {gas_limit}")
 
         if args.force_gas_price_gwei:
             gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
             print(f"Gas Price (FORCED):    {args.force_gas_price_gwei} Gwei")
+        elif isinstance(node_gas_price, Exception):
+            raise node_gas_price
         else:
-            gas_price = w3.eth.gas_price
+            gas_price = node_gas_price
             print(f"Gas Price (Node):      {w3.from_wei(gas_price, 'gwei'):.2f} Gwei")
 
     except Exception as exc:
@@ -72,29 +84,31 @@ def main():
         gas_limit = 500_000
         gas_price = w3.to_wei(100, 'gwei')
 
-    nonce = w3.eth.get_transaction_count(account.address, "pending")
-
     tx = fn.build_transaction({
         "from": account.address,
         "nonce": nonce,
         "gas": gas_limit,
         "gasPrice": gas_price,
-        "chainId": w3.eth.chain_id,
+        "chainId": chain_id,
         "value": 0,
     })
 
     print(f"Sending transaction (Nonce: {nonce})...")
-    signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
+    tracker = tracker_from_args(w3, account, args, log=print)
 
     try:
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-        print(f"Sent tx: {tx_hash.hex()}")
+        pending = tracker.send(tx)
+        print(f"Sent tx: {pending.tx_hash.hex()}")
     except Exception as e:
         print(f"Transaction failed locally: {e}")
         sys.exit(1)
 
     print("Waiting for receipt...")
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    try:
+        receipt = tracker.wait([pending])[0]
+    except InclusionError as e:
+        sys.exit(f"Inclusion Error: {e}")
+    print(f"Included after {pending.latency:.1f}s ({pending.blocks_to_inclusion} blocks, {pending.attempts} broadcasts)")
 
     if receipt["status"] == 1:
         print(f"SUCCESS! Block: {receipt['blockNumber']}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+CLI to serve proposal state, voting power and balance reads over HTTP.
+
+Dashboards query this instead of running get_proposal_state.py,
+get_voting_power.py and get_balance.py per refresh:
+
+  GET /proposal-state?proposal_id=123
+  GET /voting-power?hotkey=0x...&netuid=1[&timepoint=N]
+  GET /balance?address=0x...[&address=0x...]
+  GET /stats
+
+Responses are cached per head block, and identical requests that arrive
+while a read is in flight share it, so any number of viewers cost one RPC
+fan-out per block. Concurrent reads are merged into JSON-RPC batches
+(--coalesce-ms). /stats reports per-endpoint hits, coalesced requests,
+misses and latency percentiles.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider
+from utils.read_api import DEFAULT_API_PORT, DEFAULT_IDLE_TIMEOUT, ReadAPIServer
+
+
+async def serve(server):
+    await server.start()
+    print("-" * 40)
+    print("READ API")
+    print("-" * 40)
+    print(f"Listening: {server.url}")
+    print(f"Head:      Block {server.head}")
+    for kind, address in server.defaults.items():
+        print(f"{kind.capitalize() + ':':<11}{address}")
+    print("-" * 40)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read API Server")
+    parser.add_argument("--rpc-url", required=True)
+    parser.add_argument("--governor", help="TreasuryController address used when a request omits contract")
+    parser.add_argument("--votes", help="MockBittensorVotes address used when a request omits contract")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_API_PORT)
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between head block checks")
+    parser.add_argument("--workers", type=int, default=16, help="Threads running RPC reads")
+    parser.add_argument("--coalesce-ms", type=float, default=2.0, help="Window for merging concurrent reads (0 disables)")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds before a connection without a complete request is closed")
+    args = parser.parse_args()
+
+    try:
+        w3 = get_web3_provider(args.rpc_url, coalesce_window=args.coalesce_ms / 1000 or None)
+    except Exception as e:
+        sys.exit(f"RPC Connection Error: {e}")
+
+    defaults = {kind: address for kind, address in (("governor", args.governor), ("votes", args.votes)) if address}
+    server = ReadAPIServer(w3, defaults, args.host, args.port, args.poll_interval, args.workers, args.idle_timeout)
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        print("Stopping.")
+    except (ConnectionError, OSError) as e:
+        sys.exit(f"Server Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 
 import argparse
-import os
 import sys
 from pathlib import Path
-import bittensor as bt
 
 current_dir = Path(__file__).resolve().parent
 if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
+from utils.burn_monitor import WEI_PER_RAO
 from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, add_inclusion_args, tracker_from_args
+from utils.rpc_batch import fetch_tx_params
+from utils.signing_agent import AgentError, get_signer
 
 
 def get_burn_cost_fallback(subtensor, netuid):
+    import bittensor as bt
+
     try:
         return subtensor.get_subnet_burn_cost(netuid)
     except Exception:
@@ -44,6 +48,14 @@ def get_burn_cost_fallback(subtensor, netuid):
     raise RuntimeError(f"Could not find Burn/Recycle cost for NetUID {netuid} in storage")
 
 
+def fetch_burn_cost_rao(network, netuid):
+    """Returns (burn_rao, subtensor); bittensor is only imported when called."""
+    import bittensor as bt
+
+    subtensor = bt.subtensor(network=network)
+    return get_burn_cost_fallback(subtensor, netuid).rao, subtensor
+
+
 def safe_cleanup(subtensor=None, w3=None):
     """Force close Substrate and Web3 sessions to avoid hanging threads."""
     try:
@@ -66,20 +78,25 @@ def main():
     parser.add_argument("--hotkey", required=True)
     parser.add_argument("--rpc-url", required=True)
     parser.add_argument("--private-key", default=None)
-    parser.add_argument("--network", default="test")
+    parser.add_argument("--network", default="test", help="Bittensor network")
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
     parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(parser)
     args = parser.parse_args()
 
-    private_key = args.private_key or os.getenv("PRIVATE_KEY")
-    if not private_key:
-        raise SystemExit("Error: Set PRIVATE_KEY env var or pass --private-key")
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None:
+        raise SystemExit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
 
     print(f"--- FETCHING NETWORK DATA ({args.network}) ---")
     try:
-        subtensor = bt.subtensor(network=args.network)
-        burn_cost_tao = get_burn_cost_fallback(subtensor, args.netuid)
+        burn_cost_rao, subtensor = fetch_burn_cost_rao(args.network, args.netuid)
+        burn_cost_tao = burn_cost_rao / 1_000_000_000
 
-        print(f"Current Burn Cost for NetUID {args.netuid}: {burn_cost_tao.tao} TAO")
+        print(f"Current Burn Cost for NetUID {args.netuid}: {burn_cost_tao} TAO")
 
     except Exception as e:
         print(f"CRITICAL ERROR fetching burn cost: {e}", file=sys.stderr)
@@ -87,7 +104,6 @@ def main():
 
     try:
         w3 = get_web3_provider(args.rpc_url)
-        account = w3.eth.account.from_key(private_key)
         balance_wei = w3.eth.get_balance(account.address)
         balance_eth = w3.from_wei(balance_wei, 'ether')
 
@@ -105,22 +121,22 @@ def main():
         safe_cleanup(subtensor)
         sys.exit(1)
 
-    burn_amount_wei = w3.to_wei(str(burn_cost_tao.tao), 'ether')
+    burn_amount_wei = burn_cost_rao * WEI_PER_RAO
 
     print(f"\n--- CONFIRMATION ---")
     print(f"Operation: Register Neuron on NetUID {args.netuid}")
     print(f"Contract:  {args.contract}")
     print(f"Hotkey:    {args.hotkey}")
-    print(f"Cost:      {burn_cost_tao.tao} TAO")
+    print(f"Cost:      {burn_cost_tao} TAO")
 
     if balance_wei < burn_amount_wei:
         print(f"\n[!] ERROR: Insufficient funds.")
         print(f"Have: {balance_eth}")
-        print(f"Need: {burn_cost_tao.tao}")
+        print(f"Need: {burn_cost_tao}")
         safe_cleanup(subtensor, w3)
         sys.exit(1)
 
-    confirm = input("\nDo you want to proceed? (y/N): ").strip().lower()
+    confirm = "y" if args.yes else input("\nDo you want to proceed? (y/N): ").strip().lower()
     if confirm != 'y':
         print("Aborted by user.")
         safe_cleanup(subtensor, w3)
@@ -151,18 +167,21 @@ def main():
     fn = contract.functions.registerNeuron(args.netuid, hotkey_bytes32)
 
     print("\n--- ESTIMATING GAS ---")
+    gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(
+        w3, fn, account.address, value=burn_amount_wei
+    )
     try:
-        gas_estimate = fn.estimate_gas({
-            "from": account.address,
-            "value": burn_amount_wei
-        })
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
         gas_limit = int(gas_estimate * 2.0)
         print(f"Gas Limit (Estimated): {gas_limit}")
 
         if args.force_gas_price_gwei:
             gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
+        elif isinstance(node_gas_price, Exception):
+            raise node_gas_price
         else:
-            gas_price = w3.eth.gas_price
+            gas_price = node_gas_price
 
         gas_cost_wei = gas_limit * gas_price
         total_cost_eth = w3.from_wei(gas_cost_wei + burn_amount_wei, 'ether')
@@ -174,34 +193,34 @@ def main():
         gas_limit = 3_000_000
         gas_price = w3.to_wei(100, 'gwei')
 
-    nonce = w3.eth.get_transaction_count(account.address, "pending")
-
     tx = fn.build_transaction({
         "from": account.address,
         "nonce": nonce,
         "gas": gas_limit,
         "gasPrice": gas_price,
-        "chainId": w3.eth.chain_id,
+        "chainId": chain_id,
         "value": burn_amount_wei,
     })
 
     print(f"Sending transaction (Nonce: {nonce})...")
-    signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
+    tracker = tracker_from_args(w3, account, args, log=print)
 
     try:
-        if hasattr(signed, 'rawTransaction'):
-            tx_hash = w3.eth.send_raw_transaction(signed.rawTransaction)
-        else:
-            tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-
-        print(f"Sent tx: {tx_hash.hex()}")
+        pending = tracker.send(tx)
+        print(f"Sent tx: {pending.tx_hash.hex()}")
     except Exception as e:
         print(f"Transaction failed locally: {e}")
         safe_cleanup(subtensor, w3)
         sys.exit(1)
 
     print("Waiting for receipt...")
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    try:
+        receipt = tracker.wait([pending])[0]
+    except InclusionError as e:
+        safe_cleanup(subtensor, w3)
+        sys.exit(f"Inclusion Error: {e}")
+    tx_hash = receipt["transactionHash"]
+    print(f"Included after {pending.latency:.1f}s ({pending.blocks_to_inclusion} blocks, {pending.attempts} broadcasts)")
 
     if receipt["status"] == 1:
         print(f"SUCCESS! Block: {receipt['blockNumber']}, Gas Used: {receipt['gasUsed']}")
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+CLI to collect signed votes offline and relay them in batched transactions.
+
+Voters sign an EIP-712 Ballot for castVoteBySig instead of sending their own
+castVote transaction:
+
+    sign    sign a ballot and print it, append it to --out or POST it to --intake
+    intake  local HTTP endpoint that verifies ballots and stores them in a file
+    submit  relay ballot files through TreasuryController.multicall, packing
+            as many castVoteBySig calls per transaction as --max-gas allows;
+            a batch that reverts is bisected by simulation and resent
+            without the ballots that revert, which are reported as dropped
+
+Ballots are JSON lines: {"proposalId", "support", "voter", "nonce", "signature"}.
+Each signed vote consumes the voter's governor nonce, so a voter signing for
+several proposals uses consecutive nonces; submit orders them accordingly.
+"""
+
+import argparse
+import json
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, add_inclusion_args, tracker_from_args
+from utils.rpc_batch import batch_read
+from utils.signing_agent import AgentError, get_signer
+from utils.vote_relay import (
+    DEFAULT_INTAKE_PORT,
+    INTRINSIC_GAS,
+    STATE_ACTIVE,
+    SUPPORT_LABELS,
+    BallotIntake,
+    BallotStore,
+    GovernorDomain,
+    bisect_ballots,
+    order_ballots,
+    pack_batches,
+    read_ballots,
+    sign_ballot,
+    verify_ballot,
+)
+
+# castVoteBySig execution gas assumed for ballots that cannot be estimated
+# before earlier ones land (second and later nonces of a voter)
+FALLBACK_VOTE_GAS = 120_000
+GAS_MARGIN = 1.2
+# Send/bisect/resend cycles before ballots of failed batches are reported as not relayed
+MAX_RELAY_ROUNDS = 3
+
+
+def connect(args):
+    try:
+        w3 = get_web3_provider(args.rpc_url)
+        artifact_path = current_dir.parent / "out" / "TreasuryController.sol" / "TreasuryController.json"
+        governor = load_contract(w3, args.contract, artifact_path)
+        domain = GovernorDomain.from_chain(governor)
+    except Exception as e:
+        sys.exit(f"RPC Connection Error: {e}")
+    return w3, governor, domain
+
+
+def get_account(args):
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None:
+        sys.exit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
+    return account
+
+
+def cmd_sign(args):
+    account = get_account(args)
+    if args.rpc_url:
+        w3, governor, domain = connect(args)
+        nonce = args.nonce if args.nonce is not None else governor.functions.nonces(account.address).call()
+    else:
+        if args.chain_id is None or args.nonce is None:
+            sys.exit("Error: without --rpc-url pass --chain-id and --nonce")
+        domain = GovernorDomain(args.contract, args.chain_id)
+        nonce = args.nonce
+
+    try:
+        ballot = sign_ballot(account, domain, args.proposal_id, args.support, nonce)
+    except (AgentError, OSError) as e:
+        sys.exit(f"Signer Error: {e}")
+    line = json.dumps(ballot)
+
+    if args.intake:
+        request = urllib.request.Request(
+            args.intake, data=line.encode(), headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                result = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            result = json.loads(e.read() or b"{}")
+        except OSError as e:
+            sys.exit(f"Intake Error: {e}")
+        if not result.get("accepted"):
+            sys.exit(f"Intake Error: {result.get('rejected') or result}")
+        print(f"Ballot accepted by {args.intake}")
+    elif args.out:
+        with args.out.open("a") as f:
+            f.write(line + "\n")
+        print(f"Ballot appended to {args.out}")
+    else:
+        print(line)
+    print(f"Voter: {ballot['voter']}  Proposal: {ballot['proposalId']}  "
+          f"Support: {SUPPORT_LABELS[ballot['support']]}  Nonce: {ballot['nonce']}", file=sys.stderr)
+
+
+def cmd_intake(args):
+    w3, governor, domain = connect(args)
+    try:
+        store = BallotStore(args.store, domain)
+        intake = BallotIntake(store, host=args.host, port=args.port)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Intake Error: {e}")
+
+    print("-" * 40)
+    print("BALLOT INTAKE")
+    print("-" * 40)
+    print(f"Governor: {domain.governor} (chain {domain.chain_id})")
+    print(f"Store:    {args.store} ({store.count} ballots)")
+    print(f"Listen:   {intake.address}")
+    print("-" * 40)
+    try:
+        intake.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Stopped with {store.count} ballots.")
+
+
+def read_chain_state(w3, governor, ballots, batch_size):
+    """Proposal states, (proposalId, voter) pairs that already voted and voters' nonces."""
+    proposal_ids = sorted({ballot["proposalId"] for ballot in ballots})
+    voters = sorted({ballot["voter"] for ballot in ballots})
+    pairs = sorted({(ballot["proposalId"], ballot["voter"]) for ballot in ballots})
+
+    calls = (
+        [governor.functions.state(pid) for pid in proposal_ids]
+        + [governor.functions.nonces(voter) for voter in voters]
+        + [governor.functions.hasVoted(pid, voter) for pid, voter in pairs]
+    )
+    results = []
+    for start in range(0, len(calls), batch_size):
+        results.extend(batch_read(w3, calls[start:start + batch_size], return_exceptions=True))
+
+    states = results[:len(proposal_ids)]
+    nonces = results[len(proposal_ids):len(proposal_ids) + len(voters)]
+    has_voted = results[len(proposal_ids) + len(voters):]
+    for result in nonces + has_voted:
+        if isinstance(result, Exception):
+            raise result
+    # Unknown proposal ids revert in state()
+    active = {pid for pid, state in zip(proposal_ids, states) if state == STATE_ACTIVE}
+    voted = {pair for pair, flag in zip(pairs, has_voted) if flag}
+    return active, dict(zip(voters, nonces)), voted
+
+
+def estimate_votes(w3, governor, ballots, current_nonces, sender, batch_size):
+    """
+    Execution gas per castVoteBySig (without the intrinsic cost). Ballots at
+    the voter's current nonce are estimated on chain; a failing estimate means
+    the call would revert and is returned as the exception.
+    """
+    first = [i for i, ballot in enumerate(ballots) if ballot["nonce"] == current_nonces[ballot["voter"]]]
+    fns = [_cast_vote_fn(governor, ballots[i]) for i in first]
+    estimates = []
+    for start in range(0, len(fns), batch_size):
+        estimates.extend(batch_read(w3, [
+            lambda fn=fn: fn.estimate_gas({"from": sender}) for fn in fns[start:start + batch_size]
+        ], return_exceptions=True))
+
+    gas = [None] * len(ballots)
+    for i, estimate in zip(first, estimates):
+        gas[i] = estimate if isinstance(estimate, Exception) else max(estimate - INTRINSIC_GAS, 0)
+    known = [value for value in gas if isinstance(value, int)]
+    fallback = max(known) if known else FALLBACK_VOTE_GAS
+    return [fallback if value is None else value for value in gas]
+
+
+def _cast_vote_fn(governor, ballot):
+    return governor.functions.castVoteBySig(
+        ballot["proposalId"], ballot["support"], ballot["voter"], bytes.fromhex(ballot["signature"][2:])
+    )
+
+
+def _encode_vote(governor, ballot):
+    return _cast_vote_fn(governor, ballot)._encode_transaction_data()
+
+
+def cmd_submit(args):
+    try:
+        ballots = read_ballots(args.ballots)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Ballot File Error: {e}")
+    if not ballots:
+        sys.exit("Error: no ballots")
+
+    w3, governor, domain = connect(args)
+    account = get_account(args)
+
+    # 1. Drop ballots castVoteBySig would reject
+    skipped = []
+    verified = []
+    for ballot in ballots:
+        try:
+            verify_ballot(domain, ballot)
+            verified.append(ballot)
+        except ValueError as e:
+            skipped.append((ballot, f"bad signature: {e}"))
+    try:
+        active, current_nonces, voted = read_chain_state(w3, governor, verified, args.batch_size)
+        ready, not_ready = order_ballots(verified, current_nonces, voted, active)
+        skipped.extend(not_ready)
+        gas = estimate_votes(w3, governor, ready, current_nonces, account.address, args.batch_size)
+    except Exception as e:
+        sys.exit(f"Error reading governor state: {e}")
+
+    relayable, costs = [], []
+    blocked = set()
+    for ballot, cost in zip(ready, gas):
+        if isinstance(cost, Exception):
+            skipped.append((ballot, f"would revert: {cost}"))
+            blocked.add(ballot["voter"])
+        elif ballot["voter"] in blocked:
+            # Its nonce depends on a dropped ballot of the same voter
+            skipped.append((ballot, "earlier ballot of this voter was dropped"))
+        else:
+            relayable.append(ballot)
+            costs.append(cost)
+
+    # 2. Pack into gas-bounded multicalls
+    batches = pack_batches(relayable, costs, int(args.max_gas / GAS_MARGIN))
+
+    print("-" * 40)
+    print("VOTE RELAY")
+    print("-" * 40)
+    print(f"Governor:  {domain.governor}")
+    print(f"Relayer:   {account.address}")
+    print(f"Ballots:   {len(ballots)} read, {len(relayable)} relayable, {len(skipped)} skipped")
+    print(f"Batches:   {len(batches)} (max {args.max_gas} gas each)")
+    for ballot, reason in skipped:
+        print(f"  SKIP {ballot['voter']} proposal {ballot['proposalId']} nonce {ballot['nonce']}: {reason}")
+    print("-" * 40)
+    if not batches or args.dry_run:
+        for i, (batch, batch_gas) in enumerate(batches):
+            print(f"Batch {i}: {len(batch)} votes, ~{batch_gas} gas")
+        return
+
+    # 3. Sign and send every batch with consecutive nonces, then wait for all of them
+    if args.force_gas_price_gwei:
+        gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
+    else:
+        gas_price = w3.eth.gas_price
+    tracker = tracker_from_args(w3, account, args, log=print)
+    cost_of = {(ballot["voter"], ballot["nonce"]): cost for ballot, cost in zip(relayable, costs)}
+
+    def simulate(ballots):
+        governor.functions.multicall([_encode_vote(governor, ballot) for ballot in ballots]).call(
+            {"from": account.address}
+        )
+
+    relayed, total_gas, transactions, label = 0, 0, 0, 0
+    dropped, unresolved, incomplete = [], [], False
+    for round_number in range(MAX_RELAY_ROUNDS):
+        try:
+            results, incomplete = send_batches(w3, governor, account, tracker, batches, gas_price, args.max_gas, label)
+        except InclusionError as e:
+            sys.exit(f"Inclusion Error: {e}")
+
+        failed = []
+        for i, (batch, pending, receipt) in enumerate(results, start=label):
+            if receipt["status"] == 1:
+                relayed += len(batch)
+                transactions += 1
+                total_gas += receipt["gasUsed"]
+                print(f"Batch {i}: block {receipt['blockNumber']}, {receipt['gasUsed']} gas "
+                      f"({receipt['gasUsed'] // len(batch)} per vote), included after {pending.latency:.1f}s "
+                      f"in {pending.attempts} broadcasts")
+            else:
+                failed.extend(batch)
+                print(f"Batch {i}: FAILED in block {receipt['blockNumber']}")
+        label += len(batches)
+        if incomplete or not failed:
+            break
+
+        # A multicall is all-or-nothing: one ballot that started reverting takes its whole
+        # batch down, and later batches holding the same voter's next nonce fail with it
+        print(f"Bisecting {len(failed)} ballots of failed batches...")
+        kept, bad = bisect_ballots(failed, simulate)
+        dropped.extend(bad)
+        if not bad or round_number == MAX_RELAY_ROUNDS - 1:
+            # Nothing to blame (e.g. out of gas) or out of rounds: don't resend blindly
+            unresolved = kept
+            break
+        batches = pack_batches(kept, [cost_of[(ballot["voter"], ballot["nonce"])] for ballot in kept],
+                               int(args.max_gas / GAS_MARGIN))
+        if not batches:
+            break
+        print(f"Resending {len(kept)} ballots in {len(batches)} batches")
+
+    print("-" * 40)
+    print(f"Relayed {relayed} votes in {transactions} transactions"
+          + (f", {total_gas // relayed} gas per vote" if relayed else ""))
+    if dropped:
+        print(f"Dropped {len(dropped)} ballots:")
+        for ballot, reason in dropped:
+            print(f"  {ballot['voter']} proposal {ballot['proposalId']} nonce {ballot['nonce']}: {reason}")
+    if unresolved:
+        print(f"Not relayed: {len(unresolved)} ballots of failed batches")
+    print("-" * 40)
+    if unresolved or incomplete:
+        sys.exit(1)
+
+
+def send_batches(w3, governor, account, tracker, batches, gas_price, max_gas, first_label=0):
+    """
+    Signs and sends `batches` as multicalls with consecutive nonces and waits
+    for all of them. Returns ([(batch, pending, receipt)], incomplete), where
+    `incomplete` means sending stopped at a batch that failed locally.
+    """
+    nonce, chain_id, block = batch_read(w3, [
+        lambda: w3.eth.get_transaction_count(account.address, "pending"),
+        lambda: w3.eth.chain_id,
+        lambda: w3.eth.block_number,
+    ])
+    sent = []
+    for i, (batch, batch_gas) in enumerate(batches):
+        tx = governor.functions.multicall([_encode_vote(governor, ballot) for ballot in batch]).build_transaction({
+            "from": account.address,
+            "nonce": nonce + i,
+            "gas": min(max_gas, int(batch_gas * GAS_MARGIN) + INTRINSIC_GAS),
+            "gasPrice": gas_price,
+            "chainId": chain_id,
+            "value": 0,
+        })
+        try:
+            sent.append(tracker.send(tx, block))
+        except Exception as e:
+            print(f"Batch {first_label + i} failed locally: {e}", file=sys.stderr)
+            break
+        print(f"Batch {first_label + i}: {len(batch)} votes, sent tx {sent[-1].tx_hash.hex()}")
+
+    print("Waiting for receipts...")
+    receipts = tracker.wait(sent)
+    results = [(batch, pending, receipt) for (batch, _), pending, receipt in zip(batches, sent, receipts)]
+    return results, len(sent) < len(batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Signed Vote Relayer")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sign_parser = subparsers.add_parser("sign", help="Sign a ballot for castVoteBySig")
+    sign_parser.add_argument("contract", help="Governor contract address")
+    sign_parser.add_argument("--proposal-id", required=True, type=int)
+    sign_parser.add_argument("--support", required=True, type=int, choices=sorted(SUPPORT_LABELS), help="0=Against, 1=For, 2=Abstain")
+    sign_parser.add_argument("--nonce", type=int, help="Governor nonce to sign (default: read from chain)")
+    sign_parser.add_argument("--chain-id", type=int, help="Chain id when signing without --rpc-url")
+    sign_parser.add_argument("--intake", help=f"POST the ballot to an intake, e.g. http://127.0.0.1:{DEFAULT_INTAKE_PORT}/ballots")
+    sign_parser.add_argument("--out", type=Path, help="Append the ballot to this file")
+    sign_parser.add_argument("--rpc-url")
+    sign_parser.add_argument("--private-key", default=None)
+
+    intake_parser = subparsers.add_parser("intake", help="Collect ballots over local HTTP")
+    intake_parser.add_argument("contract", help="Governor contract address")
+    intake_parser.add_argument("--store", type=Path, required=True, help="JSON-lines file ballots are appended to")
+    intake_parser.add_argument("--host", default="127.0.0.1")
+    intake_parser.add_argument("--port", type=int, default=DEFAULT_INTAKE_PORT)
+    intake_parser.add_argument("--rpc-url", required=True)
+
+    submit_parser = subparsers.add_parser("submit", help="Relay ballots in batched multicall transactions")
+    submit_parser.add_argument("contract", help="Governor contract address")
+    submit_parser.add_argument("ballots", nargs="+", type=Path, help="Ballot JSON-lines file(s)")
+    submit_parser.add_argument("--max-gas", type=int, default=8_000_000, help="Gas limit per batch transaction")
+    submit_parser.add_argument("--batch-size", type=int, default=100, help="JSON-RPC calls per batch")
+    submit_parser.add_argument("--dry-run", action="store_true", help="Validate and pack without sending")
+    submit_parser.add_argument("--rpc-url", required=True)
+    submit_parser.add_argument("--private-key", default=None)
+    submit_parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(submit_parser)
+    args = parser.parse_args()
+
+    if args.command == "sign":
+        cmd_sign(args)
+    elif args.command == "intake":
+        cmd_intake(args)
+    else:
+        cmd_submit(args)
+
+
+if __name__ == "__main__":
+    main()
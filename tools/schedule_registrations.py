@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+CLI to watch registration burn cost across subnets and register when it is cheap.
+
+`watch` prints the burn cost of every --netuid at each new block, read with
+one multi-key storage query over a single substrate connection. `run` takes
+a queue of `netuid,hotkey[,max_tao]` lines and submits
+TreasuryVault.registerNeuron for each once its subnet's burn is at or under
+the ceiling (per line, or --max-tao).
+
+Pass --fake-burn NETUID=TAO (repeatable) to use an in-memory substrate
+instead of a node; with --fake-decay the fake burn drops every block.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.burn_monitor import BURN_STORAGE, WEI_PER_RAO, BurnMonitor, RegistrationScheduler
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.fake_substrate import FakeSubstrate, decaying_burn
+from utils.inclusion import InclusionTracker, add_inclusion_args, tracker_from_args
+from utils.reads import RAO_PER_TAO, tao_to_rao
+from utils.rpc_batch import fetch_tx_params
+from utils.signing_agent import AgentError, get_signer
+
+
+def parse_fake_burn(values):
+    burns = {}
+    for value in values:
+        netuid, _, tao = value.partition("=")
+        try:
+            burns[int(netuid)] = tao_to_rao(tao)
+        except (ArithmeticError, ValueError):
+            raise ValueError(f"expected NETUID=TAO, got '{value}'")
+    return burns
+
+
+def connect_substrate(args):
+    """
+    Returns (substrate, subtensor); subtensor is None for the fake backend.
+    bittensor is only imported for a real network.
+    """
+    if args.fake_burn:
+        burns = parse_fake_burn(args.fake_burn)
+        hooks = [decaying_burn(netuid, args.fake_decay, 0) for netuid in burns] if args.fake_decay < 1 else []
+        fake = FakeSubstrate(
+            storage={(*BURN_STORAGE, netuid): burn for netuid, burn in burns.items()},
+            block_time=args.fake_block_time,
+            on_block=hooks,
+        )
+        return fake, None
+    import bittensor as bt
+
+    subtensor = bt.subtensor(network=args.network)
+    return subtensor.substrate, subtensor
+
+
+def read_queue(path: Path, default_max_tao):
+    """Parses `netuid,hotkey[,max_tao]` lines. Blank lines and lines starting with '#' are ignored."""
+    entries = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part.strip() for part in line.split(",")]
+        try:
+            netuid = int(parts[0])
+            hotkey = bytes.fromhex(parts[1].removeprefix("0x"))
+            max_tao = parts[2] if len(parts) > 2 and parts[2] else default_max_tao
+            max_rao = None if max_tao is None else tao_to_rao(max_tao)
+        except (IndexError, ArithmeticError, ValueError):
+            raise ValueError(f"{path}:{line_no}: expected netuid,hotkey[,max_tao]")
+        if len(hotkey) != 32:
+            raise ValueError(f"{path}:{line_no}: hotkey must be 32 bytes, got {len(hotkey)}")
+        if max_rao is None:
+            raise ValueError(f"{path}:{line_no}: no max_tao and no --max-tao given")
+        entries.append((netuid, hotkey, max_rao))
+    return entries
+
+
+def make_submitter(w3, vault, account, slippage, force_gas_price_gwei=None, tracker=None):
+    """
+    registerNeuron sender; overpayment up to the ceiling is refunded by the
+    vault. Stuck transactions are re-sent with higher fees by `tracker`
+    (default: an InclusionTracker with its default settings).
+    """
+    tracker = tracker or InclusionTracker(w3, account)
+
+    def submit(request, cost_rao):
+        value_rao = min(request.max_cost_rao, int(cost_rao * (1 + slippage / 100)))
+        value = value_rao * WEI_PER_RAO
+        fn = vault.functions.registerNeuron(request.netuid, request.hotkey)
+
+        gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(w3, fn, account.address, value=value)
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
+        if force_gas_price_gwei:
+            gas_price = w3.to_wei(force_gas_price_gwei, 'gwei')
+        elif isinstance(node_gas_price, Exception):
+            raise node_gas_price
+        else:
+            gas_price = node_gas_price
+
+        tx = fn.build_transaction({
+            "from": account.address,
+            "nonce": nonce,
+            "gas": int(gas_estimate * 2.0),
+            "gasPrice": gas_price,
+            "chainId": chain_id,
+            "value": value,
+        })
+        receipt = tracker.send_and_wait(tx).receipt
+        if receipt["status"] != 1:
+            raise RuntimeError(f"registerNeuron reverted in block {receipt['blockNumber']}")
+        return receipt["transactionHash"].hex()
+
+    return submit
+
+
+def print_costs(monitor):
+    print("-" * 40)
+    print(f"BURN COST @ Block {monitor.block} ({monitor.queries} queries)")
+    for netuid in monitor.netuids:
+        current, low, high = monitor.summary(netuid)
+        print(f"NetUID {netuid:<5} {current / RAO_PER_TAO:>14.9f} TAO  (min {low / RAO_PER_TAO}, max {high / RAO_PER_TAO})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Burn Cost Monitor and Registration Scheduler")
+    parser.add_argument("--network", default="test", help="Bittensor network")
+    parser.add_argument("--interval", type=float, default=12.0, help="Seconds between polls")
+    parser.add_argument("--history", type=int, default=64, help="Readings kept per subnet")
+    parser.add_argument("--fake-burn", action="append", default=[], help="NETUID=TAO, use an in-memory substrate")
+    parser.add_argument("--fake-decay", type=float, default=1.0, help="Fake burn multiplier per block")
+    parser.add_argument("--fake-block-time", type=float, default=12.0, help="Seconds per fake block")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    watch_parser = subparsers.add_parser("watch", help="Print burn cost per block")
+    watch_parser.add_argument("--netuid", type=int, action="append", required=True, help="Repeatable")
+    watch_parser.add_argument("--polls", type=int, default=None, help="Stop after N polls")
+
+    run_parser = subparsers.add_parser("run", help="Submit queued registrations under a cost ceiling")
+    run_parser.add_argument("contract", help="TreasuryVault address")
+    run_parser.add_argument("--queue", type=Path, required=True, help="File with netuid,hotkey[,max_tao] lines")
+    run_parser.add_argument("--max-tao", help="Default ceiling for lines without one")
+    run_parser.add_argument("--slippage", type=float, default=5.0, help="Percent over current burn to send, capped at the ceiling")
+    run_parser.add_argument("--max-polls", type=int, default=None)
+    run_parser.add_argument("--dry-run", action="store_true", help="Report what would be submitted")
+    run_parser.add_argument("--rpc-url")
+    run_parser.add_argument("--private-key", default=None)
+    run_parser.add_argument("--force-gas-price-gwei", type=float)
+    add_inclusion_args(run_parser)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        try:
+            entries = read_queue(args.queue, args.max_tao)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Queue Error: {e}")
+        if not entries:
+            sys.exit("Error: queue is empty")
+        netuids = [netuid for netuid, _, _ in entries]
+    else:
+        netuids = args.netuid
+
+    try:
+        substrate, subtensor = connect_substrate(args)
+        monitor = BurnMonitor(substrate, netuids, history=args.history)
+        monitor.refresh()
+    except Exception as e:
+        sys.exit(f"Substrate Error: {e}")
+
+    try:
+        if args.command == "watch":
+            polls = 0
+            while args.polls is None or polls < args.polls:
+                block = monitor.block
+                monitor.refresh()
+                if monitor.block != block or polls == 0:
+                    print_costs(monitor)
+                polls += 1
+                if args.polls is None or polls < args.polls:
+                    time.sleep(args.interval)
+            print("-" * 40)
+            return
+
+        if args.dry_run:
+            def submit(request, cost_rao):
+                return "dry-run"
+        else:
+            if not args.rpc_url:
+                sys.exit("Error: run requires --rpc-url (or --dry-run)")
+            try:
+                account = get_signer(args.private_key)
+            except (OSError, ValueError, AgentError) as e:
+                sys.exit(f"Signer Error: {e}")
+            if account is None:
+                sys.exit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
+            try:
+                w3 = get_web3_provider(args.rpc_url)
+                artifact_path = current_dir.parent / "out" / "TreasuryVault.sol" / "TreasuryVault.json"
+                vault = load_contract(w3, args.contract, artifact_path)
+            except Exception as e:
+                sys.exit(f"RPC Connection Error: {e}")
+            submit = make_submitter(
+                w3, vault, account, args.slippage, args.force_gas_price_gwei,
+                tracker=tracker_from_args(w3, account, args, log=print),
+            )
+
+        scheduler = RegistrationScheduler(monitor, submit)
+        for netuid, hotkey, max_cost_rao in entries:
+            scheduler.add(netuid, hotkey, max_cost_rao)
+
+        def report(scheduler, sent):
+            print_costs(scheduler.monitor)
+            for request, cost, tx_hash in sent:
+                print(f"REGISTERED NetUID {request.netuid} 0x{request.hotkey.hex()} at {cost / RAO_PER_TAO} TAO: {tx_hash}")
+            for request in scheduler.queue:
+                if request.last_error:
+                    print(f"Retrying NetUID {request.netuid} 0x{request.hotkey.hex()}: {request.last_error}")
+            print(f"Queued: {len(scheduler.queue)}")
+
+        scheduler.run(interval=args.interval, max_polls=args.max_polls, on_poll=report)
+    except KeyboardInterrupt:
+        print("Interrupted.")
+        return
+    finally:
+        if subtensor is not None:
+            substrate.close()
+
+    print("-" * 40)
+    print(f"Submitted: {len(scheduler.submitted)}, Failed: {len(scheduler.failed)}, Still queued: {len(scheduler.queue)}")
+    for request in scheduler.failed:
+        print(f"FAILED NetUID {request.netuid} 0x{request.hotkey.hex()}: {request.last_error}")
+    print("-" * 40)
+    if scheduler.failed or scheduler.queue:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
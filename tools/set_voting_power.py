@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """
 CLI for calling: setVotingPower(uint16 netuid, bytes32 key, uint256 amount)
+
+With --file, sets power for many hotkeys at once: transactions are built with
+locally assigned nonces, signed across a process pool (--workers) and sent in
+nonce order as they come out of the pool.
 """
 
 import argparse
-import os
 import sys
+import time
 from pathlib import Path
 
 # Add the tools directory to sys.path
@@ -14,26 +18,105 @@ if str(current_dir) not in sys.path:
     sys.path.append(str(current_dir))
 
 from utils.contract_loader import get_web3_provider, load_contract
+from utils.inclusion import InclusionError, InclusionTracker, PendingTransaction, add_inclusion_args, tracker_from_args
+from utils.reads import tao_to_rao
+from utils.rpc_batch import batch_read, fetch_tx_params
+from utils.signing_pool import SigningPool, build_transactions, send_in_order
+from utils.signing_agent import AgentError, get_signer
+
+
+def hotkey_to_bytes32(hotkey):
+    # Convert address to bytes32 (left padded)
+    clean_hex = hotkey[2:] if hotkey.startswith("0x") else hotkey
+    return bytes.fromhex(clean_hex.zfill(64))
+
+
+def read_power_file(path: Path):
+    """Parses `hotkey,amount_tao` lines. Blank lines and lines starting with '#' are ignored."""
+    entries = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part.strip() for part in line.split(",")]
+        try:
+            entries.append((hotkey_to_bytes32(parts[0]), tao_to_rao(parts[1])))
+        except (IndexError, ArithmeticError, ValueError):
+            raise ValueError(f"{path}:{line_no}: expected hotkey,amount_tao")
+    return entries
+
+
+def set_bulk(w3, contract, account, netuid, entries, gas_price, workers, batch_size, tracker=None):
+    fns = [contract.functions.setVotingPower(netuid, hotkey, amount) for hotkey, amount in entries]
+
+    # One batched estimate per chunk; the largest one covers every transaction
+    estimates = []
+    for start in range(0, len(fns), batch_size):
+        estimates.extend(batch_read(w3, [
+            lambda fn=fn: fn.estimate_gas({"from": account.address}) for fn in fns[start:start + batch_size]
+        ]))
+    gas_limit = int(max(estimates) * 1.2)
+    nonce, chain_id, block = batch_read(w3, [
+        lambda: w3.eth.get_transaction_count(account.address, "pending"),
+        lambda: w3.eth.chain_id,
+        lambda: w3.eth.block_number,
+    ])
+    print(f"Gas Limit (Max Estimate): {gas_limit}")
+    print(f"Nonces:                   {nonce}..{nonce + len(fns) - 1}")
+
+    txs = build_transactions(fns, account.address, nonce, gas_limit, gas_price, chain_id)
+    start = time.perf_counter()
+    if hasattr(account, "key"):
+        with SigningPool(account.key, workers=workers) as pool:
+            tx_hashes = send_in_order(w3, pool.sign(txs))
+        signer = f"{pool.workers} workers"
+    else:
+        # Signing agent: the whole batch in one request
+        tx_hashes = send_in_order(w3, account.sign_transactions(txs))
+        signer = "signing agent"
+    elapsed = time.perf_counter() - start
+    print(f"Signed and sent {len(tx_hashes)} txs in {elapsed:.2f}s ({len(tx_hashes) / elapsed:.1f} tx/s, {signer})")
+
+    print("Waiting for receipts...")
+    # Any nonce that gets stuck is re-signed with a higher fee instead of blocking the rest
+    tracker = tracker or InclusionTracker(w3, account, batch_size=batch_size)
+    receipts = tracker.wait([PendingTransaction(tx, tx_hash, block) for tx, tx_hash in zip(txs, tx_hashes)])
+    failed = [tx_hash.hex() for tx_hash, receipt in zip(tx_hashes, receipts) if receipt["status"] != 1]
+    if failed:
+        print(f"FAILED: {len(failed)} of {len(tx_hashes)}")
+        for tx_hash in failed:
+            print(f"  {tx_hash}")
+        sys.exit(1)
+    print(f"SUCCESS! {len(tx_hashes)} transactions, last block: {receipts[-1]['blockNumber']}")
 
 def main():
     parser = argparse.ArgumentParser(description="Set Mock Voting Power")
     parser.add_argument("contract", help="MockBittensorVotes contract address")
-    parser.add_argument("--hotkey", required=True, help="EVM Address (0x...) to act as bytes32 key")
-    parser.add_argument("--amount", required=True, type=float, help="Amount in TAO")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--hotkey", help="EVM Address (0x...) to act as bytes32 key")
+    target.add_argument("--file", type=Path, help="File with hotkey,amount_tao lines")
+    parser.add_argument("--amount", help="Amount in TAO (with --hotkey)")
     parser.add_argument("--netuid", default=1, type=int)
     parser.add_argument("--rpc-url", required=True)
     parser.add_argument("--private-key", default=None)
     parser.add_argument("--force-gas-price-gwei", type=float, help="Force a specific Gas Price in Gwei")
+    add_inclusion_args(parser)
+    parser.add_argument("--workers", type=int, default=None, help="Signing processes for --file (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=100, help="JSON-RPC calls per batch for --file")
     args = parser.parse_args()
+    if args.hotkey and args.amount is None:
+        parser.error("--hotkey requires --amount")
 
-    private_key = args.private_key or os.getenv("PRIVATE_KEY")
-    if not private_key:
-        raise SystemExit("Error: Set PRIVATE_KEY env var or pass --private-key")
+    try:
+        account = get_signer(args.private_key)
+    except (OSError, ValueError, AgentError) as e:
+        sys.exit(f"Signer Error: {e}")
+    if account is None:
+        raise SystemExit("Error: Set PRIVATE_KEY env var, pass --private-key or start tools/signing_agent.py")
 
     # 1. Setup Web3 & Account
     try:
         w3 = get_web3_provider(args.rpc_url)
-        account = w3.eth.account.from_key(private_key)
 
         print(f"--- WALLET INFO ---")
         print(f"Address: {account.address}")
@@ -43,17 +126,14 @@ def main():
 
     # 2. Prepare Data
     try:
-        # Convert address to bytes32 (left padded)
-        if args.hotkey.startswith("0x"):
-            clean_hex = args.hotkey[2:]
+        if args.file:
+            entries = read_power_file(args.file)
         else:
-            clean_hex = args.hotkey
+            hotkey_bytes32 = hotkey_to_bytes32(args.hotkey)
 
-        hotkey_bytes32 = bytes.fromhex(clean_hex.zfill(64))
-
-        # 9 decimals logic as per example
-        amount_raw = int(args.amount * 1_000_000_000)
-    except ValueError as e:
+            # 9 decimals logic as per example
+            amount_raw = tao_to_rao(args.amount)
+    except (OSError, ArithmeticError, ValueError) as e:
         print(f"CRITICAL ERROR converting data: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -66,20 +146,40 @@ def main():
         print(f"CRITICAL ERROR loading contract: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if args.file:
+        if not entries:
+            sys.exit("Error: no hotkeys in file")
+        print(f"--- BULK SET ({len(entries)} hotkeys) ---")
+        try:
+            if args.force_gas_price_gwei:
+                gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
+            else:
+                gas_price = w3.eth.gas_price
+            tracker = tracker_from_args(w3, account, args, log=print)
+            set_bulk(w3, contract, account, args.netuid, entries, gas_price, args.workers, args.batch_size, tracker)
+        except Exception as e:
+            sys.exit(f"Bulk Error: {e}")
+        return
+
     # 4. Execute
     fn = contract.functions.setVotingPower(args.netuid, hotkey_bytes32, amount_raw)
 
     print("--- GAS & COST CALCULATION ---")
+    # Estimate, gas price, nonce and chain id travel in one JSON-RPC batch
+    gas_estimate, node_gas_price, nonce, chain_id = fetch_tx_params(w3, fn, account.address)
     try:
-        gas_estimate = fn.estimate_gas({"from": account.address})
+        if isinstance(gas_estimate, Exception):
+            raise gas_estimate
         gas_limit = int(gas_estimate * 1.2)
         print(f"Gas Limit (Estimated): {gas_limit}")
 
         if args.force_gas_price_gwei:
             gas_price = w3.to_wei(args.force_gas_price_gwei, 'gwei')
             print(f"Gas Price (FORCED):    {args.force_gas_price_gwei} Gwei")
+        elif isinstance(node_gas_price, Exception):
+            raise node_gas_price
         else:
-            gas_price = w3.eth.gas_price
+            gas_price = node_gas_price
             print(f"Gas Price (Node):      {w3.from_wei(gas_price, 'gwei'):.2f} Gwei")
 
     except Exception as exc:
@@ -87,29 +187,31 @@ def main():
         gas_limit = 500_000
         gas_price = w3.to_wei(100, 'gwei')
 
-    nonce = w3.eth.get_transaction_count(account.address, "pending")
-
     tx = fn.build_transaction({
         "from": account.address,
         "nonce": nonce,
         "gas": gas_limit,
         "gasPrice": gas_price,
-        "chainId": w3.eth.chain_id,
+        "chainId": chain_id,
         "value": 0,
     })
 
     print(f"Sending transaction (Nonce: {nonce})...")
-    signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
+    tracker = tracker_from_args(w3, account, args, log=print)
 
     try:
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-        print(f"Sent tx: {tx_hash.hex()}")
+        pending = tracker.send(tx)
+        print(f"Sent tx: {pending.tx_hash.hex()}")
     except Exception as e:
         print(f"Transaction failed locally: {e}")
         sys.exit(1)
 
     print("Waiting for receipt...")
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    try:
+        receipt = tracker.wait([pending])[0]
+    except InclusionError as e:
+        sys.exit(f"Inclusion Error: {e}")
+    print(f"Included after {pending.latency:.1f}s ({pending.blocks_to_inclusion} blocks, {pending.attempts} broadcasts)")
 
     if receipt["status"] == 1:
         print(f"SUCCESS! Block: {receipt['blockNumber']}, Gas Used: {receipt['gasUsed']}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+CLI for the local signing agent.
+
+`start` unlocks keys once (encrypted keystores and/or PRIVATE_KEY) and keeps
+them in memory, serving signing requests on a Unix socket until it has been
+idle for --idle-timeout seconds. Write tools that get neither --private-key
+nor PRIVATE_KEY sign through the agent (socket path from
+TREASURY_SIGNER_SOCK, account from TREASURY_SIGNER_ADDRESS, default: the
+first unlocked key). `status` lists unlocked accounts; `stop` drops the keys
+and shuts the agent down.
+"""
+
+import argparse
+import getpass
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from eth_account import Account
+
+from utils.signing_agent import (
+    DEFAULT_IDLE_TIMEOUT,
+    AgentError,
+    SigningAgent,
+    SigningAgentClient,
+    socket_path_from_env,
+)
+
+
+def unlock_keystores(paths, password_file=None):
+    password = password_file.read_text().rstrip("\n") if password_file else None
+    accounts = []
+    for path in paths:
+        keystore = json.loads(path.read_text())
+        secret = password if password is not None else getpass.getpass(f"Password for {path.name}: ")
+        start = time.perf_counter()
+        accounts.append(Account.from_key(Account.decrypt(keystore, secret)))
+        print(f"Unlocked {accounts[-1].address} in {time.perf_counter() - start:.2f}s")
+    return accounts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Signing Agent")
+    parser.add_argument("--socket", type=Path, default=None, help="Unix socket path (default: $TREASURY_SIGNER_SOCK)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    start_parser = subparsers.add_parser("start", help="Unlock keys and serve signing requests")
+    start_parser.add_argument("--keystore", type=Path, action="append", default=[], help="Encrypted keystore JSON (repeatable)")
+    start_parser.add_argument("--password-file", type=Path, help="Password for every keystore (default: prompt)")
+    start_parser.add_argument("--env-key", action="store_true", help="Also load PRIVATE_KEY from the environment")
+    start_parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT, help="Seconds without signing before the agent exits")
+
+    subparsers.add_parser("status", help="Show unlocked accounts")
+    subparsers.add_parser("stop", help="Drop keys and stop the agent")
+    args = parser.parse_args()
+
+    socket_path = args.socket or socket_path_from_env()
+
+    if args.command == "start":
+        try:
+            accounts = unlock_keystores(args.keystore, args.password_file)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Keystore Error: {e}")
+        if args.env_key:
+            if not os.getenv("PRIVATE_KEY"):
+                sys.exit("Error: --env-key given but PRIVATE_KEY is not set")
+            accounts.append(Account.from_key(os.environ["PRIVATE_KEY"]))
+        if not accounts:
+            sys.exit("Error: pass --keystore and/or --env-key")
+
+        agent = SigningAgent(accounts, socket_path, idle_timeout=args.idle_timeout)
+        print("-" * 40)
+        print(f"SIGNING AGENT on {socket_path}")
+        for account in accounts:
+            print(f"  {account.address}")
+        print(f"Idle timeout: {args.idle_timeout}s")
+        print("-" * 40)
+        try:
+            agent.serve_forever()
+        except AgentError as e:
+            sys.exit(f"Agent Error: {e}")
+        except KeyboardInterrupt:
+            pass
+        print("Agent stopped, keys dropped.")
+        return
+
+    try:
+        client = SigningAgentClient(socket_path, timeout=5.0)
+        if args.command == "status":
+            status = client.call("status")
+            print("-" * 40)
+            print(f"SIGNING AGENT on {socket_path}")
+            print("-" * 40)
+            for address in status["accounts"]:
+                print(f"  {address}")
+            print(f"Idle: {status['idle_for']:.0f}s of {status['idle_timeout']}s")
+        else:
+            client.call("lock")
+            print("Agent stopped, keys dropped.")
+    except (OSError, AgentError) as e:
+        sys.exit(f"Agent Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
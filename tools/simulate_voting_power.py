@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+CLI to predict EMA voting power for a whole subnet from stake time series.
+
+Stake changes come from a CSV of `block,hotkey,stake_tao` rows (stake holds
+from that block until the hotkey's next row). EMA parameters and starting
+power can be read from the votes contract, then every hotkey is simulated
+block by block up to --until-block and checked against proposalThreshold.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.contract_loader import get_web3_provider, load_contract
+from utils.ema_simulator import NEVER, PROPOSAL_THRESHOLD, alpha_from_raw, first_crossing, simulate, stake_grid
+from utils.reads import RAO_PER_TAO, tao_to_rao
+from utils.rpc_batch import batch_read
+
+
+def read_stake_events(path: Path):
+    """Returns (blocks, hotkeys, stakes_rao) lists from a block,hotkey,stake_tao CSV."""
+    blocks, hotkeys, stakes = [], [], []
+    with path.open(newline="") as f:
+        for line_no, row in enumerate(csv.reader(f), start=1):
+            if not row or row[0].startswith("#"):
+                continue
+            if line_no == 1 and not row[0].strip().isdigit():
+                continue  # header
+            try:
+                blocks.append(int(row[0]))
+                hotkeys.append(row[1].strip().lower())
+                stakes.append(tao_to_rao(row[2].strip()))
+            except (IndexError, ArithmeticError, ValueError):
+                raise ValueError(f"{path}:{line_no}: expected block,hotkey,stake_tao")
+    return blocks, hotkeys, stakes
+
+
+def hotkey_bytes32(hotkey: str) -> bytes:
+    return bytes.fromhex(hotkey.removeprefix("0x").zfill(64))
+
+
+def fetch_chain_params(w3, contract, netuid, hotkeys, batch_size=100):
+    """Alpha, disable block and current power of every hotkey, batched."""
+    raw_alpha, disable_at = batch_read(w3, [
+        contract.functions.getVotingPowerEmaAlpha(netuid),
+        contract.functions.getVotingPowerDisableAtBlock(netuid),
+    ])
+    calls = [contract.functions.getVotingPower(netuid, hotkey_bytes32(hotkey)) for hotkey in hotkeys]
+    power = []
+    for start in range(0, len(calls), batch_size):
+        power.extend(batch_read(w3, calls[start:start + batch_size]))
+    return raw_alpha, disable_at, power
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate EMA Voting Power")
+    parser.add_argument("--stakes", type=Path, required=True, help="CSV of block,hotkey,stake_tao rows")
+    parser.add_argument("--until-block", type=int, required=True, help="Last block to simulate")
+    parser.add_argument("--start-block", type=int, help="First block (default: chain head or first event)")
+    parser.add_argument("--alpha", type=float, help="EMA alpha as a fraction (default: read from --contract)")
+    parser.add_argument("--interval", type=int, default=1, help="Blocks between EMA steps")
+    parser.add_argument("--disable-at-block", type=int, help="Default: read from --contract")
+    parser.add_argument("--threshold", type=float, default=PROPOSAL_THRESHOLD / RAO_PER_TAO, help="In TAO")
+    parser.add_argument("--contract", help="Votes contract to read alpha and current power from")
+    parser.add_argument("--netuid", default=1, type=int)
+    parser.add_argument("--rpc-url")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        blocks, hotkey_of_event, stakes = read_stake_events(args.stakes)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Stake File Error: {e}")
+    hotkeys = list(dict.fromkeys(hotkey_of_event))
+    if not hotkeys:
+        sys.exit("Stake File Error: no stake rows")
+
+    initial_power = None
+    raw_alpha, disable_at, start_block = None, None, args.start_block
+    if args.contract:
+        if not args.rpc_url:
+            sys.exit("Error: --contract requires --rpc-url")
+        try:
+            w3 = get_web3_provider(args.rpc_url)
+            artifact_path = current_dir.parent / "out" / "MockBittensorVotes.sol" / "MockBittensorVotes.json"
+            contract = load_contract(w3, args.contract, artifact_path)
+            raw_alpha, disable_at, initial_power = fetch_chain_params(w3, contract, args.netuid, hotkeys)
+            if start_block is None:
+                start_block = w3.eth.block_number + 1
+        except Exception as e:
+            sys.exit(f"Chain Read Error: {e}")
+
+    alpha = args.alpha if args.alpha is not None else (alpha_from_raw(raw_alpha) if raw_alpha is not None else None)
+    if alpha is None:
+        sys.exit("Error: pass --alpha or --contract/--rpc-url to read it")
+    if not 0.0 <= alpha <= 1.0:
+        sys.exit(f"Error: alpha must be within [0, 1], got {alpha}")
+    if args.disable_at_block is not None:
+        disable_at = args.disable_at_block
+    if start_block is None:
+        start_block = min(blocks)
+    if args.until_block < start_block:
+        sys.exit(f"Error: --until-block {args.until_block} is before start block {start_block}")
+
+    n_blocks = args.until_block - start_block + 1
+    columns = {hotkey: j for j, hotkey in enumerate(hotkeys)}
+    threshold = tao_to_rao(args.threshold)
+
+    start = time.perf_counter()
+    stake = stake_grid(blocks, [columns[h] for h in hotkey_of_event], stakes, start_block, n_blocks, len(hotkeys))
+    power = simulate(
+        stake,
+        alpha,
+        initial_power=initial_power,
+        interval=args.interval,
+        disable_row=disable_at - start_block if disable_at else None,
+    )
+    crossing = first_crossing(power, threshold)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # propose() checks getVotes(proposer, clock() - 1)
+    rows = []
+    for j, hotkey in enumerate(hotkeys):
+        rows.append({
+            "hotkey": hotkey,
+            "final_power": int(power[-1, j]),
+            "first_block": int(start_block + crossing[j]) if crossing[j] != NEVER else None,
+            "can_propose_at_end": bool(power[-1, j] >= threshold),
+        })
+    rows.sort(key=lambda row: (row["first_block"] is None, row["first_block"] or 0, -row["final_power"]))
+
+    if args.json:
+        print(json.dumps({
+            "start_block": start_block,
+            "until_block": args.until_block,
+            "alpha": alpha,
+            "threshold": threshold,
+            "elapsed_ms": elapsed_ms,
+            "hotkeys": rows,
+        }, indent=2))
+        return
+
+    clearing = [row for row in rows if row["first_block"] is not None]
+    print("-" * 40)
+    print(f"EMA VOTING POWER: Blocks {start_block}..{args.until_block}")
+    print(f"Alpha:      {alpha}")
+    print(f"Threshold:  {threshold / RAO_PER_TAO} TAO")
+    print(f"Simulated:  {len(hotkeys)} hotkeys x {n_blocks} blocks in {elapsed_ms:.2f} ms")
+    print("-" * 40)
+    print(f"Clearing threshold by block {args.until_block}: {len(clearing)}")
+    for row in clearing:
+        note = "" if row["can_propose_at_end"] else " (drops below again)"
+        print(f"  {row['hotkey']}  block {row['first_block']}, power {row['final_power'] / RAO_PER_TAO} TAO{note}")
+    print("-" * 40)
+
+
+if __name__ == "__main__":
+    main()
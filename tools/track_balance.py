@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+CLI to track the TreasuryVault native balance over time.
+
+`sync` walks new blocks incrementally and records every balance change with
+its attribution (inflow, executed payout or stream claim, registration burn,
+other) into a local columnar store. It reads vault events, and balances and
+blocks only where the balance moved. `at` and `outflow` answer queries from the store alone,
+without touching the RPC.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from eth_abi import decode as abi_decode
+from web3 import Web3
+
+current_dir = Path(__file__).resolve().parent
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
+
+from utils.balance_history import BalanceHistory, DEFAULT_EPOCH_LENGTH, WEI_PER_RAO, wei_to_rao
+from utils.contract_loader import get_web3_provider
+from utils.rpc_batch import batch_read
+
+NEURON_REGISTRATION_TOPIC = Web3.keccak(text="NeuronRegistration(uint16,bytes32,address)")
+CALL_EXECUTED_TOPIC = Web3.keccak(text="CallExecuted(bytes32,uint256,address,uint256,bytes)")
+STREAM_CLAIMED_TOPIC = Web3.keccak(text="StreamClaimed(uint256,address,uint32,uint256)")
+REGISTER_NEURON_SELECTOR = Web3.keccak(text="registerNeuron(uint16,bytes32)")[:4]
+
+
+def default_store_path(vault: str) -> Path:
+    return Path(f"balance_{vault.lower()}.npz")
+
+
+def read_balances(w3, vault, blocks, batch_size):
+    """Balances of `vault` at `blocks` in JSON-RPC batches, as {block: rao}."""
+    blocks = sorted(set(blocks))
+    balances = {}
+    for start in range(0, len(blocks), batch_size):
+        chunk = blocks[start:start + batch_size]
+        balances.update(zip(chunk, (wei_to_rao(balance) for balance in batch_read(w3, [
+            lambda number=number: w3.eth.get_balance(vault, block_identifier=number) for number in chunk
+        ]))))
+    return balances
+
+
+def find_changes(w3, vault, segments, balances, batch_size):
+    """
+    Blocks in which the balance changed, found by bisecting `segments`: (lo, hi)
+    block pairs with known balances and no vault logs in (lo, hi]. A segment
+    with equal end balances is taken as quiet, so changes that cancel out
+    inside one are not seen. Each round reads the midpoints of all open
+    segments in one batch; `balances` is extended with every read.
+    """
+    changed = []
+    open_segments = [(lo, hi) for lo, hi in segments if hi > lo]
+    while open_segments:
+        splits = []
+        for lo, hi in open_segments:
+            if balances[lo] == balances[hi]:
+                continue
+            if hi == lo + 1:
+                changed.append(hi)
+            else:
+                splits.append((lo, (lo + hi) // 2, hi))
+        balances.update(read_balances(w3, vault, [mid for _, mid, _ in splits], batch_size))
+        open_segments = [segment for lo, mid, hi in splits for segment in ((lo, mid), (mid, hi))]
+    return sorted(changed)
+
+
+def scan_range(w3, vault, from_block, to_block, opening_balance, batch_size=100):
+    """
+    Collects the blocks in [from_block, to_block] where `vault`'s balance may
+    have changed, with their flow hints.
+
+    Vault events mark registrations, executed payouts and stream claims. The
+    balance is read around each of those blocks and at `to_block`, and the
+    stretches between them are bisected for other changes (transfers in), so
+    balances are only read where something happened. Only blocks found this
+    way are fetched with their transactions, to attribute direct transfers.
+    `opening_balance` is the balance (rao) after from_block - 1.
+
+    Returns (activity, timestamps, balances) where activity maps block ->
+    dict with inflow/payout in wei and a `registration` flag, and balances
+    maps block -> rao for every block in activity.
+    """
+    activity = {}
+
+    def touch(block_number):
+        return activity.setdefault(block_number, {"inflow": 0, "payout": 0, "registration": False})
+
+    logs = w3.eth.get_logs({
+        "address": vault,
+        "fromBlock": from_block,
+        "toBlock": to_block,
+        "topics": [[NEURON_REGISTRATION_TOPIC, CALL_EXECUTED_TOPIC, STREAM_CLAIMED_TOPIC]],
+    })
+    for log in logs:
+        entry = touch(log["blockNumber"])
+        if log["topics"][0] == NEURON_REGISTRATION_TOPIC:
+            entry["registration"] = True
+        elif log["topics"][0] == STREAM_CLAIMED_TOPIC:
+            recipient = Web3.to_checksum_address(bytes(log["topics"][2])[12:])
+            _, amount = abi_decode(["uint32", "uint256"], bytes(log["data"]))
+            if recipient != vault:
+                entry["payout"] += amount
+        else:
+            target, value, _ = abi_decode(["address", "uint256", "bytes"], bytes(log["data"]))
+            # Calls the vault makes to itself (e.g. updateDelay) don't move funds
+            if Web3.to_checksum_address(target) != vault:
+                entry["payout"] += value
+
+    # Known balances: each event block and the block before it, and the end of the range
+    event_blocks = sorted(activity)
+    checkpoints = {to_block}
+    for number in event_blocks:
+        checkpoints.update((number - 1, number))
+    checkpoints.discard(from_block - 1)
+    balances = {from_block - 1: opening_balance, **read_balances(w3, vault, checkpoints, batch_size)}
+
+    # Stretches without events: from the previous known block to the block before the next event
+    segments, lo = [], from_block - 1
+    for number in event_blocks + [to_block + 1]:
+        if number - 1 > lo:
+            segments.append((lo, number - 1))
+        lo = number
+    for number in find_changes(w3, vault, segments, balances, batch_size):
+        touch(number)
+
+    numbers = sorted(activity)
+    blocks = []
+    for start in range(0, len(numbers), batch_size):
+        blocks.extend(batch_read(w3, [
+            lambda number=number: w3.eth.get_block(number, full_transactions=True)
+            for number in numbers[start:start + batch_size]
+        ]))
+    timestamps = {}
+    transfers = []
+    for number, block in zip(numbers, blocks):
+        timestamps[number] = block["timestamp"]
+        for tx in block["transactions"]:
+            if tx["to"] != vault:
+                continue
+            if bytes(tx.get("input", b""))[:4] == REGISTER_NEURON_SELECTOR:
+                touch(number)["registration"] = True
+            elif tx["value"] > 0:
+                transfers.append((number, tx))
+    statuses = batch_read(w3, [
+        lambda tx=tx: w3.eth.get_transaction_receipt(tx["hash"]) for _, tx in transfers
+    ]) if transfers else []
+    for (number, tx), receipt in zip(transfers, statuses):
+        if receipt["status"] == 1:
+            touch(number)["inflow"] += tx["value"]
+
+    return activity, timestamps, {number: balances[number] for number in numbers}
+
+
+def sync(w3, history, vault, from_block, to_block, chunk_size):
+    """Extends the store up to `to_block`, saving after every chunk."""
+    if len(history) == 0:
+        start = from_block if from_block is not None else to_block
+        block = w3.eth.get_block(start)
+        opening = wei_to_rao(w3.eth.get_balance(vault, block_identifier=start))
+        history.append([{
+            "block": start, "timestamp": block["timestamp"], "balance": opening,
+            "inflow": 0, "payout": 0, "burn": 0, "other": 0,
+        }])
+        history.save()
+        print(f"Opening balance at block {start}: {opening / WEI_PER_RAO} TAO")
+
+    cursor = history.last_block + 1
+    while cursor <= to_block:
+        chunk_end = min(cursor + chunk_size - 1, to_block)
+        previous = history.latest_balance
+        activity, timestamps, balances = scan_range(w3, vault, cursor, chunk_end, previous)
+
+        rows = []
+        for number in sorted(activity):
+            entry = activity[number]
+            balance = balances[number]
+            delta = balance - previous
+            inflow = wei_to_rao(entry["inflow"])
+            payout = wei_to_rao(entry["payout"])
+            if entry["registration"]:
+                burn, other = inflow - payout - delta, 0
+            else:
+                burn, other = 0, delta - inflow + payout
+            rows.append({
+                "block": number, "timestamp": timestamps[number], "balance": balance,
+                "inflow": inflow, "payout": payout, "burn": burn, "other": other,
+            })
+            previous = balance
+
+        history.append(rows, synced_to=chunk_end)
+        history.save()
+        print(f"Synced blocks {cursor}-{chunk_end} ({len(rows)} changes)")
+        cursor = chunk_end + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track Vault Balance History")
+    parser.add_argument("vault", help="TreasuryVault address")
+    parser.add_argument("--store", type=Path, help="History file (default: balance_<vault>.npz)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser("sync", help="Fetch new blocks into the store")
+    sync_parser.add_argument("--rpc-url", required=True)
+    sync_parser.add_argument("--from-block", type=int, help="First block for a new store (default: head)")
+    sync_parser.add_argument("--to-block", type=int, help="Last block to sync (default: head)")
+    sync_parser.add_argument("--chunk-size", type=int, default=500)
+
+    at_parser = subparsers.add_parser("at", help="Balance after a given block")
+    at_parser.add_argument("block", type=int)
+
+    outflow_parser = subparsers.add_parser("outflow", help="Net outflow per epoch")
+    outflow_parser.add_argument("--epoch-length", type=int, default=DEFAULT_EPOCH_LENGTH)
+    outflow_parser.add_argument("--last", type=int, default=20, help="Number of most recent epochs to show")
+
+    args = parser.parse_args()
+
+    if not Web3.is_address(args.vault):
+        sys.exit("Invalid address format")
+    vault = Web3.to_checksum_address(args.vault)
+    store_path = args.store or default_store_path(vault)
+
+    try:
+        history = BalanceHistory.load(vault, store_path)
+    except Exception as e:
+        sys.exit(f"Store Load Error: {e}")
+
+    if args.command == "sync":
+        try:
+            w3 = get_web3_provider(args.rpc_url)
+        except Exception as e:
+            sys.exit(f"RPC Connection Error: {e}")
+
+        to_block = args.to_block if args.to_block is not None else w3.eth.block_number
+        try:
+            sync(w3, history, vault, args.from_block, to_block, args.chunk_size)
+        except Exception as e:
+            sys.exit(f"Sync Error (progress up to block {history.last_block} saved): {e}")
+        return
+
+    if len(history) == 0:
+        sys.exit(f"No history in {store_path}. Run 'sync' first.")
+
+    if args.command == "at":
+        try:
+            balance_rao = history.balance_at(args.block)
+        except LookupError as e:
+            sys.exit(str(e))
+
+        print("-" * 40)
+        print(f"BALANCE AT BLOCK {args.block}")
+        print("-" * 40)
+        print(f"Target:  {vault}")
+        print(f"TAO:     {balance_rao / WEI_PER_RAO}")
+        print(f"Rao:     {balance_rao}")
+        print("-" * 40)
+        return
+
+    flows = history.outflow_per_epoch(args.epoch_length)
+    print("-" * 72)
+    print(f"NET OUTFLOW PER EPOCH ({args.epoch_length} blocks, TAO)")
+    print("-" * 72)
+    print(f"{'Epoch':>8} {'Inflow':>12} {'Payout':>12} {'Burn':>12} {'Other':>12} {'Net Out':>12}")
+    for i in range(max(0, len(flows["epoch"]) - args.last), len(flows["epoch"])):
+        print(
+            f"{flows['epoch'][i]:>8} "
+            f"{flows['inflow'][i] / WEI_PER_RAO:>12.4f} "
+            f"{flows['payout'][i] / WEI_PER_RAO:>12.4f} "
+            f"{flows['burn'][i] / WEI_PER_RAO:>12.4f} "
+            f"{flows['other'][i] / WEI_PER_RAO:>12.4f} "
+            f"{flows['net_outflow'][i] / WEI_PER_RAO:>12.4f}"
+        )
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
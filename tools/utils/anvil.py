@@ -0,0 +1,121 @@
+import os
+import re
+import shutil
+import socket
+import subprocess
+import time
+from pathlib import Path
+
+from web3 import Web3
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# First pre-funded anvil account (mnemonic "test test ... junk")
+ANVIL_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+ANVIL_ADDRESS = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+DEPLOY_LOG_PATTERNS = {
+    "votes": re.compile(r"MockVotes deployed at:\s*(0x[0-9a-fA-F]{40})"),
+    "vault": re.compile(r"Vault deployed at:\s*(0x[0-9a-fA-F]{40})"),
+    "governor": re.compile(r"Governor deployed at:\s*(0x[0-9a-fA-F]{40})"),
+    "registry": re.compile(r"Registry deployed at:\s*(0x[0-9a-fA-F]{40})"),
+}
+
+
+def anvil_rpc(w3, method, params):
+    """Calls an anvil_*/evm_* method; raises RuntimeError on a JSON-RPC error."""
+    response = w3.provider.make_request(method, params)
+    if response.get("error"):
+        raise RuntimeError(f"{method}: {response['error']}")
+    return response.get("result")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class AnvilNode:
+    """
+    Runs a throwaway anvil instance for the lifetime of a `with` block.
+
+    Usage:
+        with AnvilNode() as node:
+            w3 = Web3(Web3.HTTPProvider(node.rpc_url))
+    """
+
+    def __init__(self, port: int = None, extra_args: list = None, startup_timeout: float = 15.0):
+        self.port = port or free_port()
+        self.rpc_url = f"http://127.0.0.1:{self.port}"
+        self.extra_args = extra_args or []
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    def start(self):
+        if shutil.which("anvil") is None:
+            raise RuntimeError("Error: 'anvil' command not found. Please install Foundry.")
+
+        self.process = subprocess.Popen(
+            ["anvil", "--port", str(self.port), "--silent", *self.extra_args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"anvil exited early: {self.process.stderr.read().decode().strip()}")
+            if w3.is_connected():
+                return self
+            time.sleep(0.05)
+        self.stop()
+        raise TimeoutError(f"anvil did not start on port {self.port} within {self.startup_timeout}s")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def deploy_governance(rpc_url: str, private_key: str = ANVIL_PRIVATE_KEY) -> dict:
+    """
+    Deploys MockBittensorVotes, TreasuryVault, HotkeyRegistry and
+    TreasuryController with script/Deploy.s.sol and returns their addresses
+    keyed votes/vault/registry/governor.
+    """
+    if shutil.which("forge") is None:
+        raise RuntimeError("Error: 'forge' command not found. Please install Foundry.")
+
+    result = subprocess.run(
+        [
+            "forge", "script", "script/Deploy.s.sol:DeployGovernance",
+            "--rpc-url", rpc_url,
+            "--broadcast",
+        ],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PRIVATE_KEY": private_key},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Error executing forge script: {result.stderr.strip() or result.stdout.strip()}")
+
+    addresses = {}
+    for name, pattern in DEPLOY_LOG_PATTERNS.items():
+        match = pattern.search(result.stdout)
+        if not match:
+            raise ValueError(f"Could not find {name} address in forge script output")
+        addresses[name] = Web3.to_checksum_address(match.group(1))
+    return addresses
@@ -0,0 +1,186 @@
+import hashlib
+import json
+from pathlib import Path
+
+from eth_account import Account
+from web3 import Web3
+
+from .anvil import ANVIL_ADDRESS, REPO_ROOT, AnvilNode, anvil_rpc, deploy_governance
+from .contract_loader import load_contract
+from .reads import ARTIFACTS, tao_to_rao
+
+FIXTURE_VERSION = 1
+DEFAULT_FIXTURE_PATH = REPO_ROOT / "out" / "fixtures" / "governance.json"
+
+# anvil's dev accounts (mnemonic "test test ... junk"); the first one deploys
+ANVIL_MNEMONIC = "test test test test test test test test test test test junk"
+# Voting power (TAO) of dev accounts 0.. in the default fixture; each clears the 100 TAO proposal threshold
+DEFAULT_VOTING_POWER_TAO = (10_000, 5_000, 2_500, 1_000, 500)
+DEFAULT_VAULT_FUNDING_TAO = 1_000
+
+# Inputs of the deployed contracts: a fixture built from other sources is stale
+FIXTURE_SOURCES = ("src/**/*.sol", "script/Deploy.s.sol", "foundry.toml")
+
+
+def anvil_accounts(count):
+    """(address, private_key) of anvil's first `count` dev accounts."""
+    Account.enable_unaudited_hdwallet_features()
+    accounts = []
+    for i in range(count):
+        account = Account.from_mnemonic(ANVIL_MNEMONIC, account_path=f"m/44'/60'/0'/0/{i}")
+        accounts.append((account.address, account.key.to_0x_hex()))
+    return accounts
+
+
+def source_hash(root=REPO_ROOT):
+    """sha256 over the contract sources and deploy script a fixture was built from."""
+    digest = hashlib.sha256()
+    for pattern in FIXTURE_SOURCES:
+        for path in sorted(root.glob(pattern)):
+            digest.update(str(path.relative_to(root)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_fixture(voting_power=None, vault_funding_tao=DEFAULT_VAULT_FUNDING_TAO, netuid=1):
+    """
+    Builds the seeded environment once on a throwaway anvil and returns it as
+    a fixture dict: contracts deployed with script/Deploy.s.sol, voting power
+    set per account (`voting_power` maps address to TAO, default
+    DEFAULT_VOTING_POWER_TAO over the dev accounts), the vault funded, and
+    one more block mined so the power is in the past for propose. The chain
+    itself is stored as anvil_dumpState output.
+    """
+    if voting_power is None:
+        dev = anvil_accounts(len(DEFAULT_VOTING_POWER_TAO))
+        accounts = [(address, key, tao) for (address, key), tao in zip(dev, DEFAULT_VOTING_POWER_TAO)]
+    else:
+        keys = dict(anvil_accounts(10))
+        accounts = [
+            (Web3.to_checksum_address(address), keys.get(Web3.to_checksum_address(address)), tao)
+            for address, tao in voting_power.items()
+        ]
+
+    with AnvilNode() as node:
+        w3 = Web3(Web3.HTTPProvider(node.rpc_url))
+        addresses = deploy_governance(node.rpc_url)
+        votes = load_contract(w3, addresses["votes"], ARTIFACTS["votes"])
+
+        tx_hashes = [
+            votes.functions.setVotingPower(
+                netuid, bytes.fromhex(address[2:].rjust(64, "0")), tao_to_rao(tao)
+            ).transact({"from": ANVIL_ADDRESS})
+            for address, _, tao in accounts
+        ]
+        vault_funding = w3.to_wei(vault_funding_tao, "ether")
+        tx_hashes.append(w3.eth.send_transaction({
+            "from": ANVIL_ADDRESS,
+            "to": addresses["vault"],
+            "value": vault_funding,
+        }))
+        for tx_hash in tx_hashes:
+            if w3.eth.wait_for_transaction_receipt(tx_hash)["status"] != 1:
+                raise RuntimeError(f"fixture setup transaction {tx_hash.hex()} failed")
+        anvil_rpc(w3, "evm_mine", [])
+
+        return {
+            "version": FIXTURE_VERSION,
+            "source_hash": source_hash(),
+            "netuid": netuid,
+            "block": w3.eth.block_number,
+            "addresses": addresses,
+            "accounts": [
+                {"address": address, "private_key": key, "voting_power": tao_to_rao(tao)}
+                for address, key, tao in accounts
+            ],
+            "vault_balance": vault_funding,
+            "state": anvil_rpc(w3, "anvil_dumpState", []),
+        }
+
+
+def save_fixture(fixture, path=DEFAULT_FIXTURE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(fixture))
+
+
+def load_fixture(path=DEFAULT_FIXTURE_PATH):
+    fixture = json.loads(Path(path).read_text())
+    if fixture.get("version") != FIXTURE_VERSION:
+        raise ValueError(f"{path}: fixture version {fixture.get('version')}, expected {FIXTURE_VERSION}")
+    return fixture
+
+
+def ensure_fixture(path=DEFAULT_FIXTURE_PATH, **build_kwargs):
+    """
+    Loads the fixture at `path`, building and saving it first when it is
+    missing, from another fixture version or stale (built from different
+    contract sources). Returns (fixture, built).
+    """
+    path = Path(path)
+    if path.exists():
+        try:
+            fixture = load_fixture(path)
+        except ValueError:
+            fixture = None
+        if fixture is not None and fixture["source_hash"] == source_hash():
+            return fixture, False
+    fixture = build_fixture(**build_kwargs)
+    save_fixture(fixture, path)
+    return fixture, True
+
+
+def restore_fixture(w3, fixture):
+    """
+    Loads a fixture's state into a running anvil. Blocks are mined up to the
+    fixture's height if the node reports a lower one, so snapshot block
+    numbers stay valid. Returns the contract addresses.
+    """
+    if not anvil_rpc(w3, "anvil_loadState", [fixture["state"]]):
+        raise RuntimeError("anvil_loadState was rejected")
+    behind = fixture["block"] - w3.eth.block_number
+    if behind > 0:
+        anvil_rpc(w3, "anvil_mine", [hex(behind)])
+    if w3.eth.get_code(fixture["addresses"]["governor"]) in (b"", None):
+        raise RuntimeError("fixture state restored without the governor contract")
+    return dict(fixture["addresses"])
+
+
+class FixtureNode(AnvilNode):
+    """
+    A fresh anvil started from a fixture instead of a deployment.
+
+    `reset()` reverts to the restored state with evm_snapshot/evm_revert,
+    so one node can serve many tests without restarting.
+
+    Usage:
+        fixture, _ = ensure_fixture()
+        with FixtureNode(fixture) as node:
+            governor = node.addresses["governor"]
+            ...
+            node.reset()
+    """
+
+    def __init__(self, fixture, **kwargs):
+        super().__init__(**kwargs)
+        self.fixture = fixture
+        self.addresses = dict(fixture["addresses"])
+        self.w3 = None
+        self.snapshot_id = None
+
+    def start(self):
+        super().start()
+        try:
+            self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            restore_fixture(self.w3, self.fixture)
+            self.snapshot_id = anvil_rpc(self.w3, "evm_snapshot", [])
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def reset(self):
+        # A snapshot is consumed by evm_revert, so take the next one right away
+        if not anvil_rpc(self.w3, "evm_revert", [self.snapshot_id]):
+            raise RuntimeError(f"evm_revert to snapshot {self.snapshot_id} failed")
+        self.snapshot_id = anvil_rpc(self.w3, "evm_snapshot", [])
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Subtensor EVM balances are rao (1e9) scaled to 18 decimals, so every native
+# balance is a whole multiple of 1e9 wei and fits in int64 once stored as rao.
+WEI_PER_RAO = 10 ** 9
+
+# Bittensor default tempo, used as the epoch length for outflow aggregation.
+DEFAULT_EPOCH_LENGTH = 360
+
+COLUMNS = ("block", "timestamp", "balance", "inflow", "payout", "burn", "other")
+
+
+def wei_to_rao(amount_wei: int) -> int:
+    return int(amount_wei) // WEI_PER_RAO
+
+
+class BalanceHistory:
+    """
+    Columnar time series of a single address' native balance.
+
+    One row per block in which the balance was observed to change. All amounts
+    are stored in rao (int64):
+        balance  - balance after the block
+        inflow   - plain transfers received
+        payout   - value sent by executed timelock calls
+        burn     - net cost of neuron registrations (burn minus refunds)
+        other    - unattributed change (internal transfers, dust, ...)
+
+    Invariant per row: delta(balance) == inflow - payout - burn + other.
+    """
+
+    def __init__(self, address: str, path: Path):
+        self.address = address
+        self.path = Path(path)
+        self.last_block = -1
+        self.columns = {name: np.zeros(0, dtype=np.int64) for name in COLUMNS}
+
+    @classmethod
+    def load(cls, address: str, path: Path) -> "BalanceHistory":
+        """Opens an existing store or creates an empty one for `address`."""
+        history = cls(address, path)
+        if not history.path.exists():
+            return history
+
+        with np.load(history.path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["address"].lower() != address.lower():
+                raise ValueError(
+                    f"Store {history.path} tracks {meta['address']}, not {address}"
+                )
+            history.last_block = int(meta["last_block"])
+            history.columns = {name: data[name].astype(np.int64) for name in COLUMNS}
+        return history
+
+    def save(self):
+        """Atomically writes the store next to its final location."""
+        meta = json.dumps({"address": self.address, "last_block": self.last_block})
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as fh:
+            np.savez_compressed(fh, meta=np.array(meta), **self.columns)
+        tmp_path.replace(self.path)
+
+    def __len__(self):
+        return len(self.columns["block"])
+
+    @property
+    def latest_balance(self):
+        """Last recorded balance in rao, or None if nothing was recorded yet."""
+        if len(self) == 0:
+            return None
+        return int(self.columns["balance"][-1])
+
+    def append(self, rows: list, synced_to: int = None):
+        """
+        Appends rows (dicts keyed by COLUMNS) and advances the sync cursor to
+        `synced_to` (defaults to the last row's block). Rows must be in
+        ascending block order and newer than the store.
+        """
+        if rows and rows[0]["block"] <= self.last_block:
+            raise ValueError(
+                f"Row for block {rows[0]['block']} is not newer than synced block {self.last_block}"
+            )
+        if rows:
+            for name in COLUMNS:
+                new = np.fromiter((row[name] for row in rows), dtype=np.int64, count=len(rows))
+                self.columns[name] = np.concatenate([self.columns[name], new])
+            self.last_block = max(self.last_block, int(rows[-1]["block"]))
+        if synced_to is not None:
+            self.last_block = max(self.last_block, int(synced_to))
+
+    def balance_at(self, block: int) -> int:
+        """Balance in rao after `block`. Raises if the block predates the store."""
+        blocks = self.columns["block"]
+        idx = np.searchsorted(blocks, block, side="right") - 1
+        if idx < 0:
+            raise LookupError(f"Block {block} precedes the first tracked block")
+        if block > self.last_block:
+            raise LookupError(f"Block {block} is beyond the last synced block {self.last_block}")
+        return int(self.columns["balance"][idx])
+
+    def outflow_per_epoch(self, epoch_length: int = DEFAULT_EPOCH_LENGTH):
+        """
+        Aggregates flows per epoch (block // epoch_length).
+
+        Returns a dict of int64 arrays: epoch, inflow, payout, burn, other and
+        net_outflow (payout + burn - inflow - other). Epochs without activity
+        are omitted.
+        """
+        if len(self) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return {name: empty for name in ("epoch", "inflow", "payout", "burn", "other", "net_outflow")}
+
+        epoch_ids = self.columns["block"] // epoch_length
+        epochs, inverse = np.unique(epoch_ids, return_inverse=True)
+
+        result = {"epoch": epochs}
+        for name in ("inflow", "payout", "burn", "other"):
+            totals = np.zeros(len(epochs), dtype=np.int64)
+            np.add.at(totals, inverse, self.columns[name])
+            result[name] = totals
+
+        result["net_outflow"] = result["payout"] + result["burn"] - result["inflow"] - result["other"]
+        return result
@@ -0,0 +1,133 @@
+import time
+from collections import deque
+
+# Registration burn per subnet (rao), read by burned_register / the neuron precompile
+BURN_STORAGE = ("SubtensorModule", "Burn")
+WEI_PER_RAO = 10**9
+
+
+class BurnMonitor:
+    """
+    Burn cost of many subnets from one multi-key storage query per block.
+
+    `substrate` is a connected substrate interface (e.g. `subtensor.substrate`)
+    kept open for the monitor's lifetime; anything providing get_chain_head,
+    get_block_number, create_storage_key and query_multi works, which is how
+    utils.fake_substrate.FakeSubstrate stands in for a node. Results are cached
+    for the current head block and the last `history` readings are kept per netuid.
+    """
+
+    def __init__(self, substrate, netuids, history=64):
+        self.substrate = substrate
+        self.netuids = sorted(set(netuids))
+        self.history = {netuid: deque(maxlen=history) for netuid in self.netuids}
+        self.block = None
+        self.costs = {}
+        self.queries = 0
+        self._storage_keys = [
+            substrate.create_storage_key(*BURN_STORAGE, [netuid]) for netuid in self.netuids
+        ]
+
+    def refresh(self):
+        """Returns {netuid: burn_rao} at the chain head, querying only when the head moved."""
+        block_hash = self.substrate.get_chain_head()
+        block = self.substrate.get_block_number(block_hash)
+        if block == self.block:
+            return self.costs
+
+        results = self.substrate.query_multi(self._storage_keys, block_hash=block_hash)
+        self.queries += 1
+        costs = {}
+        for storage_key, value in results:
+            netuid = storage_key.params[0]
+            costs[netuid] = int(getattr(value, "value", value))
+
+        missing = set(self.netuids) - set(costs)
+        if missing:
+            raise RuntimeError(f"No Burn storage for NetUID(s) {sorted(missing)} at block {block}")
+
+        self.block, self.costs = block, costs
+        for netuid, cost in costs.items():
+            self.history[netuid].append((block, cost))
+        return costs
+
+    def cost(self, netuid):
+        return self.refresh()[netuid]
+
+    def summary(self, netuid):
+        """(current, min, max) burn in rao over the kept history."""
+        values = [cost for _, cost in self.history[netuid]]
+        return values[-1], min(values), max(values)
+
+
+class RegistrationRequest:
+    def __init__(self, netuid, hotkey, max_cost_rao):
+        self.netuid = netuid
+        self.hotkey = hotkey
+        self.max_cost_rao = max_cost_rao
+        self.attempts = 0
+        self.last_error = None
+
+    def __repr__(self):
+        return f"RegistrationRequest(netuid={self.netuid}, hotkey={self.hotkey}, max_cost_rao={self.max_cost_rao})"
+
+
+class RegistrationScheduler:
+    """
+    Submits queued registrations once a subnet's burn cost is at or under the
+    request's ceiling.
+
+    `submit(request, cost_rao)` sends the registration and returns a tx hash,
+    or raises; failed requests stay queued until `max_attempts`. At most one
+    registration per subnet is submitted per block, since each one raises the
+    burn for the next.
+    """
+
+    def __init__(self, monitor, submit, max_attempts=3):
+        self.monitor = monitor
+        self.submit = submit
+        self.max_attempts = max_attempts
+        self.queue = []
+        self.submitted = []
+        self.failed = []
+
+    def add(self, netuid, hotkey, max_cost_rao):
+        if netuid not in self.monitor.history:
+            raise ValueError(f"NetUID {netuid} is not monitored")
+        self.queue.append(RegistrationRequest(netuid, hotkey, max_cost_rao))
+
+    def poll(self):
+        """Checks costs once and submits what is affordable; returns [(request, cost, tx_hash)]."""
+        costs = self.monitor.refresh()
+        sent = []
+        busy = set()
+        for request in list(self.queue):
+            cost = costs[request.netuid]
+            if request.netuid in busy or cost > request.max_cost_rao:
+                continue
+            busy.add(request.netuid)
+            request.attempts += 1
+            try:
+                tx_hash = self.submit(request, cost)
+            except Exception as e:
+                request.last_error = e
+                if request.attempts >= self.max_attempts:
+                    self.queue.remove(request)
+                    self.failed.append(request)
+                continue
+            self.queue.remove(request)
+            self.submitted.append((request, cost, tx_hash))
+            sent.append((request, cost, tx_hash))
+        return sent
+
+    def run(self, interval=6.0, max_polls=None, on_poll=None):
+        """Polls every `interval` seconds until the queue is empty or max_polls is reached."""
+        polls = 0
+        while self.queue and (max_polls is None or polls < max_polls):
+            sent = self.poll()
+            polls += 1
+            if on_poll:
+                on_poll(self, sent)
+            if self.queue and (max_polls is None or polls < max_polls):
+                time.sleep(interval)
+        return polls
@@ -3,9 +3,45 @@ import sys
 from pathlib import Path
 from web3 import Web3
 
-def get_web3_provider(rpc_url: str) -> Web3:
-    """Initializes and checks Web3 connection."""
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+from .rpc_batch import CoalescingHTTPProvider, CountingHTTPProvider
+
+# Minimal ABI containing likely used functions, used when a Forge artifact is missing
+FALLBACK_ABI = [
+    {
+        "inputs": [
+            {"internalType": "bytes32[]", "name": "hotkeys", "type": "bytes32[]"},
+            {"internalType": "uint256", "name": "netuid", "type": "uint256"},
+            {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
+        ],
+        "name": "unstakeAndBurn",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "bytes32", "name": "hotkey", "type": "bytes32"},
+            {"internalType": "uint256", "name": "netuid", "type": "uint256"},
+            {"internalType": "uint256", "name": "amount", "type": "uint256"}
+        ],
+        "name": "stake",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+def get_web3_provider(rpc_url: str, coalesce_window: float = None) -> Web3:
+    """
+    Initializes and checks Web3 connection.
+    With `coalesce_window` (seconds), concurrent requests are merged into
+    JSON-RPC batches (see CoalescingHTTPProvider).
+    """
+    if coalesce_window:
+        provider = CoalescingHTTPProvider(rpc_url, window=coalesce_window)
+    else:
+        provider = CountingHTTPProvider(rpc_url)
+    w3 = Web3(provider)
     if not w3.is_connected():
         raise ConnectionError(f"Failed to connect to RPC URL: {rpc_url}")
     return w3
@@ -25,31 +61,7 @@ def load_contract(w3: Web3, contract_address: str, artifact_path: Path):
     except (FileNotFoundError, KeyError) as e:
         print(f"Error loading ABI: {e}", file=sys.stderr)
         print("Using minimal fallback ABI...", file=sys.stderr)
-        # Minimal ABI containing likely used functions
-        abi = [
-            {
-                "inputs": [
-                    {"internalType": "bytes32[]", "name": "hotkeys", "type": "bytes32[]"},
-                    {"internalType": "uint256", "name": "netuid", "type": "uint256"},
-                    {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
-                ],
-                "name": "unstakeAndBurn",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "bytes32", "name": "hotkey", "type": "bytes32"},
-                    {"internalType": "uint256", "name": "netuid", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amount", "type": "uint256"}
-                ],
-                "name": "stake",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]
+        abi = FALLBACK_ABI
 
     return w3.eth.contract(
         address=Web3.to_checksum_address(contract_address),
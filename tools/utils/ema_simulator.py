@@ -0,0 +1,123 @@
+import numpy as np
+
+# IBittensorVotes.getVotingPowerEmaAlpha is a fixed-point fraction of 1e18
+ALPHA_SCALE = 10**18
+
+# TreasuryController: GovernorSettings(0, 10, 100e9)
+PROPOSAL_THRESHOLD = 100 * 10**9
+
+# Returned by first_crossing for hotkeys that never reach the threshold
+NEVER = -1
+
+
+def alpha_from_raw(raw_alpha):
+    """Converts the on-chain fixed-point alpha to a float fraction."""
+    return raw_alpha / ALPHA_SCALE
+
+
+def stake_grid(blocks, columns, stakes, start_block, n_blocks, n_hotkeys, initial=None):
+    """
+    Expands stake change events into a dense (blocks x hotkeys) float64 grid.
+
+    Args:
+        blocks: Block of each event.
+        columns: Hotkey column of each event.
+        stakes: Stake (rao) from that block on.
+        start_block: Block of row 0.
+        n_blocks / n_hotkeys: Grid shape.
+        initial: (hotkeys,) stake before the first event, default 0.
+
+    Returns:
+        np.ndarray where every row holds the stake in force at that block. When
+        a hotkey has several events in one block the last one wins. Events
+        outside the grid are ignored, except that events before start_block set
+        the stake carried into row 0.
+    """
+    blocks = np.asarray(blocks, dtype=np.int64)
+    columns = np.asarray(columns, dtype=np.int64)
+    stakes = np.asarray(stakes, dtype=np.float64)
+
+    rows = np.clip(blocks - start_block, 0, None)
+    keep = rows < n_blocks
+    rows, columns, stakes = rows[keep], columns[keep], stakes[keep]
+
+    # Last event per (row, column): stable sort by position, keep the final occurrence
+    order = np.lexsort((np.arange(len(rows)), blocks[keep], columns))
+    rows, columns, stakes = rows[order], columns[order], stakes[order]
+    cell = rows * n_hotkeys + columns
+    last = np.ones(len(cell), dtype=bool)
+    last[:-1] = cell[1:] != cell[:-1]
+
+    grid = np.full((n_blocks, n_hotkeys), np.nan)
+    grid[rows[last], columns[last]] = stakes[last]
+    first = np.zeros(n_hotkeys) if initial is None else np.asarray(initial, dtype=np.float64)
+    grid[0] = np.where(np.isnan(grid[0]), first, grid[0])
+
+    # Forward fill: index of the latest row with an event, per column
+    source = np.where(np.isnan(grid), 0, np.arange(n_blocks)[:, None])
+    np.maximum.accumulate(source, axis=0, out=source)
+    return grid[source, np.arange(n_hotkeys)]
+
+
+def _ema_scan(stake, alpha, initial, chunk):
+    """
+    power[k] = alpha * stake[k] + (1 - alpha) * power[k - 1] for every row.
+
+    Rows are processed in chunks through a lower-triangular decay matrix, so
+    the loop runs len(stake) / chunk times instead of once per step.
+    """
+    n_steps, n_hotkeys = stake.shape
+    decay = 1.0 - alpha
+    lag = np.arange(chunk)[:, None] - np.arange(chunk)[None, :]
+    weights = np.tril(alpha * decay ** np.clip(lag, 0, None))
+    carry_decay = decay ** np.arange(1, chunk + 1)
+
+    power = np.empty((n_steps, n_hotkeys))
+    previous = initial
+    for start in range(0, n_steps, chunk):
+        block = stake[start:start + chunk]
+        size = len(block)
+        power[start:start + size] = weights[:size, :size] @ block + carry_decay[:size, None] * previous
+        previous = power[start + size - 1]
+    return power
+
+
+def simulate(stake, alpha, initial_power=None, step_rows=None, interval=1, disable_row=None, chunk=128):
+    """
+    Reproduces EMA voting power per block for every hotkey at once.
+
+    Args:
+        stake: (blocks, hotkeys) stake in rao, e.g. from stake_grid.
+        alpha: EMA alpha as a fraction (see alpha_from_raw).
+        initial_power: (hotkeys,) power before row 0, default 0.
+        step_rows: Rows at which an EMA step is applied. Defaults to every
+            `interval` rows starting at row 0.
+        disable_row: First row at which tracking is disabled. No step is
+            applied from there on and power stays frozen.
+
+    Returns:
+        (blocks, hotkeys) float64 power in rao. A step at row r is visible
+        from row r on, matching getPastVotingPower(r). The contract floors
+        every step, so on-chain power is up to one rao per step lower.
+    """
+    stake = np.asarray(stake, dtype=np.float64)
+    n_blocks, n_hotkeys = stake.shape
+    initial = np.zeros(n_hotkeys) if initial_power is None else np.asarray(initial_power, dtype=np.float64)
+
+    if step_rows is None:
+        step_rows = np.arange(0, n_blocks, interval)
+    step_rows = np.unique(np.asarray(step_rows, dtype=np.int64))
+    step_rows = step_rows[(step_rows >= 0) & (step_rows < n_blocks)]
+    if disable_row is not None:
+        step_rows = step_rows[step_rows < disable_row]
+
+    stepped = _ema_scan(stake[step_rows], alpha, initial, chunk)
+    # Row t shows the latest step at or before t, or the initial power
+    applied = np.searchsorted(step_rows, np.arange(n_blocks), side="right")
+    return np.vstack([initial[None, :], stepped])[applied]
+
+
+def first_crossing(power, threshold=PROPOSAL_THRESHOLD):
+    """Index of the first row with power >= threshold per hotkey, NEVER if none."""
+    hit = power >= threshold
+    return np.where(hit.any(axis=0), hit.argmax(axis=0), NEVER)
@@ -0,0 +1,238 @@
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RAO_PER_TAO = 10**9
+# Stake of a hotkey from a coldkey on a subnet (rao), as in subtensor's Alpha map
+STAKE_STORAGE = ("SubtensorModule", "Alpha")
+
+
+class FakeStorageKey:
+    def __init__(self, pallet, storage_function, params):
+        self.pallet = pallet
+        self.storage_function = storage_function
+        self.params = list(params)
+
+
+class FakeValue:
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeSubstrate:
+    """
+    In-memory stand-in for the substrate interface of `bt.subtensor`.
+
+    Serves storage from a dict keyed by (pallet, storage_function, *params)
+    and produces a new block on `advance()` or, with `block_time`, as wall
+    time passes. `on_block(fake, block)` hooks run for every new block, e.g.
+    to script burn changes. Counts RPC-equivalent calls in `calls`.
+
+    Usage:
+        fake = FakeSubstrate(storage={("SubtensorModule", "Burn", 1): 10**9})
+        monitor = BurnMonitor(fake, [1])
+    """
+
+    def __init__(self, storage=None, block=1, block_time=None, on_block=None):
+        self.storage = dict(storage or {})
+        self.block = block
+        self.block_time = block_time
+        self.on_block = list(on_block or [])
+        self.calls = 0
+        self._block_started = time.monotonic()
+
+    # --- Test controls ---
+
+    def set_storage(self, pallet, storage_function, params, value):
+        self.storage[(pallet, storage_function, *params)] = value
+
+    def advance(self, blocks=1):
+        for _ in range(blocks):
+            self.block += 1
+            for hook in self.on_block:
+                hook(self, self.block)
+
+    def _tick(self):
+        if self.block_time:
+            elapsed = time.monotonic() - self._block_started
+            blocks = int(elapsed // self.block_time)
+            if blocks:
+                self._block_started += blocks * self.block_time
+                self.advance(blocks)
+
+    # --- Substrate interface subset ---
+
+    def get_chain_head(self):
+        self.calls += 1
+        self._tick()
+        return f"0x{self.block:064x}"
+
+    def get_block_number(self, block_hash=None):
+        self.calls += 1
+        if block_hash is None:
+            self._tick()
+            return self.block
+        return int(block_hash, 16)
+
+    def create_storage_key(self, pallet, storage_function, params=None):
+        return FakeStorageKey(pallet, storage_function, params or [])
+
+    def query(self, module, storage_function, params=None, block_hash=None):
+        self.calls += 1
+        value = self.storage.get((module, storage_function, *(params or [])))
+        return None if value is None else FakeValue(value)
+
+    def query_multi(self, storage_keys, block_hash=None):
+        self.calls += 1
+        results = []
+        for key in storage_keys:
+            value = self.storage.get((key.pallet, key.storage_function, *key.params))
+            if value is not None:
+                results.append((key, FakeValue(value)))
+        return results
+
+    def stake_list(self, coldkey, netuid=None):
+        """Stakes of `coldkey` shaped like `btcli stake list --json-out`."""
+        self.calls += 1
+        stake_info = {}
+        for key, rao in self.storage.items():
+            if key[:2] != STAKE_STORAGE or key[3] != coldkey or (netuid is not None and key[4] != netuid):
+                continue
+            stake_info.setdefault(key[2], []).append({"netuid": key[4], "stake_value": rao / RAO_PER_TAO})
+        return {"stake_info": stake_info}
+
+    def close(self):
+        pass
+
+
+class FakeSubstrateServer:
+    """
+    Serves a FakeSubstrate over JSON-RPC on HTTP so separate processes (the
+    tools, benchmarks) can share one fake chain. Methods are `fake_*`
+    versions of the interface above; FakeSubstrateClient is the matching client.
+    Storage keys and values travel as JSON, so params are ints and strings.
+    """
+
+    def __init__(self, fake, host="127.0.0.1", port=0):
+        self.fake = fake
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+
+    def dispatch(self, method, params):
+        fake = self.fake
+        with self.lock:
+            if method == "fake_getChainHead":
+                return fake.get_chain_head()
+            if method == "fake_getBlockNumber":
+                return fake.get_block_number(*params)
+            if method == "fake_query":
+                value = fake.query(*params)
+                return None if value is None else value.value
+            if method == "fake_queryMulti":
+                keys = [FakeStorageKey(*key) for key in params[0]]
+                found = {id(key): value.value for key, value in fake.query_multi(keys)}
+                return [found.get(id(key)) for key in keys]
+            if method == "fake_stakeList":
+                return fake.stake_list(*params)
+            if method == "fake_setStorage":
+                fake.set_storage(*params)
+                return True
+            if method == "fake_advance":
+                fake.advance(*params)
+                return fake.block
+        raise ValueError(f"unknown method '{method}'")
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                try:
+                    response = {"jsonrpc": "2.0", "id": request.get("id"),
+                                "result": server.dispatch(request["method"], request.get("params") or [])}
+                except Exception as e:
+                    response = {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32000, "message": str(e)}}
+                data = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeSubstrateClient:
+    """
+    Substrate interface subset (as used by BurnMonitor and the tools) backed by
+    a FakeSubstrateServer, so it can replace `subtensor.substrate` offline.
+    """
+
+    def __init__(self, url, timeout=10.0):
+        self.url = url
+        self.timeout = timeout
+        self._next_id = 0
+
+    def _call(self, method, *params):
+        self._next_id += 1
+        payload = json.dumps({"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": list(params)})
+        request = urllib.request.Request(self.url, data=payload.encode(), headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = json.loads(response.read())
+        if "error" in body:
+            raise RuntimeError(f"{method}: {body['error']['message']}")
+        return body["result"]
+
+    def get_chain_head(self):
+        return self._call("fake_getChainHead")
+
+    def get_block_number(self, block_hash=None):
+        return self._call("fake_getBlockNumber", *([block_hash] if block_hash else []))
+
+    def create_storage_key(self, pallet, storage_function, params=None):
+        return FakeStorageKey(pallet, storage_function, params or [])
+
+    def query(self, module, storage_function, params=None, block_hash=None):
+        value = self._call("fake_query", module, storage_function, list(params or []))
+        return None if value is None else FakeValue(value)
+
+    def query_multi(self, storage_keys, block_hash=None):
+        keys = [[key.pallet, key.storage_function, key.params] for key in storage_keys]
+        values = self._call("fake_queryMulti", keys)
+        return [(key, FakeValue(value)) for key, value in zip(storage_keys, values) if value is not None]
+
+    def stake_list(self, coldkey, netuid=None):
+        return self._call("fake_stakeList", coldkey, netuid)
+
+    def set_storage(self, pallet, storage_function, params, value):
+        self._call("fake_setStorage", pallet, storage_function, list(params), value)
+
+    def advance(self, blocks=1):
+        return self._call("fake_advance", blocks)
+
+    def close(self):
+        pass
+
+
+def decaying_burn(netuid, factor, floor):
+    """on_block hook lowering a subnet's Burn by `factor` per block down to `floor` rao."""
+    def hook(fake, block):
+        key = ("SubtensorModule", "Burn", netuid)
+        fake.storage[key] = max(floor, int(fake.storage.get(key, 0) * factor))
+    return hook
@@ -0,0 +1,224 @@
+import time
+
+from .rpc_batch import batch_read
+
+# A pending transaction this old (seconds, about three Bittensor blocks) is re-broadcast at a higher fee
+DEFAULT_STUCK_AFTER = 36.0
+# Nodes only accept a replacement at the same nonce that pays at least 10% more
+DEFAULT_BUMP_PERCENT = 12.5
+# Without an explicit cap, bumping stops at this multiple of the first fee
+DEFAULT_MAX_FEE_MULTIPLIER = 4
+# Receipts fetched per JSON-RPC batch (the tools' --batch-size)
+DEFAULT_RECEIPT_BATCH_SIZE = 100
+FEE_FIELDS = ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas")
+# Rebroadcast errors meaning "keep waiting": a version was just mined
+BENIGN_REBROADCAST_ERRORS = ("nonce too low", "already imported")
+# The bumped version is already in the pool (an earlier send went through despite an error)
+KNOWN_REBROADCAST_ERRORS = ("already known",)
+# The pool wants a bigger bump than ours; the same fees would be rejected again
+UNDERPRICED_REBROADCAST_ERRORS = ("underpriced",)
+
+
+class InclusionError(Exception):
+    """A tracked transaction can't be brought into a block."""
+
+
+class TransactionStuck(InclusionError):
+    """Raised when transactions are still pending at the tracker's timeout."""
+
+    def __init__(self, pending):
+        self.pending = pending
+        nonces = ", ".join(str(tx.nonce) for tx in pending)
+        super().__init__(f"transactions still pending after all fee bumps (nonces {nonces})")
+
+
+class PendingTransaction:
+    """One nonce and every version of it that was broadcast."""
+
+    def __init__(self, tx, tx_hash, block):
+        self.tx = dict(tx)
+        self.nonce = tx["nonce"]
+        self.hashes = [tx_hash]
+        self.sent_at = time.monotonic()
+        self.sent_block = block
+        self.last_broadcast = self.sent_at
+        # Fees before any bump, for the default cap
+        self.first_fees = {field: tx[field] for field in FEE_FIELDS if field in tx}
+        self.receipt = None
+        self.latency = None
+        self.foreign_polls = 0
+        # Set once the pool rejected a bump as underpriced: no further bumps
+        self.bump_rejected = False
+
+    @property
+    def tx_hash(self):
+        """Hash of the version that was mined, else of the latest broadcast."""
+        return self.receipt["transactionHash"] if self.receipt else self.hashes[-1]
+
+    @property
+    def attempts(self):
+        return len(self.hashes)
+
+    @property
+    def fee(self):
+        return self.tx.get("gasPrice", self.tx.get("maxFeePerGas"))
+
+    @property
+    def blocks_to_inclusion(self):
+        return self.receipt["blockNumber"] - self.sent_block if self.receipt else None
+
+
+class InclusionTracker:
+    """
+    Sends transactions and waits for them without ever blocking on one that
+    is underpriced.
+
+    The lowest unmined nonce, if still pending `stuck_after` seconds after its
+    last broadcast, is signed again at the same nonce with every fee field
+    raised by `bump_percent`, up to `max_fee` (default:
+    DEFAULT_MAX_FEE_MULTIPLIER times the first fee), and re-broadcast. Later
+    nonces are left alone: they can't be mined before it, so re-pricing them
+    would only churn the pool. Once the account's nonce moves past a
+    transaction, the receipts of all its versions are fetched in JSON-RPC
+    batches of `batch_size`, so whichever version was mined ends the wait.
+    With a `timeout` (seconds), `wait` raises TransactionStuck for whatever
+    is still pending then. Many transactions can be waited on together.
+
+    Usage:
+        tracker = InclusionTracker(w3, account, log=print)
+        pending = tracker.send(tx)
+        tracker.wait([pending])
+        print(pending.receipt["blockNumber"], pending.latency, pending.attempts)
+    """
+
+    def __init__(self, w3, account, stuck_after=DEFAULT_STUCK_AFTER, bump_percent=DEFAULT_BUMP_PERCENT,
+                 max_fee=None, timeout=None, poll_interval=1.0, log=None, batch_size=DEFAULT_RECEIPT_BATCH_SIZE):
+        self.w3 = w3
+        self.account = account
+        self.stuck_after = stuck_after
+        self.bump_percent = bump_percent
+        self.max_fee = max_fee
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+
+    def send(self, tx, block=None):
+        """Signs and broadcasts `tx` (which must carry its nonce); returns its PendingTransaction."""
+        if block is None:
+            block = self.w3.eth.block_number
+        signed = self.account.sign_transaction(tx)
+        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        return PendingTransaction(tx, tx_hash, block)
+
+    def send_and_wait(self, tx):
+        pending = self.send(tx)
+        self.wait([pending])
+        return pending
+
+    def _bump(self, pending):
+        """
+        Re-signs `pending` at higher fees; returns False once every fee is at
+        its cap or the pool rejected a bump as underpriced.
+        """
+        if pending.bump_rejected:
+            return False
+        bumped = dict(pending.tx)
+        for field in FEE_FIELDS:
+            if field in bumped:
+                cap = self.max_fee if self.max_fee is not None else pending.first_fees[field] * DEFAULT_MAX_FEE_MULTIPLIER
+                raised = max(bumped[field] + 1, int(bumped[field] * (100 + self.bump_percent) / 100))
+                bumped[field] = max(bumped[field], min(cap, raised))
+        if "maxFeePerGas" in bumped and "maxPriorityFeePerGas" in bumped:
+            bumped["maxPriorityFeePerGas"] = min(bumped["maxPriorityFeePerGas"], bumped["maxFeePerGas"])
+        if all(bumped[field] == pending.tx[field] for field in FEE_FIELDS if field in bumped):
+            return False
+
+        signed = self.account.sign_transaction(bumped)
+        try:
+            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception as e:
+            error = str(e).lower()
+            if any(reason in error for reason in UNDERPRICED_REBROADCAST_ERRORS):
+                self.log(f"Nonce {pending.nonce}: re-broadcast rejected as underpriced ({e}), no further bumps")
+                pending.bump_rejected = True
+                return False
+            if any(reason in error for reason in KNOWN_REBROADCAST_ERRORS):
+                tx_hash = signed.hash
+            elif any(reason in error for reason in BENIGN_REBROADCAST_ERRORS):
+                self.log(f"Nonce {pending.nonce}: re-broadcast not accepted ({e}), still waiting")
+                pending.last_broadcast = time.monotonic()
+                return True
+            else:
+                raise
+        pending.tx = bumped
+        pending.hashes.append(tx_hash)
+        pending.last_broadcast = time.monotonic()
+        self.log(
+            f"Nonce {pending.nonce}: pending {pending.last_broadcast - pending.sent_at:.0f}s, re-broadcast at "
+            f"{self.w3.from_wei(pending.fee, 'gwei'):.2f} Gwei (attempt {pending.attempts}): {tx_hash.hex()}"
+        )
+        return True
+
+    def wait(self, pending_list):
+        """Waits until every transaction in `pending_list` is mined, bumping stuck ones; returns their receipts."""
+        waiting = [pending for pending in pending_list if pending.receipt is None]
+        address = self.account.address
+        while waiting:
+            # The account's mined nonce says which nonces have a receipt to fetch, so no
+            # lookup of an unmined hash fails (and with it the whole JSON-RPC batch)
+            mined_count = self.w3.eth.get_transaction_count(address, "latest")
+            mined = [pending for pending in waiting if pending.nonce < mined_count]
+            calls, index = [], []
+            for pending in mined:
+                for tx_hash in pending.hashes:
+                    calls.append(lambda tx_hash=tx_hash: self.w3.eth.get_transaction_receipt(tx_hash))
+                    index.append(pending)
+            receipts = []
+            for start in range(0, len(calls), self.batch_size):
+                receipts.extend(batch_read(self.w3, calls[start:start + self.batch_size], return_exceptions=True))
+
+            now = time.monotonic()
+            for pending, receipt in zip(index, receipts):
+                if pending.receipt is None and not isinstance(receipt, Exception):
+                    pending.receipt = receipt
+                    pending.latency = now - pending.sent_at
+            for pending in waiting:
+                if pending.receipt is not None:
+                    continue
+                if pending.nonce < mined_count:
+                    # The nonce is used but none of our receipts showed up: allow one poll for indexing lag
+                    pending.foreign_polls += 1
+                    if pending.foreign_polls > 1:
+                        raise InclusionError(f"nonce {pending.nonce} was used by a transaction not sent by this tool")
+                elif (pending.nonce == mined_count and now - pending.last_broadcast >= self.stuck_after
+                      and not self._bump(pending)):
+                    pending.last_broadcast = now
+                    self.log(f"Nonce {pending.nonce}: pending with no further fee bumps, still waiting")
+
+            waiting = [pending for pending in waiting if pending.receipt is None]
+            if not waiting:
+                break
+            if self.timeout is not None and now - min(pending.sent_at for pending in waiting) >= self.timeout:
+                raise TransactionStuck(waiting)
+            time.sleep(self.poll_interval)
+        return [pending.receipt for pending in pending_list]
+
+
+def add_inclusion_args(parser):
+    """Adds the stuck-transaction options every write tool shares."""
+    parser.add_argument("--stuck-after", type=float, default=DEFAULT_STUCK_AFTER,
+                        help="Seconds a transaction may stay pending before it is re-sent with a higher fee")
+    parser.add_argument("--bump-percent", type=float, default=DEFAULT_BUMP_PERCENT,
+                        help="Fee increase per re-send")
+    parser.add_argument("--max-gas-price-gwei", type=float,
+                        help=f"Fee cap for re-sends (default {DEFAULT_MAX_FEE_MULTIPLIER}x the first fee)")
+    parser.add_argument("--inclusion-timeout", type=float,
+                        help="Give up after this many seconds pending (default: wait at the cap)")
+
+
+def tracker_from_args(w3, account, args, log=None):
+    """Tracker configured from add_inclusion_args options, and --batch-size where the tool has one."""
+    max_fee = w3.to_wei(args.max_gas_price_gwei, 'gwei') if args.max_gas_price_gwei else None
+    return InclusionTracker(w3, account, args.stuck_after, args.bump_percent, max_fee, args.inclusion_timeout,
+                            log=log, batch_size=getattr(args, "batch_size", DEFAULT_RECEIPT_BATCH_SIZE))
@@ -0,0 +1,171 @@
+import json
+
+from web3 import Web3
+
+from .anvil import ANVIL_ADDRESS, REPO_ROOT, AnvilNode, anvil_rpc, deploy_governance
+from .burn_monitor import BURN_STORAGE, WEI_PER_RAO
+from .fake_substrate import STAKE_STORAGE, FakeSubstrate, FakeSubstrateServer
+from .log_decoder import LogDecoder, event_abi_from_signature
+from .rpc_batch import batch_read
+
+NEURON_PRECOMPILE = "0x0000000000000000000000000000000000000804"
+# Where LocalNeuronPrecompile's burns end up (BURN_SINK in the contract)
+BURN_SINK = "0x000000000000000000000000000000000000dEaD"
+PRECOMPILE_ARTIFACT = REPO_ROOT / "out" / "LocalNeuronPrecompile.sol" / "LocalNeuronPrecompile.json"
+
+BURNED_EVENT = "Burned(uint16 indexed netuid,bytes32 hotkey,address indexed payer,uint256 amount)"
+REGISTRATION_EVENT = "NeuronRegistration(uint16 indexed netuid,bytes32 hotkey,address indexed caller)"
+
+
+def etch_neuron_precompile(w3, burns, increase_bps=0, sender=ANVIL_ADDRESS):
+    """
+    Places LocalNeuronPrecompile's runtime code at 0x804 on anvil and sets the
+    burn (wei) of each netuid in `burns`. Returns the contract at 0x804.
+    """
+    if not PRECOMPILE_ARTIFACT.exists():
+        raise FileNotFoundError(f"{PRECOMPILE_ARTIFACT} not found, run `forge build` first")
+    artifact = json.loads(PRECOMPILE_ARTIFACT.read_text())
+    anvil_rpc(w3, "anvil_setCode", [NEURON_PRECOMPILE, artifact["deployedBytecode"]["object"]])
+
+    precompile = w3.eth.contract(address=NEURON_PRECOMPILE, abi=artifact["abi"])
+    tx_hashes = []
+    for netuid, burn_wei in burns.items():
+        tx_hashes.append(precompile.functions.setBurn(netuid, burn_wei).transact({"from": sender}))
+        if increase_bps:
+            tx_hashes.append(precompile.functions.setBurnIncreaseBps(netuid, increase_bps).transact({"from": sender}))
+    for tx_hash in tx_hashes:
+        w3.eth.wait_for_transaction_receipt(tx_hash)
+    return precompile
+
+
+class BurnLog:
+    """
+    Collects the burns LocalNeuronPrecompile took, for mirroring and checks.
+
+    The precompile takes each burn out of the forwarded msg.value and sends
+    it to BURN_SINK, so balances are already right on anvil. A burn passed
+    through TreasuryVault.registerNeuron is attributed to the registration's
+    caller; direct calls to the precompile to the calling account.
+    """
+
+    def __init__(self, w3, start_block=0):
+        self.w3 = w3
+        self.decoder = LogDecoder([[event_abi_from_signature(BURNED_EVENT), event_abi_from_signature(REGISTRATION_EVENT)]])
+        self.topics = [self.decoder.topic("Burned"), self.decoder.topic("NeuronRegistration")]
+        self.next_block = start_block
+        self.burns = []
+
+    def collect(self):
+        """Burns mined since the last call as [(account, wei)]."""
+        head = self.w3.eth.block_number
+        if head < self.next_block:
+            return []
+        logs = self.w3.eth.get_logs({
+            "fromBlock": self.next_block,
+            "toBlock": head,
+            "topics": [["0x" + topic.hex() for topic in self.topics]],
+        })
+        self.next_block = head + 1
+
+        by_tx = {}
+        for event in self.decoder.decode_logs(logs).events:
+            by_tx.setdefault(bytes(event["transactionHash"]), []).append(event)
+
+        burns = []
+        for events in by_tx.values():
+            registrations = [event for event in events if event["event"] == "NeuronRegistration"]
+            for burn in events:
+                if burn["event"] != "Burned" or burn["address"] != NEURON_PRECOMPILE:
+                    continue
+                args = burn["args"]
+                account = args["payer"]
+                for registration in registrations:
+                    if (registration["address"] == args["payer"]
+                            and registration["args"]["netuid"] == args["netuid"]
+                            and registration["args"]["hotkey"] == args["hotkey"]):
+                        account = registration["args"]["caller"]
+                        break
+                burns.append((account, args["amount"]))
+        self.burns.extend(burns)
+        return burns
+
+
+class LocalSubtensor:
+    """
+    Offline stand-in for a subtensor node with the EVM: anvil with the
+    governance contracts deployed and LocalNeuronPrecompile at 0x804, plus a
+    FakeSubstrateServer serving Burn (mirrored from the precompile) and stake
+    storage. `sync()` collects new burns and moves the fake substrate to
+    anvil's block; call it between steps or periodically.
+
+    Usage:
+        with LocalSubtensor(burns={1: 10**18}) as local:
+            w3 = Web3(Web3.HTTPProvider(local.rpc_url))
+            substrate = FakeSubstrateClient(local.substrate_url)
+
+    `stakes` are (coldkey_ss58, hotkey_ss58, netuid, rao) tuples.
+    """
+
+    def __init__(self, burns, stakes=(), increase_bps=0, deploy=True, port=None, anvil_args=None, substrate_port=0):
+        self.burns = dict(burns)
+        self.stakes = list(stakes)
+        self.increase_bps = increase_bps
+        self.deploy = deploy
+        self.node = AnvilNode(port=port, extra_args=anvil_args)
+        self.substrate_port = substrate_port
+        self.addresses = {}
+        self.w3 = None
+        self.precompile = None
+        self.burn_log = None
+        self.server = None
+
+    @property
+    def rpc_url(self):
+        return self.node.rpc_url
+
+    @property
+    def substrate_url(self):
+        return self.server.url
+
+    def start(self):
+        self.node.start()
+        try:
+            self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            if self.deploy:
+                self.addresses = deploy_governance(self.rpc_url)
+            self.precompile = etch_neuron_precompile(self.w3, self.burns, self.increase_bps)
+            self.burn_log = BurnLog(self.w3, self.w3.eth.block_number + 1)
+
+            storage = {(*STAKE_STORAGE, hotkey, coldkey, netuid): rao for coldkey, hotkey, netuid, rao in self.stakes}
+            self.server = FakeSubstrateServer(FakeSubstrate(storage=storage), port=self.substrate_port).start()
+            self.sync()
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def sync(self):
+        """Collects new burns and mirrors anvil's block and burns into the fake substrate."""
+        burned = self.burn_log.collect()
+        netuids = sorted(self.burns)
+        block, *burns = batch_read(self.w3, [lambda: self.w3.eth.block_number] + [
+            self.precompile.functions.burn(netuid) for netuid in netuids
+        ])
+        with self.server.lock:
+            fake = self.server.fake
+            fake.block = block
+            for netuid, burn_wei in zip(netuids, burns):
+                fake.storage[(*BURN_STORAGE, netuid)] = burn_wei // WEI_PER_RAO
+        return burned
+
+    def stop(self):
+        if self.server:
+            self.server.stop()
+            self.server = None
+        self.node.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,221 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from eth_abi import decode as abi_decode
+from eth_utils import keccak, to_checksum_address
+
+ARTIFACTS_DIR = Path(__file__).resolve().parent.parent.parent / "out"
+DEFAULT_ARTIFACTS = (
+    ARTIFACTS_DIR / "TreasuryController.sol" / "TreasuryController.json",
+    ARTIFACTS_DIR / "TreasuryVault.sol" / "TreasuryVault.json",
+)
+
+# Used when the forge artifacts are not built: the events TreasuryController
+# (OpenZeppelin v5 Governor + extensions) and TreasuryVault (TimelockController
+# + AccessControl) can emit.
+KNOWN_EVENTS = (
+    # Governor
+    "ProposalCreated(uint256 proposalId,address proposer,address[] targets,uint256[] values,"
+    "string[] signatures,bytes[] calldatas,uint256 voteStart,uint256 voteEnd,string description)",
+    "ProposalQueued(uint256 proposalId,uint256 etaSeconds)",
+    "ProposalExecuted(uint256 proposalId)",
+    "ProposalCanceled(uint256 proposalId)",
+    "VoteCast(address indexed voter,uint256 proposalId,uint8 support,uint256 weight,string reason)",
+    "VoteCastWithParams(address indexed voter,uint256 proposalId,uint8 support,uint256 weight,string reason,bytes params)",
+    "VotingDelaySet(uint256 oldVotingDelay,uint256 newVotingDelay)",
+    "VotingPeriodSet(uint256 oldVotingPeriod,uint256 newVotingPeriod)",
+    "ProposalThresholdSet(uint256 oldProposalThreshold,uint256 newProposalThreshold)",
+    "QuorumNumeratorUpdated(uint256 oldQuorumNumerator,uint256 newQuorumNumerator)",
+    "TimelockChange(address oldTimelock,address newTimelock)",
+    "EIP712DomainChanged()",
+    # TimelockController
+    "CallScheduled(bytes32 indexed id,uint256 indexed index,address target,uint256 value,bytes data,"
+    "bytes32 predecessor,uint256 delay)",
+    "CallExecuted(bytes32 indexed id,uint256 indexed index,address target,uint256 value,bytes data)",
+    "CallSalt(bytes32 indexed id,bytes32 salt)",
+    "Cancelled(bytes32 indexed id)",
+    "MinDelayChange(uint256 oldDuration,uint256 newDuration)",
+    "RoleGranted(bytes32 indexed role,address indexed account,address indexed sender)",
+    "RoleRevoked(bytes32 indexed role,address indexed account,address indexed sender)",
+    "RoleAdminChanged(bytes32 indexed role,bytes32 indexed previousAdminRole,bytes32 indexed newAdminRole)",
+    # TreasuryVault
+    "NeuronRegistration(uint16 indexed netuid,bytes32 hotkey,address indexed caller)",
+    "StreamCreated(uint256 indexed streamId,address indexed recipient,uint256 amountPerPeriod,uint64 start,"
+    "uint32 period,uint32 periods)",
+    "StreamClaimed(uint256 indexed streamId,address indexed recipient,uint32 periods,uint256 amount)",
+    "StreamCancelled(uint256 indexed streamId,uint32 periods)",
+)
+
+_SIGNATURE_PATTERN = re.compile(r"^(\w+)\((.*)\)$")
+# Elementary types that occupy exactly one 32-byte word (no arrays, bytes or string)
+_WORD_TYPE_PATTERN = re.compile(r"^(u?int\d*|address|bool|bytes\d+)$")
+
+
+def event_abi_from_signature(signature):
+    """'Name(type [indexed] name,...)' -> event ABI entry."""
+    name, params = _SIGNATURE_PATTERN.match(signature).groups()
+    inputs = []
+    for param in filter(None, params.split(",")):
+        parts = param.split()
+        inputs.append({"type": parts[0], "indexed": "indexed" in parts[1:-1], "name": parts[-1]})
+    return {"type": "event", "name": name, "inputs": inputs, "anonymous": False}
+
+
+def _canonical(abi_type):
+    if abi_type == "uint":
+        return "uint256"
+    if abi_type == "int":
+        return "int256"
+    return abi_type
+
+
+def _word_decoder(abi_type):
+    """Decoder for one static 32-byte word, or None if the type needs eth_abi."""
+    if not _WORD_TYPE_PATTERN.match(abi_type):
+        return None
+    if abi_type == "address":
+        return lambda word: to_checksum_address(word[12:])
+    if abi_type == "bool":
+        return lambda word: word[31] == 1
+    if abi_type.startswith("uint"):
+        return lambda word: int.from_bytes(word, "big")
+    if abi_type.startswith("int"):
+        return lambda word: int.from_bytes(word, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        size = int(abi_type[5:])
+        return lambda word: word[:size]
+    return None
+
+
+class _EventSpec:
+    """Everything needed to decode one event, computed once."""
+
+    def __init__(self, abi):
+        self.name = abi["name"]
+        inputs = abi["inputs"]
+        self.signature = f"{self.name}({','.join(_canonical(item['type']) for item in inputs)})"
+        self.topic0 = keccak(text=self.signature)
+
+        self.indexed = []
+        for item in inputs:
+            if not item.get("indexed"):
+                continue
+            abi_type = _canonical(item["type"])
+            # Indexed dynamic values are stored as their keccak hash
+            self.indexed.append((item["name"], _word_decoder(abi_type) or (lambda word: word)))
+
+        self.data_names = [item["name"] for item in inputs if not item.get("indexed")]
+        self.data_types = [_canonical(item["type"]) for item in inputs if not item.get("indexed")]
+        word_decoders = [_word_decoder(t) for t in self.data_types]
+        # All-static data is sliced word by word, which is much faster than eth_abi
+        self.word_decoders = word_decoders if all(word_decoders) else None
+        self.order = [item["name"] for item in inputs]
+
+    def decode(self, topics, data):
+        if len(topics) != len(self.indexed) + 1:
+            raise ValueError(f"{self.name}: expected {len(self.indexed) + 1} topics, got {len(topics)}")
+        args = {name: decoder(bytes(topic)) for (name, decoder), topic in zip(self.indexed, topics[1:])}
+
+        if self.word_decoders is not None:
+            if len(data) != 32 * len(self.word_decoders):
+                raise ValueError(f"{self.name}: expected {32 * len(self.word_decoders)} data bytes, got {len(data)}")
+            for i, (name, decoder) in enumerate(zip(self.data_names, self.word_decoders)):
+                args[name] = decoder(data[32 * i:32 * i + 32])
+        elif self.data_types:
+            values = abi_decode(self.data_types, data)
+            for name, abi_type, value in zip(self.data_names, self.data_types, values):
+                args[name] = _checksum(abi_type, value)
+        return {name: args[name] for name in self.order}
+
+
+def _checksum(abi_type, value):
+    if abi_type == "address":
+        return to_checksum_address(value)
+    if abi_type == "address[]":
+        return tuple(to_checksum_address(item) for item in value)
+    return value
+
+
+class DecodedLogs:
+    """
+    Result of LogDecoder.decode_logs.
+
+    events:  decoded events in input order
+    unknown: logs whose topic0 is not in the index (other contracts, anonymous events)
+    errors:  (log, exception) for logs that matched an event but failed to decode
+    """
+
+    def __init__(self):
+        self.events = []
+        self.unknown = []
+        self.errors = []
+
+    def by_name(self, name):
+        return [event for event in self.events if event["event"] == name]
+
+
+class LogDecoder:
+    """
+    Decodes raw logs through a topic0 -> event index built once from ABIs.
+
+    Usage:
+        decoder = default_decoder()
+        result = decoder.decode_logs(receipt["logs"])
+        for event in result.by_name("ProposalCreated"):
+            print(event["args"]["proposalId"])
+    """
+
+    def __init__(self, abis):
+        self.index = {}
+        for abi in abis:
+            for entry in abi:
+                if entry.get("type") != "event" or entry.get("anonymous"):
+                    continue
+                spec = _EventSpec(entry)
+                self.index.setdefault(spec.topic0, spec)
+
+    @classmethod
+    def from_artifacts(cls, paths=DEFAULT_ARTIFACTS):
+        """Indexes the events of forge artifacts, falling back to KNOWN_EVENTS if none are built."""
+        abis = [json.loads(Path(path).read_text())["abi"] for path in paths if Path(path).exists()]
+        if not abis:
+            abis = [[event_abi_from_signature(signature) for signature in KNOWN_EVENTS]]
+        return cls(abis)
+
+    def topic(self, name):
+        for topic0, spec in self.index.items():
+            if spec.name == name:
+                return topic0
+        raise KeyError(f"Unknown event '{name}'")
+
+    def decode_logs(self, logs):
+        result = DecodedLogs()
+        index = self.index
+        for log in logs:
+            topics = log["topics"]
+            spec = index.get(bytes(topics[0])) if topics else None
+            if spec is None:
+                result.unknown.append(log)
+                continue
+            try:
+                args = spec.decode(topics, bytes(log["data"]))
+            except Exception as e:
+                result.errors.append((log, e))
+                continue
+            result.events.append({
+                "event": spec.name,
+                "args": args,
+                "address": log.get("address"),
+                "blockNumber": log.get("blockNumber"),
+                "transactionHash": log.get("transactionHash"),
+                "logIndex": log.get("logIndex"),
+            })
+        return result
+
+
+@lru_cache(maxsize=None)
+def default_decoder():
+    """Process-wide decoder for the TreasuryController and TreasuryVault artifacts."""
+    return LogDecoder.from_artifacts()
@@ -0,0 +1,147 @@
+from eth_utils import keccak
+
+PROPOSE_SELECTOR = keccak(text="propose(address[],uint256[],bytes[],string)")[:4]
+QUEUE_SELECTOR = keccak(text="queue(address[],uint256[],bytes[],bytes32)")[:4]
+EXECUTE_SELECTOR = keccak(text="execute(address[],uint256[],bytes[],bytes32)")[:4]
+ZERO_WORD = b"\x00" * 32
+MAX_UINT256 = 2**256 - 1
+
+
+def description_hash(description: str) -> bytes:
+    """keccak256(bytes(description)), as Governor.propose computes it."""
+    return keccak(text=description)
+
+
+def _address_bytes(address) -> bytes:
+    if isinstance(address, bytes):
+        raw = address
+    else:
+        try:
+            raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid target address {address!r}")
+    if len(raw) != 20:
+        raise ValueError(f"invalid target address {address!r}")
+    return raw
+
+
+def normalize_actions(targets, values, calldatas):
+    """
+    Returns targets as 20-byte strings, values as ints and calldatas as bytes
+    (hex strings are accepted for targets and calldatas). Raises ValueError
+    on length mismatches and empty proposals, which Governor.propose rejects.
+    """
+    if len(targets) != len(values) or len(targets) != len(calldatas):
+        raise ValueError(f"invalid proposal length: {len(targets)} targets, {len(values)} values, {len(calldatas)} calldatas")
+    if not targets:
+        raise ValueError("empty proposal")
+    values = [int(value) for value in values]
+    if any(value < 0 or value > MAX_UINT256 for value in values):
+        raise ValueError("values must fit in uint256")
+    try:
+        calldatas = [data if isinstance(data, bytes) else bytes.fromhex(data.removeprefix("0x")) for data in calldatas]
+    except (AttributeError, ValueError):
+        raise ValueError("calldatas must be bytes or hex strings")
+    return [_address_bytes(target) for target in targets], values, calldatas
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _padded(data: bytes) -> bytes:
+    return _word(len(data)) + data + b"\x00" * (-len(data) % 32)
+
+
+def _encode_actions(targets, values, calldatas, *trailing) -> bytes:
+    """
+    abi.encode(address[] targets, uint256[] values, bytes[] calldatas, ...)
+    for normalized actions. Each `trailing` argument is a bytes32 word, or a
+    str encoded as a dynamic string.
+
+    Written out by hand because eth_abi's generic encoder dominates the cost
+    of batch encoding; bench/proposal_encoder.py checks it against eth_abi.
+    """
+    count = len(targets)
+    items = [_padded(data) for data in calldatas]
+    offsets, offset = [], 32 * count
+    for item in items:
+        offsets.append(_word(offset))
+        offset += len(item)
+    tails = [
+        _word(count) + b"".join(b"\x00" * 12 + target for target in targets),
+        _word(count) + b"".join(_word(value) for value in values),
+        _word(count) + b"".join(offsets) + b"".join(items),
+    ]
+    heads = []
+    position = 32 * (3 + len(trailing))
+    for tail in tails:
+        heads.append(_word(position))
+        position += len(tail)
+    for value in trailing:
+        if isinstance(value, str):
+            tails.append(_padded(value.encode()))
+            heads.append(_word(position))
+            position += len(tails[-1])
+        else:
+            heads.append(value)
+    return b"".join(heads) + b"".join(tails)
+
+
+def hash_proposal(targets, values, calldatas, description_hash_: bytes) -> int:
+    """Governor.hashProposal: uint256(keccak256(abi.encode(targets, values, calldatas, descriptionHash)))."""
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    return int.from_bytes(keccak(_encode_actions(targets, values, calldatas, description_hash_)), "big")
+
+
+def timelock_operation_id(governor, targets, values, calldatas, description_hash_: bytes) -> bytes:
+    """
+    Id of the TimelockController batch GovernorTimelockControl queues for a
+    proposal: hashOperationBatch(targets, values, calldatas, 0, salt) with
+    salt = bytes20(governor) ^ descriptionHash.
+    """
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    governor_word = _address_bytes(governor) + b"\x00" * 12
+    salt = bytes(a ^ b for a, b in zip(governor_word, description_hash_))
+    return keccak(_encode_actions(targets, values, calldatas, ZERO_WORD, salt))
+
+
+def encode_propose(targets, values, calldatas, description: str) -> bytes:
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    return PROPOSE_SELECTOR + _encode_actions(targets, values, calldatas, description)
+
+
+def encode_queue(targets, values, calldatas, description_hash_: bytes) -> bytes:
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    return QUEUE_SELECTOR + _encode_actions(targets, values, calldatas, description_hash_)
+
+
+def encode_execute(targets, values, calldatas, description_hash_: bytes) -> bytes:
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    return EXECUTE_SELECTOR + _encode_actions(targets, values, calldatas, description_hash_)
+
+
+def encode_proposal(targets, values, calldatas, description: str, governor=None, ids_only=False):
+    """
+    Everything the proposal lifecycle needs, computed without a node: the
+    proposal id, descriptionHash and propose/queue/execute calldata (and the
+    timelock operation id when the `governor` address is given). With
+    `ids_only`, only the id and descriptionHash. Byte values are 0x-prefixed
+    hex and the proposal id a decimal string, ready for JSON.
+    """
+    targets, values, calldatas = normalize_actions(targets, values, calldatas)
+    desc_hash = description_hash(description)
+    # hashProposal, queue and execute all take abi.encode(targets, values, calldatas, descriptionHash)
+    args = _encode_actions(targets, values, calldatas, desc_hash)
+    encoded = {
+        "proposal_id": str(int.from_bytes(keccak(args), "big")),
+        "description_hash": "0x" + desc_hash.hex(),
+    }
+    if ids_only:
+        return encoded
+    encoded["propose"] = "0x" + (PROPOSE_SELECTOR + _encode_actions(targets, values, calldatas, description)).hex()
+    encoded["queue"] = "0x" + (QUEUE_SELECTOR + args).hex()
+    encoded["execute"] = "0x" + (EXECUTE_SELECTOR + args).hex()
+    if governor:
+        encoded["timelock_operation_id"] = "0x" + timelock_operation_id(governor, targets, values, calldatas, desc_hash).hex()
+    return encoded
@@ -0,0 +1,119 @@
+import numpy as np
+
+# GovernorCountingSimple.VoteType
+SUPPORT_AGAINST = 0
+SUPPORT_FOR = 1
+SUPPORT_ABSTAIN = 2
+NOT_VOTED = -1
+
+# Returned by votes_to_pass / votes_to_block when no set of remaining voters suffices
+UNREACHABLE = -1
+
+
+def build_support_matrix(proposal_ids, voters, votes):
+    """
+    Builds the (proposals x voters) int8 matrix of cast votes.
+
+    Args:
+        proposal_ids: Sequence of proposal ids (row order).
+        voters: Sequence of voter keys (column order), as used in the power snapshot.
+        votes: Iterable of (proposal_id, voter, support) tuples.
+
+    Returns:
+        np.ndarray filled with NOT_VOTED where no vote was cast. Votes from
+        voters outside the snapshot are ignored.
+    """
+    rows = {pid: i for i, pid in enumerate(proposal_ids)}
+    cols = {voter: j for j, voter in enumerate(voters)}
+    support = np.full((len(proposal_ids), len(voters)), NOT_VOTED, dtype=np.int8)
+    for proposal_id, voter, value in votes:
+        i, j = rows.get(proposal_id), cols.get(voter)
+        if i is not None and j is not None:
+            support[i, j] = value
+    return support
+
+
+def _voters_needed(cum_sorted, need):
+    """Smallest k with cum_sorted[:, k-1] >= need, 0 if need <= 0, UNREACHABLE if never."""
+    available = cum_sorted[:, -1] if cum_sorted.shape[1] else np.zeros(len(need), dtype=np.int64)
+    count = (cum_sorted < need[:, None]).sum(axis=1) + 1
+    count = np.where(need <= 0, 0, count)
+    return np.where(need > available, UNREACHABLE, count)
+
+
+def project(power, support, quorum):
+    """
+    Projects the outcome of many proposals at once.
+
+    Args:
+        power: Voting power in rao, shape (voters,) shared by all proposals or
+            (proposals, voters) for per-proposal snapshots.
+        support: (proposals, voters) matrix from build_support_matrix.
+        quorum: The governor's quorum(snapshot) of each proposal, scalar or
+            (proposals,).
+
+    Returns:
+        Dict of (proposals,) arrays:
+            against / for / abstain - current tally
+            quorum, quorum_gap      - votes required and still missing (for + abstain)
+            succeeded               - would pass if voting ended now
+            pass_power / block_power
+                                    - extra power needed to pass (if nobody else
+                                      votes) / to guarantee a defeat (even if every
+                                      other remaining voter votes For)
+            votes_to_pass / votes_to_block
+                                    - minimum number of remaining voters achieving
+                                      the above, UNREACHABLE if impossible
+        plus `order`, the (proposals, voters) column order of remaining voters by
+        descending power, used by min_voter_set.
+    """
+    support = np.asarray(support)
+    power = np.broadcast_to(np.asarray(power, dtype=np.int64), support.shape)
+    n_proposals = support.shape[0]
+    quorum = np.broadcast_to(np.asarray(quorum, dtype=np.int64), (n_proposals,))
+
+    against = np.where(support == SUPPORT_AGAINST, power, 0).sum(axis=1)
+    in_favour = np.where(support == SUPPORT_FOR, power, 0).sum(axis=1)
+    abstain = np.where(support == SUPPORT_ABSTAIN, power, 0).sum(axis=1)
+
+    quorum_votes = in_favour + abstain
+    quorum_reached = quorum_votes >= quorum
+    succeeded = quorum_reached & (in_favour > against)
+
+    remaining = np.where(support == NOT_VOTED, power, 0)
+    order = np.argsort(-remaining, axis=1, kind="stable")
+    cum_sorted = np.cumsum(np.take_along_axis(remaining, order, axis=1), axis=1)
+    remaining_total = cum_sorted[:, -1] if cum_sorted.shape[1] else np.zeros(n_proposals, dtype=np.int64)
+
+    # Pass: For votes must beat Against and (with Abstain) reach quorum
+    pass_power = np.maximum(np.maximum(against - in_favour + 1, quorum - quorum_votes), 0)
+
+    # Block: B moved to Against while all other remaining power goes For must give
+    # either For <= Against (2B >= F + R - A) or For + Abstain < quorum
+    margin_block = -(-(in_favour + remaining_total - against) // 2)
+    quorum_block = quorum_votes + remaining_total - quorum + 1
+    block_power = np.maximum(np.minimum(margin_block, quorum_block), 0)
+
+    return {
+        "against": against,
+        "for": in_favour,
+        "abstain": abstain,
+        "quorum": quorum,
+        "quorum_gap": np.maximum(quorum - quorum_votes, 0),
+        "quorum_reached": quorum_reached,
+        "succeeded": succeeded,
+        "remaining_power": remaining_total,
+        "pass_power": pass_power,
+        "block_power": block_power,
+        "votes_to_pass": _voters_needed(cum_sorted, pass_power),
+        "votes_to_block": _voters_needed(cum_sorted, block_power),
+        "order": order,
+    }
+
+
+def min_voter_set(projection, proposal_index, mode="pass"):
+    """Column indices of the smallest remaining voter set for one proposal ('pass' or 'block')."""
+    count = int(projection[f"votes_to_{mode}"][proposal_index])
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64)
+    return projection["order"][proposal_index, :count]
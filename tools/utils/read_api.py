@@ -0,0 +1,312 @@
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from .reads import ContractCache, hotkey_to_bytes32, read_balances, read_proposal_state, read_voting_power
+
+DEFAULT_API_PORT = 8700
+MAX_HEADER_BYTES = 16_384
+# Seconds a connection may sit without sending a complete request head before it is closed
+DEFAULT_IDLE_TIMEOUT = 30.0
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class BlockCache:
+    """
+    Responses of the current head block, keyed by endpoint and parameters.
+
+    Entries are futures, so a request arriving while an identical one is
+    still being read waits for that read instead of starting another. A new
+    head drops every entry; a failed read is dropped so the next request
+    retries it.
+    """
+
+    def __init__(self):
+        self.block = None
+        self.entries = {}
+
+    def lookup(self, block, key):
+        """Returns (future, state) where state is "hit", "coalesced" or "miss"."""
+        if block != self.block:
+            self.block = block
+            self.entries = {}
+        future = self.entries.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.entries[key] = future
+            return future, "miss"
+        return future, "hit" if future.done() else "coalesced"
+
+    def discard(self, block, key):
+        if block == self.block:
+            self.entries.pop(key, None)
+
+
+class EndpointStats:
+    """Request counts by cache outcome and latency percentiles over the last `window` requests."""
+
+    def __init__(self, window=1024):
+        self.counts = {"requests": 0, "hit": 0, "coalesced": 0, "miss": 0, "error": 0}
+        self.latencies = deque(maxlen=window)
+
+    def record(self, state, seconds):
+        self.counts["requests"] += 1
+        self.counts[state] += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self):
+        samples = sorted(self.latencies)
+        if not samples:
+            return dict(self.counts)
+
+        def percentile(p):
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 3)
+
+        return {
+            **self.counts,
+            "avg_ms": round(sum(samples) / len(samples) * 1000, 3),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1] * 1000, 3),
+        }
+
+
+class ReadAPIServer:
+    """
+    asyncio HTTP server exposing proposal state, voting power and balance
+    reads (the get_proposal_state.py/get_voting_power.py/get_balance.py
+    data) as JSON:
+
+        GET /proposal-state?proposal_id=123[&contract=0x...]
+        GET /voting-power?hotkey=0x...[&netuid=1][&timepoint=N][&contract=0x...]
+        GET /balance?address=0x...[&address=0x...]
+        GET /stats   per-endpoint counts and latency, RPC totals
+        GET /head    block the responses are served at
+
+    A background task polls the head block every `poll_interval` seconds
+    and every read is pinned to it, so identical requests within a block are
+    answered from one RPC fan-out (see BlockCache). Reads run on a thread
+    pool over `w3`; pass a w3 built with `get_web3_provider(url,
+    coalesce_window=...)` so concurrent reads share JSON-RPC batches.
+    `defaults` maps "governor"/"votes" to addresses used when a request
+    omits `contract`. Connections that send no complete request head for
+    `idle_timeout` seconds (idle keep-alive or slow clients) are closed.
+    """
+
+    def __init__(self, w3, defaults=None, host="127.0.0.1", port=DEFAULT_API_PORT, poll_interval=1.0, workers=16,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.w3 = w3
+        self.defaults = defaults or {}
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.contracts = ContractCache(w3)
+        self.cache = BlockCache()
+        self.stats = {name: EndpointStats() for name in self.ENDPOINTS}
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.head = None
+        self.head_error = None
+        self.server = None
+        self._poller = None
+        self._started = time.time()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        await self._poll_head()
+        if self.head is None:
+            raise ConnectionError(f"cannot read the head block: {self.head_error}")
+        self.server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._poller = asyncio.create_task(self._poll_loop())
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self._poller:
+            self._poller.cancel()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _poll_head(self):
+        try:
+            self.head = await asyncio.get_running_loop().run_in_executor(self.executor, lambda: self.w3.eth.block_number)
+            self.head_error = None
+        except Exception as e:
+            self.head_error = str(e)
+
+    async def _poll_loop(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self._poll_head()
+
+    # --- Endpoints: validate parameters, return (cache key, read(block)) ---
+
+    def _contract(self, kind, query):
+        address = _param(query, "contract", None) or self.defaults.get(kind)
+        if not address:
+            raise BadRequest("missing parameter 'contract'")
+        try:
+            return self.contracts.get(kind, address)
+        except ValueError as e:
+            raise BadRequest(str(e))
+
+    def _proposal_state(self, query):
+        governor = self._contract("governor", query)
+        proposal_id = _int_param(query, "proposal_id")
+        return (governor.address, proposal_id), lambda block: read_proposal_state(self.w3, governor, proposal_id, block)
+
+    def _voting_power(self, query):
+        votes = self._contract("votes", query)
+        netuid = _int_param(query, "netuid", 1)
+        timepoint = _int_param(query, "timepoint", None)
+        try:
+            hotkey = "0x" + hotkey_to_bytes32(_param(query, "hotkey")).hex()
+        except ValueError as e:
+            raise BadRequest(str(e))
+        return (votes.address, netuid, hotkey, timepoint), lambda block: read_voting_power(votes, netuid, hotkey, timepoint, block)
+
+    def _balance(self, query):
+        addresses = query.get("address")
+        if not addresses:
+            raise BadRequest("missing parameter 'address'")
+        if not all(self.w3.is_address(address) for address in addresses):
+            raise BadRequest("'address' must be H160 addresses")
+        addresses = tuple(self.w3.to_checksum_address(address) for address in addresses)
+
+        def read(block):
+            balances = read_balances(self.w3, addresses, block)
+            return balances[0] if len(balances) == 1 else balances
+
+        return addresses, read
+
+    ENDPOINTS = {
+        "/proposal-state": _proposal_state,
+        "/voting-power": _voting_power,
+        "/balance": _balance,
+    }
+
+    async def _read(self, path, query):
+        """Answers an endpoint from the head block's cache; returns (status, body)."""
+        start = time.perf_counter()
+        stats = self.stats[path]
+        try:
+            key, read = self.ENDPOINTS[path](self, query)
+        except BadRequest as e:
+            stats.record("error", time.perf_counter() - start)
+            return 400, {"error": str(e)}
+
+        block = self.head
+        future, state = self.cache.lookup(block, (path, key))
+        if state == "miss":
+            # A task of its own, so a client disconnecting doesn't strand the requests waiting on it
+            asyncio.create_task(self._fill(future, read, block, (path, key)))
+        try:
+            result = await asyncio.shield(future)
+        except Exception as e:
+            stats.record("error", time.perf_counter() - start)
+            return 502, {"error": str(e), "block": block}
+        stats.record(state, time.perf_counter() - start)
+        return 200, result
+
+    async def _fill(self, future, read, block, key):
+        try:
+            future.set_result(await asyncio.get_running_loop().run_in_executor(self.executor, read, block))
+        except Exception as e:
+            future.set_exception(e)
+            self.cache.discard(block, key)
+
+    def _stats(self):
+        provider = self.w3.provider
+        return {
+            "head": self.head,
+            "head_error": self.head_error,
+            "uptime_seconds": round(time.time() - self._started, 1),
+            "rpc": {
+                "http_requests": getattr(provider, "http_requests", None),
+                "rpc_calls": getattr(provider, "rpc_calls", None),
+            },
+            "endpoints": {path: stats.snapshot() for path, stats in self.stats.items()},
+        }
+
+    async def _route(self, method, target):
+        url = urlsplit(target)
+        if method != "GET":
+            return 400, {"error": "only GET is supported"}
+        if url.path == "/stats":
+            return 200, self._stats()
+        if url.path == "/head":
+            return (503 if self.head_error else 200), {"block": self.head, "error": self.head_error}
+        if url.path in self.ENDPOINTS:
+            return await self._read(url.path, parse_qs(url.query))
+        return 404, {"error": "not found"}
+
+    async def _serve_connection(self, reader, writer):
+        """Minimal HTTP/1.1: GET requests without bodies, with keep-alive."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                status, body = await self._route(method, target)
+                payload = json.dumps(body).encode()
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+
+def _param(query, name, default=...):
+    values = query.get(name)
+    if values:
+        return values[0]
+    if default is ...:
+        raise BadRequest(f"missing parameter '{name}'")
+    return default
+
+
+def _int_param(query, name, default=...):
+    value = _param(query, name, default)
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value, 0)
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer")
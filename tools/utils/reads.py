@@ -0,0 +1,139 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+from pathlib import Path
+
+from web3 import Web3
+
+from .burn_monitor import WEI_PER_RAO
+from .contract_loader import load_contract
+from .rpc_batch import batch_read
+
+OUT_DIR = Path(__file__).resolve().parent.parent.parent / "out"
+
+ARTIFACTS = {
+    "governor": OUT_DIR / "TreasuryController.sol" / "TreasuryController.json",
+    "votes": OUT_DIR / "MockBittensorVotes.sol" / "MockBittensorVotes.json",
+    "vault": OUT_DIR / "TreasuryVault.sol" / "TreasuryVault.json",
+}
+
+# OpenZeppelin ProposalState Enum
+STATES = [
+    "Pending",   # 0
+    "Active",    # 1
+    "Canceled",  # 2
+    "Defeated",  # 3
+    "Succeeded", # 4
+    "Queued",    # 5
+    "Expired",   # 6
+    "Executed"   # 7
+]
+
+RAO_PER_TAO = 1_000_000_000
+
+# Balances of substrate accounts (coldkeys, and the SS58 mirrors of H160 accounts)
+ACCOUNT_STORAGE = ("System", "Account")
+
+
+class ContractCache:
+    """
+    Loads each (kind, address) contract once per process, so long-lived tools
+    parse a Forge artifact only the first time it is needed. `kind` is a key
+    of ARTIFACTS.
+    """
+
+    def __init__(self, w3):
+        self.w3 = w3
+        self._contracts = {}
+
+    def get(self, kind, address):
+        if kind not in ARTIFACTS:
+            raise ValueError(f"unknown contract kind '{kind}'")
+        key = (kind, Web3.to_checksum_address(address))
+        if key not in self._contracts:
+            self._contracts[key] = load_contract(self.w3, key[1], ARTIFACTS[kind])
+        return self._contracts[key]
+
+
+def hotkey_to_bytes32(hotkey):
+    clean_hex = hotkey[2:] if hotkey.startswith("0x") else hotkey
+    try:
+        return bytes.fromhex(clean_hex.zfill(64))
+    except ValueError:
+        raise ValueError(f"invalid hotkey '{hotkey}', expected a hex string")
+
+
+def read_proposal_state(w3, governor, proposal_id, block="latest"):
+    """
+    Reads state, snapshot, deadline and votes of a proposal at `block` in one
+    JSON-RPC batch. Returns the JSON-ready dict get_proposal_state.py prints.
+    """
+    state, snapshot, deadline, current_block, votes = batch_read(w3, [
+        lambda: governor.functions.state(proposal_id).call(block_identifier=block),
+        lambda: governor.functions.proposalSnapshot(proposal_id).call(block_identifier=block),
+        lambda: governor.functions.proposalDeadline(proposal_id).call(block_identifier=block),
+        lambda: w3.eth.block_number if block == "latest" else block,
+        # proposalVotes(uint256) returns (against, for, abstain)
+        lambda: governor.functions.proposalVotes(proposal_id).call(block_identifier=block),
+    ])
+    return {
+        "proposal_id": str(proposal_id),
+        "state": state,
+        "state_name": STATES[state] if 0 <= state < len(STATES) else "Unknown",
+        "snapshot": snapshot,
+        "deadline": deadline,
+        "block": current_block,
+        "remaining_blocks": max(0, deadline - current_block),
+        "votes": {"against": str(votes[0]), "for": str(votes[1]), "abstain": str(votes[2])},
+    }
+
+
+def read_voting_power(votes, netuid, hotkey, timepoint=None, block="latest"):
+    """
+    Reads a hotkey's voting power, checkpointed at `timepoint` when given.
+    Amounts are strings so rao values survive JSON consumers that use floats.
+    """
+    key = hotkey_to_bytes32(hotkey)
+    if timepoint is not None:
+        power = votes.functions.getPastVotingPower(netuid, key, timepoint).call(block_identifier=block)
+    else:
+        power = votes.functions.getVotingPower(netuid, key).call(block_identifier=block)
+    return {
+        "netuid": netuid,
+        "hotkey": "0x" + key.hex(),
+        "timepoint": timepoint,
+        "raw": str(power),
+        "tao": str(power / RAO_PER_TAO),
+    }
+
+
+def tao_to_rao(value) -> int:
+    """
+    Exact rao for a TAO amount given as text (or a float, through its shortest
+    decimal repr), so 8.2 TAO is 8200000000 rao rather than the 8199999999
+    that int(8.2 * 1e9) gives. Invalid text raises decimal.InvalidOperation,
+    an ArithmeticError.
+    """
+    return int((Decimal(str(value)) * RAO_PER_TAO).to_integral_value(ROUND_HALF_EVEN))
+
+
+def read_account_balances(substrate, ss58_addresses, block_hash=None):
+    """
+    Free balances of SS58 accounts from System.Account in one multi-key query,
+    in wei like eth_getBalance. Accounts without storage have a zero balance.
+    """
+    keys = [substrate.create_storage_key(*ACCOUNT_STORAGE, [address]) for address in ss58_addresses]
+    free = {}
+    for storage_key, value in substrate.query_multi(keys, block_hash=block_hash):
+        free[storage_key.params[0]] = int(getattr(value, "value", value)["data"]["free"])
+    return [free.get(address, 0) * WEI_PER_RAO for address in ss58_addresses]
+
+
+def read_balances(w3, addresses, block="latest"):
+    """Reads native balances of H160 `addresses` at `block` in one JSON-RPC batch."""
+    addresses = [Web3.to_checksum_address(address) for address in addresses]
+    balances = batch_read(w3, [
+        lambda address=address: w3.eth.get_balance(address, block_identifier=block) for address in addresses
+    ])
+    return [
+        {"address": address, "wei": str(balance), "tao": str(Web3.from_wei(balance, "ether"))}
+        for address, balance in zip(addresses, balances)
+    ]
@@ -0,0 +1,186 @@
+import threading
+
+from web3 import Web3
+
+# Methods that must never be held back or merged with other calls
+NON_COALESCED_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+class CountingHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider that counts HTTP round trips and JSON-RPC calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._counter_lock = threading.Lock()
+        self.http_requests = 0
+        self.rpc_calls = 0
+
+    def _count(self, calls):
+        with self._counter_lock:
+            self.http_requests += 1
+            self.rpc_calls += calls
+
+    def reset_counters(self):
+        with self._counter_lock:
+            self.http_requests = 0
+            self.rpc_calls = 0
+
+    def make_request(self, method, params):
+        self._count(1)
+        return super().make_request(method, params)
+
+    def make_batch_request(self, batch_requests):
+        self._count(len(batch_requests))
+        return super().make_batch_request(batch_requests)
+
+
+class _PendingCall:
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.response = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class CoalescingHTTPProvider(CountingHTTPProvider):
+    """
+    HTTPProvider that merges concurrent requests into JSON-RPC batch arrays.
+
+    The first thread to issue a request opens a batch and waits up to `window`
+    seconds (or until `max_batch` calls are queued) for other threads to join
+    it, then sends everything in one HTTP POST. Single-threaded callers see
+    at most `window` of added latency per call, so this is meant for fan-out
+    code (thread pools, servers) rather than linear scripts.
+    """
+
+    def __init__(self, endpoint_uri=None, window: float = 0.002, max_batch: int = 100, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self.window = window
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending = []
+        self._collecting = False
+
+    def make_request(self, method, params):
+        if method in NON_COALESCED_METHODS:
+            return super().make_request(method, params)
+
+        call = _PendingCall(method, params)
+        with self._cond:
+            self._pending.append(call)
+            leader = not self._collecting
+            if leader:
+                self._collecting = True
+            elif len(self._pending) >= self.max_batch:
+                self._cond.notify_all()
+
+        if leader:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._pending) >= self.max_batch, timeout=self.window)
+                batch, self._pending = self._pending, []
+                self._collecting = False
+            for start in range(0, len(batch), self.max_batch):
+                self._flush(batch[start:start + self.max_batch])
+
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.response
+
+    def _flush(self, batch):
+        try:
+            if len(batch) == 1:
+                responses = [super().make_request(batch[0].method, batch[0].params)]
+            else:
+                responses = super().make_batch_request([(call.method, call.params) for call in batch])
+                if not isinstance(responses, list):
+                    # The node rejected the whole batch with a single error object
+                    responses = [responses] * len(batch)
+        except Exception as e:
+            for call in batch:
+                call.error = e
+                call.done.set()
+            return
+
+        for call, response in zip(batch, responses):
+            call.response = response
+            call.done.set()
+
+
+def batch_read(w3, calls, return_exceptions=False):
+    """
+    Executes independent reads as one JSON-RPC batch and returns their results
+    in order.
+
+    Each entry in `calls` is either a contract function (e.g.
+    `contract.functions.state(pid)`) or a zero-argument callable wrapping an
+    `w3.eth` read (e.g. `lambda: w3.eth.gas_price`).
+
+    Every response in the batch array carries its own result or error, so a
+    failing call only fails its own slot: with `return_exceptions` the error
+    is returned in its place, otherwise it is raised. The calls are retried
+    one by one only when the batch as a whole can't be sent (the provider
+    can't batch, or the node rejects the array).
+
+    Keeping per-call errors needs web3 internals (RequestBatcher._requests_info,
+    RequestManager._format_batched_response), so requirements.txt pins web3
+    exactly and tests/test_rpc_batch.py fails if an upgrade breaks them.
+    """
+    responses = None
+    try:
+        with w3.batch_requests() as batch:
+            for call in calls:
+                batch.add(call if hasattr(call, "call") else call())
+            requests_info = list(batch._requests_info)
+        # Send the array ourselves: RequestBatcher.execute formats the responses
+        # in one go and raises on the first error, discarding the other results
+        request_func = w3.provider.batch_request_func(w3, w3.middleware_onion)
+        responses = request_func([request for request, _ in requests_info])
+    except Exception:
+        pass
+
+    if isinstance(responses, list) and len(responses) == len(calls):
+        results = []
+        for info, response in zip(requests_info, responses):
+            try:
+                results.append(w3.manager._format_batched_response(info, response))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    results = []
+    for call in calls:
+        try:
+            results.append(call.call() if hasattr(call, "call") else call())
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def fetch_tx_params(w3, fn, sender, value=0):
+    """
+    Fetches everything a write tool needs before signing in one round trip:
+    (gas_estimate, gas_price, pending nonce, chain_id).
+
+    The gas estimate and gas price are returned as exceptions when they fail
+    so callers can apply their fallbacks; nonce and chain id errors are raised.
+    """
+    tx = {"from": sender, "to": fn.address, "data": fn._encode_transaction_data()}
+    if value:
+        tx["value"] = value
+    gas_estimate, gas_price, nonce, chain_id = batch_read(w3, [
+        lambda: w3.eth.estimate_gas(tx),
+        lambda: w3.eth.gas_price,
+        lambda: w3.eth.get_transaction_count(sender, "pending"),
+        lambda: w3.eth.chain_id,
+    ], return_exceptions=True)
+
+    for result in (nonce, chain_id):
+        if isinstance(result, Exception):
+            raise result
+    return gas_estimate, gas_price, nonce, chain_id
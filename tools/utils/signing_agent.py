@@ -0,0 +1,252 @@
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from pathlib import Path
+
+from eth_account import Account
+from hexbytes import HexBytes
+
+SOCKET_ENV = "TREASURY_SIGNER_SOCK"
+ADDRESS_ENV = "TREASURY_SIGNER_ADDRESS"
+DEFAULT_SOCKET = Path.home() / ".bittensor-treasury" / "signer.sock"
+DEFAULT_IDLE_TIMEOUT = 900
+
+
+class AgentError(Exception):
+    """Error reported by the signing agent."""
+
+
+class SignedTransaction:
+    """The parts of eth_account's SignedTransaction the tools use."""
+
+    def __init__(self, tx_hash, raw_transaction):
+        self.hash = HexBytes(tx_hash)
+        self.raw_transaction = HexBytes(raw_transaction)
+
+
+class SignedMessage:
+    """The part of eth_account's SignedMessage the tools use."""
+
+    def __init__(self, signature):
+        self.signature = HexBytes(signature)
+
+
+def socket_path_from_env():
+    return Path(os.getenv(SOCKET_ENV) or DEFAULT_SOCKET)
+
+
+def _encode_tx(tx):
+    return {key: ("0x" + value.hex() if isinstance(value, (bytes, bytearray)) else value) for key, value in tx.items()}
+
+
+def _peer_uid(sock):
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", creds)[1]
+
+
+class SigningAgent:
+    """
+    Holds unlocked accounts in memory and signs for local clients over a Unix socket.
+
+    The protocol is one JSON object per line in each direction:
+    {"method": ..., "params": {...}} -> {"result": ...} or {"error": "..."}.
+    The socket is only accessible to the owner, and on Linux connections from
+    other users are refused. Keys are dropped and the agent exits after
+    `idle_timeout` seconds without a signing request, or on a "lock" request.
+    """
+
+    def __init__(self, accounts, socket_path=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.accounts = {account.address: account for account in accounts}
+        self.socket_path = Path(socket_path or socket_path_from_env())
+        self.idle_timeout = idle_timeout
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+        self.server = None
+        self.stop_requested = False
+
+    # --- Requests ---
+
+    def _account(self, address):
+        if not self.accounts:
+            raise AgentError("agent is locked")
+        if address is None:
+            return next(iter(self.accounts.values()))
+        for known, account in self.accounts.items():
+            if known.lower() == address.lower():
+                return account
+        raise AgentError(f"no unlocked key for {address}")
+
+    def _sign(self, account, tx):
+        signed = account.sign_transaction(tx)
+        return {"hash": "0x" + bytes(signed.hash).hex(), "raw": "0x" + bytes(signed.raw_transaction).hex()}
+
+    def handle(self, method, params):
+        with self.lock:
+            if method == "accounts":
+                return list(self.accounts)
+            if method == "status":
+                return {
+                    "accounts": list(self.accounts),
+                    "idle_timeout": self.idle_timeout,
+                    "idle_for": time.monotonic() - self.last_used,
+                }
+            if method == "lock":
+                self.accounts.clear()
+                self.stop_requested = True
+                return True
+            if method == "sign_transaction":
+                account = self._account(params.get("address"))
+                self.last_used = time.monotonic()
+                return self._sign(account, params["tx"])
+            if method == "sign_transactions":
+                account = self._account(params.get("address"))
+                self.last_used = time.monotonic()
+                return [self._sign(account, tx) for tx in params["txs"]]
+            if method == "sign_typed_data":
+                account = self._account(params.get("address"))
+                self.last_used = time.monotonic()
+                signed = account.sign_typed_data(full_message=params["message"])
+                return "0x" + bytes(signed.signature).hex()
+        raise AgentError(f"unknown method '{method}'")
+
+    # --- Server ---
+
+    def _handler(self):
+        agent = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                uid = _peer_uid(self.connection)
+                if uid is not None and uid != os.getuid():
+                    return
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                        response = {"result": agent.handle(request["method"], request.get("params") or {})}
+                    except Exception as e:
+                        response = {"error": str(e)}
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+                    if agent.stop_requested:
+                        # Only after the reply to "lock" is out
+                        agent.server.shutdown()
+                        return
+
+        return Handler
+
+    def _watch_idle(self, server):
+        while self.server is server:
+            time.sleep(min(1.0, self.idle_timeout))
+            with self.lock:
+                if time.monotonic() - self.last_used >= self.idle_timeout:
+                    self.accounts.clear()
+                    server.shutdown()
+                    return
+
+    def serve_forever(self):
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if SigningAgentClient.is_running(self.socket_path):
+                raise AgentError(f"an agent is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+
+        old_umask = os.umask(0o177)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), self._handler())
+        finally:
+            os.umask(old_umask)
+        self.server.daemon_threads = True
+
+        threading.Thread(target=self._watch_idle, args=(self.server,), daemon=True).start()
+        try:
+            self.server.serve_forever()
+        finally:
+            server, self.server = self.server, None
+            server.server_close()
+            self.accounts.clear()
+            self.socket_path.unlink(missing_ok=True)
+
+
+class SigningAgentClient:
+    """
+    Signs through a running SigningAgent. Exposes `address`,
+    `sign_transaction(tx)` and `sign_typed_data(full_message=...)` like
+    eth_account's LocalAccount, so the tools can use either interchangeably.
+    """
+
+    def __init__(self, socket_path=None, timeout=30.0):
+        self.socket_path = Path(socket_path or socket_path_from_env())
+        self.timeout = timeout
+        self.address = None
+
+    def use_account(self, address=None):
+        """Selects the signing account (default: the agent's first key); returns self."""
+        accounts = self.call("accounts")
+        if not accounts:
+            raise AgentError("agent has no unlocked keys")
+        if address is None:
+            self.address = accounts[0]
+        else:
+            matches = [known for known in accounts if known.lower() == address.lower()]
+            if not matches:
+                raise AgentError(f"no unlocked key for {address}")
+            self.address = matches[0]
+        return self
+
+    @staticmethod
+    def is_running(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1.0)
+                sock.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+
+    def call(self, method, **params):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(json.dumps({"method": method, "params": params}).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise AgentError("agent closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise AgentError(response["error"])
+        return response["result"]
+
+    def sign_transaction(self, tx):
+        result = self.call("sign_transaction", address=self.address, tx=_encode_tx(tx))
+        return SignedTransaction(result["hash"], result["raw"])
+
+    def sign_transactions(self, txs):
+        """Signs many transactions in one request; returns (hash, raw) pairs in order."""
+        results = self.call("sign_transactions", address=self.address, txs=[_encode_tx(tx) for tx in txs])
+        return [(HexBytes(result["hash"]), HexBytes(result["raw"])) for result in results]
+
+    def sign_typed_data(self, full_message):
+        """Signs an EIP-712 message given as a full typed-data dict."""
+        return SignedMessage(self.call("sign_typed_data", address=self.address, message=full_message))
+
+
+def get_signer(private_key=None):
+    """
+    Returns the account the write tools sign with: --private-key, then the
+    PRIVATE_KEY env var, then a running signing agent. Returns None if none
+    of them is available.
+    """
+    private_key = private_key or os.getenv("PRIVATE_KEY")
+    if private_key:
+        return Account.from_key(private_key)
+    socket_path = socket_path_from_env()
+    if socket_path.exists():
+        return SigningAgentClient(socket_path).use_account(os.getenv(ADDRESS_ENV))
+    return None
@@ -0,0 +1,97 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from eth_account import Account
+
+# Set once per worker by _init_worker so the key is not pickled with every chunk
+_worker_account = None
+
+
+def _init_worker(private_key):
+    global _worker_account
+    _worker_account = Account.from_key(private_key)
+
+
+def _sign_chunk(txs):
+    signed = []
+    for tx in txs:
+        result = _worker_account.sign_transaction(tx)
+        signed.append((bytes(result.hash), bytes(result.raw_transaction)))
+    return signed
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def build_transactions(fns, sender, start_nonce, gas, gas_price, chain_id, value=0):
+    """
+    Builds one transaction per contract function call with consecutive local nonces.
+
+    All fields are supplied, so build_transaction makes no RPC calls.
+    """
+    return [
+        fn.build_transaction({
+            "from": sender,
+            "nonce": start_nonce + i,
+            "gas": gas,
+            "gasPrice": gas_price,
+            "chainId": chain_id,
+            "value": value,
+        })
+        for i, fn in enumerate(fns)
+    ]
+
+
+class SigningPool:
+    """
+    Signs transactions for one key across a process pool.
+
+    Signing is pure-Python secp256k1 work, so threads do not help; each worker
+    process holds its own copy of the account. `sign` streams (tx_hash, raw)
+    pairs back in input order while later chunks are still being signed.
+
+    Usage:
+        with SigningPool(private_key, workers=4) as pool:
+            for tx_hash, raw in pool.sign(txs):
+                w3.eth.send_raw_transaction(raw)
+    """
+
+    def __init__(self, private_key, workers=None, chunk_size=32):
+        self.private_key = private_key
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.private_key,),
+            )
+        else:
+            _init_worker(self.private_key)
+        return self
+
+    def __exit__(self, *exc):
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def sign(self, txs):
+        if self.executor is None:
+            for chunk in _chunks(txs, self.chunk_size):
+                yield from _sign_chunk(chunk)
+            return
+        # Executor.map submits every chunk up front and yields results in order
+        for signed in self.executor.map(_sign_chunk, _chunks(txs, self.chunk_size)):
+            yield from signed
+
+
+def send_in_order(w3, signed):
+    """Sends signed raw transactions as they arrive; returns their hashes."""
+    return [w3.eth.send_raw_transaction(raw) for _, raw in signed]
@@ -0,0 +1,253 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from web3 import Web3
+
+from .address_converter import ss58_to_bytes
+from .contract_loader import FALLBACK_ABI
+from .reads import tao_to_rao
+from .rpc_batch import batch_read
+from .staking_manager import fetch_stake_info
+
+# Heuristic gas for calls that aren't estimated against the target (see estimate_call_gas): a fixed
+# overhead plus a flat amount per hotkey touched. These are rough guesses, not measurements of the
+# staking precompile (override with --gas-per-hotkey)
+CALL_OVERHEAD_GAS = 30_000
+DEFAULT_GAS_PER_HOTKEY = 100_000
+# Headroom on eth_estimateGas results, like the write tools' gas limits
+GAS_ESTIMATE_MARGIN = 1.2
+DEFAULT_MAX_HOTKEYS_PER_CALL = 32
+# Leaves room under a block gas limit for the Governor/Timelock execution around the calls
+DEFAULT_MAX_PROPOSAL_GAS = 10_000_000
+
+# Functions the planned calls need on the target, by call kind
+PLANNED_SIGNATURES = {
+    "unstakeAndBurn": "unstakeAndBurn(bytes32[],uint256,uint256[])",
+    "stake": "stake(bytes32,uint256,uint256)",
+}
+
+
+def parse_subnet_stakes(data, netuids):
+    """
+    Per-subnet stake from `btcli stake list --json-out` output, as
+    {netuid: {hotkey_bytes32: rao}} for every netuid in `netuids` (subnets
+    without stake map to {}). Entries of one hotkey on one subnet are summed.
+    """
+    stakes = {netuid: {} for netuid in netuids}
+    for hotkey_ss58, entries in (data or {}).get("stake_info", {}).items():
+        hotkey = None
+        for entry in entries:
+            try:
+                netuid = int(entry.get("netuid"))
+            except (TypeError, ValueError):
+                continue
+            if netuid not in stakes:
+                continue
+            rao = tao_to_rao(entry.get("stake_value", 0))
+            if rao <= 0:
+                continue
+            if hotkey is None:
+                hotkey = ss58_to_bytes(hotkey_ss58)
+            stakes[netuid][hotkey] = stakes[netuid].get(hotkey, 0) + rao
+    return stakes
+
+
+def fetch_subnet_stakes(coldkeys, netuids, network="test", workers=None):
+    """
+    Stake of every coldkey on every netuid in one pass: {netuid: {hotkey: rao}}
+    summed over the coldkeys. One `btcli stake list` already covers all
+    subnets of a coldkey, so each coldkey is fetched once, and the coldkeys
+    concurrently.
+    """
+    netuids = list(netuids)
+    with ThreadPoolExecutor(max_workers=workers or min(8, len(coldkeys))) as pool:
+        results = list(pool.map(lambda coldkey: fetch_stake_info(coldkey, network), coldkeys))
+
+    stakes = {netuid: {} for netuid in netuids}
+    for data in results:
+        for netuid, hotkeys in parse_subnet_stakes(data, netuids).items():
+            for hotkey, rao in hotkeys.items():
+                stakes[netuid][hotkey] = stakes[netuid].get(hotkey, 0) + rao
+    return stakes
+
+
+def plan_rebalance(stakes, targets, stake_hotkeys=None, tolerance=0):
+    """
+    Moves each subnet's total stake to its target (rao).
+
+    Returns (unstakes, stakes_to_add): unstakes is {netuid: [(hotkey, rao)]},
+    taking the excess from the largest positions first so the fewest hotkeys
+    are touched; stakes_to_add is [(netuid, hotkey, rao)], adding the
+    shortfall to `stake_hotkeys[netuid]` or else to the subnet's largest
+    position. Differences of at most `tolerance` rao are left alone.
+    """
+    stake_hotkeys = stake_hotkeys or {}
+    unstakes, stakes_to_add = {}, []
+    for netuid, target in sorted(targets.items()):
+        positions = sorted(stakes.get(netuid, {}).items(), key=lambda item: (-item[1], item[0]))
+        current = sum(rao for _, rao in positions)
+        if abs(current - target) <= tolerance:
+            continue
+
+        if current > target:
+            excess, removals = current - target, []
+            for hotkey, rao in positions:
+                if excess == 0:
+                    break
+                amount = min(rao, excess)
+                removals.append((hotkey, amount))
+                excess -= amount
+            unstakes[netuid] = removals
+        else:
+            hotkey = stake_hotkeys.get(netuid) or (positions[0][0] if positions else None)
+            if hotkey is None:
+                raise ValueError(f"netuid {netuid} has no stake to add to: pass a stake hotkey for it")
+            stakes_to_add.append((netuid, hotkey, target - current))
+    return unstakes, stakes_to_add
+
+
+def build_calls(treasury, unstakes, stakes_to_add, max_hotkeys_per_call=DEFAULT_MAX_HOTKEYS_PER_CALL,
+                gas_per_hotkey=DEFAULT_GAS_PER_HOTKEY):
+    """
+    Encodes the plan as treasury calls: unstakeAndBurn(bytes32[], uint256,
+    uint256[]) chunks of at most `max_hotkeys_per_call` hotkeys per subnet,
+    then one stake(bytes32, uint256, uint256) per addition. unstakeAndBurn
+    burns what it unstakes, so additions are paid from the treasury's free
+    balance. Each call is a dict with target, value, calldata, gas,
+    gas_source ("heuristic" until estimate_call_gas replaces it), kind,
+    netuid, hotkeys and amount_rao. Check the target with missing_functions
+    before proposing.
+    """
+    contract = Web3().eth.contract(abi=FALLBACK_ABI)
+    treasury = Web3.to_checksum_address(treasury)
+    calls = []
+    for netuid, removals in sorted(unstakes.items()):
+        for start in range(0, len(removals), max_hotkeys_per_call):
+            chunk = removals[start:start + max_hotkeys_per_call]
+            hotkeys = [hotkey for hotkey, _ in chunk]
+            amounts = [amount for _, amount in chunk]
+            calls.append({
+                "target": treasury,
+                "value": 0,
+                "calldata": contract.encode_abi("unstakeAndBurn", [hotkeys, netuid, amounts]),
+                "gas": CALL_OVERHEAD_GAS + len(chunk) * gas_per_hotkey,
+                "gas_source": "heuristic",
+                "kind": "unstakeAndBurn",
+                "netuid": netuid,
+                "hotkeys": ["0x" + hotkey.hex() for hotkey in hotkeys],
+                "amount_rao": sum(amounts),
+            })
+    for netuid, hotkey, amount in stakes_to_add:
+        calls.append({
+            "target": treasury,
+            "value": 0,
+            "calldata": contract.encode_abi("stake", [hotkey, netuid, amount]),
+            "gas": CALL_OVERHEAD_GAS + gas_per_hotkey,
+            "gas_source": "heuristic",
+            "kind": "stake",
+            "netuid": netuid,
+            "hotkeys": ["0x" + hotkey.hex()],
+            "amount_rao": amount,
+        })
+    return calls
+
+
+def _canonical_type(param):
+    if param["type"].startswith("tuple"):
+        inner = ",".join(_canonical_type(component) for component in param["components"])
+        return f"({inner}){param['type'][len('tuple'):]}"
+    return param["type"]
+
+
+def abi_signatures(abi):
+    """Canonical signatures ("name(type,...)") of the functions in an ABI."""
+    return {
+        f"{item['name']}({','.join(_canonical_type(param) for param in item.get('inputs', []))})"
+        for item in abi if item.get("type") == "function"
+    }
+
+
+def code_has_selector(code, selector):
+    """
+    Whether runtime code pushes `selector` as a constant, which is how the
+    Solidity dispatcher compares calldata to each external function (leading
+    zero bytes are dropped, so it may be a PUSH3 or shorter).
+    """
+    trimmed = selector.lstrip(b"\x00")
+    return bytes([0x5f + len(trimmed)]) + trimmed in bytes(code)
+
+
+def missing_functions(calls, abi=None, code=None):
+    """
+    Signatures the planned calls need that the target doesn't implement,
+    checked against its ABI and/or its deployed runtime code.
+    """
+    needed = sorted({PLANNED_SIGNATURES[call["kind"]] for call in calls})
+    missing = []
+    for signature in needed:
+        if abi is not None and signature not in abi_signatures(abi):
+            missing.append(signature)
+        elif code is not None and not code_has_selector(code, Web3.keccak(text=signature)[:4]):
+            missing.append(signature)
+    return missing
+
+
+def estimate_call_gas(w3, calls, executor, batch_size=100):
+    """
+    Replaces the heuristic gas of `calls` with eth_estimateGas against their
+    target, sent from `executor` (the timelock that executes the proposals),
+    plus GAS_ESTIMATE_MARGIN. Estimates are read in JSON-RPC batches of
+    `batch_size`. Calls whose estimate fails (e.g. the call reverts in the
+    current state) keep the heuristic; they are returned as (call, error).
+    """
+    executor = Web3.to_checksum_address(executor)
+    failed = []
+    for start in range(0, len(calls), batch_size):
+        chunk = calls[start:start + batch_size]
+        estimates = batch_read(w3, [
+            lambda call=call: w3.eth.estimate_gas({"from": executor, "to": call["target"], "data": call["calldata"]})
+            for call in chunk
+        ], return_exceptions=True)
+        for call, estimate in zip(chunk, estimates):
+            if isinstance(estimate, Exception):
+                failed.append((call, estimate))
+                continue
+            call["gas"] = int(estimate * GAS_ESTIMATE_MARGIN)
+            call["gas_source"] = "estimate"
+    return failed
+
+
+def pack_proposals(calls, description, max_proposal_gas=DEFAULT_MAX_PROPOSAL_GAS):
+    """
+    Packs calls, in order, into as few proposals as fit `max_proposal_gas`
+    of estimated gas each. Returns proposal dicts with targets, values,
+    calldatas and a description numbered "(i/n)" when there are several, so
+    every proposal gets its own id; the lines feed encode_proposal.py --batch.
+    heuristic_gas marks proposals whose estimated_gas includes heuristic calls.
+    """
+    groups, current, current_gas = [], [], 0
+    for call in calls:
+        if call["gas"] > max_proposal_gas:
+            raise ValueError(
+                f"a {call['kind']} call on netuid {call['netuid']} needs ~{call['gas']} gas, "
+                f"over the {max_proposal_gas} per proposal: lower the hotkeys per call"
+            )
+        if current and current_gas + call["gas"] > max_proposal_gas:
+            groups.append(current)
+            current, current_gas = [], 0
+        current.append(call)
+        current_gas += call["gas"]
+    if current:
+        groups.append(current)
+
+    proposals = []
+    for i, group in enumerate(groups, start=1):
+        proposals.append({
+            "targets": [call["target"] for call in group],
+            "values": [call["value"] for call in group],
+            "calldatas": [call["calldata"] for call in group],
+            "description": description if len(groups) == 1 else f"{description} ({i}/{len(groups)})",
+            "netuids": sorted({call["netuid"] for call in group}),
+            "estimated_gas": sum(call["gas"] for call in group),
+            "heuristic_gas": any(call["gas_source"] == "heuristic" for call in group),
+        })
+    return proposals
@@ -4,7 +4,7 @@ import sys
 # Relative import is crucial here when running as a package
 from .address_converter import ss58_to_bytes
 
-def fetch_validator_stakes(coldkey_ss58: str, netuid: int, network: str = "test"):
+def fetch_validator_stakes(coldkey_ss58: str, netuid: int, network: str = "test", stake_list=None):
     """
     Fetches stake info via btcli for a given coldkey, network, and netuid.
 
@@ -12,15 +12,30 @@ def fetch_validator_stakes(coldkey_ss58: str, netuid: int, network: str = "test"
         coldkey_ss58: The SS58 address of the coldkey.
         netuid: The subnet ID to filter stakes by.
         network: The bittensor network name (e.g., 'test', 'finney', 'local').
+        stake_list: Optional `(coldkey_ss58, netuid) -> data` source used instead
+            of btcli, e.g. FakeSubstrateClient.stake_list in benches.
 
     Returns:
         Tuple containing two lists: (list_of_bytes32_hotkeys, list_of_amounts_in_rao)
     """
-    print(f"Fetching stake data via btcli...")
-    print(f"  > Coldkey: {coldkey_ss58}")
-    print(f"  > Network: {network}")
-    print(f"  > NetUID:  {netuid}")
+    if stake_list is not None:
+        data = stake_list(coldkey_ss58, netuid)
+    else:
+        print(f"Fetching stake data via btcli...")
+        print(f"  > Coldkey: {coldkey_ss58}")
+        print(f"  > Network: {network}")
+        print(f"  > NetUID:  {netuid}")
+        data = fetch_stake_info(coldkey_ss58, network)
+    if data is None:
+        return [], []
+    return _parse_stake_info(data, netuid)
+
 
+def fetch_stake_info(coldkey_ss58: str, network: str = "test"):
+    """
+    Raw `btcli stake list --json-out` output for a coldkey, covering every
+    subnet it stakes on. Returns None when btcli reports no stake.
+    """
     cmd = [
         "btcli", "stake", "list",
         "--network", network,
@@ -39,13 +54,13 @@ def fetch_validator_stakes(coldkey_ss58: str, netuid: int, network: str = "test"
     if result.returncode != 0:
         err_msg = result.stderr.strip()
         if "No stake found" in raw_output or "No stake found" in err_msg:
-            print("Info: No stake found (btcli returned empty).")
-            return [], []
+            print("Info: No stake found (btcli returned empty).", file=sys.stderr)
+            return None
         raise RuntimeError(f"Error executing btcli: {err_msg}")
 
     if not raw_output:
-        print("Info: No stake data returned.")
-        return [], []
+        print("Info: No stake data returned.", file=sys.stderr)
+        return None
 
     # JSON SANITIZATION
     # btcli often prints logs (e.g. "Update available") before the actual JSON.
@@ -58,13 +73,16 @@ def fetch_validator_stakes(coldkey_ss58: str, netuid: int, network: str = "test"
             raise ValueError("No JSON object found in output")
 
         json_str = raw_output[start_idx:end_idx]
-        data = json.loads(json_str)
+        return json.loads(json_str)
 
     except (json.JSONDecodeError, ValueError) as e:
         # Dump output for debugging if parsing fails
         print(f"DEBUG: Raw output was:\n{raw_output}", file=sys.stderr)
         raise ValueError(f"Failed to parse JSON from btcli output: {e}")
 
+
+def _parse_stake_info(data, netuid):
+    """Per-hotkey stake on `netuid` from `btcli stake list --json-out` output."""
     # Extract stake info
     stake_map = data.get("stake_info", {})
     if not stake_map:
@@ -0,0 +1,339 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_keys.exceptions import BadSignature
+from eth_utils import is_address, to_checksum_address
+from hexbytes import HexBytes
+
+# EIP-712 domain of TreasuryController (Governor("BittensorDAO"), version "1")
+GOVERNOR_NAME = "BittensorDAO"
+GOVERNOR_VERSION = "1"
+# IGovernor.ProposalState.Active: the only state castVoteBySig accepts
+STATE_ACTIVE = 1
+SUPPORT_LABELS = {0: "Against", 1: "For", 2: "Abstain"}
+DEFAULT_INTAKE_PORT = 8600
+
+# Gas of a castVoteBySig transaction that is not paid again per call inside multicall
+INTRINSIC_GAS = 21_000
+# multicall's own cost, and per call (delegatecall plus copying calldata and results)
+MULTICALL_BASE_GAS = 30_000
+MULTICALL_CALL_GAS = 5_000
+
+BALLOT_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Ballot": [
+        {"name": "proposalId", "type": "uint256"},
+        {"name": "support", "type": "uint8"},
+        {"name": "voter", "type": "address"},
+        {"name": "nonce", "type": "uint256"},
+    ],
+}
+
+
+class GovernorDomain:
+    """EIP-712 domain a ballot is signed for; `from_chain` reads it from the governor (ERC-5267)."""
+
+    def __init__(self, governor, chain_id, name=GOVERNOR_NAME, version=GOVERNOR_VERSION):
+        self.governor = to_checksum_address(governor)
+        self.chain_id = chain_id
+        self.name = name
+        self.version = version
+
+    @classmethod
+    def from_chain(cls, governor_contract):
+        _, name, version, chain_id, verifying_contract, _, _ = governor_contract.functions.eip712Domain().call()
+        return cls(verifying_contract, chain_id, name, version)
+
+    def typed_data(self, proposal_id, support, voter, nonce):
+        return {
+            "types": BALLOT_TYPES,
+            "primaryType": "Ballot",
+            "domain": {
+                "name": self.name,
+                "version": self.version,
+                "chainId": self.chain_id,
+                "verifyingContract": self.governor,
+            },
+            "message": {
+                "proposalId": proposal_id,
+                "support": support,
+                "voter": voter,
+                "nonce": nonce,
+            },
+        }
+
+
+def sign_ballot(account, domain, proposal_id, support, nonce):
+    """Signs a Ballot with `account` (LocalAccount or SigningAgentClient); returns the ballot dict."""
+    message = domain.typed_data(proposal_id, support, account.address, nonce)
+    signed = account.sign_typed_data(full_message=message)
+    return {
+        "proposalId": proposal_id,
+        "support": support,
+        "voter": account.address,
+        "nonce": nonce,
+        "signature": "0x" + bytes(signed.signature).hex(),
+    }
+
+
+def parse_ballot(data):
+    """Validates the shape of a ballot dict and normalizes its fields; raises ValueError."""
+    try:
+        ballot = {
+            "proposalId": int(data["proposalId"]),
+            "support": int(data["support"]),
+            "voter": data["voter"],
+            "nonce": int(data["nonce"]),
+            "signature": HexBytes(data["signature"]),
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"malformed ballot: {e!r}")
+    if ballot["support"] not in SUPPORT_LABELS:
+        raise ValueError(f"support must be 0, 1 or 2, got {ballot['support']}")
+    if not is_address(ballot["voter"]):
+        raise ValueError(f"invalid voter address '{ballot['voter']}'")
+    if len(ballot["signature"]) != 65:
+        raise ValueError(f"signature must be 65 bytes, got {len(ballot['signature'])}")
+    ballot["voter"] = to_checksum_address(ballot["voter"])
+    ballot["signature"] = "0x" + bytes(ballot["signature"]).hex()
+    return ballot
+
+
+def verify_ballot(domain, ballot):
+    """Raises ValueError unless the signature recovers to the ballot's voter."""
+    message = domain.typed_data(ballot["proposalId"], ballot["support"], ballot["voter"], ballot["nonce"])
+    try:
+        signer = Account.recover_message(encode_typed_data(full_message=message), signature=ballot["signature"])
+    except BadSignature as e:
+        # A bad v byte or out of range r/s: as invalid as a wrong signer
+        raise ValueError(f"unrecoverable signature: {e}")
+    if signer != ballot["voter"]:
+        raise ValueError(f"signature is from {signer}, not {ballot['voter']}")
+
+
+def read_ballots(paths):
+    """Parses ballot JSON lines from each file. Blank lines are ignored."""
+    ballots = []
+    for path in paths:
+        for line_no, line in enumerate(Path(path).read_text().splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                ballots.append(parse_ballot(json.loads(line)))
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_no}: {e}")
+    return ballots
+
+
+def order_ballots(ballots, current_nonces, voted, active):
+    """
+    Selects the ballots castVoteBySig would accept, in submission order.
+
+    A voter's nonce is consumed by each signed vote, so their ballots must be
+    submitted with consecutive nonces starting at `current_nonces[voter]`.
+    Ballots are ordered by that position (every voter's first ballot, then
+    every second one, ...), so the first round can be gas-estimated up front.
+
+    Returns (ready, skipped) where skipped is [(ballot, reason)].
+    """
+    skipped = []
+    seen = set()
+    by_voter = {}
+    for ballot in ballots:
+        key = (ballot["proposalId"], ballot["voter"])
+        if ballot["proposalId"] not in active:
+            skipped.append((ballot, "proposal is not active"))
+        elif key in voted:
+            skipped.append((ballot, "already voted"))
+        elif key in seen:
+            skipped.append((ballot, "duplicate ballot"))
+        else:
+            seen.add(key)
+            by_voter.setdefault(ballot["voter"], []).append(ballot)
+
+    ready = []
+    for voter, voter_ballots in by_voter.items():
+        expected = current_nonces[voter]
+        for ballot in sorted(voter_ballots, key=lambda item: item["nonce"]):
+            if ballot["nonce"] < expected:
+                skipped.append((ballot, f"nonce {ballot['nonce']} already used"))
+            elif ballot["nonce"] > expected:
+                skipped.append((ballot, f"nonce gap: expected {expected}, got {ballot['nonce']}"))
+            else:
+                ready.append((ballot["nonce"] - current_nonces[voter], len(ready), ballot))
+                expected += 1
+    return [ballot for _, _, ballot in sorted(ready)], skipped
+
+
+def pack_batches(items, gas_costs, gas_budget):
+    """
+    Splits items into consecutive batches whose multicall gas stays within
+    `gas_budget`. `gas_costs[i]` is the execution gas of item i on its own
+    (without the intrinsic transaction cost). An item over budget gets a batch to itself.
+
+    Returns [(batch_items, batch_gas)].
+    """
+    batches = []
+    batch, batch_gas = [], MULTICALL_BASE_GAS
+    for item, gas in zip(items, gas_costs):
+        cost = gas + MULTICALL_CALL_GAS
+        if batch and batch_gas + cost > gas_budget:
+            batches.append((batch, batch_gas))
+            batch, batch_gas = [], MULTICALL_BASE_GAS
+        batch.append(item)
+        batch_gas += cost
+    if batch:
+        batches.append((batch, batch_gas))
+    return batches
+
+
+def bisect_ballots(ballots, simulate):
+    """
+    Separates the ballots that revert from an ordered list whose multicall
+    failed. `simulate(ballots)` must raise when those ballots, executed in
+    order as one multicall, revert.
+
+    Ballots are accepted chunk by chunk on top of the ones already kept, and
+    a chunk that reverts is split in half until the reverting ballot is
+    isolated, so k bad ballots cost O(k log n) simulations. A voter's later
+    ballots are dropped with their first bad one: their nonces depend on it.
+
+    Returns (kept, dropped) where dropped is [(ballot, reason)].
+    """
+    kept, dropped, blocked = [], [], set()
+
+    def visit(chunk):
+        live = []
+        for ballot in chunk:
+            if ballot["voter"] in blocked:
+                dropped.append((ballot, "earlier ballot of this voter was dropped"))
+            else:
+                live.append(ballot)
+        if not live:
+            return
+        try:
+            simulate(kept + live)
+        except Exception as e:
+            if len(live) == 1:
+                dropped.append((live[0], f"reverts: {e}"))
+                blocked.add(live[0]["voter"])
+                return
+            middle = len(live) // 2
+            visit(live[:middle])
+            visit(live[middle:])
+            return
+        kept.extend(live)
+
+    visit(list(ballots))
+    return kept, dropped
+
+
+class BallotStore:
+    """
+    Verified ballots appended to a JSON-lines file, one per (proposal, voter).
+
+    Existing lines are loaded on start, so an intake can be restarted without
+    accepting duplicates. Safe to use from several threads.
+    """
+
+    def __init__(self, path, domain):
+        self.path = Path(path)
+        self.domain = domain
+        self.lock = threading.Lock()
+        self.keys = set()
+        self.count = 0
+        if self.path.exists():
+            for ballot in read_ballots([self.path]):
+                self.keys.add((ballot["proposalId"], ballot["voter"]))
+                self.count += 1
+
+    def add(self, data):
+        """Verifies and stores one ballot; returns it, or raises ValueError."""
+        ballot = parse_ballot(data)
+        verify_ballot(self.domain, ballot)
+        key = (ballot["proposalId"], ballot["voter"])
+        with self.lock:
+            if key in self.keys:
+                raise ValueError(f"{ballot['voter']} already submitted a ballot for proposal {ballot['proposalId']}")
+            with self.path.open("a") as f:
+                f.write(json.dumps(ballot) + "\n")
+            self.keys.add(key)
+            self.count += 1
+        return ballot
+
+
+class BallotIntake:
+    """
+    Local HTTP endpoint collecting signed ballots into a BallotStore.
+
+    POST /ballots with one ballot object or a list of them answers
+    {"accepted": n, "rejected": [{"index": i, "error": "..."}]};
+    GET /ballots answers {"count": n, "governor": ..., "chainId": ...}.
+    """
+
+    def __init__(self, store, host="127.0.0.1", port=DEFAULT_INTAKE_PORT):
+        self.store = store
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/ballots"
+
+    def _handler(self):
+        store = self.store
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if self.path != "/ballots":
+                    return self._reply(404, {"error": "not found"})
+                self._reply(200, {"count": store.count, "governor": store.domain.governor, "chainId": store.domain.chain_id})
+
+            def do_POST(self):
+                if self.path != "/ballots":
+                    return self._reply(404, {"error": "not found"})
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                except ValueError:
+                    return self._reply(400, {"error": "body is not JSON"})
+                items = body if isinstance(body, list) else [body]
+                accepted, rejected = 0, []
+                for index, item in enumerate(items):
+                    try:
+                        store.add(item)
+                        accepted += 1
+                    except ValueError as e:
+                        rejected.append({"index": index, "error": str(e)})
+                self._reply(200 if accepted or not rejected else 400, {"accepted": accepted, "rejected": rejected})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+    def shutdown(self):
+        self.server.shutdown()